@@ -1,14 +1,22 @@
 """Base agent class for all game agents."""
 
-from typing import Dict, Any, Optional, ClassVar
+from typing import Dict, Any, Optional, ClassVar, Sequence, Callable, Awaitable, TypeVar
+import hashlib
+import time
 from pydantic import BaseModel, Field
+from langchain_core.messages import BaseMessage, AIMessage
 
 from config.agents.agent_config_base import AgentConfigBase
 from config.logging_config import get_logger
 from agents.protocols.base_agent_protocol import BaseAgentProtocol
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+from managers.protocols.single_flight_protocol import SingleFlightProtocol
 from models.agent_config_model import AgentConfigModel
+from utils.metrics import LLM_CALL_SECONDS, LLM_CALLS
 import logging
 
+T = TypeVar("T")
+
 class BaseAgent:
     """Base agent implementation."""
     logger: ClassVar = get_logger(__name__)
@@ -47,11 +55,18 @@ class BaseAgent:
         else:
             raise ValueError(f"Unknown agent type: {agent_type}")
 
-    def __init__(self, config: AgentConfigBase):
+    def __init__(
+        self,
+        config: AgentConfigBase,
+        llm_cache: Optional[LLMCacheManagerProtocol] = None,
+        single_flight: Optional[SingleFlightProtocol] = None
+    ):
         """Initialize BaseAgent.
         
         Args:
             config: Configuration for the agent
+            llm_cache: Optional shared LLM response cache
+            single_flight: Optional coalescing of concurrent section generations
         """
         if not config:
             raise ValueError("config is required")
@@ -62,9 +77,110 @@ class BaseAgent:
         else:
             self.config = config
             
+        self.llm_cache = llm_cache
+        self.single_flight = single_flight
+            
         # Setup logging
         self.config.setup_logging(self.__class__.__name__)
 
+    def _llm_cache_key(self, messages: Sequence[BaseMessage]) -> Optional[str]:
+        """Get the cache key of a prompt (None without cache)."""
+        if not self.llm_cache:
+            return None
+        from managers.llm_cache_manager import split_messages
+        system_message, human_message = split_messages(messages)
+        return self.llm_cache.make_key(
+            self.config.model_name,
+            self.config.temperature,
+            system_message,
+            human_message
+        )
+
+    def _prompt_version(self) -> str:
+        """Short digest of what shapes a generation (model, temperature, system prompt)."""
+        fingerprint = f"{self.config.model_name}|{self.config.temperature}|{self.config.system_message}"
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+    @staticmethod
+    def _content_digest(content: Optional[str]) -> Optional[str]:
+        """Digest of caller-provided content (None when read from storage)."""
+        if content is None:
+            return None
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+    async def _coalesce(self, kind: str, section_number: int, compute: Callable[[], Awaitable[T]], *extra_key) -> T:
+        """Share the generation of a section between concurrent callers.
+        
+        Args:
+            kind: Kind of generation ("narrator", "rules"...)
+            section_number: Section number
+            compute: Coroutine factory doing the lookup, generation and save
+            *extra_key: Other inputs the result depends on
+            
+        Returns:
+            T: Result of the shared computation (a copy for pydantic models)
+        """
+        if not self.single_flight:
+            return await compute()
+        key = (kind, section_number, self._prompt_version(), *extra_key)
+        result = await self.single_flight.run(key, compute)
+        # Chaque partie reçoit sa copie : l'état du graphe annote et modifie les modèles
+        return result.model_copy() if isinstance(result, BaseModel) else result
+
+    async def _discard_llm_response(self, cache_key: Optional[str]) -> None:
+        """Drop a cached response that could not be used."""
+        if self.llm_cache and cache_key:
+            await self.llm_cache.invalidate(cache_key)
+
+    async def _ainvoke_llm(
+        self,
+        messages: Sequence[BaseMessage],
+        cache_key: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> AIMessage:
+        """Call the agent LLM through the shared response cache if any.
+        
+        Args:
+            messages: Prompt messages
+            cache_key: Optional cache key (defaults to the prompt hash)
+            on_chunk: Optional callback receiving the response text as it is
+                generated (the LLM is then called with ``astream``)
+            
+        Returns:
+            AIMessage: LLM response
+        """
+        labels = (self.__class__.__name__, self.config.model_name)
+        start = time.perf_counter()
+        try:
+            response = await self._call_llm(messages, cache_key, on_chunk)
+        except Exception:
+            LLM_CALLS.labels(*labels, "error").inc()
+            raise
+        finally:
+            LLM_CALL_SECONDS.labels(*labels).observe(time.perf_counter() - start)
+        LLM_CALLS.labels(*labels, "ok").inc()
+        return response
+
+    async def _call_llm(
+        self,
+        messages: Sequence[BaseMessage],
+        cache_key: Optional[str],
+        on_chunk: Optional[Callable[[str], None]]
+    ) -> AIMessage:
+        if not self.llm_cache:
+            if on_chunk:
+                from managers.llm_cache_manager import astream_message
+                return await astream_message(self.config.llm, messages, on_chunk)
+            return await self.config.llm.ainvoke(messages)
+        return await self.llm_cache.ainvoke(
+            self.config.llm,
+            messages,
+            model_name=self.config.model_name,
+            temperature=self.config.temperature,
+            key=cache_key,
+            on_chunk=on_chunk
+        )
+
     async def initialize(self) -> None:
         """Initialize the agent."""
         pass
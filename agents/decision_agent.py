@@ -8,40 +8,112 @@ from models.game_state import GameState
 from models.decision_model import DecisionModel, AnalysisResult, NextActionType, ActionType
 from models.rules_model import RulesModel
 from models.errors_model import DecisionError
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from agents.base_agent import BaseAgent
 from config.agents.decision_agent_config import DecisionAgentConfig
 from managers.protocols.decision_manager_protocol import DecisionManagerProtocol
 from agents.protocols import DecisionAgentProtocol
 from agents.protocols.rules_agent_protocol import RulesAgentProtocol
 from agents.factories.model_factory import ModelFactory
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+from managers.protocols.decision_index_protocol import DecisionIndexProtocol
+from utils.choice_resolver import normalize_player_input, resolve_choice
 from datetime import datetime
 from loguru import logger
+import hashlib
 import json
 
 # Type pour les agents de règles (réel ou mock)
 RulesAgentType = Union[RulesAgentProtocol, Any]
 
+# Champs des règles qui ne changent pas la décision
+_RULES_VOLATILE_FIELDS = {"last_update"}
+
+def rules_digest(rules: Dict) -> str:
+    """Stable digest of the rules used for a decision."""
+    stable = {k: v for k, v in rules.items() if k not in _RULES_VOLATILE_FIELDS}
+    return hashlib.sha256(
+        json.dumps(stable, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
 class DecisionAgent(BaseAgent):
     """Agent responsable des décisions."""
     
     config: DecisionAgentConfig = Field(default_factory=DecisionAgentConfig)
     
-    def __init__(self, config: DecisionAgentConfig, decision_manager: DecisionManagerProtocol):
+    def __init__(
+        self,
+        config: DecisionAgentConfig,
+        decision_manager: DecisionManagerProtocol,
+        llm_cache: Optional[LLMCacheManagerProtocol] = None,
+        section_graph: Optional[SectionGraphProtocol] = None,
+        decision_index: Optional[DecisionIndexProtocol] = None
+    ):
         """
         Initialise l'agent avec une configuration.
         
         Args:
             config: Configuration de l'agent
             decision_manager: Manager pour les décisions
+            llm_cache: Cache partagé des réponses LLM (optionnel)
+            section_graph: Index des liens entre sections (optionnel)
+            decision_index: Index des décisions passées (optionnel)
         """
-        super().__init__(config=config)
+        super().__init__(config=config, llm_cache=llm_cache)
         self.decision_manager = decision_manager
+        self.section_graph = section_graph
+        self.decision_index = decision_index
         self.rules_agent = self.config.dependencies.get("rules_agent")
         self.llm = self.config.llm
         self.system_prompt = self.config.system_message
         self._logger = logger
 
+    def _decision_cache_key(self, section_number: int, user_response: str, rules: Dict) -> Optional[str]:
+        """Cache key of a decision: (section, normalized input, rules digest).
+        
+        Deux joueurs qui tapent « Je vais à gauche. » et « je vais à gauche »
+        dans la même section partagent la même analyse.
+        """
+        if not self.llm_cache:
+            return None
+        return self.llm_cache.make_key(
+            self.config.model_name,
+            self.config.temperature,
+            self.system_prompt,
+            f"decision|{section_number}|{normalize_player_input(user_response)}|{rules_digest(rules)}"
+        )
+
+    def _allowed_targets(self, section_number: int) -> tuple:
+        """Sections linked from the current section, empty if unknown."""
+        if not self.section_graph:
+            return ()
+        return self.section_graph.successors(section_number)
+
+    def _resolve_locally(
+        self,
+        section_number: int,
+        player_input: Optional[str],
+        rules: RulesModel
+    ) -> Optional[DecisionModel]:
+        """Resolve a click or a numeric dice roll without the LLM.
+        
+        Returns:
+            Optional[DecisionModel]: Decision, or None to fall back to the LLM
+        """
+        if not self.config.local_resolution:
+            return None
+        result = resolve_choice(player_input, rules, self._allowed_targets(section_number))
+        if result is None:
+            return None
+        self._logger.info("Decision resolved locally: section {} -> {}", section_number, result.next_section)
+        return ModelFactory.create_decision_model(
+            section_number=section_number,
+            next_section=result.next_section,
+            conditions=result.conditions,
+            analysis=result.analysis
+        )
+
     async def analyze_response(
         self,
         section_number: int,
@@ -60,25 +132,73 @@ class DecisionAgent(BaseAgent):
             AnalysisResult: Résultat de l'analyse
         """
         try:
+            allowed_targets = self._allowed_targets(section_number)
+            
+            # Réponse déjà en cache : ni embedding ni recherche dans l'index
+            cache_key = self._decision_cache_key(section_number, user_response, rules)
+            cached = await self.llm_cache.get(cache_key) if cache_key else None
+            
+            # Décisions passées similaires (réutilisées telles quelles si quasi identiques)
+            retrieval = None
+            if self.decision_index and cached is None:
+                retrieval = await self.decision_index.search(section_number, user_response)
+            if retrieval and retrieval.hit:
+                record = retrieval.hit.record
+                if not allowed_targets or record["next_section"] in allowed_targets:
+                    self._logger.info("Decision reused from index (similarity {:.3f}): section {} -> {}",
+                                      retrieval.hit.similarity, section_number, record["next_section"])
+                    return AnalysisResult(
+                        next_section=record["next_section"],
+                        conditions=record.get("conditions", []),
+                        analysis=record.get("analysis", "")
+                    )
+            
             # Construire le prompt
-            messages = [
-                SystemMessage(content=self.system_prompt),
-                HumanMessage(content=f"""
+            human_message = f"""
                     Section actuelle: {section_number}
                     Réponse utilisateur: {user_response}
                     Règles: {json.dumps(rules, indent=2)}
-                """)
+                """
+            if allowed_targets:
+                human_message += f"Sections accessibles: {list(allowed_targets)}\n"
+            if retrieval and retrieval.examples:
+                human_message += "Décisions similaires:\n" + "".join(
+                    f"- {example.text}\n" for example in retrieval.examples
+                )
+            messages = [
+                SystemMessage(content=self.system_prompt),
+                HumanMessage(content=human_message)
             ]
             
-            # Appeler le LLM
-            response = await self.llm.ainvoke(messages)
+            # Appeler le LLM (ou le cache partagé)
+            if cached is not None:
+                response = AIMessage(content=cached)
+            else:
+                response = await self._ainvoke_llm(messages, cache_key)
             
             # Parser la réponse en utilisant le DecisionManager
-            result = self.decision_manager.clean_llm_json_response(response.content)
+            try:
+                result = self.decision_manager.clean_llm_json_response(response.content)
+                next_section = result.get("next_section")
+                if next_section is None:
+                    raise DecisionError("Missing next_section in LLM response")
+                # Le graphe des sections borne les destinations possibles
+                if allowed_targets and int(next_section) not in allowed_targets:
+                    raise DecisionError(
+                        f"Section {next_section} is not linked from section {section_number}"
+                    )
+            except Exception:
+                await self._discard_llm_response(cache_key)
+                raise
             
-            next_section = result.get("next_section")
-            if next_section is None:
-                raise DecisionError("Missing next_section in LLM response")
+            # Seules les décisions validées par le graphe des sections enrichissent l'index
+            if retrieval and allowed_targets:
+                await self.decision_index.add_decision(
+                    retrieval,
+                    int(next_section),
+                    result.get("conditions", []),
+                    result.get("analysis", "")
+                )
                 
             return AnalysisResult(
                 next_section=next_section,
@@ -115,6 +235,10 @@ class DecisionAgent(BaseAgent):
             # Si on a déjà un jet de dés comme input, l'analyser directement
             if player_input and "jet de" in player_input.lower():
                 self._logger.info("Processing dice roll result")
+                # Résultat chiffré couvert par dice_results : pas besoin du LLM
+                local_decision = self._resolve_locally(section_number, player_input, rules)
+                if local_decision:
+                    return local_decision
                 analysis_result = await self.analyze_response(
                     section_number,
                     player_input,
@@ -155,6 +279,11 @@ class DecisionAgent(BaseAgent):
                     analysis="En attente du jet de dés"
                 )
 
+            # Clic sur un choix (texte exact ou numéro de section) : pas besoin du LLM
+            local_decision = self._resolve_locally(section_number, player_input, rules)
+            if local_decision:
+                return local_decision
+
             # Analyser la réponse utilisateur
             self._logger.info("Analyzing user response")
             analysis_result = await self.analyze_response(
@@ -187,7 +316,7 @@ class DecisionAgent(BaseAgent):
                 state = GameState.model_validate(input_data.get("state", {}))
 
             # Log plus détaillé
-            self._logger.debug("Full state in decision: {}", state.model_dump())
+            self._logger.opt(lazy=True).trace("Full state in decision: {}", lambda: state.model_dump())
             self._logger.info("Starting decision processing: session={}, game={}, section={}, input={}", 
                      state.session_id, state.game_id, state.section_number, 
                      state.decision.player_input if state.decision else None)
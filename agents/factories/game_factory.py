@@ -9,6 +9,7 @@ from typing import Optional, Dict, Union, TYPE_CHECKING
 from config.game_config import GameConfig
 from config.agents.agent_config_base import AgentConfigBase
 from config.storage_config import StorageConfig
+from config.managers.checkpoint_config import CheckpointConfig
 
 from managers.cache_manager import CacheManager
 from managers.state_manager import StateManager
@@ -17,6 +18,15 @@ from managers.trace_manager import TraceManager
 from managers.rules_manager import RulesManager
 from managers.decision_manager import DecisionManager
 from managers.narrator_manager import NarratorManager
+from managers.llm_cache_manager import LLMCacheManager
+from managers.single_flight import SingleFlight
+from managers.prefetch_manager import PrefetchManager
+from managers.narrative_stream import NarrativeStream
+from managers.section_store import SectionStore, compilation_metadata
+from managers.section_corpus import SectionCorpus
+from managers.section_graph_index import SectionGraphIndex
+from managers.decision_index_manager import DecisionIndexManager
+from managers.checkpoint_saver import SQLiteCheckpointSaver
 
 from managers.protocols.workflow_manager_protocol import WorkflowManagerProtocol
 from managers.protocols.state_manager_protocol import StateManagerProtocol
@@ -26,6 +36,17 @@ from managers.protocols.trace_manager_protocol import TraceManagerProtocol
 from managers.protocols.rules_manager_protocol import RulesManagerProtocol
 from managers.protocols.decision_manager_protocol import DecisionManagerProtocol
 from managers.protocols.narrator_manager_protocol import NarratorManagerProtocol
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+from managers.protocols.single_flight_protocol import SingleFlightProtocol
+from managers.protocols.prefetch_manager_protocol import PrefetchManagerProtocol
+from managers.protocols.narrative_stream_protocol import NarrativeStreamProtocol
+from managers.protocols.section_store_protocol import SectionStoreProtocol
+from managers.protocols.section_corpus_protocol import SectionCorpusProtocol
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+from managers.protocols.decision_index_protocol import DecisionIndexProtocol
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
 
 from agents.protocols.narrator_agent_protocol import NarratorAgentProtocol
 from agents.protocols.rules_agent_protocol import RulesAgentProtocol
@@ -68,53 +89,213 @@ class GameFactory:
             config: Configuration for game components
         """
         self._config = config or GameConfig.create_default()
-        self._cache_manager = CacheManager(self._config.manager_configs.storage_config)
+        # Mappé au premier usage (get_section_corpus), sinon lecture des fichiers sources
+        self._section_corpus: SectionCorpusProtocol = SectionCorpus(
+            self._config.manager_configs.section_corpus_config
+        )
+        self._section_corpus_loaded = False
+        self._cache_manager = CacheManager(
+            self._config.manager_configs.storage_config,
+            section_corpus=self._section_corpus
+        )
+        # Composants partagés entre toutes les parties (sections, règles, LLM)
+        self._shared_managers: Optional[Dict[str, ManagerProtocols]] = None
+        self._shared_agents: Optional[Dict[str, AgentProtocols]] = None
+        self._llm_cache: Optional[LLMCacheManagerProtocol] = None
+        self._single_flight: Optional[SingleFlightProtocol] = None
+        self._prefetcher: Optional[PrefetchManagerProtocol] = None
+        self._narrative_stream: Optional[NarrativeStreamProtocol] = None
+        self._section_store: Optional[SectionStoreProtocol] = None
+        self._section_graph: Optional[SectionGraphProtocol] = None
+        self._decision_index: Optional[DecisionIndexProtocol] = None
+        self._checkpointer: Optional[BaseCheckpointSaver] = None
         
-    def _create_managers(self) -> Dict[str, ManagerProtocols]:
+    @property
+    def config(self) -> GameConfig:
+        """Get factory configuration."""
+        return self._config
+
+    def get_llm_cache(self) -> LLMCacheManagerProtocol:
+        """Get the LLM response cache shared by all agents."""
+        if self._llm_cache is None:
+            self._llm_cache = LLMCacheManager(self._config.manager_configs.llm_cache_config)
+        return self._llm_cache
+
+    def get_single_flight(self) -> SingleFlightProtocol:
+        """Get the coalescing of concurrent section generations shared by all games."""
+        if self._single_flight is None:
+            self._single_flight = SingleFlight(self._config.manager_configs.single_flight_config)
+        return self._single_flight
+
+    def get_narrative_stream(self) -> NarrativeStreamProtocol:
+        """Get the shared narrative stream, creating it on first use."""
+        if self._narrative_stream is None:
+            self._narrative_stream = NarrativeStream(self._config.manager_configs.narrative_stream_config)
+        return self._narrative_stream
+
+    def get_prefetcher(self) -> PrefetchManagerProtocol:
+        """Get the shared section prefetcher, creating it on first use."""
+        if self._prefetcher is None:
+            agents = self._get_shared_agents()
+            self._prefetcher = PrefetchManager(
+                narrator_agent=agents["narrator_agent"],
+                rules_agent=agents["rules_agent"],
+                config=self._config.manager_configs.prefetch_config
+            )
+        return self._prefetcher
+
+    def get_section_store(self) -> SectionStoreProtocol:
+        """Get the precompiled section artifact, loaded on first use."""
+        if self._section_store is None:
+            agent_configs = self._config.agent_configs
+            self._section_store = SectionStore(
+                self._config.manager_configs.section_store_config,
+                compilation_metadata(agent_configs.narrator_config, agent_configs.rules_config)
+            )
+            self._section_store.load()
+        return self._section_store
+
+    def get_section_corpus(self) -> SectionCorpusProtocol:
+        """Get the packed corpus of section sources, mapped on first use."""
+        if not self._section_corpus_loaded:
+            self._section_corpus.load()
+            self._section_corpus_loaded = True
+        return self._section_corpus
+
+    def get_section_graph(self) -> SectionGraphProtocol:
+        """Get the index of links between sections, built on first use."""
+        if self._section_graph is None:
+            self._section_graph = SectionGraphIndex(self._config.manager_configs.section_graph_config)
+            self._section_graph.refresh(force=True)
+        return self._section_graph
+
+    def get_decision_index(self) -> DecisionIndexProtocol:
+        """Get the index of past decisions, memory-mapped on first use."""
+        if self._decision_index is None:
+            self._decision_index = DecisionIndexManager(self._config.manager_configs.decision_index_config)
+            self._decision_index.load()
+        return self._decision_index
+
+    def get_checkpointer(self) -> BaseCheckpointSaver:
+        """Get the workflow checkpointer shared by all games (thread_id = game_id)."""
+        if self._checkpointer is None:
+            config = self._config.manager_configs.checkpoint_config or CheckpointConfig()
+            if config.persistent:
+                self._checkpointer = SQLiteCheckpointSaver(config)
+            else:
+                self._checkpointer = MemorySaver()
+        return self._checkpointer
+
+    def _scoped_config(self, config: StorageConfig, game_id: Optional[str]) -> StorageConfig:
+        """Return a copy of a storage config bound to a game.
+        
+        Managers mutate ``config.game_id``, so each game needs its own copy.
+        
+        Args:
+            config: Base storage configuration
+            game_id: Game ID to bind, or None to keep the shared config
+            
+        Returns:
+            StorageConfig: Config bound to the game
+        """
+        if not game_id:
+            return config
+        return config.model_copy(update={"game_id": game_id})
+
+    def _create_shared_managers(self) -> Dict[str, ManagerProtocols]:
+        """Create managers that only read immutable game data.
+        
+        Returns:
+            Dict[str, ManagerProtocols]: rules, decision and narrator managers
+        """
+        manager_configs = self._config.manager_configs
+        section_store = self.get_section_store()
+        self.get_section_corpus()
+        return {
+            "rules_manager": RulesManager(
+                manager_configs.rules_config or manager_configs.storage_config, 
+                self._cache_manager,
+                section_store=section_store
+            ),
+            "decision_manager": DecisionManager(),  # No config needed for now
+            "narrator_manager": NarratorManager(
+                manager_configs.storage_config,
+                self._cache_manager,
+                section_store=section_store
+            )
+        }
+
+    def _get_shared_managers(self) -> Dict[str, ManagerProtocols]:
+        """Get shared managers, creating them on first use."""
+        if self._shared_managers is None:
+            logger.debug("Creating shared managers")
+            self._shared_managers = self._create_shared_managers()
+        return self._shared_managers
+
+    def _create_managers(self, game_id: Optional[str] = None) -> Dict[str, ManagerProtocols]:
         """Create all game managers.
         
+        Without ``game_id`` every manager is created from scratch on the
+        factory cache. With a ``game_id`` the state, trace and character
+        managers get their own cache bound to the game, while the section
+        and rules managers are shared with the other games.
+        
+        Args:
+            game_id: Optional game ID to bind the per-game managers to
+        
         Returns:
             Dict[str, ManagerProtocols]: Container with all managers
         """
         try:
-            logger.debug("Creating managers")
+            logger.debug(f"Creating managers (game_id={game_id})")
             manager_configs = self._config.manager_configs
             
+            if game_id:
+                shared_managers = self._get_shared_managers()
+                cache_manager = CacheManager(
+                    self._scoped_config(manager_configs.storage_config, game_id)
+                )
+            else:
+                shared_managers = self._create_shared_managers()
+                cache_manager = self._cache_manager
+            
             # Create managers with their specific configs
             # 1. D'abord character_manager car state_manager en dépend
             character_manager = CharacterManager(
-                manager_configs.character_config or manager_configs.storage_config, 
-                self._cache_manager
+                self._scoped_config(
+                    manager_configs.character_config or manager_configs.storage_config,
+                    game_id
+                ), 
+                cache_manager
             )
             
             # 2. Ensuite state_manager avec character_manager
             state_manager = StateManager(
-                manager_configs.storage_config, 
-                self._cache_manager,
-                character_manager
+                self._scoped_config(manager_configs.storage_config, game_id), 
+                cache_manager,
+                character_manager,
+                game_id=game_id,
+                persistence_config=manager_configs.state_persistence_config
             )
             
             # 3. Les autres managers
             trace_manager = TraceManager(
-                manager_configs.trace_config or manager_configs.storage_config, 
-                self._cache_manager
+                self._scoped_config(
+                    manager_configs.trace_config or manager_configs.storage_config,
+                    game_id
+                ), 
+                cache_manager.fs_adapter
             )
-            rules_manager = RulesManager(
-                manager_configs.rules_config or manager_configs.storage_config, 
-                self._cache_manager
-            )
-            decision_manager = DecisionManager()  # No config needed for now
-            narrator_manager = NarratorManager(manager_configs.storage_config, self._cache_manager)
             workflow_manager = self._create_workflow_manager(state_manager)
             
             managers = {
                 "state_manager": state_manager,
-                "cache_manager": self._cache_manager,
+                "cache_manager": cache_manager,
                 "character_manager": character_manager,
                 "trace_manager": trace_manager,
-                "rules_manager": rules_manager,
-                "decision_manager": decision_manager,
-                "narrator_manager": narrator_manager,
+                "rules_manager": shared_managers["rules_manager"],
+                "decision_manager": shared_managers["decision_manager"],
+                "narrator_manager": shared_managers["narrator_manager"],
                 "workflow_manager": workflow_manager
             }
             
@@ -150,39 +331,76 @@ class GameFactory:
         """
         try:
             logger.debug("Creating agents")
-            agent_configs = self._config.agent_configs
-            
-            # Import agents here to avoid circular imports
-            from agents.narrator_agent import NarratorAgent
-            from agents.rules_agent import RulesAgent
-            from agents.decision_agent import DecisionAgent
-            from agents.trace_agent import TraceAgent
-            
-            # Create agents
-            agents = {
-                "narrator_agent": NarratorAgent(
-                    config=agent_configs.narrator_config,
-                    narrator_manager=managers["narrator_manager"]
-                ),
-                "rules_agent": RulesAgent(
-                    config=agent_configs.rules_config,
-                    rules_manager=managers["rules_manager"]
-                ),
-                "decision_agent": DecisionAgent(
-                    config=agent_configs.decision_config,
-                    decision_manager=managers["decision_manager"]
-                ),
-                "trace_agent": TraceAgent(
-                    config=agent_configs.trace_config,
-                    trace_manager=managers["trace_manager"]
-                )
-            }
-            
+            agents = dict(self._create_shared_agents(managers))
+            agents["trace_agent"] = self._create_trace_agent(managers)
             return agents
             
         except Exception as e:
             logger.error(f"Failed to create agents: {str(e)}")
             raise
+
+    def _create_shared_agents(self, managers: Dict[str, ManagerProtocols]) -> Dict[str, AgentProtocols]:
+        """Create agents that only depend on shared managers.
+        
+        Args:
+            managers: Container with all managers
+            
+        Returns:
+            Dict[str, AgentProtocols]: narrator, rules and decision agents
+        """
+        agent_configs = self._config.agent_configs
+        llm_cache = self.get_llm_cache()
+        single_flight = self.get_single_flight()
+        
+        # Import agents here to avoid circular imports
+        from agents.narrator_agent import NarratorAgent
+        from agents.rules_agent import RulesAgent
+        from agents.decision_agent import DecisionAgent
+        
+        return {
+            "narrator_agent": NarratorAgent(
+                config=agent_configs.narrator_config,
+                narrator_manager=managers["narrator_manager"],
+                llm_cache=llm_cache,
+                single_flight=single_flight,
+                narrative_stream=self.get_narrative_stream()
+            ),
+            "rules_agent": RulesAgent(
+                config=agent_configs.rules_config,
+                rules_manager=managers["rules_manager"],
+                llm_cache=llm_cache,
+                single_flight=single_flight
+            ),
+            "decision_agent": DecisionAgent(
+                config=agent_configs.decision_config,
+                decision_manager=managers["decision_manager"],
+                llm_cache=llm_cache,
+                section_graph=self.get_section_graph(),
+                decision_index=self.get_decision_index()
+            )
+        }
+
+    def _get_shared_agents(self) -> Dict[str, AgentProtocols]:
+        """Get shared agents, creating them on first use."""
+        if self._shared_agents is None:
+            logger.debug("Creating shared agents")
+            self._shared_agents = self._create_shared_agents(self._get_shared_managers())
+        return self._shared_agents
+
+    def _create_trace_agent(self, managers: Dict[str, ManagerProtocols]) -> TraceAgentProtocol:
+        """Create the trace agent of a game.
+        
+        Args:
+            managers: Container with all managers
+            
+        Returns:
+            TraceAgentProtocol: Trace agent bound to the game trace manager
+        """
+        from agents.trace_agent import TraceAgent
+        return TraceAgent(
+            config=self._config.agent_configs.trace_config,
+            trace_manager=managers["trace_manager"]
+        )
             
     def _validate_managers(self, managers: Dict[str, ManagerProtocols]) -> None:
         """Validate that all required managers are present and properly initialized."""
@@ -236,6 +454,39 @@ class GameFactory:
             logger.error("Error creating game components: {}", str(e))
             raise Exception(f"Failed to create game components: {str(e)}")
 
+    def create_session_components(
+        self,
+        game_id: str
+    ) -> tuple[Dict[str, AgentProtocols], Dict[str, ManagerProtocols]]:
+        """Create the components of a single game.
+        
+        State, trace and character managers (and the trace agent) are
+        created for the game; section, rules and decision components are
+        shared by all the games served by this factory.
+        
+        Args:
+            game_id: ID of the game
+            
+        Returns:
+            tuple[Dict[str, AgentProtocols], Dict[str, ManagerProtocols]]: Game components
+            
+        Raises:
+            Exception: If component creation fails
+        """
+        try:
+            managers = self._create_managers(game_id)
+            self._validate_managers(managers)
+            
+            agents = dict(self._get_shared_agents())
+            agents["trace_agent"] = self._create_trace_agent(managers)
+            self._validate_agents(agents)
+            
+            return agents, managers
+            
+        except Exception as e:
+            logger.error(f"Error creating session components for game {game_id}: {str(e)}")
+            raise Exception(f"Failed to create session components: {str(e)}")
+
     def create_story_graph(self, config: AgentConfigBase, managers: Dict[str, ManagerProtocols], agents: Dict[str, AgentProtocols]) -> StoryGraphProtocol:
         """Create and configure story graph.
         
@@ -259,7 +510,9 @@ class GameFactory:
             story_graph = StoryGraph(
                 config=config,
                 managers=managers,
-                agents=agents
+                agents=agents,
+                checkpointer=self.get_checkpointer(),
+                prefetcher=self.get_prefetcher()
             )
             
             logger.debug("Story graph created successfully")
@@ -3,7 +3,8 @@ NarratorAgent Module
 Handles content processing and formatting.
 """
 
-from typing import Dict, Optional, AsyncGenerator, Any, Union
+from contextlib import nullcontext
+from typing import Callable, Dict, Optional, AsyncGenerator, Any, Union
 from datetime import datetime
 import json
 from pydantic import BaseModel, Field
@@ -16,28 +17,59 @@ from models.errors_model import NarratorError
 from config.agents.narrator_agent_config import NarratorAgentConfig
 from config.logging_config import get_logger
 from managers.protocols.narrator_manager_protocol import NarratorManagerProtocol
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+from managers.protocols.single_flight_protocol import SingleFlightProtocol
+from managers.protocols.narrative_stream_protocol import NarrativeStreamProtocol
 from agents.protocols.narrator_agent_protocol import NarratorAgentProtocol
 from agents.factories.model_factory import ModelFactory
+from utils.json_stream import JsonStringFieldStream
 
 logger = get_logger('narrator_agent')
 
 class NarratorAgent(BaseAgent):
     """Agent for processing and formatting game content."""
 
-    def __init__(self, config: NarratorAgentConfig, narrator_manager: NarratorManagerProtocol):
+    def __init__(
+        self,
+        config: NarratorAgentConfig,
+        narrator_manager: NarratorManagerProtocol,
+        llm_cache: Optional[LLMCacheManagerProtocol] = None,
+        single_flight: Optional[SingleFlightProtocol] = None,
+        narrative_stream: Optional[NarrativeStreamProtocol] = None
+    ):
         """Initialize NarratorAgent.
         
         Args:
             config: Configuration for the agent
             narrator_manager: Manager for narrator operations
+            llm_cache: Optional shared LLM response cache
+            single_flight: Optional coalescing of concurrent section generations
+            narrative_stream: Optional forwarding of the narrative while it is generated
         """
-        super().__init__(config=config)
+        super().__init__(config=config, llm_cache=llm_cache, single_flight=single_flight)
         self.narrator_manager = narrator_manager
+        self.narrative_stream = narrative_stream
         self.logger = logger
 
+    def _stream_handler(self, section_number: int) -> Optional[Callable[[str], None]]:
+        """Start streaming a section, returning the LLM chunk callback (None if disabled)."""
+        if not self.narrative_stream or not self.narrative_stream.enabled:
+            return None
+        extractor = JsonStringFieldStream("content")
+        self.narrative_stream.begin(section_number)
+
+        def on_chunk(text: str) -> None:
+            # Seule la valeur du champ "content" est relayée, décodée
+            self.narrative_stream.publish(section_number, extractor.feed(text))
+
+        return on_chunk
+
     async def _process_section(self, section_number: int, content: Optional[str] = None) -> Union[NarratorModel, NarratorError]:
         """Process and format a game section.
         
+        Concurrent calls for the same section share a single lookup,
+        LLM call and cache write.
+        
         Args:
             section_number: Section number to process
             content: Optional raw content to process. If not provided, will be fetched from manager.
@@ -45,6 +77,29 @@ class NarratorAgent(BaseAgent):
         Returns:
             Union[NarratorModel, NarratorError]: Processed section content or error
         """
+        return await self._coalesce(
+            "narrator",
+            section_number,
+            lambda: self._load_or_generate_section(section_number, content),
+            self._content_digest(content)
+        )
+
+    async def generate_section(self, section_number: int) -> Union[NarratorModel, NarratorError]:
+        """Get the narrative of a section, generating and caching it if needed.
+        
+        Used outside of a turn (e.g. prefetch): joins a generation already
+        running for the same section.
+        
+        Args:
+            section_number: Section number to generate
+            
+        Returns:
+            Union[NarratorModel, NarratorError]: Formatted section content or error
+        """
+        return await self._process_section(section_number)
+
+    async def _load_or_generate_section(self, section_number: int, content: Optional[str] = None) -> Union[NarratorModel, NarratorError]:
+        """Get a section from cache, or generate and save it."""
         try:
             logger.debug("Starting process_section for section {}", section_number)
             
@@ -112,7 +167,13 @@ class NarratorAgent(BaseAgent):
             ]
             
             logger.debug("Sending request to LLM")
-            response = await self.config.llm.ainvoke(messages)
+            cache_key = self._llm_cache_key(messages)
+            on_chunk = self._stream_handler(section_number)
+            try:
+                response = await self._ainvoke_llm(messages, cache_key, on_chunk)
+            finally:
+                if on_chunk:
+                    self.narrative_stream.end(section_number)
             logger.debug("Received response from LLM: {}", 
                        (response.content[:100] + "...") if len(response.content) > 100 else response.content)
             
@@ -165,6 +226,7 @@ class NarratorAgent(BaseAgent):
             except json.JSONDecodeError as e:
                 logger.error("Invalid JSON in LLM response: {}", str(e))
                 logger.error("Response content: {}", response.content)
+                await self._discard_llm_response(cache_key)
                 return NarratorError(
                     section_number=section_number,
                     message=f"Invalid JSON in LLM response: {str(e)}"
@@ -172,6 +234,7 @@ class NarratorAgent(BaseAgent):
             except Exception as e:
                 logger.error("Error parsing LLM response: {}", str(e))
                 logger.error("Full error: {}", str(e), exc_info=True)
+                await self._discard_llm_response(cache_key)
                 return NarratorError(
                     section_number=section_number,
                     message=f"Error parsing LLM response: {str(e)}"
@@ -202,8 +265,13 @@ class NarratorAgent(BaseAgent):
             logger.debug("Processing narrative for state: session={}, section={}", 
                         state.session_id, state.section_number)
             
-            # Process section
-            result = await self._process_section(state.section_number)
+            # Process section, relaying its text to the game's clients as it is generated
+            watch = (
+                self.narrative_stream.watch(state.game_id, state.section_number)
+                if self.narrative_stream else nullcontext()
+            )
+            with watch:
+                result = await self._process_section(state.section_number)
             if isinstance(result, NarratorError):
                 yield {"narrative": result}
                 return
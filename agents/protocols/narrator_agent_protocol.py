@@ -11,4 +11,14 @@ from agents.protocols.base_agent_protocol import BaseAgentProtocol
 @runtime_checkable
 class NarratorAgentProtocol(BaseAgentProtocol, Protocol):
     """Protocol defining the interface for the Narrator Agent."""
-    pass
+
+    async def generate_section(self, section_number: int) -> Union[NarratorModel, NarratorError]:
+        """Get the narrative of a section, generating and caching it if needed.
+        
+        Args:
+            section_number: Section number to generate
+            
+        Returns:
+            Union[NarratorModel, NarratorError]: Formatted section content or error
+        """
+        ...
@@ -28,6 +28,17 @@ class RulesAgentProtocol(BaseAgentProtocol, Protocol):
         """
         ...
 
+    async def generate_section(self, section_number: int) -> Union[RulesModel, RulesError]:
+        """Get the rules of a section, extracting and caching them if needed.
+        
+        Args:
+            section_number: Section number to generate
+            
+        Returns:
+            Union[RulesModel, RulesError]: Section rules or error
+        """
+        ...
+
     async def ainvoke(self, input_data: Dict) -> AsyncGenerator[Dict, None]:
         """Process game state and update rules.
         
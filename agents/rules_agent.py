@@ -17,6 +17,8 @@ from agents.base_agent import BaseAgent
 from config.agents.rules_agent_config import RulesAgentConfig
 from config.logging_config import get_logger
 from managers.protocols.rules_manager_protocol import RulesManagerProtocol
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+from managers.protocols.single_flight_protocol import SingleFlightProtocol
 from agents.protocols.rules_agent_protocol import RulesAgentProtocol
 from agents.factories.model_factory import ModelFactory
 
@@ -25,14 +27,22 @@ logger = get_logger('rules_agent')
 class RulesAgent(BaseAgent):
     """Agent for analyzing and validating game rules."""
     
-    def __init__(self, config: RulesAgentConfig, rules_manager: RulesManagerProtocol):
+    def __init__(
+        self,
+        config: RulesAgentConfig,
+        rules_manager: RulesManagerProtocol,
+        llm_cache: Optional[LLMCacheManagerProtocol] = None,
+        single_flight: Optional[SingleFlightProtocol] = None
+    ):
         """Initialize the agent with configuration.
         
         Args:
             config: Agent configuration
             rules_manager: Rules manager instance
+            llm_cache: Optional shared LLM response cache
+            single_flight: Optional coalescing of concurrent section generations
         """
-        super().__init__(config=config)
+        super().__init__(config=config, llm_cache=llm_cache, single_flight=single_flight)
         self.rules_manager = rules_manager
         self.logger = logger
 
@@ -43,6 +53,9 @@ class RulesAgent(BaseAgent):
         ) -> Union[RulesModel, RulesError]:
         """Process rules for a game section.
         
+        Concurrent calls for the same section share a single lookup,
+        LLM call and cache write.
+        
         Args:
             section_number: Section number to process
             content: Optional content to process. If not provided, will be fetched from manager.
@@ -50,6 +63,33 @@ class RulesAgent(BaseAgent):
         Returns:
             Union[RulesModel, RulesError]: Processed rules or error
         """
+        return await self._coalesce(
+            "rules",
+            section_number,
+            lambda: self._load_or_extract_rules(section_number, content),
+            self._content_digest(content)
+        )
+
+    async def generate_section(self, section_number: int) -> Union[RulesModel, RulesError]:
+        """Get the rules of a section, extracting and caching them if needed.
+        
+        Used outside of a turn (e.g. prefetch): joins an extraction already
+        running for the same section.
+        
+        Args:
+            section_number: Section number to generate
+            
+        Returns:
+            Union[RulesModel, RulesError]: Section rules or error
+        """
+        return await self._process_section_rules(section_number)
+
+    async def _load_or_extract_rules(
+            self,
+            section_number: int,
+            content: Optional[str] = None
+        ) -> Union[RulesModel, RulesError]:
+        """Get rules from cache, or extract and save them."""
         try:
             logger.debug("Starting process_section_rules for section {}", section_number)
             
@@ -105,6 +145,7 @@ class RulesAgent(BaseAgent):
         Returns:
             RulesModel: Extracted rules including dice requirements, conditions and choices
         """
+        cache_key = None
         try:
             logger.debug(f"Starting LLM extraction for section {section_number}")
             
@@ -113,7 +154,8 @@ class RulesAgent(BaseAgent):
                 HumanMessage(content=f"""Section Number: {section_number} Content: {content}""")
             ]
             
-            response = await self.config.llm.ainvoke(messages)
+            cache_key = self._llm_cache_key(messages)
+            response = await self._ainvoke_llm(messages, cache_key)
             
             try:
                 # Valider que la réponse est du JSON valide
@@ -206,6 +248,7 @@ class RulesAgent(BaseAgent):
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON in LLM response: {e}")
                 logger.error(f"Response content: {response.content}")
+                await self._discard_llm_response(cache_key)
                 return ModelFactory.create_rules_model(
                     section_number=section_number,
                     error=f"Error parsing LLM response: {str(e)}",
@@ -215,6 +258,7 @@ class RulesAgent(BaseAgent):
         except Exception as e:
             logger.error(f"Error extracting rules with LLM: {e}")
             logger.error(f"Section content: {content}")
+            await self._discard_llm_response(cache_key)
             return ModelFactory.create_rules_model(
                 section_number=section_number,
                 error=f"Error in LLM analysis: {str(e)}",
@@ -1,7 +1,9 @@
 """
 Story Graph Agent
 """
-from typing import Dict, Any, Optional, AsyncGenerator, List, Union
+import inspect
+import time
+from typing import Dict, Any, Optional, AsyncGenerator, List, Union, Callable
 from loguru import logger
 from pydantic import BaseModel, Field
 
@@ -28,12 +30,16 @@ from agents.protocols.trace_agent_protocol import TraceAgentProtocol
 
 from managers.protocols.workflow_manager_protocol import WorkflowManagerProtocol
 from managers.protocols.state_manager_protocol import StateManagerProtocol
+from managers.protocols.prefetch_manager_protocol import PrefetchManagerProtocol
 
 from langgraph.graph import StateGraph, END, START
 from langgraph.prebuilt import ToolExecutor
 from langgraph.types import Command, interrupt  
 from langgraph.checkpoint.memory import MemorySaver
-from langgraph.errors import GraphInterrupt
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.errors import GraphInterrupt, GraphBubbleUp
+
+from utils.metrics import GRAPH_NODE_SECONDS, GRAPH_NODE_ERRORS
 
 # Type alias for manager protocols
 ManagerProtocols = Union[
@@ -53,7 +59,9 @@ class StoryGraph(StoryGraphProtocol):
             RulesAgentProtocol,
             DecisionAgentProtocol,
             TraceAgentProtocol
-        ]]] = None
+        ]]] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        prefetcher: Optional[PrefetchManagerProtocol] = None
     ):
         """Initialize StoryGraph.
         
@@ -61,6 +69,8 @@ class StoryGraph(StoryGraphProtocol):
             config: Configuration for the story graph
             managers: Container with all game managers
             agents: Optional container with all game agents
+            checkpointer: Optional shared checkpointer (defaults to an in-memory MemorySaver)
+            prefetcher: Optional prefetcher of the sections reachable from the current one
         """
         # Initialize managers
         self.state_manager: StateManagerProtocol = managers["state_manager"]
@@ -74,7 +84,32 @@ class StoryGraph(StoryGraphProtocol):
             self.trace_agent: TraceAgentProtocol = agents["trace_agent"]
         
         self._graph = None
-        self._memory = None
+        self._memory = checkpointer
+        self._prefetcher = prefetcher
+
+    @staticmethod
+    def _timed_node(name: str, node: Callable) -> Callable:
+        """Wrap a node to record its duration (and errors) in the metrics."""
+        seconds = GRAPH_NODE_SECONDS.labels(name)
+        errors = GRAPH_NODE_ERRORS.labels(name)
+
+        async def timed(state):
+            start = time.perf_counter()
+            try:
+                result = node(state)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except GraphBubbleUp:
+                # Interruption (attente du joueur) : pas une erreur
+                raise
+            except Exception:
+                errors.inc()
+                raise
+            finally:
+                seconds.observe(time.perf_counter() - start)
+
+        return timed
 
     async def _setup_workflow(self) -> None:
         try:
@@ -82,14 +117,14 @@ class StoryGraph(StoryGraphProtocol):
 
             self._graph = StateGraph(GameState, output=GameState)
 
-            # Ajouter les nœuds
-            self._graph.add_node("node_start", self.workflow_manager.start_workflow)
+            # Ajouter les nœuds (durée de chaque nœud mesurée)
+            self._graph.add_node("node_start", self._timed_node("node_start", self.workflow_manager.start_workflow))
 
-            self._graph.add_node("node_narrator", self._process_narrative)
-            self._graph.add_node("node_rules", self._process_rules)
-            self._graph.add_node("node_decision", self._process_decision)
+            self._graph.add_node("node_narrator", self._timed_node("node_narrator", self._process_narrative))
+            self._graph.add_node("node_rules", self._timed_node("node_rules", self._process_rules))
+            self._graph.add_node("node_decision", self._timed_node("node_decision", self._process_decision))
             #self._graph.add_node("node_trace", self._process_trace)  # Ajouté pour la traçabilité
-            self._graph.add_node("node_end", self.workflow_manager.end_workflow)
+            self._graph.add_node("node_end", self._timed_node("node_end", self.workflow_manager.end_workflow))
 
             # Ajouter les connexions
             self._graph.add_edge(START, "node_start")
@@ -102,7 +137,7 @@ class StoryGraph(StoryGraphProtocol):
             
             # Ajouter une connexion conditionnelle basée sur `should_continue`
             def should_continue_condition(state):
-                logger.debug("Condition state details: {}", state.model_dump())
+                logger.opt(lazy=True).trace("Condition state details: {}", lambda: state.model_dump())
                 logger.info("[WORKFLOW] Evaluating should_continue={} for section {}", 
                           state.should_continue, state.section_number)
                 return state.should_continue
@@ -122,6 +157,30 @@ class StoryGraph(StoryGraphProtocol):
             logger.exception("Error setting up workflow: {}", str(e))
             raise
 
+    def _record_transition(self, state: GameState) -> None:
+        """Tell the prefetcher which section the game entered."""
+        if not self._prefetcher:
+            return
+        try:
+            self._prefetcher.record_transition(state.game_id, state.section_number)
+        except Exception as e:
+            logger.warning("Error recording prefetch transition: {}", str(e))
+
+    def _prefetch_next_sections(self, state: GameState, rules: RulesModel) -> None:
+        """Queue the background generation of the sections reachable from the rules."""
+        if not self._prefetcher:
+            return
+        targets = []
+        for choice in rules.choices:
+            if choice.target_section:
+                targets.append(choice.target_section)
+            targets.extend(choice.dice_results.values())
+        try:
+            self._prefetcher.schedule(state.game_id, targets)
+        except Exception as e:
+            # Le préchargement est un bonus : il ne doit jamais faire échouer le tour
+            logger.warning("Error scheduling prefetch: {}", str(e))
+
     async def _process_rules(self, input_data: GameState) -> GameState:
         """Process game rules for the current state."""
         try:
@@ -130,6 +189,8 @@ class StoryGraph(StoryGraphProtocol):
             if not input_data:
                 raise GameError("No input data available for rules processing")
 
+            self._record_transition(input_data)
+
             if not self.rules_agent:
                 logger.debug("No rules agent available, returning input state")
                 return input_data
@@ -143,6 +204,7 @@ class StoryGraph(StoryGraphProtocol):
                         
                     logger.debug("Received rules from agent: {}", rules_result)
                     output = input_data.with_node_updates('node_rules', rules=rules_result)
+                    self._prefetch_next_sections(input_data, rules_result)
                     return output
                     
             raise GameError("No valid rules result")
@@ -326,7 +388,8 @@ class StoryGraph(StoryGraphProtocol):
         Returns:
             Any: Compiled workflow graph ready for execution
         """
-        self._memory = MemorySaver()
+        if self._memory is None:
+            self._memory = MemorySaver()
         if not self._graph:
             await self._setup_workflow()
         return self._graph.compile(checkpointer=self._memory)
@@ -20,7 +20,7 @@ from fastapi.openapi.utils import get_openapi
 from config.storage_config import StorageConfig
 from config.game_config import GameConfig
 from config.logging_config import get_logger
-from managers.dependencies import get_agent_manager
+from managers.dependencies import get_session_manager, get_game_factory
 from api.routes.rest import api_router_rest
 from api.routes.ws import api_router_ws
 
@@ -52,13 +52,17 @@ def get_storage_config() -> StorageConfig:
 async def shutdown_event():
     """Cleanup API components."""
     try:
-        # Get agent manager
-        agent_mgr = get_agent_manager()
-        
-        # Cleanup agent manager
-        if agent_mgr:
-            logger.debug("Cleaning up AgentManager")
-            await agent_mgr.stop_game()
+        # Sauvegarder et fermer toutes les parties en mémoire
+        logger.debug("Closing live game sessions")
+        await get_session_manager().shutdown()
+        await get_game_factory().get_prefetcher().close()
+        await get_game_factory().get_llm_cache().close()
+        await get_game_factory().get_decision_index().close()
+        get_game_factory().get_section_corpus().close()
+        # Écrire les derniers checkpoints des parties
+        checkpointer = get_game_factory().get_checkpointer()
+        if hasattr(checkpointer, "close"):
+            await checkpointer.close()
         
         logger.info("API shutdown successfully")
     except Exception as e:
@@ -70,6 +74,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan."""
     # Startup
     logger.info("Starting up...")
+    # Charger l'artefact précompilé, le corpus, le graphe des sections et l'index des décisions
+    get_game_factory().get_section_store()
+    get_game_factory().get_section_corpus()
+    get_game_factory().get_section_graph()
+    get_game_factory().get_decision_index()
+    await get_session_manager().start()
     yield
     # Shutdown
     logger.info("Shutting down...")
@@ -0,0 +1,88 @@
+"""
+REST endpoints for authors (sections and knowledge graph).
+"""
+from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, HTTPException, status
+from loguru import logger
+from managers.dependencies import get_author_manager, get_section_graph
+from managers.protocols.author_manager_protocol import AuthorManagerProtocol
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+
+author_router_rest = APIRouter(prefix="/api/author", tags=["author"])
+
+@author_router_rest.get("/sections")
+async def get_sections(
+    author_manager: AuthorManagerProtocol = Depends(get_author_manager)
+) -> List[Dict[str, Any]]:
+    """
+    List game sections with their metadata.
+    """
+    return await author_manager.get_sections()
+
+@author_router_rest.get("/graph")
+async def get_knowledge_graph(
+    author_manager: AuthorManagerProtocol = Depends(get_author_manager)
+) -> Dict[str, Any]:
+    """
+    Get the knowledge graph (sections and [[n]] links).
+    """
+    return await author_manager.get_knowledge_graph()
+
+@author_router_rest.get("/graph/report")
+async def get_graph_report(
+    author_manager: AuthorManagerProtocol = Depends(get_author_manager)
+) -> Dict[str, Any]:
+    """
+    Get dead ends, orphans, unreachable sections and broken links.
+    """
+    return await author_manager.get_graph_report()
+
+@author_router_rest.get("/graph/sections/{section_number}")
+async def get_section_links(
+    section_number: int,
+    section_graph: SectionGraphProtocol = Depends(get_section_graph)
+) -> Dict[str, Any]:
+    """
+    Get the incoming and outgoing links of a section.
+    
+    Args:
+        section_number (int): Section number
+    """
+    if not section_graph.has_section(section_number):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Section {section_number} not found"
+        )
+    return {
+        "section_number": section_number,
+        "successors": list(section_graph.successors(section_number)),
+        "predecessors": list(section_graph.predecessors(section_number))
+    }
+
+@author_router_rest.get("/graph/path")
+async def get_shortest_path(
+    source: int,
+    target: int,
+    section_graph: SectionGraphProtocol = Depends(get_section_graph)
+) -> Dict[str, Any]:
+    """
+    Get the shortest path between two sections.
+    
+    Args:
+        source (int): Start section
+        target (int): Target section
+    """
+    for section_number in (source, target):
+        if not section_graph.has_section(section_number):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Section {section_number} not found"
+            )
+    path = section_graph.shortest_path(source, target)
+    logger.debug("Shortest path {} -> {}: {}", source, target, path)
+    return {
+        "source": source,
+        "target": target,
+        "reachable": path is not None,
+        "path": path or []
+    }
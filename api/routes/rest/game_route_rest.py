@@ -4,8 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from loguru import logger
 
 from managers.agent_manager import AgentManager
-from managers.dependencies import get_agent_manager
-from api.utils.serialization_utils import from_game_state
+from managers.dependencies import get_agent_manager, get_session_manager
+from managers.protocols.session_manager_protocol import SessionManagerProtocol
+from models.errors_model import SessionError
+from api.utils.serialization_utils import from_game_state, game_state_response
 
 from api.dto.request_dto import GameInitRequest
 from api.dto.response_dto import GameResponse
@@ -16,33 +18,38 @@ game_router_rest = APIRouter(prefix="/api/game", tags=["game"])
 @game_router_rest.post("/initialize")
 async def initialize_game(
     init_request: GameInitRequest,
-    agent_mgr: AgentManager = Depends(get_agent_manager)
+    session_mgr: SessionManagerProtocol = Depends(get_session_manager)
 ) -> GameResponse:
     """
     Initialize a new game session.
 
     Args:
         init_request: Optional initialization parameters
-        agent_mgr: Agent manager instance
+        session_mgr: Session registry
 
     Returns:
         GameResponse: Initialized game state and metadata
     """
     try:
+        # Chaque partie a ses propres managers (état, trace, personnage)
+        try:
+            session = await session_mgr.create_session(getattr(init_request, 'game_id', None))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except SessionError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+        
         # Extraire les paramètres de init_request si présents
-        game_state = await agent_mgr.initialize_game(
-            session_id=getattr(init_request, 'session_id', None),
-            game_id=getattr(init_request, 'game_id', None),
-            section_number=getattr(init_request, 'section_number', None)
-        )
+        async with session.lock:
+            game_state = await session.agent_manager.initialize_game(
+                session_id=getattr(init_request, 'session_id', None),
+                game_id=session.game_id,
+                section_number=getattr(init_request, 'section_number', None)
+            )
         
-        state_dict = from_game_state(game_state)
-        return GameResponse(
-            success=True,
-            game_id=state_dict["game_id"],
-            state=state_dict,
-            message="Game initialized successfully"
-        )
+        return game_state_response(game_state, message="Game initialized successfully")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to initialize game: {e}")
         raise HTTPException(
@@ -53,17 +60,24 @@ async def initialize_game(
 
 @game_router_rest.post("/stop")
 async def stop_game(
-    agent_mgr: AgentManager = Depends(get_agent_manager)
+    game_id: str,
+    session_mgr: SessionManagerProtocol = Depends(get_session_manager)
 ):
     """
-    Stop the current game session and cleanup resources.
+    Stop a game session and release its resources.
     """
     try:
-        await agent_mgr.stop_game()
+        if not await session_mgr.close_session(game_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game session not found"
+            )
         return {
             "success": True,
             "message": "Game stopped successfully"
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to stop game: {e}")
         raise HTTPException(
@@ -75,7 +89,7 @@ async def stop_game(
 @game_router_rest.get("/state")
 async def get_game_state(
     game_id: Optional[str] = None,
-    agent_mgr: AgentManager = Depends(get_agent_manager)
+    session_mgr: SessionManagerProtocol = Depends(get_session_manager)
 ) -> GameResponse:
     """
     Get current game state.
@@ -86,17 +100,20 @@ async def get_game_state(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="game_id is required"
             )
-        game_state = await agent_mgr.get_state()
+        # Pas de session construite pour un game_id inconnu
+        session = await session_mgr.restore_session(game_id)
+        if session is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game session not found"
+            )
+        game_state = await session.agent_manager.get_state()
         if not game_state:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Game state not found"
             )
-        state_dict = from_game_state(game_state)
-        return GameResponse(
-            game_id=state_dict["game_id"],  # game_id est toujours présent
-            state=state_dict
-        )
+        return game_state_response(game_state)
     except HTTPException:
         raise
     except Exception as e:
@@ -127,18 +144,22 @@ async def get_feedback(
 
 @game_router_rest.post("/reset")
 async def reset_game(
-    agent_mgr: AgentManager = Depends(get_agent_manager)
+    game_id: str,
+    session_mgr: SessionManagerProtocol = Depends(get_session_manager)
 ):
     """
     Reset the game state and clear all data.
     """
     try:
-        # Arrêter le jeu en cours
-        await agent_mgr.stop_game()
-        
-        # Nettoyer l'état
-        if agent_mgr.managers.state_manager:
-            await agent_mgr.managers.state_manager.clear_state()
+        # Une partie évincée est rechargée pour effacer aussi ses fichiers
+        session = await session_mgr.restore_session(game_id)
+        if session:
+            try:
+                # Effacer les états sauvegardés avant de libérer la session
+                async with session.lock:
+                    await session.agent_manager.managers['state_manager'].clear_state()
+            finally:
+                await session_mgr.close_session(game_id)
             
         return {
             "success": True,
@@ -1,13 +1,20 @@
 """
 Health check endpoints.
 """
-from typing import Optional
+from typing import Optional, Dict, Any
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
 from loguru import logger
 from api.dto.response_dto import HealthResponse
+from managers.dependencies import get_session_manager, get_game_factory
+from managers.protocols.session_manager_protocol import SessionManagerProtocol
+from api.routes.ws.game_route_ws import ws_manager
+from utils.metrics import REGISTRY, CONTENT_TYPE
 
 health_router_rest = APIRouter(prefix="/api", tags=["health"])
+# Chemin attendu par défaut par Prometheus, hors du préfixe /api
+metrics_router_rest = APIRouter(tags=["health"])
 
 @health_router_rest.get("/health")
 async def health_check(check_type: Optional[str] = None) -> HealthResponse:
@@ -37,3 +44,65 @@ async def health_check(check_type: Optional[str] = None) -> HealthResponse:
         version=version,
         type=check_type
     )
+
+@health_router_rest.get("/health/sessions")
+async def sessions_health(
+    session_mgr: SessionManagerProtocol = Depends(get_session_manager)
+) -> Dict[str, Any]:
+    """
+    Live game sessions statistics.
+    
+    Returns:
+        Dict[str, Any]: Active session counts and eviction counters
+    """
+    return {
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        **session_mgr.get_stats()
+    }
+
+@health_router_rest.get("/health/generation")
+async def generation_health() -> Dict[str, Any]:
+    """
+    Section generation statistics.
+    
+    Returns:
+        Dict[str, Any]: LLM cache counters, coalesced generations
+            (per-key wait times of concurrent misses), prefetch hit rate and
+            narrative streaming counters
+    """
+    factory = get_game_factory()
+    return {
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        "llm_cache": factory.get_llm_cache().get_stats(),
+        "single_flight": factory.get_single_flight().get_stats(),
+        "prefetch": factory.get_prefetcher().get_stats(),
+        "narrative_stream": factory.get_narrative_stream().get_stats()
+    }
+
+@health_router_rest.get("/health/websocket")
+async def websocket_health() -> Dict[str, Any]:
+    """
+    WebSocket rooms statistics.
+    
+    Returns:
+        Dict[str, Any]: Connection and room counts, outbound queue depths
+            and slow consumer counters
+    """
+    return {
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        **ws_manager.get_stats()
+    }
+
+@metrics_router_rest.get("/metrics")
+async def metrics() -> Response:
+    """
+    Process metrics in the Prometheus text format.
+    
+    Returns:
+        Response: Latency histograms of the graph nodes, LLM calls, file
+            and WebSocket I/O; cache lookups; active sessions and connections
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -1,62 +1,315 @@
 """
 WebSocket endpoints for game state management.
 """
-from fastapi import WebSocket, WebSocketDisconnect, Depends, status
+from fastapi import WebSocket, WebSocketDisconnect, status
 from fastapi.routing import APIRouter
 from starlette.websockets import WebSocketState
-from managers.agent_manager import AgentManager
-from managers.dependencies import get_agent_manager
-from api.utils.serialization_utils import from_game_state, _json_serial
-import json
+from typing import Any, Dict, List, Optional, Set, Union
+from collections import defaultdict
+from dataclasses import dataclass
+import asyncio
+import time
+from managers.dependencies import get_game_factory, get_session_manager
+from managers.session_manager import GameSession
+from api.utils.serialization_utils import from_state_update, _json_serial
+from api.utils.state_delta_utils import (
+    StateVersions,
+    make_state_patch,
+    patch_message,
+    snapshot_message
+)
+from pydantic import BaseModel
 from loguru import logger
+from utils import json_codec
+from utils.metrics import WEBSOCKET_CONNECTIONS, WEBSOCKET_SEND_SECONDS
 from api.dto.request_dto import ChoiceRequest
+from config.managers.websocket_config import WebSocketConfig
 
 game_router_ws = APIRouter()  # Enlever le préfixe /api pour les WebSockets
 
+@dataclass(eq=False)
+class WSConnection:
+    """A client connection and its outbound queue."""
+    websocket: WebSocket
+    game_id: Optional[str]
+    queue: asyncio.Queue
+    writer: Optional[asyncio.Task] = None
+    dropped: int = 0
+    # Trames binaires (send_bytes) plutôt que texte
+    binary: bool = False
+    # Protocole delta : états versionnés, patchs depuis la dernière version acquittée
+    delta: bool = False
+    acked_version: Optional[int] = None
+
+
 # WebSocket connection manager
 class GameWSConnectionManager:
-    def __init__(self):
-        self.active_connections: list[WebSocket] = []
+    """Per-game rooms of WebSocket clients.
+
+    Un message diffusé est encodé une seule fois puis déposé dans la file
+    bornée de chaque client de la salle ; une tâche par client l'envoie.
+    Un client lent ne retarde donc que lui-même : quand sa file est pleine,
+    son plus ancien message est abandonné, ou il est déconnecté, selon
+    ``slow_consumer_policy``.
+
+    Les messages sont encodés en octets (``utils.json_codec``) ; les clients
+    ``binary`` les reçoivent tels quels (``send_bytes``), les autres en texte,
+    décodé lui aussi une seule fois par message.
+
+    Les clients en mode delta reçoivent les états sous forme d'instantanés
+    versionnés puis de patchs JSON (voir ``api.utils.state_delta_utils``).
+    """
 
-    async def connect(self, websocket: WebSocket):
+    def __init__(self, config: Optional[WebSocketConfig] = None):
+        self.config = config or WebSocketConfig()
+        self._connections: Dict[WebSocket, WSConnection] = {}
+        self._rooms: Dict[Optional[str], Set[WSConnection]] = defaultdict(set)
+        self._closing: Set[asyncio.Task] = set()
+        self._states: Dict[str, StateVersions] = {}
+        self._broadcasts = 0
+        self._sent = 0
+        self._dropped = 0
+        self._slow_disconnects = 0
+        self._snapshots = 0
+        self._patches = 0
+        self._state_bytes = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        """Connected clients, all games together."""
+        return list(self._connections)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        game_id: Optional[str] = None,
+        delta: bool = False,
+        binary: bool = False
+    ):
         """Connect and initialize a WebSocket connection."""
         try:
             await websocket.accept()
-            self.active_connections.append(websocket)
-            return True
         except Exception as e:
             logger.error(f"Error accepting WebSocket connection: {e}")
             return False
+        connection = WSConnection(
+            websocket=websocket,
+            game_id=game_id,
+            queue=asyncio.Queue(maxsize=self.config.queue_size),
+            delta=delta,
+            binary=binary
+        )
+        connection.writer = asyncio.create_task(self._write(connection))
+        self._connections[websocket] = connection
+        self._rooms[game_id].add(connection)
+        return True
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        connection = self._connections.pop(websocket, None)
+        if connection is None:
+            return
+        room = self._rooms.get(connection.game_id)
+        if room is not None:
+            room.discard(connection)
+            if not room:
+                del self._rooms[connection.game_id]
+                self._states.pop(connection.game_id, None)
+        if connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        for connection in self.active_connections:
+    async def _write(self, connection: WSConnection) -> None:
+        """Send the queued messages of one client."""
+        while True:
+            payload = await connection.queue.get()
+            if isinstance(payload, bytes):
+                send = connection.websocket.send_bytes(payload)
+            else:
+                send = connection.websocket.send_text(payload)
+            start = time.perf_counter()
             try:
-                await connection.send_text(json.dumps(message, default=_json_serial))
+                await asyncio.wait_for(send, timeout=self.config.send_timeout_seconds)
+                WEBSOCKET_SEND_SECONDS.observe(time.perf_counter() - start)
+                self._sent += 1
             except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                await self.handle_error(connection)
+                logger.error(f"Error sending to client: {e!r}")
+                await self.handle_error(connection.websocket)
+                return
 
-    async def handle_error(self, websocket: WebSocket):
-        """Handle WebSocket errors."""
+    def _enqueue(self, connection: WSConnection, payload: Union[bytes, str]) -> None:
+        """Queue an encoded message, applying the slow consumer policy."""
+        try:
+            connection.queue.put_nowait(payload)
+            return
+        except asyncio.QueueFull:
+            connection.dropped += 1
+            self._dropped += 1
+
+        if self.config.slow_consumer_policy == "disconnect":
+            logger.warning(f"Disconnecting slow WebSocket client of game {connection.game_id}")
+            self._slow_disconnects += 1
+            self.disconnect(connection.websocket)
+            task = asyncio.create_task(self._close(connection.websocket, status.WS_1013_TRY_AGAIN_LATER))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            return
+        connection.queue.get_nowait()
+        connection.queue.put_nowait(payload)
+
+    def _fanout(self, targets: List[WSConnection], data: bytes) -> None:
+        """Queue one encoded message for several clients."""
+        text = None
+        for connection in targets:
+            if connection.binary:
+                self._enqueue(connection, data)
+                continue
+            if text is None:
+                text = data.decode()
+            self._enqueue(connection, text)
+
+    async def _close(self, websocket: WebSocket, code: int) -> None:
         try:
             if websocket.client_state != WebSocketState.DISCONNECTED:
-                await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+                await websocket.close(code=code)
         except Exception as e:
             logger.error(f"Error closing WebSocket: {e}")
+
+    async def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for one client."""
+        connection = self._connections.get(websocket)
+        if connection is not None:
+            self._fanout([connection], json_codec.dumps(message))
+
+    async def broadcast(self, message: dict, game_id: Optional[str] = None):
+        """Broadcast message to the clients of a game (all clients if no game_id)."""
+        if game_id:
+            targets = list(self._rooms.get(game_id, ()))
+        else:
+            targets = list(self._connections.values())
+        if not targets:
+            return
+        # Encodé une fois pour toute la salle
+        self._broadcasts += 1
+        self._fanout(targets, json_codec.dumps(message))
+
+    async def broadcast_state(self, state: Union[BaseModel, dict], game_id: str):
+        """Broadcast a game state to the clients of a game.
+
+        Full dump for the other clients; snapshot or patch for delta clients.
+        """
+        await self._publish_state(game_id, state, list(self._rooms.get(game_id, ())))
+
+    async def send_state(self, websocket: WebSocket, state: Union[BaseModel, dict]):
+        """Send a game state to one client."""
+        connection = self._connections.get(websocket)
+        if connection is not None:
+            await self._publish_state(connection.game_id, state, [connection])
+
+    async def _publish_state(self, game_id: Optional[str], state: Union[BaseModel, dict], targets: List[WSConnection]):
+        if not targets:
+            return
+        # Un GameState est encodé une fois par version (mémorisé par json_codec)
+        data = json_codec.encode_state(state) if isinstance(state, BaseModel) else json_codec.dumps(state)
+        legacy = [connection for connection in targets if not connection.delta]
+        if legacy:
+            self._fanout(legacy, data)
+
+        deltas = [connection for connection in targets if connection.delta]
+        if not deltas:
+            return
+        versions = self._states.get(game_id)
+        if versions is None:
+            versions = self._states[game_id] = StateVersions(self.config.state_history)
+        document = json_codec.loads(data)
+        version = versions.add(document)
+
+        # Un message encodé par version de base (None : instantané complet)
+        groups: Dict[Optional[int], List[WSConnection]] = defaultdict(list)
+        for connection in deltas:
+            base = connection.acked_version
+            groups[base if versions.get(base) is not None else None].append(connection)
+        for base, connections in groups.items():
+            if base is None:
+                message = snapshot_message(version, document)
+                self._snapshots += 1
+            else:
+                message = patch_message(base, version, make_state_patch(versions.get(base), document))
+                self._patches += 1
+            encoded = json_codec.dumps(message)
+            self._state_bytes += len(encoded)
+            self._fanout(connections, encoded)
+
+    async def ack(self, websocket: WebSocket, version: Optional[int]):
+        """Record the state version a delta client has applied.
+
+        An unknown version (too old, or from another server) triggers a resync.
+        """
+        connection = self._connections.get(websocket)
+        if connection is None:
+            return
+        versions = self._states.get(connection.game_id)
+        if versions is not None and versions.get(version) is not None:
+            connection.acked_version = version
+            return
+        await self.resync(websocket)
+
+    async def resync(self, websocket: WebSocket):
+        """Send the latest state of the game as a full snapshot."""
+        connection = self._connections.get(websocket)
+        if connection is None:
+            return
+        connection.acked_version = None
+        versions = self._states.get(connection.game_id)
+        latest = versions.latest if versions is not None else None
+        if latest is None:
+            return
+        encoded = json_codec.dumps(snapshot_message(*latest))
+        self._snapshots += 1
+        self._state_bytes += len(encoded)
+        self._fanout([connection], encoded)
+
+    async def handle_error(self, websocket: WebSocket):
+        """Handle WebSocket errors."""
+        try:
+            await self._close(websocket, status.WS_1011_INTERNAL_ERROR)
         finally:
             self.disconnect(websocket)
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection counts and queue depths."""
+        depths = [connection.queue.qsize() for connection in self._connections.values()]
+        return {
+            "connections": len(self._connections),
+            "rooms": sum(1 for game_id in self._rooms if game_id),
+            "max_room_size": max((len(room) for room in self._rooms.values()), default=0),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "queue_size": self.config.queue_size,
+            "broadcasts": self._broadcasts,
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "slow_disconnects": self._slow_disconnects,
+            "delta_connections": sum(1 for connection in self._connections.values() if connection.delta),
+            "state_snapshots": self._snapshots,
+            "state_patches": self._patches,
+            "state_bytes": self._state_bytes
+        }
+
 ws_manager = GameWSConnectionManager()
+WEBSOCKET_CONNECTIONS.set_function(lambda: len(ws_manager.active_connections))
+
+
+async def forward_narrative(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """Send the narrative deltas of a game as they are generated."""
+    while True:
+        message = await queue.get()
+        await ws_manager.send(websocket, message)
 
 @game_router_ws.websocket("/ws/game")
 async def game_websocket_endpoint(
     websocket: WebSocket,
-    agent_mgr: AgentManager = Depends(get_agent_manager)
+    game_id: Optional[str] = None,
+    protocol: Optional[str] = None,
+    encoding: Optional[str] = None
 ):
     """
     WebSocket endpoint for real-time game state updates.
@@ -65,15 +318,49 @@ async def game_websocket_endpoint(
     - Connection management
     - Real-time state updates
     - Game events broadcasting
+    - Narrative streaming (narrative_delta messages while a section is generated)
+    - Progressive updates (node_update message as each workflow node completes)
     - Heartbeat (ping/pong)
+    
+    With ``?protocol=delta``, states are sent as versioned ``state_snapshot``
+    then ``state_patch`` (RFC 6902) messages; the client acknowledges each
+    applied version with ``{"type": "ack", "version": n}`` and requests a
+    full snapshot with ``{"type": "resync"}`` on a version mismatch.
+    
+    With ``?encoding=binary``, messages are sent as binary frames holding
+    the UTF-8 JSON document (no text decoding on either side).
+    
+    ``?game_id=`` is required: the game must be live or have a saved state
+    (created by POST /api/game/initialize). Otherwise the connection is
+    closed with code 1008.
     """
-    logger.info("New WebSocket connection attempt")
+    logger.info("New WebSocket connection attempt for game {}", game_id)
+    # Jamais de nouvelle partie ici : seulement la partie créée par REST
+    session: Optional[GameSession] = None
+    if game_id:
+        session = await get_session_manager().restore_session(game_id)
+    if session is None:
+        logger.warning("WebSocket refused: unknown game {}", game_id)
+        await websocket.accept()
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Unknown game_id")
+        return
+    agent_mgr = session.agent_manager
     
     # Étape 1: Accepter la connexion
-    if not await ws_manager.connect(websocket):
+    if not await ws_manager.connect(
+        websocket,
+        session.game_id,
+        delta=protocol == "delta",
+        binary=encoding == "binary"
+    ):
         logger.error("Failed to establish WebSocket connection")
         return
     
+    # Le texte du narrateur arrive pendant le tour (messages narrative_delta)
+    narrative_stream = get_game_factory().get_narrative_stream()
+    narrative_queue = narrative_stream.subscribe(session.game_id)
+    narrative_task = asyncio.create_task(forward_narrative(websocket, narrative_queue))
+    
     try:
         logger.info("WebSocket connection established")
         
@@ -81,13 +368,10 @@ async def game_websocket_endpoint(
         try:
             initial_state = await agent_mgr.get_state()
             if initial_state:
-                state_dict = from_game_state(initial_state)
-                await websocket.send_text(
-                    json.dumps(state_dict, default=_json_serial)
-                )
+                await ws_manager.send_state(websocket, initial_state)
         except Exception as e:
             logger.error(f"Error sending initial state: {e}")
-            await websocket.send_json({
+            await ws_manager.send(websocket, {
                 "error": str(e),
                 "status": "error"
             })
@@ -101,20 +385,25 @@ async def game_websocket_endpoint(
                 
                 # Gérer les pings
                 if data.get("type") == "ping":
-                    await websocket.send_json({
+                    await ws_manager.send(websocket, {
                         "type": "pong",
                         "timestamp": _json_serial(data.get("timestamp"))
                     })
                     continue
                 
+                # Protocole delta : version appliquée par le client, ou demande d'instantané
+                if data.get("type") == "ack":
+                    await ws_manager.ack(websocket, data.get("version"))
+                    continue
+                if data.get("type") == "resync":
+                    await ws_manager.resync(websocket)
+                    continue
+                
                 # Traiter les messages du client
                 if data.get("type") == "get_state":
                     current_state = await agent_mgr.get_state()
                     if current_state:
-                        state_dict = from_game_state(current_state)
-                        await websocket.send_text(
-                            json.dumps(state_dict, default=_json_serial)
-                        )
+                        await ws_manager.send_state(websocket, current_state)
                 
                 elif data.get("type") == "choice":
                     logger.info("Processing user choice")
@@ -123,6 +412,8 @@ async def game_websocket_endpoint(
                         logger.debug(f"Received choice data: {data}")
                         if not choice_data:
                             raise ValueError("No choice provided")
+                        if choice_data.get("game_id") and choice_data["game_id"] != session.game_id:
+                            raise ValueError(f"Choice for game {choice_data['game_id']} sent on game {session.game_id}")
                             
                         # Valider le choix avec le DTO
                         choice_request = ChoiceRequest(
@@ -132,23 +423,32 @@ async def game_websocket_endpoint(
                             metadata=choice_data.get("metadata", {})
                         )
                         
-                        # Process le choix avec process_game_state
+                        # Process le choix : chaque nœud terminé est diffusé aussitôt
                         logger.info(f"Processing choice: {choice_request}")
-                        new_state = await agent_mgr.process_game_state(
-                            user_input=choice_request.choice_text
-                        )
+                        session.touch()
+                        new_state = None
+                        async with session.lock:
+                            async for event in agent_mgr.stream_game_state(
+                                user_input=choice_request.choice_text
+                            ):
+                                if event["node"] is None:
+                                    new_state = event["state"]
+                                else:
+                                    await ws_manager.broadcast(
+                                        from_state_update(event["node"], event["update"]),
+                                        session.game_id
+                                    )
                         
                         if new_state:
-                            # Broadcast le nouvel état à tous les clients
+                            # Broadcast le nouvel état aux clients de la partie
                             logger.info("Broadcasting new state after choice")
-                            state_dict = from_game_state(new_state)
-                            await ws_manager.broadcast(state_dict)
+                            await ws_manager.broadcast_state(new_state, session.game_id)
                         else:
                             raise ValueError("No state returned after processing choice")
                             
                     except Exception as e:
                         logger.error(f"Error processing choice: {e}")
-                        await websocket.send_json({
+                        await ws_manager.send(websocket, {
                             "error": str(e),
                             "status": "error",
                             "type": "choice_error"
@@ -159,7 +459,7 @@ async def game_websocket_endpoint(
                 break
             except Exception as e:
                 logger.error(f"Error handling WebSocket message: {e}")
-                await websocket.send_json({
+                await ws_manager.send(websocket, {
                     "error": str(e),
                     "status": "error"
                 })
@@ -168,5 +468,7 @@ async def game_websocket_endpoint(
         logger.error(f"WebSocket error: {e}")
         await ws_manager.handle_error(websocket)
     finally:
+        narrative_stream.unsubscribe(session.game_id, narrative_queue)
+        narrative_task.cancel()
         ws_manager.disconnect(websocket)
         logger.info("WebSocket connection closed")
@@ -1,9 +1,13 @@
 """
 Utilities for serializing game state and other objects.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
+from fastapi.responses import Response
+from pydantic import BaseModel
 from models.game_state import GameState
+from api.dto.response_dto import GameResponse
+from utils.json_codec import encode_state
 
 def _json_serial(obj: Any) -> Any:
     """JSON serializer for objects not serializable by default json code"""
@@ -11,6 +15,19 @@ def _json_serial(obj: Any) -> Any:
         return obj.isoformat()
     return str(obj)
 
+def from_state_update(node: str, update: Any) -> Dict[str, Any]:
+    """
+    Convert the update of a workflow node to a serializable message.
+    """
+    if isinstance(update, BaseModel):
+        update = update.model_dump()
+    elif isinstance(update, dict):
+        update = {
+            key: value.model_dump() if isinstance(value, BaseModel) else value
+            for key, value in update.items()
+        }
+    return {"type": "node_update", "node": node, "update": update}
+
 def from_game_state(state: GameState) -> Dict[str, Any]:
     """
     Convert a GameState to a serializable dictionary.
@@ -38,3 +55,14 @@ def from_game_state(state: GameState) -> Dict[str, Any]:
                 k: _json_serial(v) for k, v in state.state.items() if k != "state"
             }
         }
+
+def game_state_response(state: GameState, message: Optional[str] = None) -> Response:
+    """
+    Build the JSON response of a GameResponse around the encoded state.
+    
+    L'état est inséré tel qu'encodé par encode_state : il n'est ni
+    re-sérialisé ni revalidé par FastAPI.
+    """
+    envelope = GameResponse(game_id=state.game_id, message=message, state={}).model_dump_json(exclude={"state"})
+    content = b"".join((envelope[:-1].encode(), b',"state":', encode_state(state), b"}"))
+    return Response(content=content, media_type="application/json")
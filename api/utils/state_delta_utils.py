@@ -0,0 +1,75 @@
+"""
+Versioned game states and JSON-patch deltas for the WebSocket protocol.
+
+En mode ``delta``, chaque état diffusé reçoit un numéro de version par
+partie. Un client reçoit un instantané complet (``state_snapshot``) puis,
+une fois la version acquittée, des différences RFC 6902 (``state_patch``)
+calculées par rapport à la dernière version qu'il a acquittée. La taille
+d'un tour ne dépend alors plus de la longueur de l'historique.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import jsonpatch
+
+from utils.json_codec import dumps, loads
+
+STATE_SNAPSHOT = "state_snapshot"
+STATE_PATCH = "state_patch"
+
+
+def to_json_document(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a serialized state to plain JSON values (as the client sees it)."""
+    return loads(dumps(data))
+
+
+def make_state_patch(base: Dict[str, Any], target: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Compute the RFC 6902 operations turning ``base`` into ``target``."""
+    return jsonpatch.make_patch(base, target).patch
+
+
+def snapshot_message(version: int, document: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": STATE_SNAPSHOT, "version": version, "state": document}
+
+
+def patch_message(base_version: int, version: int, patch: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"type": STATE_PATCH, "base_version": base_version, "version": version, "patch": patch}
+
+
+class StateVersions:
+    """Recent serialized states of one game, by version."""
+
+    def __init__(self, max_versions: int):
+        """Initialize the history.
+
+        Args:
+            max_versions: Number of versions kept as patch bases
+        """
+        self.max_versions = max_versions
+        self._documents: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._last_version = 0
+
+    @property
+    def latest(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Latest version and its document."""
+        if not self._documents:
+            return None
+        version = next(reversed(self._documents))
+        return version, self._documents[version]
+
+    def add(self, document: Dict[str, Any]) -> int:
+        """Record a state, returning its version (unchanged if identical to the latest)."""
+        latest = self.latest
+        if latest is not None and latest[1] == document:
+            return latest[0]
+        self._last_version += 1
+        self._documents[self._last_version] = document
+        while len(self._documents) > self.max_versions:
+            self._documents.popitem(last=False)
+        return self._last_version
+
+    def get(self, version: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Get the document of a version still in the history."""
+        if version is None:
+            return None
+        return self._documents.get(version)
@@ -0,0 +1,89 @@
+"""
+Benchmark of GameState.with_updates as the trace history grows.
+
+Compare la copie complète historique (model_dump + revalidation) à la copie
+structurelle actuelle, pour un tour de jeu (règles, narration, décision).
+
+Usage:
+    python -m benchmarks.bench_game_state [--turns 200]
+"""
+import argparse
+import time
+import tracemalloc
+
+from models.game_state import GameState
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+from models.decision_model import DecisionModel
+from models.trace_model import TraceModel, TraceAction, ActionType
+
+HISTORY_SIZES = (10, 100, 1000, 5000)
+
+
+def legacy_with_updates(state: GameState, **updates) -> GameState:
+    """Full copy, as done before copy-on-write updates."""
+    state_dict = state.model_dump(exclude_none=False, by_alias=True, exclude_unset=True)
+    state_dict.update(updates)
+    state_dict["session_id"] = state.session_id
+    state_dict["game_id"] = state.game_id
+    return GameState(**state_dict)
+
+
+def make_state(history_size: int) -> GameState:
+    history = [
+        TraceAction(section=1, action_type=ActionType.USER_INPUT, details={"input": f"choix {i}"})
+        for i in range(history_size)
+    ]
+    return GameState(
+        session_id="bench_session",
+        game_id="bench_game",
+        section_number=1,
+        narrative=NarratorModel(section_number=1, content="Il fait nuit. " * 50),
+        rules=RulesModel(section_number=1),
+        trace=TraceModel(game_id="bench_game", session_id="bench_session", section_number=1, history=history)
+    )
+
+
+def play_turn(state: GameState, update) -> GameState:
+    """Updates made by the story graph nodes during one turn."""
+    state = update(state, rules=RulesModel(section_number=1))
+    state = update(state, narrative=NarratorModel(section_number=1, content="Le jour se lève."))
+    state = update(state, decision=DecisionModel(section_number=1, next_section=2))
+    return update(state, should_continue=True)
+
+
+def measure(state: GameState, update, turns: int):
+    """Return (µs per turn, peak KiB allocated per turn)."""
+    play_turn(state, update)
+    start = time.perf_counter()
+    for _ in range(turns):
+        play_turn(state, update)
+    elapsed = (time.perf_counter() - start) / turns
+
+    tracemalloc.start()
+    play_turn(state, update)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e6, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--turns", type=int, default=200, help="Turns measured per history size")
+    args = parser.parse_args()
+
+    strategies = {
+        "full copy": legacy_with_updates,
+        "copy-on-write": lambda state, **updates: state.with_updates(**updates)
+    }
+    print(f"{'history':>8} {'strategy':>14} {'µs/turn':>10} {'peak KiB/turn':>14}")
+    for size in HISTORY_SIZES:
+        state = make_state(size)
+        for name, update in strategies.items():
+            turns = max(1, args.turns * 10 // max(size, 10))
+            micros, kib = measure(state, update, turns)
+            print(f"{size:>8} {name:>14} {micros:>10.0f} {kib:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark of the JSON encoding of a game state as the trace history grows.
+
+Compare le chemin historique (from_game_state puis json.dumps, comme la
+route WebSocket et le CacheManager) à l'encodage en octets de
+utils.json_codec, à froid puis mémorisé (même état lu par plusieurs
+consommateurs : disque, diffusion WebSocket, REST).
+
+Usage:
+    python -m benchmarks.bench_json_encoding [--rounds 200]
+"""
+import argparse
+import json
+import time
+
+from api.utils.serialization_utils import from_game_state, _json_serial
+from benchmarks.bench_game_state import HISTORY_SIZES, make_state
+from models.game_state import GameState
+from utils import json_codec
+
+# Lecteurs d'un même état après un tour : 2 clés d'état sur disque, WebSocket, REST
+CONSUMERS = 4
+
+
+def legacy_encode(state: GameState) -> bytes:
+    """model_dump + datetime loops + json.dumps, as before utils.json_codec."""
+    return json.dumps(from_game_state(state), default=_json_serial).encode()
+
+
+def codec_cold(state: GameState) -> bytes:
+    """Compiled encoder, without memoization."""
+    return json_codec.dumps(state)
+
+
+def measure(state: GameState, encode, rounds: int) -> float:
+    """Return µs per turn (one encoding per consumer)."""
+    encode(state)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(CONSUMERS):
+            encode(state)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rounds", type=int, default=200, help="Turns measured per history size")
+    args = parser.parse_args()
+
+    strategies = {
+        "json.dumps": legacy_encode,
+        "json_codec": codec_cold,
+        "memoized": json_codec.encode_state
+    }
+    print(f"{'history':>8} {'strategy':>12} {'µs/turn':>10} {'KiB':>8}")
+    for size in HISTORY_SIZES:
+        state = make_state(size)
+        kib = len(json_codec.dumps(state)) / 1024
+        for name, encode in strategies.items():
+            rounds = max(1, args.rounds * 10 // max(size, 10))
+            micros = measure(state, encode, rounds)
+            print(f"{size:>8} {name:>12} {micros:>10.0f} {kib:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
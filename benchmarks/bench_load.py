@@ -0,0 +1,274 @@
+"""
+Load generator: concurrent simulated players against /api/game and /api/ws/game.
+
+Chaque joueur initialise une partie (POST /api/game/initialize), ouvre
+/api/ws/game, envoie des messages ``choice`` le long d'un chemin valide de
+liens ``[[n]]`` (graphe de data/sections, marche aléatoire à graine fixe),
+attend l'état de la section suivante, puis termine par ``get_state``.
+
+Par défaut l'application tourne dans ce processus (uvicorn dans un thread,
+sa propre boucle) avec le modèle local ``FakeChatModel`` et une latence
+réaliste : on mesure alors le retard de la boucle du serveur et la mémoire
+résidente gagnée par joueur (les sessions restent en mémoire). Avec
+``--url``, on vise un serveur déjà lancé et seules les mesures côté client
+sont rapportées.
+
+Pour chaque niveau de concurrence du balayage : tours/s, latence
+p50/p95/p99 des choix, p95 de l'initialisation, erreurs, retard de boucle
+p99/max et Kio par joueur. Le coude de saturation est le premier niveau
+qui atteint 90 % du meilleur débit du balayage : au-delà, les joueurs
+supplémentaires n'ajoutent que de la latence.
+
+Usage:
+    python -m benchmarks.bench_load [--players 1,2,4,8,16,32] [--turns 5] [--latency-ms 800]
+    python -m benchmarks.bench_load --url http://127.0.0.1:8000 --players 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+os.environ["LLM_PROVIDER"] = "fake"
+
+import httpx
+import uvicorn
+import websockets
+from loguru import logger
+
+from benchmarks.bench_turns import make_factory, percentile
+from managers.section_graph_index import SectionGraphIndex
+from config.managers.section_graph_config import SectionGraphConfig
+
+LAG_INTERVAL = 0.01
+KNEE_FRACTION = 0.9
+
+
+def rss_bytes() -> int:
+    """Resident memory of the process."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Hors Linux : pic de mémoire résidente (Kio sous Linux, octets sous macOS)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def make_path(graph: SectionGraphIndex, turns: int, rng: random.Random, start: int = 1) -> List[int]:
+    """Random walk of at most ``turns`` links from ``start``."""
+    path, section = [], start
+    for _ in range(turns):
+        successors = graph.successors(section)
+        if not successors:
+            break
+        section = rng.choice(successors)
+        path.append(section)
+    return path
+
+
+@dataclass
+class LevelStats:
+    """Measures of one concurrency level."""
+    players: int
+    choice: List[float] = field(default_factory=list)
+    initialize: List[float] = field(default_factory=list)
+    get_state: List[float] = field(default_factory=list)
+    lag: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+    rss_growth: Optional[int] = None
+
+    @property
+    def turns_per_sec(self) -> float:
+        return len(self.choice) / self.elapsed if self.elapsed else 0.0
+
+
+class LagProbe:
+    """Measure how late a loop runs a periodic wake-up."""
+
+    def __init__(self, interval: float = LAG_INTERVAL):
+        self.interval = interval
+        self.samples: List[float] = []
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def take(self) -> List[float]:
+        samples, self.samples = self.samples, []
+        return samples
+
+
+class ServerThread:
+    """The FastAPI app served by uvicorn on its own loop, in a thread."""
+
+    def __init__(self, base_path: Path):
+        # L'application lit ses composants dans managers.dependencies
+        from managers import dependencies
+        dependencies._game_factory = make_factory(base_path)
+        from api.app import app
+
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+        self.loop = asyncio.new_event_loop()
+        self.probe = LagProbe()
+        self.thread = threading.Thread(target=self._run, name="bench-server", daemon=True)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.create_task(self.probe.run())
+        self.loop.run_until_complete(self.server.serve())
+
+    def start(self) -> str:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=30)
+
+
+async def receive_state(socket, section_number: Optional[int] = None) -> Dict:
+    """Wait for the next full state (node updates and narrative deltas skipped)."""
+    while True:
+        message = json.loads(await socket.recv())
+        if message.get("status") == "error":
+            raise RuntimeError(message.get("error"))
+        if "type" in message or "section_number" not in message:
+            continue
+        if section_number is None or message["section_number"] == section_number:
+            return message
+
+
+async def play(client: httpx.AsyncClient, ws_url: str, path: List[int], stats: LevelStats, timeout: float) -> None:
+    """One player: initialize, follow ``path`` over the WebSocket, then get_state."""
+    try:
+        start = time.perf_counter()
+        response = await client.post("/api/game/initialize", json={}, timeout=timeout)
+        response.raise_for_status()
+        game_id = response.json()["state"]["game_id"]
+        stats.initialize.append(time.perf_counter() - start)
+
+        async with websockets.connect(f"{ws_url}/api/ws/game?game_id={game_id}", max_size=None) as socket:
+            await asyncio.wait_for(receive_state(socket), timeout)
+            for section_number in path:
+                start = time.perf_counter()
+                await socket.send(json.dumps({
+                    "type": "choice",
+                    "choice": {"game_id": game_id, "choice_text": f"Rendez-vous au {section_number}"}
+                }))
+                await asyncio.wait_for(receive_state(socket, section_number), timeout)
+                stats.choice.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await socket.send(json.dumps({"type": "get_state"}))
+            await asyncio.wait_for(receive_state(socket), timeout)
+            stats.get_state.append(time.perf_counter() - start)
+    except Exception as e:
+        stats.errors += 1
+        logger.warning("Player failed: {!r}", e)
+
+
+async def run_level(base_url: str, paths: List[List[int]], timeout: float) -> LevelStats:
+    stats = LevelStats(players=len(paths))
+    ws_url = base_url.replace("http", "ws", 1)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(play(client, ws_url, path, stats, timeout) for path in paths))
+        stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def find_knee(levels: List[LevelStats]) -> Optional[LevelStats]:
+    """First level reaching ``KNEE_FRACTION`` of the best throughput.
+
+    Beyond it, more players only add latency.
+    """
+    measured = [level for level in levels if level.choice]
+    if not measured:
+        return None
+    best = max(level.turns_per_sec for level in measured)
+    return next(level for level in measured if level.turns_per_sec >= KNEE_FRACTION * best)
+
+
+def ms(values: List[float], fraction: float) -> str:
+    return f"{percentile(values, fraction) * 1000:.0f}" if values else "-"
+
+
+async def sweep(args, graph: SectionGraphIndex, server: Optional[ServerThread]) -> List[LevelStats]:
+    base_url = args.url.rstrip("/") if args.url else server.start()
+    rng = random.Random(args.seed)
+    # Échauffement : imports paresseux, compilation du graphe, premières sections
+    await run_level(base_url, [make_path(graph, args.turns, rng)], args.timeout)
+    levels = []
+    print(f"{'players':>7} {'turns/s':>8} {'p50':>6} {'p95':>6} {'p99':>6} {'init p95':>8} "
+          f"{'errors':>6} {'lag p99':>7} {'lag max':>7} {'KiB/player':>10}")
+    for players in args.players:
+        paths = [make_path(graph, args.turns, rng) for _ in range(players)]
+        rss = rss_bytes() if server else None
+        if server:
+            server.probe.take()
+        stats = await run_level(base_url, paths, args.timeout)
+        if server:
+            stats.lag = server.probe.take()
+            stats.rss_growth = rss_bytes() - rss
+        levels.append(stats)
+        per_player = f"{stats.rss_growth / players / 1024:.0f}" if stats.rss_growth is not None else "-"
+        print(f"{players:>7} {stats.turns_per_sec:>8.1f} {ms(stats.choice, 0.5):>6} {ms(stats.choice, 0.95):>6} "
+              f"{ms(stats.choice, 0.99):>6} {ms(stats.initialize, 0.95):>8} {stats.errors:>6} "
+              f"{ms(stats.lag, 0.99):>7} {(max(stats.lag) * 1000 if stats.lag else 0):>7.0f} {per_player:>10}")
+    return levels
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--players", type=lambda value: [int(n) for n in value.split(",")],
+                        default=[1, 2, 4, 8, 16, 32], help="Concurrency levels, comma separated")
+    parser.add_argument("--turns", type=int, default=5, help="Choices per player")
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="Median latency of the fake LLM")
+    parser.add_argument("--sigma", type=float, default=0.4, help="Log-normal dispersion of the latency")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the paths and latencies")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds allowed per request")
+    parser.add_argument("--url", help="Target a running server instead of an in-process one")
+    args = parser.parse_args()
+
+    os.environ["FAKE_LLM_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["FAKE_LLM_LATENCY_SIGMA"] = str(args.sigma)
+    os.environ["FAKE_LLM_SEED"] = str(args.seed)
+    logger.remove()
+    logger.add(lambda message: print(message, end=""), level="WARNING", filter=__name__)
+
+    graph = SectionGraphIndex(SectionGraphConfig())
+    graph.refresh(force=True)
+    with tempfile.TemporaryDirectory(prefix="bench_load_") as tmp:
+        server = None if args.url else ServerThread(Path(tmp))
+        try:
+            levels = asyncio.run(sweep(args, graph, server))
+        finally:
+            if server:
+                server.stop()
+
+    knee = find_knee(levels)
+    if knee is None:
+        print("No turn completed")
+    elif knee is levels[-1]:
+        print(f"Throughput still rising at {knee.players} players: extend the sweep")
+    else:
+        print(f"Saturation knee at {knee.players} players")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of the logging overhead of one game turn.
+
+Compare la configuration historique (fichier DEBUG via une file d'écriture,
+arguments évalués à l'appel : model_dump de l'état, path.absolute()) à
+l'actuelle (tampon DEBUG en mémoire, arguments paresseux, traces
+échantillonnées), avec les appels de journalisation d'un tour : état
+complet journalisé par le workflow, la décision et la condition du graphe,
+et les E/S de sauvegarde (2 écritures, 1 lecture).
+
+Usage:
+    python -m benchmarks.bench_logging [--turns 200]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from benchmarks.bench_game_state import HISTORY_SIZES, make_state
+from config.logging_config import DebugRingBuffer, get_trace_sampler
+from models.game_state import GameState
+
+FILE_OPERATIONS = 3
+STATE_DUMPS = 3
+
+
+def legacy_turn(state: GameState, path: Path) -> None:
+    """Log calls of one turn before lazy logging."""
+    for _ in range(STATE_DUMPS):
+        logger.debug("Full state in decision: {}", state.model_dump())
+    for _ in range(FILE_OPERATIONS):
+        logger.debug("Writing to file: {}", path.absolute())
+        logger.trace("Ensuring directory exists: {}", path.absolute())
+        logger.trace("Path validation: {} -> {}", path.absolute(), "valid")
+        logger.trace("Starting synchronous write to: {}", path.absolute())
+        logger.debug("Successfully wrote to file: {}", path.absolute())
+
+
+def current_turn(state: GameState, path: Path, trace=get_trace_sampler("benchmarks.bench_logging")) -> None:
+    """Same log calls, lazy and sampled."""
+    for _ in range(STATE_DUMPS):
+        logger.opt(lazy=True).trace("Full state in decision: {}", lambda: state.model_dump())
+    for _ in range(FILE_OPERATIONS):
+        logger.debug("Writing to file: {}", path)
+        trace.trace("Ensuring directory exists: {}", path)
+        trace.trace("Path validation: {} -> {}", path, "valid")
+        trace.trace("Starting synchronous write to: {}", path)
+        logger.debug("Successfully wrote to file: {}", path)
+
+
+def measure(state: GameState, turn, path: Path, turns: int) -> float:
+    """Return µs per turn, pending writes included."""
+    turn(state, path)
+    logger.complete()
+    start = time.perf_counter()
+    for _ in range(turns):
+        turn(state, path)
+    logger.complete()
+    return (time.perf_counter() - start) / turns * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--turns", type=int, default=200, help="Turns measured per history size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        path = Path("data/state/game_bench_current.json")
+
+        def legacy_setup():
+            logger.add(lambda message: None, level="INFO")
+            logger.add(log_dir / "debug.log", level="DEBUG", enqueue=True,
+                       format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}")
+
+        def current_setup():
+            logger.add(lambda message: None, level="INFO")
+            logger.add(DebugRingBuffer(log_dir / "dump.log").write, level="DEBUG", format="{message}")
+
+        configurations = {
+            "eager + file": (legacy_setup, legacy_turn),
+            "lazy + ring": (current_setup, current_turn)
+        }
+        print(f"{'history':>8} {'logging':>14} {'µs/turn':>10}")
+        for size in HISTORY_SIZES:
+            state = make_state(size)
+            turns = max(1, args.turns * 10 // max(size, 10))
+            for name, (setup, turn) in configurations.items():
+                logger.remove()
+                setup()
+                micros = measure(state, turn, path, turns)
+                logger.remove()
+                print(f"{size:>8} {name:>14} {micros:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of the cost of recording one metric event.
+
+Mesure, par événement, l'observation d'un histogramme (série gardée par
+l'appelant ou résolue par ses étiquettes), l'incrément d'un compteur
+étiqueté et la mesure de durée complète (perf_counter + observation),
+ainsi que le rendu de /metrics.
+
+Usage:
+    python -m benchmarks.bench_metrics [--events 1000000]
+"""
+import argparse
+import time
+
+from utils.metrics import MetricsRegistry
+
+
+def measure(record, events: int) -> float:
+    """Return ns per event."""
+    start = time.perf_counter()
+    for _ in range(events):
+        record()
+    return (time.perf_counter() - start) / events * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--events", type=int, default=1_000_000, help="Events recorded per case")
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    nodes = registry.histogram("node_seconds", "Node duration", ("node",))
+    lookups = registry.counter("lookups", "Cache lookups", ("namespace", "result"))
+    series = nodes.labels("node_narrator")
+
+    def timed():
+        start = time.perf_counter()
+        series.observe(time.perf_counter() - start)
+
+    cases = {
+        "loop only": lambda: None,
+        "histogram series": lambda: series.observe(0.003),
+        "histogram labels": lambda: nodes.labels("node_narrator").observe(0.003),
+        "counter labels": lambda: lookups.labels("state", "memory").inc(),
+        "timed section": timed
+    }
+    print(f"{'case':>18} {'ns/event':>10}")
+    for name, record in cases.items():
+        print(f"{name:>18} {measure(record, args.events):>10.0f}")
+
+    for node in ("node_start", "node_narrator", "node_rules", "node_decision", "node_end"):
+        nodes.labels(node).observe(0.01)
+    start = time.perf_counter()
+    registry.render()
+    print(f"{'render':>18} {(time.perf_counter() - start) * 1e6:>10.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
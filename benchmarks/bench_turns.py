@@ -0,0 +1,216 @@
+"""
+End-to-end benchmark of game turns through the real StoryGraph.
+
+Joue des parties complètes (AgentManager.initialize_game puis
+process_game_state) avec le modèle local ``FakeChatModel`` à la place
+d'OpenAI : chaque tour suit un lien ``[[n]]`` de la section courante,
+choisi par une graine fixe, donc la même suite de sections d'une exécution
+à l'autre. Les données de jeu sont écrites dans un dossier temporaire
+(sections copiées, cache LLM et index de décisions désactivés).
+
+Rapporte tours/s, latence p50/p95/p99, appels LLM, mémoire allouée et
+octets écrits sur disque par tour. ``--save-baseline`` enregistre ces
+valeurs, ``--compare`` échoue (code 1) si l'une d'elles se dégrade de plus
+de ``--tolerance`` par rapport à la référence.
+
+Usage:
+    python -m benchmarks.bench_turns [--games 5] [--turns 20] [--latency-ms 0]
+    python -m benchmarks.bench_turns --save-baseline
+    python -m benchmarks.bench_turns --compare [--tolerance 0.25]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+os.environ["LLM_PROVIDER"] = "fake"
+
+from langgraph.errors import GraphInterrupt
+from loguru import logger
+
+from agents.factories.game_factory import GameFactory
+from config.game_config import GameConfig
+from config.managers.checkpoint_config import CheckpointConfig
+from config.managers.decision_index_config import DecisionIndexConfig
+from config.managers.llm_cache_config import LLMCacheConfig
+from config.managers.section_corpus_config import SectionCorpusConfig
+from config.managers.section_store_config import SectionStoreConfig
+from managers.session_manager import SessionManager
+from utils.metrics import FS_BYTES, LLM_CALLS
+
+SECTIONS_DIR = Path("data/sections")
+BASELINE_PATH = Path(__file__).parent / "baselines" / "turns.json"
+
+# Sens d'une amélioration : +1 plus grand est meilleur, -1 plus petit est meilleur
+METRICS = {
+    "turns_per_sec": 1,
+    "p50_ms": -1,
+    "p95_ms": -1,
+    "p99_ms": -1,
+    "llm_calls_per_turn": -1,
+    "peak_kib_per_turn": -1,
+    "write_bytes_per_turn": -1
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def llm_calls() -> float:
+    return sum(series.value for series in LLM_CALLS._series.values())
+
+
+def make_factory(base_path: Path) -> GameFactory:
+    """Game factory writing into ``base_path``, without OpenAI or FAISS."""
+    shutil.copytree(SECTIONS_DIR, base_path / "sections")
+    config = GameConfig.create_default()
+    managers = config.manager_configs
+    managers.storage_config = managers.storage_config.model_copy(update={"base_path": base_path})
+    # Sans cache LLM, chaque section nouvelle passe par le modèle
+    managers.llm_cache_config = LLMCacheConfig(enabled=False, db_path=base_path / "llm_cache.sqlite3")
+    managers.decision_index_config = DecisionIndexConfig(enabled=False)
+    managers.checkpoint_config = CheckpointConfig(db_path=base_path / "checkpoints.sqlite3")
+    managers.section_store_config = SectionStoreConfig(enabled=False)
+    managers.section_corpus_config = SectionCorpusConfig(enabled=False, sections_dir=base_path / "sections")
+    return GameFactory(config)
+
+
+async def run_turn(agent_manager, game_id: str, user_input: Optional[str] = None):
+    """Play one turn; the workflow stops on the player's next choice."""
+    try:
+        if user_input is None:
+            await agent_manager.initialize_game(game_id=game_id)
+        else:
+            await agent_manager.process_game_state(user_input=user_input)
+    except GraphInterrupt:
+        pass
+    return await agent_manager.get_state()
+
+
+async def play_game(sessions: SessionManager, turns: int, rng: random.Random, samples: Dict[str, List[float]]) -> int:
+    """Play one game, recording each turn; return the number of turns played."""
+    session = await sessions.create_session()
+    agent_manager = session.agent_manager
+    user_input = None
+    played = 0
+    for _ in range(turns):
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        state = await run_turn(agent_manager, session.game_id, user_input)
+        samples["latency"].append(time.perf_counter() - start)
+        if tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            samples["peak"].append(peak - before)
+        played += 1
+        choices = state.rules.choices if state and state.rules else []
+        if not choices:
+            break
+        user_input = f"Rendez-vous au {rng.choice(choices).target_section}"
+    await sessions.close_session(session.game_id)
+    return played
+
+
+async def run(args) -> Dict[str, float]:
+    os.environ["FAKE_LLM_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["FAKE_LLM_LATENCY_SIGMA"] = str(args.sigma)
+    os.environ["FAKE_LLM_SEED"] = str(args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench_turns_") as tmp:
+        sessions = SessionManager(make_factory(Path(tmp)))
+        rng = random.Random(args.seed)
+        samples: Dict[str, List[float]] = {"latency": [], "peak": []}
+
+        # Échauffement : compilation du graphe, imports paresseux
+        await play_game(sessions, 2, random.Random(args.seed), {"latency": [], "peak": []})
+
+        written, calls = FS_BYTES.labels("write").value, llm_calls()
+        turns = 0
+        start = time.perf_counter()
+        for _ in range(args.games):
+            turns += await play_game(sessions, args.turns, rng, samples)
+        elapsed = time.perf_counter() - start
+        written, calls = FS_BYTES.labels("write").value - written, llm_calls() - calls
+
+        # Mémoire mesurée à part : tracemalloc ralentit fortement les tours
+        tracemalloc.start()
+        await play_game(sessions, args.turns, random.Random(args.seed), samples)
+        tracemalloc.stop()
+        await sessions.shutdown()
+
+    latencies = samples["latency"][:turns]
+    return {
+        "turns": turns,
+        "turns_per_sec": turns / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "llm_calls_per_turn": calls / turns,
+        "peak_kib_per_turn": sum(samples["peak"]) / len(samples["peak"]) / 1024,
+        "write_bytes_per_turn": written / turns
+    }
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Return the metrics worse than the baseline by more than ``tolerance``."""
+    regressions = []
+    for name, direction in METRICS.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        change = (results[name] - reference) / reference * direction
+        if change < -tolerance:
+            regressions.append(f"{name}: {results[name]:.2f} vs {reference:.2f} ({change:+.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--games", type=int, default=5, help="Games measured")
+    parser.add_argument("--turns", type=int, default=20, help="Maximum turns per game")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median latency of the fake LLM")
+    parser.add_argument("--sigma", type=float, default=0.0, help="Log-normal dispersion of the latency")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the choices and latencies")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail if worse than the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    logger.remove()
+    results = asyncio.run(run(args))
+
+    print(f"{'metric':>22} {'value':>12}")
+    for name, value in results.items():
+        print(f"{name:>22} {value:>12.2f}")
+
+    settings = {key: getattr(args, key) for key in ("games", "turns", "latency_ms", "sigma", "seed")}
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({"settings": settings, "results": results}, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline["settings"] != settings:
+            print(f"Warning: baseline recorded with {baseline['settings']}")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regression beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
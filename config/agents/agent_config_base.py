@@ -1,6 +1,6 @@
 # config/agents/agent_config_base.py
 """Base configuration for all agents."""
-from typing import Optional, Dict, Any, ClassVar
+from typing import Optional, Dict, Any, ClassVar, Literal
 from pydantic import Field
 from functools import cached_property
 import os
@@ -12,6 +12,13 @@ from config.logging_config import get_logger
 
 class AgentConfigBase(ConfigModel):
     """Base configuration for all agents."""
+    # Agent dont le modèle factice imite les réponses (llm_provider="fake")
+    llm_role: ClassVar[str] = ""
+    
+    llm_provider: Literal["openai", "fake"] = Field(
+        default=os.getenv("LLM_PROVIDER", "openai"),
+        description="LLM backend ('fake' is a deterministic local model for tests and benchmarks)"
+    )
     model_name: str = Field(
         default=os.getenv("LLM_MODEL_NAME", ModelType.NARRATOR),
         description="Name of the language model"
@@ -30,7 +37,7 @@ class AgentConfigBase(ConfigModel):
     )
     custom_parameters: Dict[str, Any] = Field(
         default_factory=dict,
-        description="Additional model parameters"
+        description="Additional model parameters (latency_ms, latency_sigma, seed for the fake model)"
     )
     dependencies: Dict[str, Any] = Field(
         default_factory=dict,
@@ -40,6 +47,9 @@ class AgentConfigBase(ConfigModel):
     @cached_property
     def llm(self) -> BaseChatModel:
         """Create and return LLM instance."""
+        if self.llm_provider == "fake":
+            from utils.fake_chat_model import FakeChatModel
+            return FakeChatModel.from_env(role=self.llm_role, **self.custom_parameters)
         return ChatOpenAI(
             model=self.model_name,
             temperature=self.temperature
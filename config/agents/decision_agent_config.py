@@ -1,5 +1,5 @@
 """Decision Agent configuration."""
-from typing import Dict, Any
+from typing import ClassVar, Dict, Any
 from pydantic import Field
 from config.agents.agent_config_base import AgentConfigBase
 from config.game_constants import ModelType
@@ -7,6 +7,7 @@ from langchain_core.language_models.chat_models import BaseChatModel
 
 class DecisionAgentConfig(AgentConfigBase):
     """Configuration specific to DecisionAgent."""
+    llm_role: ClassVar[str] = "decision"
     
     # Decision-making parameters
     model_name: str = Field(
@@ -47,6 +48,10 @@ Always ensure:
         default=False,
         description="Enforce strict rule validation"
     )
+    local_resolution: bool = Field(
+        default=True,
+        description="Resolve choice clicks and numeric dice rolls from the rules without calling the LLM"
+    )
     
     # Response formatting
     format_responses: bool = Field(
@@ -1,10 +1,12 @@
 """Narrator Agent configuration."""
+from typing import ClassVar
 from pydantic import Field
 from config.agents.agent_config_base import AgentConfigBase
 from config.game_constants import ModelType
 
 class NarratorAgentConfig(AgentConfigBase):
     """Configuration specific to NarratorAgent."""
+    llm_role: ClassVar[str] = "narrator"
     model_name: str = Field(
         default=ModelType.NARRATOR,
         description="Model for narrative generation"
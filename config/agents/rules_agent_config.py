@@ -1,10 +1,12 @@
 """Rules Agent configuration."""
+from typing import ClassVar
 from pydantic import Field
 from config.agents.agent_config_base import AgentConfigBase
 from config.game_constants import ModelType
 
 class RulesAgentConfig(AgentConfigBase):
     """Configuration specific to RulesAgent."""
+    llm_role: ClassVar[str] = "rules"
     model_name: str = Field(
         default=ModelType.RULES,
         description="Model for rules interpretation"
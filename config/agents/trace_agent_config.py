@@ -1,11 +1,12 @@
 """Trace Agent configuration."""
-from typing import Dict, Any
+from typing import ClassVar, Dict, Any
 from pydantic import Field
 from config.agents.agent_config_base import AgentConfigBase
 from config.game_constants import ModelType
 
 class TraceAgentConfig(AgentConfigBase):
     """Configuration specific to TraceAgent."""
+    llm_role: ClassVar[str] = "trace"
     
     # Trace detail level
     detail_level: str = Field(
@@ -12,6 +12,17 @@ from config.game_constants import (
 )
 
 from config.storage_config import StorageConfig
+from config.managers.session_manager_config import SessionManagerConfig
+from config.managers.llm_cache_config import LLMCacheConfig
+from config.managers.section_store_config import SectionStoreConfig
+from config.managers.section_graph_config import SectionGraphConfig
+from config.managers.decision_index_config import DecisionIndexConfig
+from config.managers.checkpoint_config import CheckpointConfig
+from config.managers.state_persistence_config import StatePersistenceConfig
+from config.managers.section_corpus_config import SectionCorpusConfig
+from config.managers.single_flight_config import SingleFlightConfig
+from config.managers.prefetch_config import PrefetchConfig
+from config.managers.narrative_stream_config import NarrativeStreamConfig
 
 # Agent configs - chaque agent a sa propre config
 from config.agents.narrator_agent_config import NarratorAgentConfig
@@ -40,6 +51,17 @@ class ManagerConfigs:
     trace_config: Optional[StorageConfig] = None
     rules_config: Optional[StorageConfig] = None
     decision_config: Optional[StorageConfig] = None
+    session_config: Optional[SessionManagerConfig] = None
+    llm_cache_config: Optional[LLMCacheConfig] = None
+    section_store_config: Optional[SectionStoreConfig] = None
+    section_graph_config: Optional[SectionGraphConfig] = None
+    decision_index_config: Optional[DecisionIndexConfig] = None
+    checkpoint_config: Optional[CheckpointConfig] = None
+    state_persistence_config: Optional[StatePersistenceConfig] = None
+    section_corpus_config: Optional[SectionCorpusConfig] = None
+    single_flight_config: Optional[SingleFlightConfig] = None
+    prefetch_config: Optional[PrefetchConfig] = None
+    narrative_stream_config: Optional[NarrativeStreamConfig] = None
 
 class GameConfig(BaseModel):
     """Main game configuration."""
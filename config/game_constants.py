@@ -31,11 +31,12 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "timeout_seconds": 30,
 }
 
-# Cache settings
+# Cache settings (noms des champs de StorageConfig)
 CACHE_CONFIG = {
-    "enabled": True,
-    "max_size": 1000,
-    "ttl_seconds": 3600,
+    "cache_enabled": True,
+    "max_cache_size": 1000,
+    "max_cache_bytes": 64 * 1024 * 1024,
+    "cache_sweep_interval_seconds": 60,
 }
 
 # Error messages
@@ -1,13 +1,30 @@
-"""Logging configuration for the entire application."""
+"""Logging configuration for the entire application.
+
+Les messages DEBUG ne sont plus écrits en continu dans ``logs/debug.log`` :
+les plus récents sont gardés en mémoire (``DebugRingBuffer``) et écrits sur
+disque seulement quand une erreur est journalisée. Sur les chemins chauds,
+les arguments coûteux sont passés en callables (``logger.opt(lazy=True)``)
+et les traces sont échantillonnées par module (``get_trace_sampler``).
+"""
 import os
 import sys
+import threading
+from collections import deque
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 from loguru import logger
 import logging
 
 # Get log level from environment or use INFO as default
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
 
+# Nombre de messages DEBUG gardés en mémoire (0 : désactivé)
+LOG_DEBUG_BUFFER_SIZE = int(os.getenv('LOG_DEBUG_BUFFER_SIZE', '2000'))
+
+# Échantillonnage des traces par module, ex. "managers.filesystem_adapter=0.01,agents=0.1"
+LOG_TRACE_SAMPLING = os.getenv('LOG_TRACE_SAMPLING', '')
+
 # Intercept standard logging
 class InterceptHandler(logging.Handler):
     def emit(self, record):
@@ -25,8 +42,151 @@ class InterceptHandler(logging.Handler):
 
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
+class DebugRingBuffer:
+    """Loguru sink keeping the recent records in memory.
+    
+    Les enregistrements sont gardés bruts (le texte n'est mis en forme qu'au
+    vidage) ; un enregistrement de niveau ``dump_level`` ou plus écrit le
+    tampon à la suite du fichier, précédé d'un en-tête, puis le vide.
+    """
+
+    FORMAT = "{} | {: <8} | {}:{}:{} - {}\n"
+
+    def __init__(
+        self,
+        path: Path,
+        capacity: int = 2000,
+        dump_level: str = "ERROR",
+        max_bytes: int = 5 * 1024 * 1024
+    ):
+        """Initialize the buffer.
+        
+        Args:
+            path: File the buffer is appended to on dump
+            capacity: Number of records kept
+            dump_level: Level of the records triggering a dump
+            max_bytes: Size above which the file is rotated (``.1``) before a dump
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._dump_level = logger.level(dump_level).no
+        self._records: "deque[Tuple[Any, ...]]" = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.dumps = 0
+
+    def write(self, message: Any) -> None:
+        """Sink: record a message, dumping the buffer on errors."""
+        record = message.record
+        self._records.append((
+            record["time"], record["level"].name, record["name"],
+            record["function"], record["line"], record["message"]
+        ))
+        if record["level"].no >= self._dump_level:
+            self.dump()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def dump(self, reason: str = "error") -> int:
+        """Append the buffered records to the file and clear the buffer.
+        
+        Returns:
+            int: Number of records written
+        """
+        with self._lock:
+            records = list(self._records)
+            self._records.clear()
+            if not records:
+                return 0
+            lines = [f"===== Debug dump ({reason}) at {datetime.now().isoformat()} - {len(records)} records =====\n"]
+            lines.extend(
+                self.FORMAT.format(time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3], level, name, function, line, text)
+                for time, level, name, function, line, text in records
+            )
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if self.path.exists() and self.path.stat().st_size > self.max_bytes:
+                    os.replace(self.path, self.path.with_name(self.path.name + ".1"))
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except OSError as e:
+                print(f"Error dumping debug buffer: {e}", file=sys.stderr)
+                return 0
+            self.dumps += 1
+            return len(records)
+
+
+# Tampon DEBUG installé par setup_logging
+debug_buffer: Optional[DebugRingBuffer] = None
+
+
+class TraceSampler:
+    """Lazy trace logging keeping one call in ``every``.
+    
+    Les arguments callables ne sont évalués que pour les appels retenus,
+    et seulement si un sink accepte le niveau TRACE.
+    """
+
+    def __init__(self, name: str, rate: float = 1.0):
+        """Initialize the sampler.
+        
+        Args:
+            name: Module name (bound as ``name`` in the record extras)
+            rate: Fraction of the calls logged (0 : none)
+        """
+        self.name = name
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._logger = logger.bind(name=name).opt(lazy=True, depth=1)
+        self._calls = 0
+
+    def trace(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if not self.every:
+            return
+        self._calls += 1
+        if (self._calls - 1) % self.every:
+            return
+        self._logger.trace(message, *args, **kwargs)
+
+
+def _parse_sampling(spec: str) -> Dict[str, float]:
+    rates = {}
+    for item in spec.split(","):
+        module, _, rate = item.partition("=")
+        if module.strip() and rate.strip():
+            rates[module.strip()] = float(rate)
+    return rates
+
+
+_TRACE_RATES = _parse_sampling(LOG_TRACE_SAMPLING)
+_samplers: Dict[str, TraceSampler] = {}
+
+
+def get_trace_sampler(name: str) -> TraceSampler:
+    """Get the trace sampler of a module.
+    
+    Le taux est celui du préfixe de module le plus long de LOG_TRACE_SAMPLING
+    (1 par défaut : toutes les traces).
+    
+    Args:
+        name: Module name, e.g. ``managers.filesystem_adapter``
+        
+    Returns:
+        TraceSampler: Shared sampler of the module
+    """
+    sampler = _samplers.get(name)
+    if sampler is None:
+        prefixes = [
+            module for module in _TRACE_RATES
+            if name == module or name.startswith(module + ".")
+        ]
+        rate = _TRACE_RATES[max(prefixes, key=len)] if prefixes else 1.0
+        sampler = _samplers[name] = TraceSampler(name, rate)
+    return sampler
+
+
 def setup_logging():
     """Configure logging with rotation and backup count."""
+    global debug_buffer
     try:
         logger.info(f"Configuring logging with level: {LOG_LEVEL}")
         
@@ -42,16 +202,7 @@ def setup_logging():
                     "format": "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
                     "level": "INFO",
                     "backtrace": True,
-                    "diagnose": True
-                },
-                {
-                    "sink": "logs/debug.log",
-                    "format": "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-                    "level": "DEBUG",
-                    "rotation": "5 minutes",  # Rotation toutes les 5 minutes
-                    "retention": 0,           # Ne garde pas les vieux fichiers
-                    "mode": "w",             # Mode écriture (écrase le fichier)
-                    "enqueue": True          # Thread-safe writing
+                    "diagnose": False        # Pas de valeurs des variables (coûteux, données du joueur)
                 },
                 {
                     "sink": "logs/errors.log",
@@ -67,6 +218,15 @@ def setup_logging():
             ]
         }
         
+        # DEBUG en mémoire, écrit dans logs/debug.log seulement en cas d'erreur
+        if LOG_DEBUG_BUFFER_SIZE > 0:
+            debug_buffer = DebugRingBuffer(log_dir / "debug.log", capacity=LOG_DEBUG_BUFFER_SIZE)
+            config["handlers"].append({
+                "sink": debug_buffer.write,
+                "format": "{message}",   # Mise en forme différée au vidage
+                "level": "DEBUG"
+            })
+        
         # Remove default handler and add our configuration
         logger.remove()
         for handler in config["handlers"]:
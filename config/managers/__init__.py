@@ -1,8 +1,32 @@
 """Manager configuration package."""
 from config.managers.character_manager_config import CharacterManagerConfig
 from config.managers.decision_manager_config import DecisionManagerConfig
+from config.managers.session_manager_config import SessionManagerConfig
+from config.managers.llm_cache_config import LLMCacheConfig
+from config.managers.section_store_config import SectionStoreConfig
+from config.managers.section_graph_config import SectionGraphConfig
+from config.managers.decision_index_config import DecisionIndexConfig
+from config.managers.checkpoint_config import CheckpointConfig
+from config.managers.state_persistence_config import StatePersistenceConfig
+from config.managers.section_corpus_config import SectionCorpusConfig
+from config.managers.single_flight_config import SingleFlightConfig
+from config.managers.prefetch_config import PrefetchConfig
+from config.managers.narrative_stream_config import NarrativeStreamConfig
+from config.managers.websocket_config import WebSocketConfig
 
 __all__ = [
     'CharacterManagerConfig',
-    'DecisionManagerConfig'
+    'DecisionManagerConfig',
+    'SessionManagerConfig',
+    'LLMCacheConfig',
+    'SectionStoreConfig',
+    'SectionGraphConfig',
+    'DecisionIndexConfig',
+    'CheckpointConfig',
+    'StatePersistenceConfig',
+    'SectionCorpusConfig',
+    'SingleFlightConfig',
+    'PrefetchConfig',
+    'NarrativeStreamConfig',
+    'WebSocketConfig'
 ]
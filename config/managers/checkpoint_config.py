@@ -0,0 +1,41 @@
+"""Workflow checkpoint storage configuration."""
+from pathlib import Path
+from pydantic import BaseModel, Field
+
+
+class CheckpointConfig(BaseModel):
+    """Configuration for the persistent LangGraph checkpointer."""
+
+    persistent: bool = Field(
+        default=True,
+        description="Persist workflow checkpoints in SQLite (False = in-memory MemorySaver)"
+    )
+    db_path: Path = Field(
+        default=Path("data/checkpoints/checkpoints.sqlite3"),
+        description="Path of the SQLite database (WAL mode, shared by all workers)"
+    )
+    flush_interval_seconds: float = Field(
+        default=0.5,
+        gt=0,
+        description="Maximum delay before buffered checkpoints are written to disk"
+    )
+    batch_size: int = Field(
+        default=64,
+        gt=0,
+        description="Number of buffered rows that triggers an immediate flush"
+    )
+    keep_versions: int = Field(
+        default=4,
+        ge=2,
+        description="Checkpoints kept per game (the latest one and its parent at least)"
+    )
+    max_hot_threads: int = Field(
+        default=256,
+        gt=0,
+        description="Maximum number of games whose checkpoints are kept in memory"
+    )
+    compress_min_bytes: int = Field(
+        default=1024,
+        ge=0,
+        description="Compress (zlib) serialized checkpoints larger than this size"
+    )
@@ -0,0 +1,65 @@
+"""Decision retrieval index configuration."""
+from pathlib import Path
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class DecisionIndexConfig(BaseModel):
+    """Configuration for the FAISS index of past decisions."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Look up similar past decisions before calling the LLM (requires faiss)"
+    )
+    index_dir: Path = Field(
+        default=Path("data/cache/index/decision_index"),
+        description="Runtime directory of decision_index.faiss and docstore.json (appends are written here)"
+    )
+    seed_dir: Optional[Path] = Field(
+        default=Path("data/index/decision_index"),
+        description="Shipped index, read-only, loaded while index_dir holds no index yet"
+    )
+    embedding_provider: Literal["openai", "fake"] = Field(
+        default="openai",
+        description="Embedding backend ('fake' is a deterministic local stub for tests and benchmarks)"
+    )
+    embedding_model: str = Field(
+        default="text-embedding-ada-002",
+        description="Embedding model (must match the dimension of the shipped index)"
+    )
+    dimension: int = Field(
+        default=1536,
+        gt=0,
+        description="Embedding dimension, used when the index does not exist yet"
+    )
+    top_k: int = Field(
+        default=3,
+        ge=0,
+        description="Number of similar decisions injected in the prompt"
+    )
+    direct_threshold: float = Field(
+        default=0.97,
+        ge=0,
+        le=1,
+        description="Cosine similarity above which a stored decision is reused without the LLM"
+    )
+    example_threshold: float = Field(
+        default=0.75,
+        ge=0,
+        le=1,
+        description="Minimum cosine similarity of an example injected in the prompt"
+    )
+    max_example_chars: int = Field(
+        default=400,
+        gt=0,
+        description="Maximum length of an example in the prompt"
+    )
+    learn: bool = Field(
+        default=True,
+        description="Append LLM decisions validated by the section graph to the index"
+    )
+    compact_every: int = Field(
+        default=64,
+        gt=0,
+        description="Rewrite the index on disk after this many appended decisions"
+    )
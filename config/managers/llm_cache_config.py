@@ -0,0 +1,34 @@
+"""LLM response cache configuration."""
+from pathlib import Path
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class LLMCacheConfig(BaseModel):
+    """Configuration for the shared LLM response cache."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Enable the LLM response cache"
+    )
+    memory_max_entries: int = Field(
+        default=2048,
+        ge=0,
+        description="Maximum number of responses kept in memory"
+    )
+    memory_max_bytes: Optional[int] = Field(
+        default=32 * 1024 * 1024,
+        description="Maximum size in bytes of the memory tier. None means unbounded"
+    )
+    persistent: bool = Field(
+        default=True,
+        description="Persist responses in the SQLite tier"
+    )
+    db_path: Path = Field(
+        default=Path("data/cache/llm/llm_cache.sqlite3"),
+        description="Path of the SQLite database"
+    )
+    ttl_seconds: Optional[int] = Field(
+        default=None,
+        description="Response TTL in seconds. None means no expiration"
+    )
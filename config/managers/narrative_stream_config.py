@@ -0,0 +1,16 @@
+"""Narrative streaming configuration."""
+from pydantic import BaseModel, Field
+
+
+class NarrativeStreamConfig(BaseModel):
+    """Configuration for forwarding narrator tokens to WebSocket clients."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Stream the narrator LLM response and forward the narrative as it is generated"
+    )
+    queue_size: int = Field(
+        default=512,
+        gt=0,
+        description="Maximum number of messages waiting for one client (newer deltas dropped beyond)"
+    )
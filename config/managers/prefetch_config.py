@@ -0,0 +1,26 @@
+"""Section prefetch configuration."""
+from pydantic import BaseModel, Field
+
+
+class PrefetchConfig(BaseModel):
+    """Configuration for the speculative generation of reachable sections."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Generate narrative and rules of the choice targets in background"
+    )
+    max_concurrency: int = Field(
+        default=2,
+        gt=0,
+        description="Maximum number of sections prefetched at once, all games together"
+    )
+    per_game_budget: int = Field(
+        default=4,
+        ge=0,
+        description="Maximum number of sections queued or prefetched for one game"
+    )
+    start_delay_seconds: float = Field(
+        default=0.05,
+        ge=0,
+        description="Delay before a prefetch starts, leaving the current turn's calls first"
+    )
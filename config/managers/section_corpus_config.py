@@ -0,0 +1,24 @@
+"""Section corpus configuration."""
+from pathlib import Path
+from pydantic import BaseModel, Field
+
+
+class SectionCorpusConfig(BaseModel):
+    """Configuration for the memory-mapped corpus of section sources."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Serve raw section content from the packed corpus when present"
+    )
+    corpus_path: Path = Field(
+        default=Path("data/compiled/sections.corpus"),
+        description="Path of the packed corpus (see utils/build_section_corpus.py)"
+    )
+    sections_dir: Path = Field(
+        default=Path("data/sections"),
+        description="Directory of section sources (<n>.md), used as fallback"
+    )
+    check_sources: bool = Field(
+        default=True,
+        description="Ignore the corpus when a source file is newer than it, or was added or removed"
+    )
@@ -0,0 +1,21 @@
+"""Section graph index configuration."""
+from pathlib import Path
+from pydantic import BaseModel, Field
+
+
+class SectionGraphConfig(BaseModel):
+    """Configuration for the in-memory graph of [[n]] links between sections."""
+
+    sections_dir: Path = Field(
+        default=Path("data/sections"),
+        description="Directory of section sources (<n>.md)"
+    )
+    start_section: int = Field(
+        default=1,
+        description="Entry section of the book (never reported as orphan)"
+    )
+    refresh_interval_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Minimum delay between two scans for modified section files (0 = never rescan)"
+    )
@@ -0,0 +1,20 @@
+"""Compiled section store configuration."""
+from pathlib import Path
+from pydantic import BaseModel, Field
+
+
+class SectionStoreConfig(BaseModel):
+    """Configuration for the precompiled narrative + rules artifact."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Serve sections from the compiled artifact when present"
+    )
+    artifact_path: Path = Field(
+        default=Path("data/compiled/sections.sqlite3"),
+        description="Path of the compiled artifact (see utils/precompile_sections.py)"
+    )
+    sections_dir: Path = Field(
+        default=Path("data/sections"),
+        description="Directory of section sources (<n>.md), compared with the compiled hashes at load"
+    )
@@ -0,0 +1,22 @@
+"""Session Manager configuration."""
+from pydantic import BaseModel, Field
+
+
+class SessionManagerConfig(BaseModel):
+    """Configuration for the Session Manager."""
+
+    max_sessions: int = Field(
+        default=500,
+        gt=0,
+        description="Maximum number of live games kept in memory (LRU eviction)"
+    )
+    idle_timeout_seconds: int = Field(
+        default=1800,
+        gt=0,
+        description="Idle time after which a game is evicted from memory"
+    )
+    sweep_interval_seconds: int = Field(
+        default=60,
+        gt=0,
+        description="Interval between two idle session sweeps"
+    )
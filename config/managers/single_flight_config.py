@@ -0,0 +1,16 @@
+"""Single-flight configuration."""
+from pydantic import BaseModel, Field
+
+
+class SingleFlightConfig(BaseModel):
+    """Configuration for coalescing concurrent generations of a section."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Share one in-flight generation between concurrent cache misses"
+    )
+    max_tracked_keys: int = Field(
+        default=1024,
+        gt=0,
+        description="Maximum number of keys with wait-time statistics (least recent dropped)"
+    )
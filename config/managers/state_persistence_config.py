@@ -0,0 +1,26 @@
+"""Game state persistence configuration."""
+from typing import Literal
+from pydantic import BaseModel, Field
+
+
+class StatePersistenceConfig(BaseModel):
+    """Configuration for the write-behind stage of StateManager.save_state."""
+
+    durability: Literal["sync", "batched", "lazy"] = Field(
+        default="batched",
+        description=(
+            "sync: write before save_state returns; "
+            "batched: coalesce saves and write them in the background; "
+            "lazy: write only on flush (session release, shutdown)"
+        )
+    )
+    flush_interval_seconds: float = Field(
+        default=0.2,
+        gt=0,
+        description="Delay before buffered states are written (batched mode)"
+    )
+    max_dirty_keys: int = Field(
+        default=16,
+        gt=0,
+        description="Number of buffered state keys that triggers an immediate write (batched mode)"
+    )
@@ -0,0 +1,27 @@
+"""WebSocket connection manager configuration."""
+from typing import Literal
+from pydantic import BaseModel, Field
+
+
+class WebSocketConfig(BaseModel):
+    """Configuration for the per-game WebSocket rooms."""
+
+    queue_size: int = Field(
+        default=256,
+        gt=0,
+        description="Maximum number of messages waiting to be sent to one client"
+    )
+    slow_consumer_policy: Literal["drop_oldest", "disconnect"] = Field(
+        default="drop_oldest",
+        description="What to do when a client queue is full: drop its oldest message or close it"
+    )
+    send_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Time allowed for one send before the client is considered gone"
+    )
+    state_history: int = Field(
+        default=8,
+        gt=0,
+        description="Versions of a game state kept as bases for the JSON-patch deltas"
+    )
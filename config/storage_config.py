@@ -6,7 +6,7 @@ Centralized configuration for all storage-related settings.
 from enum import Enum
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Literal
 
 class StorageFormat(str, Enum):
     """Storage format for data."""
@@ -34,6 +34,14 @@ class NamespaceConfig(BaseModel):
         default=False,
         description="Whether this namespace is per-game (stored in games/{game_id}/)"
     )
+    max_entries: Optional[int] = Field(
+        default=None,
+        description="Maximum number of entries kept in memory. None means unbounded"
+    )
+    max_bytes: Optional[int] = Field(
+        default=None,
+        description="Maximum size in bytes kept in memory. None means unbounded"
+    )
 
 # Default namespace configurations
 DEFAULT_NAMESPACES = {
@@ -42,21 +50,26 @@ DEFAULT_NAMESPACES = {
         format=StorageFormat.JSON,
         ttl_seconds=3600,
         cache_enabled=True,
-        per_game=True
+        per_game=True,
+        max_entries=16,  # état courant + dernières sections
+        max_bytes=2 * 1024 * 1024
     ),
     "trace": NamespaceConfig(
         path=Path("cache/games/{game_id}/traces"),
         format=StorageFormat.JSON,
         ttl_seconds=None,
         cache_enabled=True,
-        per_game=True
+        per_game=True,
+        max_entries=4,
+        max_bytes=4 * 1024 * 1024
     ),
     "characters": NamespaceConfig(
         path=Path("cache/games/{game_id}/characters"),
         format=StorageFormat.JSON,
         ttl_seconds=None,
         cache_enabled=True,
-        per_game=True
+        per_game=True,
+        max_entries=4
     ),
     # Raw content namespace (source files)
     "raw_content": NamespaceConfig(
@@ -69,9 +82,19 @@ DEFAULT_NAMESPACES = {
     # Cache namespaces
     "rules": NamespaceConfig(
         path=Path("cache/rules"),
-        format=StorageFormat.MARKDOWN,
+        format=StorageFormat.JSON,  # Enregistrements versionnés (RulesManager)
         ttl_seconds=None,
         cache_enabled=True,
+        per_game=False,
+        max_entries=512,
+        max_bytes=16 * 1024 * 1024
+    ),
+    # Export lisible des règles, et anciens caches markdown (relus puis migrés)
+    "rules_markdown": NamespaceConfig(
+        path=Path("cache/rules"),
+        format=StorageFormat.MARKDOWN,
+        ttl_seconds=None,
+        cache_enabled=False,
         per_game=False
     ),
     "sections": NamespaceConfig(
@@ -79,7 +102,9 @@ DEFAULT_NAMESPACES = {
         format=StorageFormat.MARKDOWN,
         ttl_seconds=None,
         cache_enabled=True,
-        per_game=False
+        per_game=False,
+        max_entries=512,
+        max_bytes=32 * 1024 * 1024
     )
 }
 
@@ -98,6 +123,35 @@ class StorageConfig(BaseModel):
         default=1000,
         description="Maximum number of items in memory cache"
     )
+    max_cache_bytes: Optional[int] = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum size in bytes of the memory cache. None means unbounded"
+    )
+    cache_sweep_interval_seconds: int = Field(
+        default=60,
+        description="Interval between two sweeps of expired memory cache entries"
+    )
+    io_threads: int = Field(
+        default=4,
+        gt=0,
+        description="Size of the thread pool dedicated to file I/O (shared by all adapters)"
+    )
+    fsync: Literal["never", "always", "batched"] = Field(
+        default="never",
+        description=(
+            "Flush written files to disk: never (OS decides), always (before each replace) "
+            "or batched (every fsync_interval_seconds)"
+        )
+    )
+    fsync_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Interval between two batched fsyncs"
+    )
+    rules_markdown_export: bool = Field(
+        default=False,
+        description="Also write cached rules as human-readable markdown (rules_markdown namespace)"
+    )
     game_id: Optional[str] = Field(
         default=None,
         description="Current game ID for per-game namespaces"
@@ -57,16 +57,22 @@ describe('WebSocketService', () => {
 
   describe('connect', () => {
     it('should establish WebSocket connection', async () => {
-      wsService.connect();
-      expect(global.WebSocket).toHaveBeenCalledWith('ws://test');
+      wsService.connect('game-1');
+      expect(global.WebSocket).toHaveBeenCalledWith('ws://test?game_id=game-1');
       
       // Simuler une connexion réussie
       mockWs.onopen();
       expect(get(wsService.connectionStatus)).toBe('connected');
     });
 
-    it('should handle connection errors', async () => {
+    it('should not connect without a game', async () => {
       wsService.connect();
+      expect(global.WebSocket).not.toHaveBeenCalled();
+      expect(get(wsService.connectionStatus)).toBe('disconnected');
+    });
+
+    it('should handle connection errors', async () => {
+      wsService.connect('game-1');
       
       // Simuler une erreur
       mockWs.onerror(new Error('Connection failed'));
@@ -77,7 +83,7 @@ describe('WebSocketService', () => {
   describe('sendChoice', () => {
     it('should format and send choice correctly', async () => {
       // Connecter d'abord le WebSocket
-      wsService.connect();
+      wsService.connect('game-1');
       mockWs.onopen();
       expect(get(wsService.connectionStatus)).toBe('connected');
 
@@ -138,7 +144,7 @@ describe('WebSocketService', () => {
 
     it('should handle missing game ID', async () => {
       // Connecter d'abord le WebSocket
-      wsService.connect();
+      wsService.connect('game-1');
       mockWs.onopen();
       expect(get(wsService.connectionStatus)).toBe('connected');
 
@@ -167,7 +173,7 @@ describe('WebSocketService', () => {
 
   describe('disconnect', () => {
     it('should close WebSocket connection', async () => {
-      wsService.connect();
+      wsService.connect('game-1');
       mockWs.onopen();
       
       await wsService.disconnect();
@@ -178,7 +184,7 @@ describe('WebSocketService', () => {
 
   describe('onMessage', () => {
     it('should handle incoming messages', () => {
-      wsService.connect();
+      wsService.connect('game-1');
       const mockHandler = vi.fn();
       wsService.onMessage(mockHandler);
 
@@ -190,7 +196,7 @@ describe('WebSocketService', () => {
     });
 
     it('should handle malformed messages', () => {
-      wsService.connect();
+      wsService.connect('game-1');
       const mockHandler = vi.fn();
       wsService.onMessage(mockHandler);
 
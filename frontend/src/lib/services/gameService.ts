@@ -90,10 +90,9 @@ class GameService {
                         gameChoices.setAvailableChoices(data.state.choices);
                     }
 
-                    // Connecter le WebSocket avec les nouveaux IDs
-                    const wsUrl = `ws://127.0.0.1:8000/api/ws/game?session_id=${data.state.session_id}&game_id=${data.state.game_id}`;
+                    // Connecter le WebSocket à la partie créée
                     websocketService.disconnect();
-                    websocketService.connect();
+                    websocketService.connect(data.state.game_id);
                 }
                 return data;
             } 
@@ -140,6 +139,8 @@ class GameService {
                 if (data.state.choices) {
                     gameChoices.setAvailableChoices(data.state.choices);
                 }
+                // Suivre la partie restaurée
+                websocketService.connect(session.gameId);
             }
 
             return data;
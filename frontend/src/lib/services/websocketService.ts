@@ -11,6 +11,8 @@ export class WebSocketService {
   private messageQueue: any[] = [];
   private isConnecting: boolean = false;
   private reconnectTimeout: number | null = null;
+  // Partie suivie : le serveur refuse (1008) une connexion sans game_id connu
+  private gameId: string | null = null;
 
   // Store pour l'état de la connexion
   public connectionStatus: Writable<ConnectionStatus> = writable('disconnected');
@@ -21,16 +23,24 @@ export class WebSocketService {
     }
   }
 
-  public async connect(): Promise<void> {
+  public async connect(gameId?: string): Promise<void> {
+    if (gameId) {
+      this.gameId = gameId;
+    }
     if (!browser || this.isConnecting) return;
+    if (!this.gameId) {
+      console.log('⏸️ No game to follow, WebSocket not connected');
+      return;
+    }
 
     this.isConnecting = true;
-    console.log('🔌 Connecting to WebSocket...', this.wsUrl);
+    const url = `${this.wsUrl}?game_id=${encodeURIComponent(this.gameId)}`;
+    console.log('🔌 Connecting to WebSocket...', url);
     this.connectionStatus.set('connecting');
 
     try {
       // Créer la connexion WebSocket
-      this.ws = new WebSocket(this.wsUrl);
+      this.ws = new WebSocket(url);
 
       this.ws.onopen = () => {
         console.log('🟢 WebSocket connected');
@@ -44,13 +54,20 @@ export class WebSocketService {
         }
       };
 
-      this.ws.onclose = () => {
+      this.ws.onclose = (event?: CloseEvent) => {
         console.log('🔴 WebSocket disconnected');
         this.connectionStatus.set('disconnected');
         this.stopHeartbeat();
         this.isConnecting = false;
         this.ws = null;
 
+        // Partie inconnue du serveur : inutile de se reconnecter
+        if (event?.code === 1008) {
+          console.log('⛔ Game not found on server, not reconnecting');
+          this.gameId = null;
+          return;
+        }
+
         // Tentative de reconnexion après 1 seconde
         if (!this.reconnectTimeout) {
           this.reconnectTimeout = window.setTimeout(() => {
@@ -183,4 +200,5 @@ export class WebSocketService {
 }
 
 // Export d'une instance unique du service
-export const websocketService = new WebSocketService('ws://127.0.0.1:8000/api/ws/game');
+// Connecté par gameService.initializeGame, une fois la partie créée
+export const websocketService = new WebSocketService('ws://127.0.0.1:8000/api/ws/game', false);
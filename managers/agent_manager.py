@@ -3,7 +3,7 @@ Agent Manager implementation.
 """
 
 from typing import (
-    Any, Optional, Dict, List, Union, Type, TypeVar, Generic)
+    Any, AsyncGenerator, Optional, Dict, List, Union, Type, TypeVar, Generic)
 from loguru import logger
 from langgraph.types import Command
 from langgraph.errors import GraphInterrupt
@@ -184,12 +184,56 @@ class AgentManager(AgentManagerProtocol):
             raise GameError(f"Failed to process game state: {str(e)}") from e
 
 
+    async def stream_game_state(
+        self,
+        user_input: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Process game state, yielding the update of each node as it completes.
+        
+        Args:
+            user_input: User input to process (optional)
+            
+        Yields:
+            Dict[str, Any]: ``{"node": name, "update": values}`` for each node,
+                then ``{"node": None, "state": GameState}`` once the state is saved
+            
+        Raises:
+            GameError: If state processing fails
+            GraphInterrupt: If waiting for user input
+        """
+        try:
+            state = await self.get_state()
+            if not state:
+                raise GameError("No state available")
+            async for event in self._stream_game_workflow(state, user_input):
+                yield event
+                
+        except GraphInterrupt as gi:
+            logger.info("Workflow interrupted: {}", str(gi))
+            raise
+            
+        except Exception as e:
+            logger.error("Error streaming game state: {}", str(e))
+            raise GameError(f"Failed to process game state: {str(e)}") from e
+
     async def _handle_game_workflow(
             self, 
             state: GameState, 
             user_input: Optional[str] = None
         ) -> GameState:
         """Handle game workflow including state updates and transitions."""
+        updated_state = None
+        async for event in self._stream_game_workflow(state, user_input):
+            if event["node"] is None:
+                updated_state = event["state"]
+        return updated_state
+
+    async def _stream_game_workflow(
+            self, 
+            state: GameState, 
+            user_input: Optional[str] = None
+        ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Run the workflow in updates mode, then save the resulting state once."""
         workflow = await self.get_story_workflow()
         thread_config = {"configurable": {"thread_id": str(state.game_id)}}
 
@@ -209,12 +253,20 @@ class AgentManager(AgentManagerProtocol):
                 logger.debug("[WORKFLOW] Command data: {} (type={})", command_data, type(command_data))
                 logger.debug("[WORKFLOW] Sending Command(resume={}) with thread_id={}", 
                             command_data, thread_config["configurable"]["thread_id"])
-                command = Command(resume=command_data)
-                await workflow.ainvoke(command, thread_config)
+                workflow_input = Command(resume=command_data)
             else:   
                 logger.debug("[WORKFLOW] Starting new workflow with thread_id={}", 
                             thread_config["configurable"]["thread_id"])
-                await workflow.ainvoke(state_dict, thread_config)
+                workflow_input = state_dict
+
+            # Chaque nœud terminé est transmis aussitôt (la narration avant les règles)
+            async for chunk in workflow.astream(workflow_input, thread_config, stream_mode="updates"):
+                for node, update in chunk.items():
+                    if node.startswith("__"):
+                        # __interrupt__ : l'attente du joueur se lit dans le snapshot
+                        continue
+                    logger.debug("[WORKFLOW] Node {} completed", node)
+                    yield {"node": node, "update": update}
 
             # Récupérer l'état mis à jour après l'invocation sans 'await'
             state_snapshot = workflow.get_state(thread_config)
@@ -226,7 +278,7 @@ class AgentManager(AgentManagerProtocol):
 
             # Sauvegarder l'état mis à jour
             await self.managers['state_manager'].save_state(updated_state)
-            return updated_state
+            yield {"node": None, "state": updated_state}
             
         except GraphInterrupt as gi:
             if not user_input:
@@ -3,17 +3,27 @@ Author Manager Module
 Handles author-specific functionality like sections management and knowledge graph.
 """
 
-from typing import Dict, Any, List
-from pathlib import Path
+from typing import Dict, Any, List, Optional
 from loguru import logger
 
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+
 class AuthorManager:
     """Manages author-specific functionality."""
 
-    def __init__(self):
-        """Initialize AuthorManager."""
+    def __init__(self, section_graph: Optional[SectionGraphProtocol] = None):
+        """Initialize AuthorManager.
+        
+        Args:
+            section_graph: Shared section graph index (built on first use if not provided)
+        """
         logger.info("Initializing AuthorManager")
-        self.sections_dir = Path("data/sections")
+        if section_graph is None:
+            # Import here to avoid circular imports
+            from managers.section_graph_index import SectionGraphIndex
+            section_graph = SectionGraphIndex()
+        self.section_graph = section_graph
+        self.sections_dir = section_graph.sections_dir
         logger.debug("AuthorManager initialized with sections dir: {}", self.sections_dir)
 
     async def get_sections(self) -> List[Dict[str, Any]]:
@@ -23,35 +33,8 @@ class AuthorManager:
             List[Dict[str, Any]]: List of available sections with metadata
         """
         logger.info("Getting game sections from {}", self.sections_dir)
-        sections = []
-        
-        if not self.sections_dir.exists():
-            logger.warning("Sections directory not found: {}", self.sections_dir)
-            return []
-            
-        for section_file in self.sections_dir.glob("*.md"):
-            try:
-                section_number = int(section_file.stem)
-                content = section_file.read_text(encoding='utf-8')
-                
-                # Parse metadata from content
-                lines = content.split('\n')
-                title = lines[0].strip('# ') if lines else f"Section {section_number}"
-                description = lines[1] if len(lines) > 1 else ""
-                
-                sections.append({
-                    "number": section_number,
-                    "title": title,
-                    "description": description,
-                    "path": str(section_file)
-                })
-                
-            except ValueError:
-                logger.warning("Invalid section file name: {}", section_file.name)
-            except Exception as e:
-                logger.error("Error processing section {}: {}", section_file.name, str(e))
-        
-        return sorted(sections, key=lambda x: x["number"])
+        self.section_graph.refresh()
+        return self.section_graph.get_sections()
 
     async def get_knowledge_graph(self) -> Dict[str, Any]:
         """Get game knowledge graph.
@@ -59,59 +42,32 @@ class AuthorManager:
         Returns:
             Dict[str, Any]: Knowledge graph data with nodes and links
             
-        The graph is built from section files, analyzing:
+        The graph is served from the section graph index, built from:
         - Section numbers and titles for nodes
         - Links between sections using [[number]] format
-        - Relationships between sections
+        Les fichiers ne sont relus que s'ils ont été modifiés.
         """
-        logger.info("Building knowledge graph from sections")
         try:
-            sections = await self.get_sections()
-            
-            # Créer les nœuds
-            nodes = [
-                {
-                    "id": str(section["number"]),
-                    "title": section["title"],
-                    "description": section["description"],
-                    "type": "section"
-                }
-                for section in sections
-            ]
-            
-            # Créer un dictionnaire des nœuds pour validation
-            node_ids = {str(section["number"]) for section in sections}
-            
-            # Créer les liens
-            links = []
-            for section in sections:
-                content = Path(section["path"]).read_text(encoding='utf-8')
-                
-                # Trouver tous les liens [[X]] dans le contenu
-                import re
-                section_links = re.findall(r'\[\[(\d+)\]\]', content)
-                
-                # Ajouter les liens valides
-                for target in section_links:
-                    # Vérifier que la section cible existe
-                    if target in node_ids:
-                        links.append({
-                            "source": str(section["number"]),
-                            "target": target,
-                            "type": "section_link"
-                        })
-            
-            logger.info(
-                "Knowledge graph built with {} nodes and {} links",
-                len(nodes),
-                len(links)
-            )
-            
-            return {
-                "nodes": nodes,
-                "links": links
-            }
-            
+            self.section_graph.refresh()
+            return self.section_graph.to_knowledge_graph()
         except Exception as e:
             logger.error("Error building knowledge graph: {}", str(e))
             return {"nodes": [], "links": []}
+
+    async def get_graph_report(self) -> Dict[str, Any]:
+        """Get structural issues of the book.
+        
+        Returns:
+            Dict[str, Any]: Dead ends, orphans, unreachable sections and broken links
+        """
+        self.section_graph.refresh()
+        return {
+            **self.section_graph.get_stats(),
+            "dead_ends": self.section_graph.dead_ends(),
+            "orphans": self.section_graph.orphans(),
+            "unreachable": self.section_graph.unreachable(),
+            "broken_links": [
+                {"source": source, "target": target}
+                for source, target in self.section_graph.broken_links()
+            ]
+        }
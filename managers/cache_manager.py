@@ -4,15 +4,20 @@ Handles caching and persistence of game data through a unified interface.
 """
 
 from typing import Dict, Optional, Any, Union, Type, TypeVar, List
-from datetime import datetime, timedelta
-import json
+import asyncio
 from pathlib import Path
 from pydantic import BaseModel
 from loguru import logger
 
 from config.storage_config import StorageConfig, StorageFormat
 from managers.filesystem_adapter import FileSystemAdapter
+from managers.memory_cache import MemoryCache
 from managers.protocols.cache_manager_protocol import CacheManagerProtocol
+from managers.protocols.filesystemadapter_protocol import FileSystemAdapterProtocol
+from managers.protocols.section_corpus_protocol import SectionCorpusProtocol
+from models.game_state import GameState
+from utils import json_codec
+from utils.metrics import CACHE_LOOKUPS
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -23,35 +28,75 @@ _FORMAT_TO_EXTENSION = {
     StorageFormat.RAW: ".md"
 }
 
-def _json_serial(obj):
-    """JSON serializer for objects not serializable by default json code"""
-    if isinstance(obj, (datetime, timedelta)):
-        return obj.isoformat()
-    raise TypeError(f"Type {type(obj)} not serializable")
-
-class CacheEntry:
-    """Represents a cached item with TTL."""
-    def __init__(self, value: Any, ttl_seconds: Optional[int]):
-        self.value = value
-        self.expiry = datetime.now() + timedelta(seconds=ttl_seconds) if ttl_seconds else None
-        
-    def is_expired(self) -> bool:
-        return self.expiry and datetime.now() > self.expiry
-
 class CacheManager(CacheManagerProtocol):
     """
     Manages caching and persistence of game data.
     Provides a unified interface for other managers to store and retrieve data.
     """
     
-    def __init__(self, config: StorageConfig):
-        """Initialize CacheManager with configuration."""
+    def __init__(self, config: StorageConfig, section_corpus: Optional[SectionCorpusProtocol] = None):
+        """Initialize CacheManager with configuration.
+        
+        Args:
+            config: Storage configuration
+            section_corpus: Optional packed corpus serving the raw_content namespace
+        """
         self.config = config
+        self.section_corpus = section_corpus
         self._fs_adapter = FileSystemAdapter(config)
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        self._memory_cache = MemoryCache(
+            max_entries=config.max_cache_size,
+            max_bytes=config.max_cache_bytes
+        )
+        for namespace, ns_config in config.namespaces.items():
+            self._memory_cache.set_limits(namespace, ns_config.max_entries, ns_config.max_bytes)
+        self._sweeper_task: Optional[asyncio.Task] = None
         self._current_session: Optional[Path] = None
         logger.debug("CacheManager initialized with config: {}", config.__class__.__name__)
-        logger.debug("Base storage path: {}", config.base_path.absolute())
+        logger.debug("Base storage path: {}", config.base_path)
+
+    def _is_cache_enabled(self, namespace: str) -> bool:
+        """Check if the memory cache is enabled for a namespace."""
+        return self.config.cache_enabled and self.config.namespaces[namespace].cache_enabled
+
+    def _ensure_sweeper(self) -> None:
+        """Start the TTL sweeper on first use (needs a running event loop)."""
+        if self._sweeper_task is not None:
+            return
+        try:
+            self._sweeper_task = asyncio.get_running_loop().create_task(self._sweep_loop())
+        except RuntimeError:
+            # Pas de boucle active : l'expiration reste paresseuse
+            pass
+
+    async def _sweep_loop(self) -> None:
+        """Periodically remove expired entries from the memory cache."""
+        while True:
+            await asyncio.sleep(self.config.cache_sweep_interval_seconds)
+            removed = self._memory_cache.purge_expired()
+            if removed:
+                logger.debug("Memory cache sweep removed {} expired entries", removed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memory cache counters (hits, misses, evictions, expirations)."""
+        return self._memory_cache.get_stats()
+
+    @property
+    def fs_adapter(self) -> FileSystemAdapterProtocol:
+        """File adapter of the game (per-path locks, I/O pool, fsync policy)."""
+        return self._fs_adapter
+
+    async def close(self) -> None:
+        """Stop the TTL sweeper, flush batched fsyncs and release the memory cache."""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+        await self._fs_adapter.close()
+        self._memory_cache.clear()
 
     def _get_cache_key(self, key: str, namespace: str) -> str:
         """Generate a unique cache key."""
@@ -66,22 +111,21 @@ class CacheManager(CacheManagerProtocol):
         logger.trace("Got file extension for namespace {}: {}", namespace, extension)
         return extension
 
-    def _serialize_data(self, data: Any, namespace: str) -> str:
-        """Serialize data according to namespace format."""
+    def _serialize_data(self, data: Any, namespace: str) -> Union[str, bytes]:
+        """Serialize data according to namespace format.
+        
+        JSON is encoded to UTF-8 bytes by utils.json_codec (once per GameState).
+        """
         format = self.config.namespaces[namespace].format
         logger.debug("Serializing data for namespace {} with format {}", namespace, format)
         
         try:
             if format == StorageFormat.JSON:
-                if isinstance(data, BaseModel):
-                    logger.debug("Serializing Pydantic model to JSON, data before: {}", data)
-                    data_dict = data.model_dump(exclude_none=False)
-                    logger.debug("Data after model_dump: {}", data_dict)
-                    serialized = json.dumps(data_dict, default=_json_serial)
-                    logger.debug("Data after json.dumps: {}", serialized)
-                    return serialized
-                logger.trace("Serializing raw data to JSON")
-                return json.dumps(data, default=_json_serial)
+                if isinstance(data, GameState):
+                    logger.trace("Serializing game state to JSON")
+                    return json_codec.encode_state(data)
+                logger.trace("Serializing data to JSON")
+                return json_codec.dumps(data)
             elif format == StorageFormat.MARKDOWN:
                 logger.trace("Serializing to Markdown format")
                 if hasattr(data, 'to_markdown'):
@@ -109,7 +153,7 @@ class CacheManager(CacheManagerProtocol):
         try:
             if format == StorageFormat.JSON:
                 logger.trace("Parsing JSON data")
-                json_data = json.loads(data)
+                json_data = json_codec.loads(data)
                 if model_type:
                     logger.trace("Converting JSON to model type: {}", model_type.__name__)
                     return model_type.model_validate(json_data)
@@ -158,19 +202,22 @@ class CacheManager(CacheManagerProtocol):
             ns_config = self.config.namespaces[namespace]
             cache_key = self._get_cache_key(key, namespace)
             
+            # Serialize and save to storage
+            logger.debug("Serializing data for storage")
+            serialized_data = self._serialize_data(data, namespace)
+            
             # Only cache if enabled for namespace
-            if ns_config.cache_enabled:
+            if self._is_cache_enabled(namespace):
                 logger.trace("Caching in memory with TTL: {} seconds", ns_config.ttl_seconds)
-                self._memory_cache[cache_key] = CacheEntry(
+                self._ensure_sweeper()
+                self._memory_cache.set(
+                    cache_key,
                     data,
-                    ns_config.ttl_seconds
+                    ns_config.ttl_seconds,
+                    size=len(serialized_data)
                 )
-            
-            # Serialize and save to storage
-            logger.debug("Serializing data for storage")
-            serialized_data = self._serialize_data(data, namespace)
             file_path = self.config.get_absolute_path(namespace) / f"{key}{self._get_file_extension(namespace)}"
-            logger.debug("Saving to file: {}", file_path.absolute())
+            logger.debug("Saving to file: {}", file_path)
             await self._fs_adapter.write_file_async(file_path, serialized_data)
             logger.info("Successfully saved data for {}/{}", namespace, key)
             
@@ -192,39 +239,42 @@ class CacheManager(CacheManagerProtocol):
             cache_key = self._get_cache_key(key, namespace)
             
             # Try memory cache if enabled
-            if ns_config.cache_enabled:
+            cache_enabled = self._is_cache_enabled(namespace)
+            if cache_enabled:
                 logger.trace("Checking memory cache")
                 cache_entry = self._memory_cache.get(cache_key)
-                if cache_entry:
-                    if cache_entry.is_expired():
-                        logger.debug("Cache entry expired")
-                        del self._memory_cache[cache_key]
-                    else:
-                        logger.debug("Found in memory cache")
-                        return cache_entry.value
+                if cache_entry is not None:
+                    logger.debug("Found in memory cache")
+                    CACHE_LOOKUPS.labels(namespace, "memory").inc()
+                    return cache_entry.value
             
             # Try persistent storage
             file_path = self.config.get_absolute_path(namespace) / f"{key}{self._get_file_extension(namespace)}"
-            logger.debug("Looking for file: {}", file_path.absolute())
+            logger.debug("Looking for file: {}", file_path)
             
             data = await self._fs_adapter.read_file_async(file_path)
             
             if data is not None:
                 logger.debug("Found in persistent storage")
+                CACHE_LOOKUPS.labels(namespace, "storage").inc()
                 # Deserialize according to format
                 deserialized_data = self._deserialize_data(data, namespace, model_type)
                 
                 # Cache if enabled
-                if ns_config.cache_enabled:
+                if cache_enabled:
                     logger.trace("Caching deserialized data")
-                    self._memory_cache[cache_key] = CacheEntry(
+                    self._ensure_sweeper()
+                    self._memory_cache.set(
+                        cache_key,
                         deserialized_data,
-                        ns_config.ttl_seconds
+                        ns_config.ttl_seconds,
+                        size=len(data)
                     )
                 
                 return deserialized_data
             
             logger.debug("Data not found in cache or storage")
+            CACHE_LOOKUPS.labels(namespace, "miss").inc()
             return None
             
         except Exception as e:
@@ -249,12 +299,7 @@ class CacheManager(CacheManagerProtocol):
         logger.info("Clearing cache for namespace: {}", namespace)
         
         # Clear in-memory cache for this namespace
-        keys_to_remove = [
-            k for k in self._memory_cache.keys() 
-            if k.startswith(f"{namespace}:")
-        ]
-        for key in keys_to_remove:
-            del self._memory_cache[key]
+        self._memory_cache.clear_namespace(namespace)
             
         # Clear persistent storage for this namespace if needed
         if self.config.namespaces[namespace].persistent:
@@ -269,6 +314,14 @@ class CacheManager(CacheManagerProtocol):
                             
         logger.debug("Cache cleared for namespace: {}", namespace)
 
+    def _serves_from_corpus(self, key: str, namespace: str) -> bool:
+        """Whether a raw_content key can be looked up in the packed corpus."""
+        return (namespace == "raw_content" and self.section_corpus is not None
+                and self.section_corpus.loaded and key.isdigit())
+
+    def _raw_content_path(self, key: str, namespace: str) -> Path:
+        return self.config.get_absolute_path(namespace) / f"{key}{self._get_file_extension(namespace)}"
+
     async def exists_raw_content(self, key: str, namespace: str) -> bool:
         """
         Check if raw content exists in cache or storage.
@@ -284,9 +337,10 @@ class CacheManager(CacheManagerProtocol):
             KeyError: If namespace is unknown
         """
         try:
-            # Utilise load_raw_content qui gère déjà la vérification et le chargement
-            content = await self.load_raw_content(key, namespace)
-            return content is not None
+            # Corpus mappé, sinon simple stat : le contenu n'est lu que par load_raw_content
+            if self._serves_from_corpus(key, namespace) and self.section_corpus.get_view(int(key)) is not None:
+                return True
+            return self._raw_content_path(key, namespace).is_file()
             
         except Exception as e:
             logger.error("Error checking content existence: {}", str(e))
@@ -308,6 +362,12 @@ class CacheManager(CacheManagerProtocol):
             KeyError: If namespace is unknown
         """
         try:
+            if self._serves_from_corpus(key, namespace):
+                content = self.section_corpus.get(int(key))
+                if content is not None:
+                    logger.debug("Content served from section corpus for {}/{}", namespace, key)
+                    return content
+                
             # Vérifier d'abord dans le cache
             cached_data = await self.get_cached_data(key, namespace)
             if cached_data is not None:
@@ -315,9 +375,9 @@ class CacheManager(CacheManagerProtocol):
                 return cached_data
                 
             # Sinon charger depuis le stockage
-            file_path = self.config.get_absolute_path(namespace) / f"{key}{self._get_file_extension(namespace)}"
-            logger.debug("Looking for file at path: {}", file_path.absolute())
-            logger.debug("Base path is: {}", self.config.base_path.absolute())
+            file_path = self._raw_content_path(key, namespace)
+            logger.debug("Looking for file at path: {}", file_path)
+            logger.debug("Base path is: {}", self.config.base_path)
             logger.debug("File exists: {}", file_path.exists())
             
             if not file_path.exists():
@@ -340,8 +400,7 @@ class CacheManager(CacheManagerProtocol):
         """Delete content from cache."""
         try:
             cache_key = self._get_cache_key(key, namespace)
-            if cache_key in self._memory_cache:
-                del self._memory_cache[cache_key]
+            self._memory_cache.delete(cache_key)
             
             file_path = self.config.get_absolute_path(namespace) / f"{key}{self._get_file_extension(namespace)}"
             await self._fs_adapter.delete_file_async(file_path)
@@ -0,0 +1,548 @@
+"""
+Checkpoint Saver Module
+Persistent LangGraph checkpointer (SQLite, WAL).
+
+Chaque partie (``thread_id`` = ``game_id``) garde ses derniers checkpoints :
+- en mémoire pour les parties actives (LRU borné, ``max_hot_threads``)
+- sur disque dans une base SQLite en mode WAL, partagée par les workers
+
+Les écritures sont bufferisées et écrites par lots dans une seule
+transaction (toutes les ``flush_interval_seconds`` ou dès ``batch_size``
+lignes). Seules les ``keep_versions`` dernières versions de chaque partie
+sont conservées. Une partie est servie par un seul worker à la fois (comme
+les sessions) ; après un redémarrage elle reprend au dernier checkpoint
+écrit.
+"""
+
+import asyncio
+import random
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Dict, Any, Iterator, AsyncIterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.serde.types import TASKS, ChannelProtocol
+
+from config.managers.checkpoint_config import CheckpointConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+_ZLIB_SUFFIX = "+zlib"
+
+# Valeur sérialisée par le serde : (type, octets)
+Typed = Tuple[str, bytes]
+
+
+class _ThreadCheckpoints:
+    """Checkpoints and pending writes of one game."""
+
+    __slots__ = ("checkpoints", "writes")
+
+    def __init__(self):
+        # checkpoint_ns -> checkpoint_id -> (checkpoint, metadata, parent_checkpoint_id)
+        self.checkpoints: Dict[str, Dict[str, Tuple[Typed, Typed, Optional[str]]]] = defaultdict(dict)
+        # (checkpoint_ns, checkpoint_id) -> (task_id, idx) -> (task_id, channel, value)
+        self.writes: Dict[Tuple[str, str], Dict[Tuple[str, int], Tuple[str, str, Typed]]] = defaultdict(dict)
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """LangGraph checkpointer with a memory hot set and a batched SQLite store."""
+
+    def __init__(self, config: Optional[CheckpointConfig] = None):
+        """Initialize SQLiteCheckpointSaver.
+
+        Args:
+            config: Optional checkpoint configuration
+        """
+        super().__init__()
+        self.config = config or CheckpointConfig()
+        self._hot: "OrderedDict[str, _ThreadCheckpoints]" = OrderedDict()
+        self._pending: List[Tuple[str, str, tuple]] = []
+        # Lignes non écrites par partie : une partie sale n'est jamais évincée
+        self._dirty: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._flushes = 0
+        self._loads = 0
+
+    # -------------------------------------------------------------------------
+    # SQLite (appels bloquants)
+    # -------------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            db_path = Path(self.config.db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL : une coupure peut perdre le dernier lot, jamais corrompre la base
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._db.commit()
+        return self._db
+
+    def _pack(self, typed: Typed) -> Typed:
+        type_, data = typed
+        if self.config.compress_min_bytes and len(data) >= self.config.compress_min_bytes:
+            return type_ + _ZLIB_SUFFIX, zlib.compress(data, 1)
+        return type_, data
+
+    @staticmethod
+    def _unpack(type_: str, data: bytes) -> Typed:
+        if type_.endswith(_ZLIB_SUFFIX):
+            return type_[:-len(_ZLIB_SUFFIX)], zlib.decompress(data)
+        return type_, bytes(data)
+
+    def _load_thread(self, thread_id: str) -> _ThreadCheckpoints:
+        """Read the stored checkpoints of a game."""
+        data = _ThreadCheckpoints()
+        with self._db_lock:
+            db = self._connect()
+            for ns, checkpoint_id, parent_id, type_, checkpoint, metadata_type, metadata in db.execute(
+                "SELECT checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, "
+                "metadata_type, metadata FROM checkpoints WHERE thread_id = ?",
+                (thread_id,)
+            ):
+                data.checkpoints[ns][checkpoint_id] = (
+                    self._unpack(type_, checkpoint),
+                    self._unpack(metadata_type, metadata),
+                    parent_id
+                )
+            for ns, checkpoint_id, task_id, idx, channel, type_, value in db.execute(
+                "SELECT checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value "
+                "FROM writes WHERE thread_id = ? ORDER BY rowid",
+                (thread_id,)
+            ):
+                data.writes[(ns, checkpoint_id)][(task_id, idx)] = (
+                    task_id, channel, self._unpack(type_, value)
+                )
+        self._loads += 1
+        return data
+
+    def flush(self) -> int:
+        """Write buffered checkpoints to disk in a single transaction.
+
+        Returns:
+            int: Number of rows written
+        """
+        with self._db_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            db = self._connect()
+            try:
+                with db:
+                    for op, thread_id, row in batch:
+                        if op == "checkpoint":
+                            db.execute(
+                                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                (thread_id, *row)
+                            )
+                        elif op == "write":
+                            db.execute(
+                                "INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                (thread_id, *row)
+                            )
+                        else:
+                            db.execute(
+                                "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                                "AND checkpoint_id < ?",
+                                (thread_id, *row)
+                            )
+                            db.execute(
+                                "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+                                "AND checkpoint_id < ?",
+                                (thread_id, *row)
+                            )
+            except Exception as e:
+                # Le lot est remis en tête : rien n'est perdu tant que le process vit
+                logger.error("Error writing checkpoints: {}", str(e))
+                with self._lock:
+                    self._pending[:0] = batch
+                raise
+
+            with self._lock:
+                for _, thread_id, _ in batch:
+                    remaining = self._dirty.get(thread_id, 0) - 1
+                    if remaining > 0:
+                        self._dirty[thread_id] = remaining
+                    else:
+                        self._dirty.pop(thread_id, None)
+                self._evict_locked()
+            self._flushes += 1
+        return len(batch)
+
+    # -------------------------------------------------------------------------
+    # Hot set
+    # -------------------------------------------------------------------------
+    def _evict_locked(self) -> None:
+        """Drop the least recently used clean games beyond the hot set size."""
+        excess = len(self._hot) - self.config.max_hot_threads
+        if excess <= 0:
+            return
+        for thread_id in [t for t in self._hot if t not in self._dirty][:excess]:
+            del self._hot[thread_id]
+
+    def _hot_thread(self, thread_id: str) -> Optional[_ThreadCheckpoints]:
+        with self._lock:
+            data = self._hot.get(thread_id)
+            if data is not None:
+                self._hot.move_to_end(thread_id)
+            return data
+
+    def _thread(self, thread_id: str) -> _ThreadCheckpoints:
+        """Checkpoints of a game, loaded from disk if not in memory."""
+        data = self._hot_thread(thread_id)
+        if data is not None:
+            return data
+        loaded = self._load_thread(thread_id)
+        with self._lock:
+            # Un autre appel a pu charger la partie entre-temps
+            data = self._hot.setdefault(thread_id, loaded)
+            self._hot.move_to_end(thread_id)
+            self._evict_locked()
+        return data
+
+    def _queue_locked(self, op: str, thread_id: str, row: tuple) -> None:
+        self._pending.append((op, thread_id, row))
+        self._dirty[thread_id] = self._dirty.get(thread_id, 0) + 1
+
+    def _prune_locked(self, thread_id: str, checkpoint_ns: str, data: _ThreadCheckpoints) -> None:
+        """Keep the latest ``keep_versions`` checkpoints of a game."""
+        checkpoints = data.checkpoints[checkpoint_ns]
+        if len(checkpoints) <= self.config.keep_versions:
+            return
+        ordered = sorted(checkpoints)
+        oldest_kept = ordered[-self.config.keep_versions]
+        for checkpoint_id in ordered[:-self.config.keep_versions]:
+            del checkpoints[checkpoint_id]
+            data.writes.pop((checkpoint_ns, checkpoint_id), None)
+        self._queue_locked("prune", thread_id, (checkpoint_ns, oldest_kept))
+
+    # -------------------------------------------------------------------------
+    # BaseCheckpointSaver
+    # -------------------------------------------------------------------------
+    def _tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        data: _ThreadCheckpoints
+    ) -> CheckpointTuple:
+        checkpoint, metadata, parent_checkpoint_id = data.checkpoints[checkpoint_ns][checkpoint_id]
+        writes = data.writes.get((checkpoint_ns, checkpoint_id), {}).values()
+        sends = []
+        if parent_checkpoint_id:
+            sends = [
+                w[2] for w in data.writes.get((checkpoint_ns, parent_checkpoint_id), {}).values()
+                if w[1] == TASKS
+            ]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **self.serde.loads_typed(checkpoint),
+                "pending_sends": [self.serde.loads_typed(s) for s in sends],
+            },
+            metadata=self.serde.loads_typed(metadata),
+            pending_writes=[(task_id, c, self.serde.loads_typed(v)) for task_id, c, v in writes],
+            parent_config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": parent_checkpoint_id,
+                }
+            } if parent_checkpoint_id else None,
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get a checkpoint (the latest one if no checkpoint_id is given)."""
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        data = self._thread(thread_id)
+        with self._lock:
+            checkpoints = data.checkpoints.get(checkpoint_ns)
+            if not checkpoints:
+                return None
+            checkpoint_id = get_checkpoint_id(config) or max(checkpoints)
+            if checkpoint_id not in checkpoints:
+                return None
+            return self._tuple(thread_id, checkpoint_ns, checkpoint_id, data)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints, newest first."""
+        if config:
+            thread_ids = [str(config["configurable"]["thread_id"])]
+        else:
+            self.flush()
+            with self._db_lock:
+                thread_ids = [
+                    row[0] for row in self._connect().execute("SELECT DISTINCT thread_id FROM checkpoints")
+                ]
+        config_checkpoint_ns = config["configurable"].get("checkpoint_ns") if config else None
+        config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+
+        for thread_id in thread_ids:
+            data = self._thread(thread_id)
+            with self._lock:
+                candidates = [
+                    (ns, checkpoint_id)
+                    for ns, checkpoints in data.checkpoints.items()
+                    if config_checkpoint_ns is None or ns == config_checkpoint_ns
+                    for checkpoint_id in checkpoints
+                ]
+            for ns, checkpoint_id in sorted(candidates, key=lambda c: c[1], reverse=True):
+                if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
+                    continue
+                if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
+                    continue
+                with self._lock:
+                    if checkpoint_id not in data.checkpoints[ns]:
+                        continue
+                    checkpoint_tuple = self._tuple(thread_id, ns, checkpoint_id, data)
+                if filter and not all(
+                    value == checkpoint_tuple.metadata.get(key) for key, value in filter.items()
+                ):
+                    continue
+                if limit is not None:
+                    if limit <= 0:
+                        return
+                    limit -= 1
+                yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint (written to disk with the next batch)."""
+        self._store_checkpoint(config, checkpoint, metadata)
+        if self._batch_full():
+            self.flush()
+        return {
+            "configurable": {
+                "thread_id": config["configurable"]["thread_id"],
+                "checkpoint_ns": config["configurable"]["checkpoint_ns"],
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def _store_checkpoint(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata
+    ) -> None:
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+        c = checkpoint.copy()
+        c.pop("pending_sends", None)
+        typed_checkpoint = self.serde.dumps_typed(c)
+        typed_metadata = self.serde.dumps_typed(metadata)
+
+        data = self._thread(thread_id)
+        with self._lock:
+            data.checkpoints[checkpoint_ns][checkpoint["id"]] = (
+                typed_checkpoint, typed_metadata, parent_checkpoint_id
+            )
+            self._queue_locked("checkpoint", thread_id, (
+                checkpoint_ns, checkpoint["id"], parent_checkpoint_id,
+                *self._pack(typed_checkpoint), *self._pack(typed_metadata)
+            ))
+            self._prune_locked(thread_id, checkpoint_ns, data)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+    ) -> None:
+        """Store the pending writes of a task."""
+        self._store_writes(config, writes, task_id)
+        if self._batch_full():
+            self.flush()
+
+    def _store_writes(self, config: RunnableConfig, writes: Sequence[Tuple[str, Any]], task_id: str) -> None:
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        data = self._thread(thread_id)
+        with self._lock:
+            stored = data.writes[(checkpoint_ns, checkpoint_id)]
+            for idx, (channel, value) in enumerate(writes):
+                key = (task_id, WRITES_IDX_MAP.get(channel, idx))
+                if key[1] >= 0 and key in stored:
+                    continue
+                typed_value = self.serde.dumps_typed(value)
+                stored[key] = (task_id, channel, typed_value)
+                self._queue_locked("write", thread_id, (
+                    checkpoint_ns, checkpoint_id, task_id, key[1], channel, *self._pack(typed_value)
+                ))
+
+    def _batch_full(self) -> bool:
+        return len(self._pending) >= self.config.batch_size
+
+    def get_next_version(self, current: Optional[str], channel: ChannelProtocol) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # -------------------------------------------------------------------------
+    # Variantes async (I/O disque dans un thread)
+    # -------------------------------------------------------------------------
+    async def _athread(self, thread_id: str) -> None:
+        """Load a game in the hot set without blocking the event loop."""
+        if self._hot_thread(thread_id) is None:
+            await asyncio.to_thread(self._thread, thread_id)
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not loop:
+            self._flusher = loop.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.flush_interval_seconds)
+            if self._pending:
+                try:
+                    await asyncio.to_thread(self.flush)
+                except Exception:
+                    pass  # Déjà loggé, le lot sera retenté
+
+    async def _aflush_if_full(self) -> None:
+        if self._batch_full():
+            await asyncio.to_thread(self.flush)
+        else:
+            self._ensure_flusher()
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Asynchronous version of get_tuple."""
+        await self._athread(str(config["configurable"]["thread_id"]))
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Asynchronous version of list."""
+        if config:
+            await self._athread(str(config["configurable"]["thread_id"]))
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Asynchronous version of put."""
+        await self._athread(str(config["configurable"]["thread_id"]))
+        self._store_checkpoint(config, checkpoint, metadata)
+        await self._aflush_if_full()
+        return {
+            "configurable": {
+                "thread_id": config["configurable"]["thread_id"],
+                "checkpoint_ns": config["configurable"]["checkpoint_ns"],
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+    ) -> None:
+        """Asynchronous version of put_writes."""
+        await self._athread(str(config["configurable"]["thread_id"]))
+        self._store_writes(config, writes, task_id)
+        await self._aflush_if_full()
+
+    # -------------------------------------------------------------------------
+    # Cycle de vie
+    # -------------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        """Get checkpointer counters."""
+        return {
+            "hot_threads": len(self._hot),
+            "pending_rows": len(self._pending),
+            "flushes": self._flushes,
+            "loads": self._loads
+        }
+
+    async def close(self) -> None:
+        """Flush buffered checkpoints and close the database."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await asyncio.to_thread(self.flush)
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
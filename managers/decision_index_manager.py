@@ -0,0 +1,382 @@
+"""
+Decision Index Manager Module
+Retrieval of similar past decisions (FAISS k-NN).
+
+L'index (``decision_index.faiss`` + ``docstore.json``) est mappé en mémoire
+au démarrage depuis ``index_dir`` (données d'exécution), ou à défaut depuis
+l'index livré dans ``seed_dir``, qui n'est jamais réécrit : la première
+fusion copie ses entrées dans ``index_dir``. Pour chaque entrée libre du
+joueur :
+- une décision déjà confirmée et quasi identique est réutilisée sans LLM
+- sinon les exemples les plus proches sont ajoutés au prompt
+
+Les décisions confirmées sont ajoutées dans un index en mémoire, fusionné
+sur disque par lots (``compact_every``) et à l'arrêt. La fusion écrit un
+instantané figé dans un thread puis remplace les références sur la boucle :
+aucune recherche n'attend l'écriture.
+"""
+
+import asyncio
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from loguru import logger
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:  # Dépendance optionnelle : l'étape de recherche est alors désactivée
+    faiss = None
+    np = None
+
+from config.managers.decision_index_config import DecisionIndexConfig
+from managers.protocols.decision_index_protocol import DecisionIndexProtocol
+from utils.choice_resolver import normalize_player_input, parse_dice_roll
+
+INDEX_FILE = "decision_index.faiss"
+DOCSTORE_FILE = "docstore.json"
+
+_NUMBER_PATTERN = re.compile(r"\d+")
+
+# Entrée du docstore : texte brut (index historique) ou décision structurée
+DocstoreEntry = Union[str, Dict[str, Any]]
+
+
+@dataclass
+class DecisionExample:
+    """Past decision similar to a player input."""
+    text: str
+    similarity: float
+    record: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class DecisionRetrieval:
+    """Result of a lookup, kept to append the confirmed decision."""
+    section_number: int
+    player_input: str
+    vector: Any
+    examples: List[DecisionExample] = field(default_factory=list)
+    hit: Optional[DecisionExample] = None
+
+
+def _query_text(section_number: int, player_input: str) -> str:
+    return f"Section {section_number}: {normalize_player_input(player_input)}"
+
+
+class DecisionIndexManager(DecisionIndexProtocol):
+    """FAISS index of past decisions."""
+
+    def __init__(self, config: Optional[DecisionIndexConfig] = None, embeddings: Optional[Any] = None):
+        """Initialize DecisionIndexManager.
+
+        Args:
+            config: Optional index configuration
+            embeddings: Optional LangChain ``Embeddings`` (defaults to the configured provider)
+        """
+        self.config = config or DecisionIndexConfig()
+        self._embeddings = embeddings
+        self._index = None
+        self._docstore: Dict[str, DocstoreEntry] = {}
+        self._delta = None
+        self._delta_docs: List[Dict[str, Any]] = []
+        # Ajouts en cours d'écriture sur disque, toujours interrogés
+        self._frozen = None
+        self._frozen_docs: List[Dict[str, Any]] = []
+        self._dimension = self.config.dimension
+        self._metric = None
+        self._compact_lock = asyncio.Lock()
+        self._loaded = False
+        self._disabled = False
+        self._searches = 0
+        self._direct_hits = 0
+        self._appended = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether the index can be queried."""
+        return self._loaded and not self._disabled
+
+    @property
+    def _index_path(self) -> Path:
+        return Path(self.config.index_dir) / INDEX_FILE
+
+    @property
+    def _docstore_path(self) -> Path:
+        return Path(self.config.index_dir) / DOCSTORE_FILE
+
+    def _source_dir(self) -> Optional[Path]:
+        """Directory to load: the runtime index, else the shipped seed."""
+        if self._index_path.exists():
+            return Path(self.config.index_dir)
+        seed_dir = self.config.seed_dir
+        if seed_dir is not None and (Path(seed_dir) / INDEX_FILE).exists():
+            return Path(seed_dir)
+        return None
+
+    # -------------------------------------------------------------------------
+    # Chargement
+    # -------------------------------------------------------------------------
+    def load(self) -> int:
+        """Memory-map the index and load its docstore.
+
+        Returns:
+            int: Number of indexed decisions
+        """
+        if not self.config.enabled:
+            return 0
+        if faiss is None:
+            logger.warning("faiss is not installed, decision retrieval disabled")
+            return 0
+
+        source_dir = self._source_dir()
+        if source_dir is not None:
+            index_path, docstore_path = source_dir / INDEX_FILE, source_dir / DOCSTORE_FILE
+            try:
+                self._index = faiss.read_index(
+                    str(index_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+                if docstore_path.exists():
+                    self._docstore = json.loads(docstore_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.error("Error loading decision index {}: {}", index_path, str(e))
+                return 0
+            self._dimension = self._index.d
+            self._metric = self._index.metric_type
+        else:
+            self._metric = faiss.METRIC_L2
+        self._loaded = True
+
+        logger.info("Decision index loaded: {} decisions (d={})", self._ntotal(), self._dimension)
+        return self._ntotal()
+
+    def _ntotal(self) -> int:
+        base = self._index.ntotal if self._index is not None else 0
+        return base + len(self._frozen_docs) + len(self._delta_docs)
+
+    def _create_embeddings(self) -> Any:
+        if self.config.embedding_provider == "fake":
+            from langchain_core.embeddings import DeterministicFakeEmbedding
+            return DeterministicFakeEmbedding(size=self._dimension)
+        from langchain_openai import OpenAIEmbeddings
+        return OpenAIEmbeddings(model=self.config.embedding_model)
+
+    async def _embed(self, text: str) -> Any:
+        if self._embeddings is None:
+            self._embeddings = self._create_embeddings()
+        vector = np.asarray([await self._embeddings.aembed_query(text)], dtype="float32")
+        if vector.shape[1] != self._dimension:
+            self._disabled = True
+            raise ValueError(
+                f"Embedding dimension {vector.shape[1]} does not match the index ({self._dimension})"
+            )
+        faiss.normalize_L2(vector)
+        return vector
+
+    # -------------------------------------------------------------------------
+    # Recherche
+    # -------------------------------------------------------------------------
+    def _similarity(self, distance: float) -> float:
+        # Vecteurs normalisés : distance L2² = 2 - 2·cos
+        if self._metric == faiss.METRIC_INNER_PRODUCT:
+            return float(distance)
+        return 1.0 - float(distance) / 2.0
+
+    def _knn(self, vector: Any, k: int) -> List[Tuple[float, DocstoreEntry]]:
+        """k-NN over the mapped index and the pending appends."""
+        # Tout s'exécute sur la boucle : les références lues ici ne sont
+        # remplacées que par _compact, jamais modifiées pendant l'écriture
+        results = []
+        sources = []
+        docstore = self._docstore
+        if self._index is not None and self._index.ntotal:
+            sources.append((self._index, lambda i: docstore.get(str(i))))
+        for delta, docs in ((self._frozen, self._frozen_docs), (self._delta, self._delta_docs)):
+            if delta is not None and delta.ntotal:
+                sources.append((delta, docs.__getitem__))
+        for index, get_doc in sources:
+            distances, ids = index.search(vector, min(k, index.ntotal))
+            for distance, i in zip(distances[0], ids[0]):
+                doc = get_doc(int(i)) if i >= 0 else None
+                if doc is not None:
+                    results.append((self._similarity(distance), doc))
+        results.sort(key=lambda r: r[0], reverse=True)
+        return results[:k]
+
+    def _format_example(self, doc: DocstoreEntry) -> str:
+        if isinstance(doc, dict):
+            return (f"Section {doc['section_number']}, « {doc['player_input']} » "
+                    f"→ section {doc['next_section']}")
+        text = " ".join(doc.split())
+        if len(text) > self.config.max_example_chars:
+            text = text[:self.config.max_example_chars].rstrip() + "…"
+        return text
+
+    def _is_direct_hit(self, section_number: int, player_input: str, doc: DocstoreEntry, similarity: float) -> bool:
+        if not isinstance(doc, dict) or similarity < self.config.direct_threshold:
+            return False
+        if doc.get("section_number") != section_number:
+            return False
+        # « au 48 » et « au 49 » ont des embeddings presque identiques
+        return _NUMBER_PATTERN.findall(player_input) == _NUMBER_PATTERN.findall(doc.get("player_input", ""))
+
+    async def search(self, section_number: int, player_input: str) -> Optional[DecisionRetrieval]:
+        """Find decisions similar to a player input.
+
+        Dice rolls are never looked up: their outcome depends on the exact value.
+
+        Args:
+            section_number: Current section
+            player_input: Player input
+
+        Returns:
+            Optional[DecisionRetrieval]: Direct hit and prompt examples, None if unavailable
+        """
+        if not self.available or not player_input or parse_dice_roll(player_input) is not None:
+            return None
+
+        try:
+            vector = await self._embed(_query_text(section_number, player_input))
+        except Exception as e:
+            logger.error("Error embedding player input: {}", str(e))
+            return None
+
+        self._searches += 1
+        retrieval = DecisionRetrieval(section_number, player_input, vector)
+        # On élargit la recherche : le hit direct doit être dans la même section
+        for similarity, doc in self._knn(vector, max(self.config.top_k, 1) * 4):
+            if retrieval.hit is None and self._is_direct_hit(section_number, player_input, doc, similarity):
+                retrieval.hit = DecisionExample(self._format_example(doc), similarity, doc)
+                self._direct_hits += 1
+            elif (similarity >= self.config.example_threshold
+                  and len(retrieval.examples) < self.config.top_k):
+                record = doc if isinstance(doc, dict) else None
+                retrieval.examples.append(DecisionExample(self._format_example(doc), similarity, record))
+        return retrieval
+
+    # -------------------------------------------------------------------------
+    # Ajouts
+    # -------------------------------------------------------------------------
+    def _new_flat_index(self) -> Any:
+        if self._metric == faiss.METRIC_INNER_PRODUCT:
+            return faiss.IndexFlatIP(self._dimension)
+        return faiss.IndexFlatL2(self._dimension)
+
+    async def add_decision(
+        self,
+        retrieval: DecisionRetrieval,
+        next_section: int,
+        conditions: Optional[List[str]] = None,
+        analysis: str = ""
+    ) -> None:
+        """Append a confirmed decision to the index.
+
+        Args:
+            retrieval: Result of the lookup made for this input (reuses its embedding)
+            next_section: Decided section
+            conditions: Conditions of the decision
+            analysis: Analysis of the decision
+        """
+        if not self.available or not self.config.learn:
+            return
+        if retrieval.hit is not None and retrieval.hit.record.get("next_section") == next_section:
+            return
+
+        record = {
+            "section_number": retrieval.section_number,
+            "player_input": retrieval.player_input,
+            "next_section": next_section,
+            "conditions": list(conditions or []),
+            "analysis": analysis
+        }
+        if self._delta is None:
+            self._delta = self._new_flat_index()
+        self._delta.add(retrieval.vector)
+        self._delta_docs.append(record)
+        self._appended += 1
+
+        if len(self._delta_docs) >= self.config.compact_every and not self._compact_lock.locked():
+            await self._compact()
+
+    async def _compact(self) -> None:
+        """Merge pending appends into the index files and map them again."""
+        async with self._compact_lock:
+            if not self._delta_docs:
+                return
+            # Les ajouts suivants vont dans un nouveau delta pendant l'écriture
+            self._frozen, self._frozen_docs = self._delta, self._delta_docs
+            self._delta, self._delta_docs = None, []
+            try:
+                index, docstore = await asyncio.to_thread(
+                    self._write_merged, self._index, self._docstore, self._frozen, self._frozen_docs
+                )
+            except Exception as e:
+                logger.error("Error writing decision index: {}", str(e))
+                self._restore_frozen()
+                return
+            self._index, self._docstore = index, docstore
+            self._frozen, self._frozen_docs = None, []
+        logger.info("Decision index compacted: {} decisions", self._ntotal())
+
+    def _restore_frozen(self) -> None:
+        """Put the decisions that could not be written back in front of the delta."""
+        delta = self._new_flat_index()
+        for index in (self._frozen, self._delta):
+            if index is not None and index.ntotal:
+                delta.add(index.reconstruct_n(0, index.ntotal))
+        self._delta, self._delta_docs = delta, self._frozen_docs + self._delta_docs
+        self._frozen, self._frozen_docs = None, []
+
+    def _write_merged(
+        self,
+        index: Any,
+        docstore: Dict[str, DocstoreEntry],
+        delta: Any,
+        delta_docs: List[Dict[str, Any]]
+    ) -> Tuple[Any, Dict[str, DocstoreEntry]]:
+        """Write the index merged with ``delta`` and map it (worker thread, inputs are not modified)."""
+        merged = self._new_flat_index()
+        base = index.ntotal if index is not None else 0
+        if base:
+            merged.add(index.reconstruct_n(0, base))
+        merged.add(delta.reconstruct_n(0, delta.ntotal))
+        docstore = dict(docstore)
+        for i, record in enumerate(delta_docs):
+            docstore[str(base + i)] = record
+
+        self._index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_index = self._index_path.with_suffix(".faiss.tmp")
+        faiss.write_index(merged, str(tmp_index))
+        tmp_docstore = self._docstore_path.with_suffix(".json.tmp")
+        tmp_docstore.write_text(json.dumps(docstore, ensure_ascii=False), encoding="utf-8")
+        # Le docstore d'abord : une entrée sans vecteur n'est jamais lue
+        os.replace(tmp_docstore, self._docstore_path)
+        os.replace(tmp_index, self._index_path)
+
+        mapped = faiss.read_index(str(self._index_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        return mapped, docstore
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index counters."""
+        return {
+            "available": self.available,
+            "decisions": self._ntotal(),
+            "pending": len(self._frozen_docs) + len(self._delta_docs),
+            "searches": self._searches,
+            "direct_hits": self._direct_hits,
+            "appended": self._appended
+        }
+
+    async def close(self) -> None:
+        """Persist appended decisions."""
+        if self.available:
+            # Attend aussi une fusion en cours
+            await self._compact()
+
+
+# Register protocol after class definition
+DecisionIndexProtocol.register(DecisionIndexManager)
@@ -1,7 +1,8 @@
 """
 Dependencies for FastAPI.
 """
-from typing import Optional, Dict, Union, TYPE_CHECKING
+from typing import Optional, Union, TYPE_CHECKING
+from fastapi import HTTPException, status
 from loguru import logger
 
 from managers.protocols.agent_manager_protocol import AgentManagerProtocol
@@ -13,6 +14,9 @@ from managers.protocols.decision_manager_protocol import DecisionManagerProtocol
 from managers.protocols.rules_manager_protocol import RulesManagerProtocol
 from managers.protocols.narrator_manager_protocol import NarratorManagerProtocol
 from managers.protocols.workflow_manager_protocol import WorkflowManagerProtocol
+from managers.protocols.session_manager_protocol import SessionManagerProtocol
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+from managers.protocols.author_manager_protocol import AuthorManagerProtocol
 
 from agents.protocols.story_graph_protocol import StoryGraphProtocol
 from agents.protocols.narrator_agent_protocol import NarratorAgentProtocol
@@ -23,6 +27,7 @@ from agents.protocols.base_agent_protocol import BaseAgentProtocol
 
 if TYPE_CHECKING:
     from agents.factories.game_factory import GameFactory
+    from managers.session_manager import GameSession
 
 # Type alias for manager protocols
 ManagerProtocols = Union[
@@ -46,38 +51,85 @@ AgentProtocols = Union[
 
 # Composants du jeu
 _game_factory: Optional["GameFactory"] = None
-_agent_manager: Optional[AgentManagerProtocol] = None
-_game_components: Optional[tuple[Dict[str, AgentProtocols], Dict[str, ManagerProtocols]]] = None
+_session_manager: Optional[SessionManagerProtocol] = None
+_author_manager: Optional[AuthorManagerProtocol] = None
 
-def get_agent_manager() -> AgentManagerProtocol:
-    """Get AgentManager instance."""
-    global _agent_manager, _game_factory, _game_components
+def get_game_factory() -> "GameFactory":
+    """Get GameFactory instance shared by all games."""
+    global _game_factory
     
-    if not _agent_manager:
-        logger.info("Creating new AgentManager instance")
-        if not _game_factory:
-            logger.debug("Creating new GameFactory instance")
-            from agents.factories.game_factory import GameFactory
-            _game_factory = GameFactory()
+    if not _game_factory:
+        logger.debug("Creating new GameFactory instance")
+        from agents.factories.game_factory import GameFactory
+        _game_factory = GameFactory()
         
-        if not _game_components:
-            logger.debug("Creating game components")
-            _game_components = _game_factory.create_game_components()
-            
-        agents, managers = _game_components
+    return _game_factory
+
+def get_session_manager() -> SessionManagerProtocol:
+    """Get SessionManager instance (registry of live games)."""
+    global _session_manager
+    
+    if not _session_manager:
+        logger.info("Creating new SessionManager instance")
+        game_factory = get_game_factory()
         
-        # Import AgentManager here to avoid circular imports
-        from managers.agent_manager import AgentManager
+        # Import SessionManager here to avoid circular imports
+        from managers.session_manager import SessionManager
         
-        logger.debug("Initializing AgentManager with components")
-        _agent_manager = AgentManager(
-            agents=agents,
-            managers=managers,
-            game_factory=_game_factory,
-            story_graph_config=_game_factory._config.agent_configs.story_graph_config
+        _session_manager = SessionManager(
+            game_factory=game_factory,
+            config=game_factory.config.manager_configs.session_config
         )
-        logger.info("AgentManager initialized successfully")
-    else:
-        logger.debug("Returning existing AgentManager instance")
+        logger.info("SessionManager initialized successfully")
+        
+    return _session_manager
+
+def get_section_graph() -> SectionGraphProtocol:
+    """Get the index of links between sections (shared by all games)."""
+    return get_game_factory().get_section_graph()
+
+def get_author_manager() -> AuthorManagerProtocol:
+    """Get AuthorManager instance, backed by the shared section graph."""
+    global _author_manager
+    
+    if not _author_manager:
+        # Import AuthorManager here to avoid circular imports
+        from managers.author_manager import AuthorManager
+        _author_manager = AuthorManager(section_graph=get_section_graph())
+        
+    return _author_manager
+
+async def get_game_session(game_id: str) -> "GameSession":
+    """Get the session of an existing game.
+    
+    Une partie n'est jamais créée ici : seule POST /api/game/initialize
+    en crée. Une partie évincée est restaurée si son état est sauvegardé.
+    
+    Args:
+        game_id: ID of the game
+        
+    Returns:
+        GameSession: Live or restored session
+        
+    Raises:
+        HTTPException: 404 if the game is unknown
+    """
+    session = await get_session_manager().restore_session(game_id)
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game session not found")
+    return session
+
+async def get_agent_manager(game_id: str) -> AgentManagerProtocol:
+    """Get the AgentManager of an existing game.
+    
+    Args:
+        game_id: ID of the game
+        
+    Returns:
+        AgentManagerProtocol: AgentManager bound to the game
         
-    return _agent_manager
+    Raises:
+        HTTPException: 404 if the game is unknown
+    """
+    session = await get_game_session(game_id)
+    return session.agent_manager
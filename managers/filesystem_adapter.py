@@ -3,17 +3,147 @@ File System Adapter Module
 Handles all file system operations through a unified interface.
 """
 
-from typing import Dict, Optional, Any, List, Union
+from typing import Dict, Optional, Any, List, Set, Union, Callable, Deque, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
+import functools
 import os
 import json
+import threading
+import time
+import uuid
 from pathlib import Path
 import asyncio
 from loguru import logger
 
+from config.logging_config import get_trace_sampler
 from config.storage_config import StorageConfig, StorageFormat
 from managers.protocols.filesystemadapter_protocol import FileSystemAdapterProtocol
 from models.errors_model import FileSystemError
+from utils.metrics import FS_OPERATION_SECONDS, FS_BYTES
+
+# Traces par opération d'E/S : échantillonnées (LOG_TRACE_SAMPLING)
+_trace = get_trace_sampler(__name__)
+
+_READ_SECONDS = FS_OPERATION_SECONDS.labels("read")
+_WRITE_SECONDS = FS_OPERATION_SECONDS.labels("write")
+_READ_BYTES = FS_BYTES.labels("read")
+_WRITE_BYTES = FS_BYTES.labels("write")
+
+# Fichiers temporaires des écritures atomiques : .<nom>.<uuid>.tmp
+_TMP_SUFFIX = ".tmp"
+
+
+def _is_temp_file(path: Path) -> bool:
+    return path.name.startswith(".") and path.name.endswith(_TMP_SUFFIX)
+
+
+class _RWLock:
+    """Asyncio reader/writer lock, granted in arrival order.
+    
+    Plusieurs lectures peuvent se chevaucher ; une écriture est exclusive.
+    Un lecteur arrivé après un écrivain en attente passe après lui.
+    """
+
+    __slots__ = ("readers", "writer", "waiters", "users")
+
+    def __init__(self):
+        self.readers = 0
+        self.writer = False
+        self.waiters: Deque[Tuple[bool, asyncio.Future]] = deque()
+        self.users = 0
+
+    def _can_grant(self, write: bool) -> bool:
+        return not self.writer and (not write or not self.readers)
+
+    def _grant(self, write: bool) -> None:
+        if write:
+            self.writer = True
+        else:
+            self.readers += 1
+
+    def _wake(self) -> None:
+        while self.waiters:
+            write, future = self.waiters[0]
+            if future.done():  # Attente annulée
+                self.waiters.popleft()
+                continue
+            if not self._can_grant(write):
+                return
+            self.waiters.popleft()
+            self._grant(write)
+            future.set_result(None)
+            if write:
+                return
+
+    async def acquire(self, write: bool) -> None:
+        if not self.waiters and self._can_grant(write):
+            self._grant(write)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.append((write, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(write)  # Accordé juste avant l'annulation
+            else:
+                self._wake()
+            raise
+
+    def release(self, write: bool) -> None:
+        if write:
+            self.writer = False
+        else:
+            self.readers -= 1
+        self._wake()
+
+
+class _PathLocks:
+    """Reader/writer locks keyed by absolute path, dropped when unused."""
+
+    def __init__(self):
+        self._locks: Dict[str, _RWLock] = {}
+
+    @asynccontextmanager
+    async def hold(self, path: Path, write: bool):
+        key = os.path.abspath(path)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = _RWLock()
+        lock.users += 1
+        try:
+            await lock.acquire(write)
+            try:
+                yield
+            finally:
+                lock.release(write)
+        finally:
+            lock.users -= 1
+            if not lock.users:
+                del self._locks[key]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+# Partagés par tous les adapters : les namespaces communs (règles, sections)
+# sont écrits par les caches de plusieurs parties
+_PATH_LOCKS = _PathLocks()
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Bounded thread pool for file I/O, separate from the default executor."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fs-io")
+        return _io_executor
+
 
 class FileSystemAdapter(FileSystemAdapterProtocol):
     """
@@ -24,23 +154,25 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
     def __init__(self, config: StorageConfig):
         """Initialize FileSystemAdapter with configuration."""
         self.config = config
+        self._fsync_pending: Set[Path] = set()
+        self._fsync_task: Optional[asyncio.Task] = None
         logger.info("Initializing FileSystemAdapter")
         
         try:
             # Create base directories
             self.base_dir = Path(config.base_path)
-            logger.debug("Creating base directory: {}", self.base_dir.absolute())
+            logger.debug("Creating base directory: {}", self.base_dir)
             self.base_dir.mkdir(parents=True, exist_ok=True)
             
             # Create namespace directories (only non per_game)
             for namespace, ns_config in config.namespaces.items():
                 if not ns_config.per_game:  # Skip per_game namespaces
                     path = self.base_dir / ns_config.path
-                    logger.debug("Creating namespace directory for {}: {}", namespace, path.absolute())
+                    logger.debug("Creating namespace directory for {}: {}", namespace, path)
                     path.mkdir(parents=True, exist_ok=True)
             
             logger.info("FileSystemAdapter initialized successfully")
-            logger.debug("Base path: {}", self.base_dir.absolute())
+            logger.debug("Base path: {}", self.base_dir)
             logger.debug("Encoding: {}", self.config.encoding)
             
         except Exception as e:
@@ -52,7 +184,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Create directory if it doesn't exist."""
         try:
             path = Path(path)
-            logger.trace("Ensuring directory exists: {}", path.absolute())
+            _trace.trace("Ensuring directory exists: {}", path)
             path.mkdir(parents=True, exist_ok=True)
             return path
         except Exception as e:
@@ -60,12 +192,85 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             logger.error("Full error details:", exc_info=True)
             raise FileSystemError(f"Failed to create directory {path}: {str(e)}")
 
-    async def write_file_async(self, path: Union[str, Path], content: str) -> None:
-        """Write content to file asynchronously."""
+    # -------------------------------------------------------------------------
+    # Exécution des I/O
+    # -------------------------------------------------------------------------
+    async def _run_io(self, func: Callable, *args) -> Any:
+        """Run a blocking file operation in the dedicated I/O pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_io_executor(self.config.io_threads), functools.partial(func, *args)
+        )
+
+    def _atomic_write_sync(self, path: Path, content: Union[str, bytes]) -> None:
+        """Write to a temporary file then replace the target.
+        
+        Un lecteur voit l'ancien ou le nouveau contenu, jamais un fichier tronqué.
+        Les octets (JSON déjà encodé en UTF-8) sont écrits tels quels.
+        """
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}{_TMP_SUFFIX}")
+        try:
+            if isinstance(content, bytes):
+                f = open(tmp_path, 'wb')
+            else:
+                f = open(tmp_path, 'w', encoding=self.config.encoding)
+            with f:
+                f.write(content)
+                if self.config.fsync == "always":
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                tmp_path.unlink()
+            raise
+
+    def _schedule_fsync(self, path: Path) -> None:
+        self._fsync_pending.add(path)
+        if self._fsync_task is None or self._fsync_task.done():
+            self._fsync_task = asyncio.get_running_loop().create_task(self._fsync_later())
+
+    async def _fsync_later(self) -> None:
+        await asyncio.sleep(self.config.fsync_interval_seconds)
+        await self.flush()
+
+    @staticmethod
+    def _fsync_sync(paths: Set[Path]) -> None:
+        """Flush files, then their directories (renames), to disk."""
+        for target in list(paths) + list({p.parent for p in paths}):
+            try:
+                fd = os.open(target, os.O_RDONLY)
+            except OSError:
+                continue  # Supprimé depuis, ou répertoire non ouvrable (Windows)
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    async def flush(self) -> None:
+        """Flush files written since the last batched fsync."""
+        paths, self._fsync_pending = self._fsync_pending, set()
+        if paths:
+            await self._run_io(self._fsync_sync, paths)
+            logger.debug("Flushed {} files to disk", len(paths))
+
+    async def close(self) -> None:
+        """Flush pending batched fsyncs."""
+        task, self._fsync_task = self._fsync_task, None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        await self.flush()
+
+    # -------------------------------------------------------------------------
+    # Opérations asynchrones (verrou lecteurs/écrivain par fichier)
+    # -------------------------------------------------------------------------
+    async def write_file_async(self, path: Union[str, Path], content: Union[str, bytes]) -> None:
+        """Write content to file asynchronously (atomic replace)."""
         try:
             path = Path(path)
-            logger.debug("Writing to file: {}", path.absolute())
-            logger.trace("Content length: {} characters", len(content))
+            logger.debug("Writing to file: {}", path)
+            _trace.trace("Content length: {} characters", len(content))
             
             # Validate path
             if not self.validate_path(path):
@@ -74,47 +279,86 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             
             self.ensure_directory(path.parent)
             
-            async with asyncio.Lock():
-                logger.trace("Acquired lock for writing")
-                await asyncio.to_thread(
-                    self._write_file_sync, path, content
-                )
-                logger.debug("Successfully wrote to file: {}", path.absolute())
+            async with _PATH_LOCKS.hold(path, write=True):
+                _trace.trace("Acquired write lock")
+                start = time.perf_counter()
+                await self._run_io(self._atomic_write_sync, path, content)
+                _WRITE_SECONDS.observe(time.perf_counter() - start)
+                _WRITE_BYTES.inc(len(content))
+                logger.debug("Successfully wrote to file: {}", path)
+            if self.config.fsync == "batched":
+                self._schedule_fsync(path)
                 
         except Exception as e:
             logger.error("Error writing to file {}: {}", path, str(e))
             logger.error("Full error details:", exc_info=True)
             raise FileSystemError(f"Failed to write to file {path}: {str(e)}")
 
+    async def append_file_async(self, path: Union[str, Path], content: str) -> None:
+        """Append content to a file asynchronously (journals).
+        
+        Contrairement à write_file_async, l'écriture n'est pas atomique : un
+        arrêt peut laisser une dernière ligne incomplète, que le lecteur ignore.
+        """
+        try:
+            path = Path(path)
+            _trace.trace("Appending {} characters to file: {}", len(content), path)
+            
+            # Validate path
+            if not self.validate_path(path):
+                logger.error("Invalid path: {} (outside base directory)", path.absolute())
+                raise FileSystemError(f"Path {path} is outside the base directory")
+            
+            self.ensure_directory(path.parent)
+            
+            async with _PATH_LOCKS.hold(path, write=True):
+                start = time.perf_counter()
+                await self._run_io(self._append_sync, path, content)
+                _WRITE_SECONDS.observe(time.perf_counter() - start)
+                _WRITE_BYTES.inc(len(content))
+            if self.config.fsync == "batched":
+                self._schedule_fsync(path)
+                
+        except Exception as e:
+            logger.error("Error appending to file {}: {}", path, str(e))
+            logger.error("Full error details:", exc_info=True)
+            raise FileSystemError(f"Failed to append to file {path}: {str(e)}")
+
+    def _append_sync(self, path: Path, content: str) -> None:
+        with open(path, 'a', encoding=self.config.encoding) as f:
+            f.write(content)
+            if self.config.fsync == "always":
+                f.flush()
+                os.fsync(f.fileno())
+
     def _write_file_sync(self, path: Path, content: str) -> None:
         """Synchronous file write operation."""
-        logger.trace("Starting synchronous write to: {}", path.absolute())
-        with open(path, 'w', encoding=self.config.encoding) as f:
-            f.write(content)
-        logger.trace("Completed synchronous write")
+        _trace.trace("Starting synchronous write to: {}", path)
+        self._atomic_write_sync(path, content)
+        _trace.trace("Completed synchronous write")
 
     async def read_file_async(self, path: Union[str, Path]) -> Optional[str]:
         """Read file content asynchronously."""
         try:
             path = Path(path)
-            logger.debug("Reading from file: {}", path.absolute())
+            logger.debug("Reading from file: {}", path)
             
             # Validate path
             if not self.validate_path(path):
                 logger.error("Invalid path: {} (outside base directory)", path.absolute())
                 raise FileSystemError(f"Path {path} is outside the base directory")
             
-            if not path.exists():
-                logger.debug("File does not exist: {}", path.absolute())
-                return None
-                
-            async with asyncio.Lock():
-                logger.trace("Acquired lock for reading")
-                content = await asyncio.to_thread(
-                    self._read_file_sync, path
-                )
+            async with _PATH_LOCKS.hold(path, write=False):
+                _trace.trace("Acquired read lock")
+                start = time.perf_counter()
+                content = await self._run_io(self._read_file_if_exists_sync, path)
+                _READ_SECONDS.observe(time.perf_counter() - start)
                 
-            logger.debug("Successfully read from file: {} ({} characters)", path.absolute(), len(content) if content else 0)
+            if content is None:
+                logger.debug("File does not exist: {}", path)
+                return None
+            _READ_BYTES.inc(len(content))
+            logger.debug("Successfully read from file: {} ({} characters)", path, len(content))
             return content
             
         except Exception as e:
@@ -122,43 +366,57 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             logger.error("Full error details:", exc_info=True)
             raise FileSystemError(f"Failed to read file {path}: {str(e)}")
 
+    def _read_file_if_exists_sync(self, path: Path) -> Optional[str]:
+        try:
+            return self._read_file_sync(path)
+        except FileNotFoundError:
+            return None
+
     def _read_file_sync(self, path: Path) -> str:
         """Synchronous file read operation."""
-        logger.trace("Starting synchronous read from: {}", path.absolute())
+        _trace.trace("Starting synchronous read from: {}", path)
         with open(path, 'r', encoding=self.config.encoding) as f:
             content = f.read().strip()
-        logger.trace("Completed synchronous read ({} characters)", len(content))
+        _trace.trace("Completed synchronous read ({} characters)", len(content))
         return content
 
     async def delete_file_async(self, path: Union[str, Path]) -> None:
         """Delete file asynchronously."""
         try:
             path = Path(path)
-            logger.debug("Deleting file: {}", path.absolute())
+            logger.debug("Deleting file: {}", path)
             
             # Validate path
             if not self.validate_path(path):
                 logger.error("Invalid path: {} (outside base directory)", path.absolute())
                 raise FileSystemError(f"Path {path} is outside the base directory")
             
-            if path.exists():
-                async with asyncio.Lock():
-                    logger.trace("Acquired lock for deletion")
-                    await asyncio.to_thread(path.unlink)
-                    logger.debug("Successfully deleted file: {}", path.absolute())
+            async with _PATH_LOCKS.hold(path, write=True):
+                _trace.trace("Acquired write lock for deletion")
+                deleted = await self._run_io(self._unlink_if_exists_sync, path)
+            if deleted:
+                logger.debug("Successfully deleted file: {}", path)
             else:
-                logger.debug("File does not exist: {}", path.absolute())
+                logger.debug("File does not exist: {}", path)
                 
         except Exception as e:
             logger.error("Error deleting file {}: {}", path, str(e))
             logger.error("Full error details:", exc_info=True)
             raise FileSystemError(f"Failed to delete file {path}: {str(e)}")
 
+    @staticmethod
+    def _unlink_if_exists_sync(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
     async def list_files(self, directory: Union[str, Path], pattern: str = "*") -> List[Path]:
         """List files in directory matching pattern."""
         try:
             directory = Path(directory)
-            logger.debug("Listing files in directory: {} (pattern: {})", directory.absolute(), pattern)
+            logger.debug("Listing files in directory: {} (pattern: {})", directory, pattern)
             
             # Validate path
             if not self.validate_path(directory):
@@ -166,18 +424,15 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
                 raise FileSystemError(f"Directory {directory} is outside the base directory")
             
             if not directory.exists():
-                logger.debug("Directory does not exist: {}", directory.absolute())
+                logger.debug("Directory does not exist: {}", directory)
                 return []
                 
-            async with asyncio.Lock():
-                logger.trace("Acquired lock for directory listing")
-                files = await asyncio.to_thread(
-                    lambda: list(directory.glob(pattern))
-                )
+            # Les remplacements atomiques ne modifient pas la liste : pas de verrou
+            files = await self._run_io(lambda: list(directory.glob(pattern)))
                 
-            sorted_files = sorted(files)
+            sorted_files = sorted(f for f in files if not _is_temp_file(f))
             logger.debug("Found {} files matching pattern '{}'", len(sorted_files), pattern)
-            logger.trace("Files found: {}", [f.name for f in sorted_files])
+            _trace.trace("Files found: {}", lambda: [f.name for f in sorted_files])
             return sorted_files
             
         except Exception as e:
@@ -189,7 +444,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Get file information."""
         try:
             path = Path(path)
-            logger.debug("Getting file info for: {}", path.absolute())
+            logger.debug("Getting file info for: {}", path)
             
             # Validate path
             if not self.validate_path(path):
@@ -197,7 +452,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
                 raise FileSystemError(f"Path {path} is outside the base directory")
             
             if not path.exists():
-                logger.debug("File does not exist: {}", path.absolute())
+                logger.debug("File does not exist: {}", path)
                 return {}
                 
             stats = path.stat()
@@ -224,7 +479,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             base_path = self.base_dir.resolve()
             
             is_valid = str(path).startswith(str(base_path))
-            logger.trace("Path validation: {} -> {}", path, "valid" if is_valid else "invalid")
+            _trace.trace("Path validation: {} -> {}", path, "valid" if is_valid else "invalid")
             return is_valid
             
         except Exception as e:
@@ -236,8 +491,8 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Save data as JSON file."""
         try:
             path = Path(path)
-            logger.debug("Saving JSON to file: {}", path.absolute())
-            logger.trace("JSON data size: {} keys", len(data))
+            logger.debug("Saving JSON to file: {}", path)
+            _trace.trace("JSON data size: {} keys", len(data))
             
             # Validate path
             if not self.validate_path(path):
@@ -246,10 +501,9 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             
             self.ensure_directory(path.parent)
             
-            with open(path, 'w', encoding=self.config.encoding) as f:
-                json.dump(data, f, indent=2)
+            self._atomic_write_sync(path, json.dumps(data, indent=2))
                 
-            logger.debug("Successfully saved JSON to: {}", path.absolute())
+            logger.debug("Successfully saved JSON to: {}", path)
             
         except Exception as e:
             logger.error("Error saving JSON to {}: {}", path, str(e))
@@ -260,7 +514,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Load data from JSON file."""
         try:
             path = Path(path)
-            logger.debug("Loading JSON from file: {}", path.absolute())
+            logger.debug("Loading JSON from file: {}", path)
             
             # Validate path
             if not self.validate_path(path):
@@ -268,13 +522,13 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
                 raise FileSystemError(f"Path {path} is outside the base directory")
             
             if not path.exists():
-                logger.debug("JSON file does not exist: {}", path.absolute())
+                logger.debug("JSON file does not exist: {}", path)
                 return None
                 
             with open(path, 'r', encoding=self.config.encoding) as f:
                 data = json.load(f)
                 
-            logger.debug("Successfully loaded JSON from: {} ({} keys)", path.absolute(), len(data))
+            logger.debug("Successfully loaded JSON from: {} ({} keys)", path, len(data))
             return data
             
         except json.JSONDecodeError as e:
@@ -290,8 +544,8 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Save content as Markdown file."""
         try:
             path = Path(path)
-            logger.debug("Saving Markdown to file: {}", path.absolute())
-            logger.trace("Markdown content length: {} characters", len(content))
+            logger.debug("Saving Markdown to file: {}", path)
+            _trace.trace("Markdown content length: {} characters", len(content))
             
             # Validate path
             if not self.validate_path(path):
@@ -300,10 +554,9 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             
             self.ensure_directory(path.parent)
             
-            with open(path, 'w', encoding=self.config.encoding) as f:
-                f.write(content)
+            self._atomic_write_sync(path, content)
                 
-            logger.debug("Successfully saved Markdown to: {}", path.absolute())
+            logger.debug("Successfully saved Markdown to: {}", path)
             
         except Exception as e:
             logger.error("Error saving Markdown to {}: {}", path, str(e))
@@ -314,7 +567,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Load Markdown file content."""
         try:
             path = Path(path)
-            logger.debug("Loading Markdown from file: {}", path.absolute())
+            logger.debug("Loading Markdown from file: {}", path)
             
             # Validate path
             if not self.validate_path(path):
@@ -322,13 +575,13 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
                 raise FileSystemError(f"Path {path} is outside the base directory")
             
             if not path.exists():
-                logger.debug("Markdown file does not exist: {}", path.absolute())
+                logger.debug("Markdown file does not exist: {}", path)
                 return None
                 
             with open(path, 'r', encoding=self.config.encoding) as f:
                 content = f.read().strip()
                 
-            logger.debug("Successfully loaded Markdown from: {} ({} characters)", path.absolute(), len(content))
+            logger.debug("Successfully loaded Markdown from: {} ({} characters)", path, len(content))
             return content
             
         except Exception as e:
@@ -340,7 +593,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """List all Markdown files in a directory."""
         try:
             directory = Path(directory)
-            logger.debug("Listing Markdown files in directory: {} (pattern: {})", directory.absolute(), pattern)
+            logger.debug("Listing Markdown files in directory: {} (pattern: {})", directory, pattern)
             
             # Validate path
             if not self.validate_path(directory):
@@ -348,7 +601,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
                 raise FileSystemError(f"Directory {directory} is outside the base directory")
             
             if not directory.exists():
-                logger.debug("Directory does not exist: {}", directory.absolute())
+                logger.debug("Directory does not exist: {}", directory)
                 return []
                 
             return list(directory.glob(pattern))
@@ -404,7 +657,7 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Read file content."""
         try:
             path = Path(path)
-            logger.debug("Reading file: {}", path.absolute())
+            logger.debug("Reading file: {}", path)
             
             # Validate path
             if not self.validate_path(path):
@@ -412,13 +665,13 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
                 raise FileSystemError(f"Path {path} is outside the base directory")
             
             if not path.exists():
-                logger.debug("File does not exist: {}", path.absolute())
+                logger.debug("File does not exist: {}", path)
                 return None
                 
             with open(path, 'r', encoding=self.config.encoding) as f:
                 content = f.read()
                 
-            logger.debug("Successfully read file: {} ({} characters)", path.absolute(), len(content))
+            logger.debug("Successfully read file: {} ({} characters)", path, len(content))
             return content
             
         except Exception as e:
@@ -430,8 +683,8 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         """Write content to file."""
         try:
             path = Path(path)
-            logger.debug("Writing to file: {}", path.absolute())
-            logger.trace("Content length: {} characters", len(content))
+            logger.debug("Writing to file: {}", path)
+            _trace.trace("Content length: {} characters", len(content))
             
             # Validate path
             if not self.validate_path(path):
@@ -440,10 +693,9 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             
             self.ensure_directory(path.parent)
             
-            with open(path, 'w', encoding=self.config.encoding) as f:
-                f.write(content)
+            self._atomic_write_sync(path, content)
                 
-            logger.debug("Successfully wrote to file: {}", path.absolute())
+            logger.debug("Successfully wrote to file: {}", path)
             
         except Exception as e:
             logger.error("Error writing to file {}: {}", path, str(e))
@@ -481,7 +733,10 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
             path = Path(path)
             await self.ensure_directory_async(path.parent)
             
-            await asyncio.to_thread(self.save_json, path, data)
+            async with _PATH_LOCKS.hold(path, write=True):
+                await self._run_io(self.save_json, path, data)
+            if self.config.fsync == "batched":
+                self._schedule_fsync(path)
         except Exception as e:
             logger.error("Error saving JSON to {}: {}", path, str(e))
             logger.error("Full error details:", exc_info=True)
@@ -492,12 +747,11 @@ class FileSystemAdapter(FileSystemAdapterProtocol):
         try:
             path = Path(path)
             if not path.exists():
-                logger.debug("JSON file does not exist: {}", path.absolute())
+                logger.debug("JSON file does not exist: {}", path)
                 return None
                 
-            async def _load():
-                return await asyncio.to_thread(self.load_json, path)
-            return await _load()
+            async with _PATH_LOCKS.hold(path, write=False):
+                return await self._run_io(self.load_json, path)
         except Exception as e:
             logger.error("Error loading JSON from {}: {}", path, str(e))
             logger.error("Full error details:", exc_info=True)
@@ -0,0 +1,304 @@
+"""
+LLM Cache Manager Module
+Shared cache of LLM responses keyed by prompt hash.
+
+Deux niveaux :
+- mémoire (MemoryCache, LRU borné) pour les prompts chauds
+- SQLite sur disque pour survivre aux redémarrages
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, Sequence, Tuple
+
+from loguru import logger
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, AIMessage, SystemMessage
+
+from config.managers.llm_cache_config import LLMCacheConfig
+from managers.memory_cache import MemoryCache
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+
+_NAMESPACE = "llm"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    model_name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def split_messages(messages: Sequence[BaseMessage]) -> Tuple[str, str]:
+    """Split a prompt into its system and human parts.
+
+    Args:
+        messages: Prompt messages
+
+    Returns:
+        Tuple[str, str]: System content and the content of the other messages
+    """
+    system = [str(m.content) for m in messages if isinstance(m, SystemMessage)]
+    other = [str(m.content) for m in messages if not isinstance(m, SystemMessage)]
+    return "\n".join(system), "\n".join(other)
+
+
+async def astream_message(
+    llm: BaseChatModel,
+    messages: Sequence[BaseMessage],
+    on_chunk: Callable[[str], None]
+) -> AIMessage:
+    """Call a chat model in streaming mode, reporting text as it arrives.
+
+    Args:
+        llm: Chat model
+        messages: Prompt messages
+        on_chunk: Called with the text of each chunk
+
+    Returns:
+        AIMessage: Complete response
+    """
+    response = None
+    async for chunk in llm.astream(messages):
+        response = chunk if response is None else response + chunk
+        if isinstance(chunk.content, str) and chunk.content:
+            on_chunk(chunk.content)
+    if response is None:
+        return AIMessage(content="")
+    return AIMessage(content=response.content, response_metadata=response.response_metadata, id=response.id)
+
+
+class LLMCacheManager(LLMCacheManagerProtocol):
+    """Two-tier (memory + SQLite) cache of LLM responses."""
+
+    def __init__(self, config: Optional[LLMCacheConfig] = None):
+        """Initialize LLMCacheManager.
+
+        Args:
+            config: Optional cache configuration
+        """
+        self.config = config or LLMCacheConfig()
+        self._memory = MemoryCache()
+        self._memory.set_limits(_NAMESPACE, self.config.memory_max_entries, self.config.memory_max_bytes)
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._disk_hits = 0
+        self._llm_calls = 0
+        logger.debug("LLMCacheManager initialized (enabled={}, db={})",
+                     self.config.enabled, self.config.db_path)
+
+    # -------------------------------------------------------------------------
+    # SQLite (appels bloquants, exécutés dans un thread)
+    # -------------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            db_path = Path(self.config.db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+            self._db.commit()
+        return self._db
+
+    def _db_get(self, key: str) -> Optional[str]:
+        with self._db_lock:
+            row = self._connect().execute(
+                "SELECT content, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        content, created_at = row
+        if self.config.ttl_seconds and time.time() - created_at > self.config.ttl_seconds:
+            return None
+        return content
+
+    def _db_set(self, key: str, content: str, model_name: str) -> None:
+        with self._db_lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, model_name, content, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, model_name, content, time.time())
+            )
+            db.commit()
+
+    # -------------------------------------------------------------------------
+    # API
+    # -------------------------------------------------------------------------
+    def make_key(
+        self,
+        model_name: str,
+        temperature: float,
+        system_message: str,
+        human_message: str
+    ) -> str:
+        """Build the cache key of an LLM call.
+
+        Args:
+            model_name: Name of the model
+            temperature: Sampling temperature
+            system_message: System prompt
+            human_message: Human prompt
+
+        Returns:
+            str: Cache key
+        """
+        return _sha256("\x1f".join((
+            str(model_name),
+            repr(float(temperature)),
+            _sha256(system_message),
+            _sha256(human_message)
+        )))
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Response content if cached
+        """
+        if not self.config.enabled:
+            return None
+
+        entry = self._memory.get(f"{_NAMESPACE}:{key}")
+        if entry is not None:
+            return entry.value
+
+        if not self.config.persistent:
+            return None
+
+        try:
+            content = await asyncio.to_thread(self._db_get, key)
+        except Exception as e:
+            logger.error("Error reading LLM cache: {}", str(e))
+            return None
+
+        if content is not None:
+            self._disk_hits += 1
+            self._memory.set(f"{_NAMESPACE}:{key}", content, self.config.ttl_seconds, size=len(content))
+        return content
+
+    async def set(self, key: str, content: str, model_name: str = "") -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key
+            content: Response content
+            model_name: Name of the model (for inspection)
+        """
+        if not self.config.enabled or not content:
+            return
+
+        self._memory.set(f"{_NAMESPACE}:{key}", content, self.config.ttl_seconds, size=len(content))
+        if self.config.persistent:
+            try:
+                await asyncio.to_thread(self._db_set, key, content, model_name)
+            except Exception as e:
+                # Le cache ne doit jamais faire échouer un tour de jeu
+                logger.error("Error writing LLM cache: {}", str(e))
+
+    def _db_delete(self, key: str) -> None:
+        with self._db_lock:
+            db = self._connect()
+            db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            db.commit()
+
+    async def invalidate(self, key: str) -> None:
+        """Remove a response (e.g. one that could not be parsed).
+
+        Args:
+            key: Cache key
+        """
+        self._memory.delete(f"{_NAMESPACE}:{key}")
+        if self.config.persistent:
+            try:
+                await asyncio.to_thread(self._db_delete, key)
+            except Exception as e:
+                logger.error("Error invalidating LLM cache: {}", str(e))
+
+    async def ainvoke(
+        self,
+        llm: BaseChatModel,
+        messages: Sequence[BaseMessage],
+        model_name: str,
+        temperature: float,
+        key: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> AIMessage:
+        """Invoke the LLM unless the response is cached.
+
+        Args:
+            llm: Chat model to call on a miss
+            messages: Prompt messages
+            model_name: Name of the model
+            temperature: Sampling temperature
+            key: Optional precomputed cache key
+            on_chunk: Optional callback streaming the text of a fresh response
+                (not called on a hit)
+
+        Returns:
+            AIMessage: Cached or fresh response
+        """
+        if not self.config.enabled:
+            self._llm_calls += 1
+            if on_chunk:
+                return await astream_message(llm, messages, on_chunk)
+            return await llm.ainvoke(messages)
+
+        if key is None:
+            system_message, human_message = split_messages(messages)
+            key = self.make_key(model_name, temperature, system_message, human_message)
+
+        cached = await self.get(key)
+        if cached is not None:
+            logger.debug("LLM cache hit for {} ({})", model_name, key[:12])
+            return AIMessage(content=cached)
+
+        logger.debug("LLM cache miss for {} ({})", model_name, key[:12])
+        self._llm_calls += 1
+        if on_chunk:
+            response = await astream_message(llm, messages, on_chunk)
+        else:
+            response = await llm.ainvoke(messages)
+        if isinstance(response.content, str):
+            await self.set(key, response.content, model_name)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses and sizes of both tiers
+        """
+        memory = self._memory.get_stats()["namespaces"].get(_NAMESPACE, {})
+        return {
+            "enabled": self.config.enabled,
+            "memory_entries": memory.get("entries", 0),
+            "memory_bytes": memory.get("bytes", 0),
+            "memory_hits": memory.get("hits", 0),
+            "disk_hits": self._disk_hits,
+            "llm_calls": self._llm_calls
+        }
+
+    async def close(self) -> None:
+        """Close the persistent tier."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Register protocol after class definition
+LLMCacheManagerProtocol.register(LLMCacheManager)
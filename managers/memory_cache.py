@@ -0,0 +1,283 @@
+"""
+Memory Cache Module
+Bounded in-memory tier used by the CacheManager.
+
+Les entrées sont rangées par namespace dans des OrderedDict (ordre LRU).
+Chaque namespace a son propre budget (nombre d'entrées et octets) et un
+budget global borne le nombre total d'entrées.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+
+class CacheEntry:
+    """Represents a cached item with TTL."""
+    __slots__ = ("value", "expiry", "size")
+
+    def __init__(self, value: Any, ttl_seconds: Optional[int], size: int = 0):
+        self.value = value
+        self.expiry = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self.size = size
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return self.expiry is not None and (now or time.monotonic()) > self.expiry
+
+
+@dataclass
+class NamespaceStats:
+    """Counters of a memory cache namespace."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class MemoryCache:
+    """Size-aware LRU cache with per-namespace budgets.
+
+    Keys are ``"namespace:key"`` strings, as produced by
+    ``CacheManager._get_cache_key``.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """Initialize MemoryCache.
+
+        Args:
+            max_entries: Global maximum number of entries (None = unbounded)
+            max_bytes: Global maximum size in bytes (None = unbounded)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._namespaces: Dict[str, "OrderedDict[str, CacheEntry]"] = {}
+        self._limits: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        self._ns_bytes: Dict[str, int] = {}
+        self._stats: Dict[str, NamespaceStats] = {}
+        self._entries = 0
+        self._bytes = 0
+
+    @staticmethod
+    def _split(cache_key: str) -> Tuple[str, str]:
+        namespace, _, key = cache_key.partition(":")
+        return namespace, key
+
+    def _bucket(self, namespace: str) -> "OrderedDict[str, CacheEntry]":
+        bucket = self._namespaces.get(namespace)
+        if bucket is None:
+            bucket = self._namespaces[namespace] = OrderedDict()
+            self._ns_bytes[namespace] = 0
+            self._stats.setdefault(namespace, NamespaceStats())
+        return bucket
+
+    def set_limits(self, namespace: str, max_entries: Optional[int], max_bytes: Optional[int]) -> None:
+        """Set the budget of a namespace.
+
+        Args:
+            namespace: Namespace name
+            max_entries: Maximum number of entries (None = unbounded)
+            max_bytes: Maximum size in bytes (None = unbounded)
+        """
+        self._limits[namespace] = (max_entries, max_bytes)
+
+    def _remove(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        bucket = self._namespaces.get(namespace)
+        if not bucket:
+            return None
+        entry = bucket.pop(key, None)
+        if entry is not None:
+            self._entries -= 1
+            self._bytes -= entry.size
+            self._ns_bytes[namespace] -= entry.size
+        return entry
+
+    def _evict_lru(self, namespace: str) -> None:
+        bucket = self._namespaces[namespace]
+        key, entry = bucket.popitem(last=False)
+        self._entries -= 1
+        self._bytes -= entry.size
+        self._ns_bytes[namespace] -= entry.size
+        self._stats[namespace].evictions += 1
+        logger.trace("Evicted {}:{} from memory cache", namespace, key)
+
+    def _enforce(self, namespace: str) -> None:
+        """Evict LRU entries until the namespace and global budgets are met."""
+        max_entries, max_bytes = self._limits.get(namespace, (None, None))
+        bucket = self._namespaces[namespace]
+        # Garder au moins l'entrée la plus récente du namespace
+        while len(bucket) > 1 and (
+            (max_entries is not None and len(bucket) > max_entries)
+            or (max_bytes is not None and self._ns_bytes[namespace] > max_bytes)
+        ):
+            self._evict_lru(namespace)
+
+        while (
+            (self.max_entries is not None and self._entries > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            victim = self._global_victim()
+            if victim is None:
+                break
+            self._evict_lru(victim)
+
+    def _global_victim(self) -> Optional[str]:
+        """Pick the namespace to evict from when the global budget is exceeded.
+
+        Évince dans le namespace le plus gros, pour ne pas vider les petits
+        namespaces (sections, règles) à cause des états de partie.
+        """
+        candidates = [(len(b), ns) for ns, b in self._namespaces.items() if b]
+        if not candidates:
+            return None
+        return max(candidates)[1]
+
+    def set(self, cache_key: str, value: Any, ttl_seconds: Optional[int], size: int = 0) -> None:
+        """Store a value, evicting LRU entries if needed.
+
+        Args:
+            cache_key: ``"namespace:key"`` key
+            value: Value to cache
+            ttl_seconds: TTL in seconds (None = no expiration)
+            size: Approximate size of the value in bytes
+        """
+        namespace, key = self._split(cache_key)
+        max_entries, max_bytes = self._limits.get(namespace, (None, None))
+        if max_entries == 0 or (max_bytes is not None and size > max_bytes):
+            # Trop gros pour le namespace : ne pas polluer le cache
+            self._remove(namespace, key)
+            return
+
+        bucket = self._bucket(namespace)
+        self._remove(namespace, key)
+        bucket[key] = CacheEntry(value, ttl_seconds, size)
+        self._entries += 1
+        self._bytes += size
+        self._ns_bytes[namespace] += size
+        self._enforce(namespace)
+
+    def get(self, cache_key: str) -> Optional[CacheEntry]:
+        """Get a live entry and mark it as recently used.
+
+        Args:
+            cache_key: ``"namespace:key"`` key
+
+        Returns:
+            Optional[CacheEntry]: Entry if present and not expired
+        """
+        namespace, key = self._split(cache_key)
+        stats = self._stats.setdefault(namespace, NamespaceStats())
+        bucket = self._namespaces.get(namespace)
+        entry = bucket.get(key) if bucket else None
+        if entry is None:
+            stats.misses += 1
+            return None
+        if entry.is_expired():
+            self._remove(namespace, key)
+            stats.expirations += 1
+            stats.misses += 1
+            return None
+        bucket.move_to_end(key)
+        stats.hits += 1
+        return entry
+
+    def delete(self, cache_key: str) -> bool:
+        """Remove an entry.
+
+        Args:
+            cache_key: ``"namespace:key"`` key
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        namespace, key = self._split(cache_key)
+        return self._remove(namespace, key) is not None
+
+    def clear_namespace(self, namespace: str) -> int:
+        """Remove every entry of a namespace.
+
+        Returns:
+            int: Number of removed entries
+        """
+        bucket = self._namespaces.get(namespace)
+        if not bucket:
+            return 0
+        count = len(bucket)
+        self._entries -= count
+        self._bytes -= self._ns_bytes[namespace]
+        self._ns_bytes[namespace] = 0
+        bucket.clear()
+        return count
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for namespace in list(self._namespaces):
+            self.clear_namespace(namespace)
+
+    def purge_expired(self) -> int:
+        """Remove every expired entry.
+
+        Returns:
+            int: Number of removed entries
+        """
+        now = time.monotonic()
+        removed = 0
+        for namespace, bucket in self._namespaces.items():
+            expired = [k for k, e in bucket.items() if e.is_expired(now)]
+            for key in expired:
+                self._remove(namespace, key)
+            self._stats[namespace].expirations += len(expired)
+            removed += len(expired)
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict[str, Any]: Global and per-namespace counters
+        """
+        namespaces = {}
+        for namespace, stats in self._stats.items():
+            bucket = self._namespaces.get(namespace)
+            max_entries, max_bytes = self._limits.get(namespace, (None, None))
+            namespaces[namespace] = {
+                "entries": len(bucket) if bucket else 0,
+                "bytes": self._ns_bytes.get(namespace, 0),
+                "max_entries": max_entries,
+                "max_bytes": max_bytes,
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "evictions": stats.evictions,
+                "expirations": stats.expirations
+            }
+        return {
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": sum(s.hits for s in self._stats.values()),
+            "misses": sum(s.misses for s in self._stats.values()),
+            "evictions": sum(s.evictions for s in self._stats.values()),
+            "expirations": sum(s.expirations for s in self._stats.values()),
+            "namespaces": namespaces
+        }
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over ``"namespace:key"`` keys."""
+        for namespace, bucket in self._namespaces.items():
+            for key in bucket:
+                yield f"{namespace}:{key}"
+
+    def __contains__(self, cache_key: str) -> bool:
+        namespace, key = self._split(cache_key)
+        bucket = self._namespaces.get(namespace)
+        return bool(bucket) and key in bucket
+
+    def __getitem__(self, cache_key: str) -> CacheEntry:
+        namespace, key = self._split(cache_key)
+        return self._namespaces[namespace][key]
+
+    def __len__(self) -> int:
+        return self._entries
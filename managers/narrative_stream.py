@@ -0,0 +1,183 @@
+"""
+Narrative Stream Module
+Forwards the narrator output to game clients while it is generated.
+
+Le narrateur publie le texte d'une section au fil des tokens du LLM. Une
+génération est partagée (single-flight, préchargement) : les deltas sont
+donc publiés par section, et relayés aux parties qui « regardent » cette
+section pendant leur tour. Une partie qui arrive en cours de génération
+reçoit d'abord le texte déjà produit (offset 0). Chaque client WebSocket
+lit sa propre file bornée ; un client trop lent perd des deltas, et l'état
+final diffusé à la fin du tour fait foi.
+"""
+
+import asyncio
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from loguru import logger
+
+from config.managers.narrative_stream_config import NarrativeStreamConfig
+from managers.protocols.narrative_stream_protocol import NarrativeStreamProtocol
+
+MESSAGE_TYPE = "narrative_delta"
+
+
+class NarrativeStream(NarrativeStreamProtocol):
+    """Per-section publication of narrative deltas, per-game delivery."""
+
+    def __init__(self, config: Optional[NarrativeStreamConfig] = None):
+        """Initialize NarrativeStream.
+
+        Args:
+            config: Optional streaming configuration
+        """
+        self.config = config or NarrativeStreamConfig()
+        # Texte déjà publié des générations en cours
+        self._texts: Dict[int, List[str]] = {}
+        self._lengths: Dict[int, int] = {}
+        # section -> parties qui la regardent (avec compteur de références)
+        self._watchers: Dict[int, Dict[str, int]] = defaultdict(dict)
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether narrator responses should be streamed."""
+        return self.config.enabled
+
+    # -------------------------------------------------------------------------
+    # Publication
+    # -------------------------------------------------------------------------
+    def _message(self, game_id: str, section_number: int, offset: int, delta: str, done: bool = False) -> Dict[str, Any]:
+        return {
+            "type": MESSAGE_TYPE,
+            "game_id": game_id,
+            "section_number": section_number,
+            "offset": offset,
+            "delta": delta,
+            "done": done
+        }
+
+    def _deliver(self, game_id: str, message: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(game_id, ()):
+            try:
+                queue.put_nowait(message)
+                self._delivered += 1
+            except asyncio.QueueFull:
+                self._dropped += 1
+
+    def _send(self, section_number: int, offset: int, delta: str, done: bool = False) -> None:
+        for game_id in self._watchers.get(section_number, {}):
+            self._deliver(game_id, self._message(game_id, section_number, offset, delta, done))
+
+    def begin(self, section_number: int) -> None:
+        """Start the generation of a section.
+
+        Args:
+            section_number: Section being generated
+        """
+        self._texts[section_number] = []
+        self._lengths[section_number] = 0
+
+    def publish(self, section_number: int, delta: str) -> None:
+        """Forward new narrative text of a section to the games watching it.
+
+        Args:
+            section_number: Section being generated
+            delta: Text following what was already published
+        """
+        if not delta or section_number not in self._texts:
+            return
+        offset = self._lengths[section_number]
+        self._texts[section_number].append(delta)
+        self._lengths[section_number] = offset + len(delta)
+        self._published += 1
+        self._send(section_number, offset, delta)
+
+    def end(self, section_number: int) -> None:
+        """End the generation of a section.
+
+        Args:
+            section_number: Section generated
+        """
+        if self._texts.pop(section_number, None) is None:
+            return
+        length = self._lengths.pop(section_number)
+        self._send(section_number, length, "", done=True)
+
+    # -------------------------------------------------------------------------
+    # Abonnements
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def watch(self, game_id: str, section_number: int) -> Iterator[None]:
+        """Forward the deltas of a section to a game while the context is open.
+
+        Args:
+            game_id: Game ID
+            section_number: Section the game is waiting for
+        """
+        watchers = self._watchers[section_number]
+        watchers[game_id] = watchers.get(game_id, 0) + 1
+        parts = self._texts.get(section_number)
+        if parts:
+            # Génération déjà commencée (autre partie, préchargement) : rattraper
+            self._deliver(game_id, self._message(game_id, section_number, 0, "".join(parts)))
+        try:
+            yield
+        finally:
+            watchers[game_id] -= 1
+            if not watchers[game_id]:
+                del watchers[game_id]
+            if not watchers:
+                self._watchers.pop(section_number, None)
+
+    def subscribe(self, game_id: str) -> "asyncio.Queue[Dict[str, Any]]":
+        """Get a queue receiving the narrative deltas of a game.
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            asyncio.Queue: Bounded queue of ``narrative_delta`` messages
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._subscribers[game_id].add(queue)
+        logger.debug("Narrative stream subscriber added for game {}", game_id)
+        return queue
+
+    def unsubscribe(self, game_id: str, queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+        """Stop feeding a queue returned by subscribe.
+
+        Args:
+            game_id: Game ID
+            queue: Queue to remove
+        """
+        queues = self._subscribers.get(game_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[game_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming counters.
+
+        Returns:
+            Dict[str, Any]: Generations in progress, subscribers and message counts
+        """
+        return {
+            "enabled": self.config.enabled,
+            "streaming_sections": len(self._texts),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped
+        }
+
+
+# Register protocol after class definition
+NarrativeStreamProtocol.register(NarrativeStream)
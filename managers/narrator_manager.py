@@ -12,22 +12,30 @@ from loguru import logger
 from config.storage_config import StorageConfig
 from managers.protocols.cache_manager_protocol import CacheManagerProtocol
 from managers.protocols.narrator_manager_protocol import NarratorManagerProtocol
+from managers.protocols.section_store_protocol import SectionStoreProtocol
 from models.narrator_model import NarratorModel, SourceType
 from models.errors_model import NarratorError
 
 class NarratorManager(NarratorManagerProtocol):
     """Manages game content and narrative elements."""
 
-    def __init__(self, config: StorageConfig, cache_manager: CacheManagerProtocol):
+    def __init__(
+        self,
+        config: StorageConfig,
+        cache_manager: CacheManagerProtocol,
+        section_store: Optional[SectionStoreProtocol] = None
+    ):
         """Initialize NarratorManager.
         
         Args:
             config: Storage configuration
             cache_manager: Cache manager instance
+            section_store: Optional precompiled section artifact
         """
         logger.info("Initializing NarratorManager")
         self.config = config
         self.cache = cache_manager
+        self.section_store = section_store
         logger.debug("NarratorManager initialized with config: {}", config.__class__.__name__)
 
     async def get_cached_content(self, section_number: int) -> Optional[NarratorModel]:
@@ -35,6 +43,13 @@ class NarratorManager(NarratorManagerProtocol):
         logger.info("Getting cached content for section {}", section_number)
         
         try:
+            # Artefact précompilé d'abord (aucun accès disque ni LLM)
+            if self.section_store is not None:
+                compiled = self.section_store.get_narrator(section_number)
+                if compiled:
+                    logger.debug("Section {} served from compiled artifact", section_number)
+                    return compiled
+                    
             content = await self.cache.get_cached_data(
                 key=f"section_{section_number}",
                 namespace="sections"  # Utilise le namespace sections pour le cache
@@ -0,0 +1,230 @@
+"""
+Prefetch Manager Module
+Speculative generation of the sections a player can reach next.
+
+Dès que les règles d'une section sont connues, les ``target_section`` des
+choix indiquent les sections suivantes possibles. Leur narration et leurs
+règles sont générées en arrière-plan pendant que le joueur réfléchit :
+la transition est alors servie depuis le cache. Les générations passent
+par les agents partagés (donc par le single-flight) : un joueur qui
+arrive pendant un préchargement rejoint l'appel en cours.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, TYPE_CHECKING
+
+from loguru import logger
+
+from config.managers.prefetch_config import PrefetchConfig
+from managers.protocols.prefetch_manager_protocol import PrefetchManagerProtocol
+from models.errors_model import NarratorError, RulesError
+
+if TYPE_CHECKING:
+    # Import agents here to avoid circular imports (la factory importe ce module)
+    from agents.protocols.narrator_agent_protocol import NarratorAgentProtocol
+    from agents.protocols.rules_agent_protocol import RulesAgentProtocol
+
+
+@dataclass
+class _Prefetch:
+    """A queued or running prefetch."""
+    section_number: int
+    task: Optional[asyncio.Task] = None
+    started: bool = False
+    succeeded: bool = False
+
+
+@dataclass
+class _Counters:
+    scheduled: int = 0
+    skipped: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    hits: int = 0
+    late_hits: int = 0
+    misses: int = 0
+
+
+class PrefetchManager(PrefetchManagerProtocol):
+    """Background generation of choice targets, shared by all games."""
+
+    def __init__(
+        self,
+        narrator_agent: "NarratorAgentProtocol",
+        rules_agent: "RulesAgentProtocol",
+        config: Optional[PrefetchConfig] = None
+    ):
+        """Initialize PrefetchManager.
+
+        Args:
+            narrator_agent: Shared narrator agent
+            rules_agent: Shared rules agent
+            config: Optional prefetch configuration
+        """
+        self.config = config or PrefetchConfig()
+        self.narrator_agent = narrator_agent
+        self.rules_agent = rules_agent
+        # Préchargements du tour courant de chaque partie
+        self._games: Dict[str, Dict[int, _Prefetch]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._counters = _Counters()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Global concurrency cap, bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, game_id: str, job: _Prefetch) -> None:
+        """Generate the narrative and rules of a section."""
+        try:
+            # Basse priorité : les appels du tour courant partent d'abord
+            if self.config.start_delay_seconds:
+                await asyncio.sleep(self.config.start_delay_seconds)
+            async with self._get_semaphore():
+                job.started = True
+                logger.debug("Prefetching section {} for game {}", job.section_number, game_id)
+                narrative, rules = await asyncio.gather(
+                    self.narrator_agent.generate_section(job.section_number),
+                    self.rules_agent.generate_section(job.section_number)
+                )
+        except asyncio.CancelledError:
+            self._counters.cancelled += 1
+            raise
+        except Exception as e:
+            self._counters.failed += 1
+            logger.warning("Prefetch of section {} failed: {}", job.section_number, str(e))
+            return
+
+        job.succeeded = not isinstance(narrative, NarratorError) and not (
+            isinstance(rules, RulesError) or getattr(rules, "error", None)
+        )
+        if job.succeeded:
+            self._counters.completed += 1
+        else:
+            self._counters.failed += 1
+            logger.debug("Prefetch of section {} returned an error", job.section_number)
+
+    @staticmethod
+    def _cancel_unstarted(jobs: Iterable[_Prefetch]) -> int:
+        cancelled = 0
+        for job in jobs:
+            if not job.started and job.task is not None and not job.task.done():
+                job.task.cancel()
+                cancelled += 1
+        return cancelled
+
+    def schedule(self, game_id: str, section_numbers: Iterable[int]) -> int:
+        """Queue the generation of sections a game can reach next.
+
+        Sections beyond the per-game budget are skipped.
+
+        Args:
+            game_id: Game ID
+            section_numbers: Target sections of the current choices
+
+        Returns:
+            int: Number of newly queued sections
+        """
+        if not self.config.enabled:
+            return 0
+
+        loop = asyncio.get_running_loop()
+        jobs = self._games.setdefault(game_id, {})
+        queued = 0
+        for section_number in dict.fromkeys(n for n in section_numbers if n):
+            if section_number in jobs:
+                continue
+            pending = sum(1 for job in jobs.values() if job.task is not None and not job.task.done())
+            if pending >= self.config.per_game_budget:
+                self._counters.skipped += 1
+                continue
+            job = _Prefetch(section_number=section_number)
+            job.task = loop.create_task(self._run(game_id, job))
+            jobs[section_number] = job
+            queued += 1
+
+        self._counters.scheduled += queued
+        if queued:
+            logger.debug("Queued {} prefetches for game {}", queued, game_id)
+        return queued
+
+    def record_transition(self, game_id: str, section_number: int) -> None:
+        """Record the section a game entered, for the hit rate.
+
+        Les préchargements non démarrés des autres choix sont annulés.
+
+        Args:
+            game_id: Game ID
+            section_number: Section entered
+        """
+        jobs = self._games.pop(game_id, None)
+        if not jobs:
+            return
+
+        job = jobs.pop(section_number, None)
+        if job is None or (job.task.done() and not job.succeeded):
+            self._counters.misses += 1
+        elif job.task.done():
+            self._counters.hits += 1
+        elif job.started:
+            # Génération en cours : le tour la rejoint via le single-flight
+            self._counters.late_hits += 1
+        else:
+            # Le tour génère lui-même la section : inutile de la garder en file
+            self._counters.misses += 1
+            self._cancel_unstarted([job])
+        self._cancel_unstarted(jobs.values())
+
+    def cancel_game(self, game_id: str) -> int:
+        """Cancel the prefetches of a game that were not started.
+
+        Les générations déjà lancées continuent : leur résultat ira au cache.
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            int: Number of cancelled prefetches
+        """
+        jobs = self._games.pop(game_id, None)
+        if not jobs:
+            return 0
+        cancelled = self._cancel_unstarted(jobs.values())
+        if cancelled:
+            logger.debug("Cancelled {} prefetches of game {}", cancelled, game_id)
+        return cancelled
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prefetch counters and hit rate.
+
+        Returns:
+            Dict[str, Any]: Counters; hit_rate counts late hits as hits
+        """
+        counters = self._counters
+        transitions = counters.hits + counters.late_hits + counters.misses
+        return {
+            "enabled": self.config.enabled,
+            "pending": sum(
+                1 for jobs in self._games.values() for job in jobs.values() if not job.task.done()
+            ),
+            **counters.__dict__,
+            "hit_rate": round((counters.hits + counters.late_hits) / transitions, 3) if transitions else None
+        }
+
+    async def close(self) -> None:
+        """Cancel all prefetches."""
+        tasks = [job.task for jobs in self._games.values() for job in jobs.values() if not job.task.done()]
+        self._games.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Register protocol after class definition
+PrefetchManagerProtocol.register(PrefetchManager)
@@ -10,6 +10,15 @@ from managers.protocols.trace_manager_protocol import TraceManagerProtocol
 from managers.protocols.decision_manager_protocol import DecisionManagerProtocol
 from managers.protocols.narrator_manager_protocol import NarratorManagerProtocol
 from managers.protocols.workflow_manager_protocol import WorkflowManagerProtocol
+from managers.protocols.session_manager_protocol import SessionManagerProtocol
+from managers.protocols.llm_cache_manager_protocol import LLMCacheManagerProtocol
+from managers.protocols.section_store_protocol import SectionStoreProtocol
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+from managers.protocols.decision_index_protocol import DecisionIndexProtocol
+from managers.protocols.section_corpus_protocol import SectionCorpusProtocol
+from managers.protocols.single_flight_protocol import SingleFlightProtocol
+from managers.protocols.prefetch_manager_protocol import PrefetchManagerProtocol
+from managers.protocols.narrative_stream_protocol import NarrativeStreamProtocol
 
 __all__ = [
     'AgentManagerProtocol',
@@ -21,5 +30,14 @@ __all__ = [
     'TraceManagerProtocol',
     'DecisionManagerProtocol',
     'NarratorManagerProtocol',
-    'WorkflowManagerProtocol'
+    'WorkflowManagerProtocol',
+    'SessionManagerProtocol',
+    'LLMCacheManagerProtocol',
+    'SectionStoreProtocol',
+    'SectionGraphProtocol',
+    'DecisionIndexProtocol',
+    'SectionCorpusProtocol',
+    'SingleFlightProtocol',
+    'PrefetchManagerProtocol',
+    'NarrativeStreamProtocol'
 ]
@@ -119,11 +119,18 @@ class AgentManagerProtocol(Protocol):
         """
         ...
 
-    async def stream_game_state(self) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream game state updates.
+    async def stream_game_state(
+        self,
+        user_input: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Process game state, streaming the update of each node as it completes.
         
+        Args:
+            user_input: User input to process (optional)
+            
         Yields:
-            Dict: Game state updates
+            Dict: ``{"node": name, "update": values}`` per node, then
+                ``{"node": None, "state": GameState}`` with the saved state
             
         Raises:
             GameError: If streaming fails
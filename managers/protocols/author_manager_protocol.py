@@ -23,3 +23,11 @@ class AuthorManagerProtocol(Protocol):
             Dict[str, Any]: Knowledge graph data
         """
         ...
+
+    async def get_graph_report(self) -> Dict[str, Any]:
+        """Get structural issues of the book.
+        
+        Returns:
+            Dict[str, Any]: Dead ends, orphans, unreachable sections and broken links
+        """
+        ...
@@ -5,6 +5,7 @@ Defines the interface for caching operations.
 from typing import Optional, Any, Dict, Protocol, runtime_checkable, Type, TypeVar, List
 from pydantic import BaseModel
 from abc import abstractmethod
+from managers.protocols.filesystemadapter_protocol import FileSystemAdapterProtocol
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -138,6 +139,28 @@ class CacheManagerProtocol(Protocol):
         """
         ...
     
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get memory cache counters.
+        
+        Returns:
+            Dict[str, Any]: Entries, bytes, hits, misses, evictions and
+                expirations, globally and per namespace
+        """
+        ...
+    
+    @property
+    @abstractmethod
+    def fs_adapter(self) -> FileSystemAdapterProtocol:
+        """File adapter of the game, shared by managers writing their own files."""
+        ...
+    
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop background tasks and release the memory cache."""
+        ...
+    
     @abstractmethod
     async def update_game_id(self, game_id: str) -> None:
         """Update the game ID for per-game namespaces.
@@ -0,0 +1,62 @@
+"""
+Decision Index Protocol
+Defines the interface for the retrieval index of past decisions.
+"""
+from typing import Dict, Any, List, Optional, Protocol, runtime_checkable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from managers.decision_index_manager import DecisionRetrieval
+
+@runtime_checkable
+class DecisionIndexProtocol(Protocol):
+    """Protocol for k-NN lookups over past decisions."""
+
+    @property
+    def available(self) -> bool:
+        """Whether the index can be queried."""
+        ...
+
+    def load(self) -> int:
+        """Load (memory-map) the index from disk.
+
+        Returns:
+            int: Number of indexed decisions
+        """
+        ...
+
+    async def search(self, section_number: int, player_input: str) -> Optional["DecisionRetrieval"]:
+        """Find decisions similar to a player input.
+
+        Args:
+            section_number: Current section
+            player_input: Player input
+
+        Returns:
+            Optional[DecisionRetrieval]: Direct hit and prompt examples, None if unavailable
+        """
+        ...
+
+    async def add_decision(
+        self,
+        retrieval: "DecisionRetrieval",
+        next_section: int,
+        conditions: Optional[List[str]] = None,
+        analysis: str = ""
+    ) -> None:
+        """Append a confirmed decision to the index.
+
+        Args:
+            retrieval: Result of the lookup made for this input (reuses its embedding)
+            next_section: Decided section
+            conditions: Conditions of the decision
+            analysis: Analysis of the decision
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index counters."""
+        ...
+
+    async def close(self) -> None:
+        """Persist appended decisions."""
+        ...
@@ -17,10 +17,14 @@ class FileSystemAdapterProtocol(Protocol):
         """Create directory if it doesn't exist."""
         ...
 
-    def write_file_async(self, path: Union[str, Path], content: str) -> None:
+    def write_file_async(self, path: Union[str, Path], content: Union[str, bytes]) -> None:
         """Write content to file asynchronously."""
         ...
 
+    def append_file_async(self, path: Union[str, Path], content: str) -> None:
+        """Append content to file asynchronously."""
+        ...
+
     def read_file_async(self, path: Union[str, Path]) -> Optional[str]:
         """Read file content asynchronously."""
         ...
@@ -32,3 +36,11 @@ class FileSystemAdapterProtocol(Protocol):
     def list_files(self, directory: Union[str, Path], pattern: str = "*") -> List[Path]:
         """List files in directory matching pattern."""
         ...
+
+    def flush(self) -> None:
+        """Flush files written since the last batched fsync."""
+        ...
+
+    def close(self) -> None:
+        """Flush pending batched fsyncs."""
+        ...
@@ -0,0 +1,96 @@
+"""
+LLM Cache Manager Protocol
+Defines the interface for the shared LLM response cache.
+"""
+from typing import Callable, Dict, Any, Optional, Protocol, Sequence, runtime_checkable
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, AIMessage
+
+@runtime_checkable
+class LLMCacheManagerProtocol(Protocol):
+    """Protocol for caching LLM responses by prompt hash."""
+
+    def make_key(
+        self,
+        model_name: str,
+        temperature: float,
+        system_message: str,
+        human_message: str
+    ) -> str:
+        """Build the cache key of an LLM call.
+
+        Args:
+            model_name: Name of the model
+            temperature: Sampling temperature
+            system_message: System prompt
+            human_message: Human prompt
+
+        Returns:
+            str: Cache key
+        """
+        ...
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Response content if cached
+        """
+        ...
+
+    async def set(self, key: str, content: str, model_name: str = "") -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key
+            content: Response content
+            model_name: Name of the model (for inspection)
+        """
+        ...
+
+    async def invalidate(self, key: str) -> None:
+        """Remove a response (e.g. one that could not be parsed).
+
+        Args:
+            key: Cache key
+        """
+        ...
+
+    async def ainvoke(
+        self,
+        llm: BaseChatModel,
+        messages: Sequence[BaseMessage],
+        model_name: str,
+        temperature: float,
+        key: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> AIMessage:
+        """Invoke the LLM unless the response is cached.
+
+        Args:
+            llm: Chat model to call on a miss
+            messages: Prompt messages
+            model_name: Name of the model
+            temperature: Sampling temperature
+            key: Optional precomputed cache key
+            on_chunk: Optional callback streaming the text of a fresh response
+
+        Returns:
+            AIMessage: Cached or fresh response
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses and sizes of both tiers
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close the persistent tier."""
+        ...
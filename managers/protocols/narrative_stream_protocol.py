@@ -0,0 +1,49 @@
+"""
+Narrative Stream Protocol
+Defines the interface for forwarding narrative deltas to game clients.
+"""
+import asyncio
+from typing import Any, ContextManager, Dict, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class NarrativeStreamProtocol(Protocol):
+    """Protocol for publishing narrator output while it is generated."""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether narrator responses should be streamed."""
+        ...
+
+    def begin(self, section_number: int) -> None:
+        """Start the generation of a section."""
+        ...
+
+    def publish(self, section_number: int, delta: str) -> None:
+        """Forward new narrative text of a section to the games watching it.
+
+        Args:
+            section_number: Section being generated
+            delta: Text following what was already published
+        """
+        ...
+
+    def end(self, section_number: int) -> None:
+        """End the generation of a section."""
+        ...
+
+    def watch(self, game_id: str, section_number: int) -> ContextManager[None]:
+        """Forward the deltas of a section to a game while the context is open."""
+        ...
+
+    def subscribe(self, game_id: str) -> "asyncio.Queue[Dict[str, Any]]":
+        """Get a queue receiving the narrative deltas of a game."""
+        ...
+
+    def unsubscribe(self, game_id: str, queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+        """Stop feeding a queue returned by subscribe."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming counters."""
+        ...
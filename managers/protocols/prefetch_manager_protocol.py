@@ -0,0 +1,50 @@
+"""
+Prefetch Manager Protocol
+Defines the interface for the speculative generation of reachable sections.
+"""
+from typing import Any, Dict, Iterable, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class PrefetchManagerProtocol(Protocol):
+    """Protocol for background generation of the next sections of a game."""
+
+    def schedule(self, game_id: str, section_numbers: Iterable[int]) -> int:
+        """Queue the generation of sections a game can reach next.
+
+        Args:
+            game_id: Game ID
+            section_numbers: Target sections of the current choices
+
+        Returns:
+            int: Number of newly queued sections
+        """
+        ...
+
+    def record_transition(self, game_id: str, section_number: int) -> None:
+        """Record the section a game entered, for the hit rate.
+
+        Args:
+            game_id: Game ID
+            section_number: Section entered
+        """
+        ...
+
+    def cancel_game(self, game_id: str) -> int:
+        """Cancel the prefetches of a game that were not started.
+
+        Args:
+            game_id: Game ID
+
+        Returns:
+            int: Number of cancelled prefetches
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prefetch counters and hit rate."""
+        ...
+
+    async def close(self) -> None:
+        """Cancel all prefetches."""
+        ...
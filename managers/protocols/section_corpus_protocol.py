@@ -0,0 +1,53 @@
+"""
+Section Corpus Protocol
+Defines the interface for the packed corpus of raw section content.
+"""
+from typing import List, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class SectionCorpusProtocol(Protocol):
+    """Protocol for read access to raw section content."""
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a corpus is mapped."""
+        ...
+
+    def load(self) -> int:
+        """Map the corpus in memory.
+
+        Returns:
+            int: Number of sections in the corpus
+        """
+        ...
+
+    def get_view(self, section_number: int) -> Optional[memoryview]:
+        """Get the UTF-8 encoded content of a section without copying it.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[memoryview]: Slice of the mapped corpus if present
+        """
+        ...
+
+    def get(self, section_number: int) -> Optional[str]:
+        """Get the decoded content of a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[str]: Section content if present
+        """
+        ...
+
+    def section_numbers(self) -> List[int]:
+        """Get the sorted section numbers of the corpus."""
+        ...
+
+    def close(self) -> None:
+        """Unmap the corpus."""
+        ...
@@ -0,0 +1,78 @@
+"""
+Section Graph Protocol
+Defines the interface for the graph of links between sections.
+"""
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Protocol, Set, Tuple, runtime_checkable
+
+@runtime_checkable
+class SectionGraphProtocol(Protocol):
+    """Protocol for navigation queries over [[n]] links between sections."""
+
+    @property
+    def sections_dir(self) -> Path:
+        """Directory of section sources."""
+        ...
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rescan section files and rebuild the index if any changed.
+
+        Args:
+            force: Ignore the refresh interval
+
+        Returns:
+            bool: True if the index was rebuilt
+        """
+        ...
+
+    def has_section(self, section_number: int) -> bool:
+        """Whether a section exists."""
+        ...
+
+    def successors(self, section_number: int) -> Tuple[int, ...]:
+        """Sections reachable in one step from a section."""
+        ...
+
+    def predecessors(self, section_number: int) -> Tuple[int, ...]:
+        """Sections linking to a section."""
+        ...
+
+    def has_link(self, source: int, target: int) -> bool:
+        """Whether a section links to another one."""
+        ...
+
+    def reachable(self, start: Optional[int] = None) -> Set[int]:
+        """Sections reachable from a section (default: the entry section)."""
+        ...
+
+    def unreachable(self) -> List[int]:
+        """Sections that cannot be reached from the entry section."""
+        ...
+
+    def dead_ends(self) -> List[int]:
+        """Sections without outgoing links."""
+        ...
+
+    def orphans(self) -> List[int]:
+        """Sections without incoming links (entry section excluded)."""
+        ...
+
+    def broken_links(self) -> List[Tuple[int, int]]:
+        """Links whose target section does not exist."""
+        ...
+
+    def shortest_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Shortest sequence of sections from source to target, if any."""
+        ...
+
+    def get_sections(self) -> List[Dict[str, Any]]:
+        """Sections with their metadata (number, title, description, path)."""
+        ...
+
+    def to_knowledge_graph(self) -> Dict[str, Any]:
+        """Nodes and links of the graph, ready to serialize."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of sections and links."""
+        ...
@@ -0,0 +1,50 @@
+"""
+Section Store Protocol
+Defines the interface for the precompiled section artifact.
+"""
+from typing import Dict, Any, Optional, Protocol, runtime_checkable
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+
+@runtime_checkable
+class SectionStoreProtocol(Protocol):
+    """Protocol for read access to precompiled narrative and rules."""
+
+    @property
+    def loaded(self) -> bool:
+        """Whether an artifact is loaded."""
+        ...
+
+    def load(self) -> int:
+        """Load the artifact in memory.
+
+        Returns:
+            int: Number of compiled sections
+        """
+        ...
+
+    def get_narrator(self, section_number: int) -> Optional[NarratorModel]:
+        """Get the compiled narrative of a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[NarratorModel]: Compiled narrative if present
+        """
+        ...
+
+    def get_rules(self, section_number: int) -> Optional[RulesModel]:
+        """Get the compiled rules of a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[RulesModel]: Compiled rules if present
+        """
+        ...
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get the artifact metadata (version, models, prompt digests)."""
+        ...
@@ -0,0 +1,118 @@
+"""
+Session Manager Protocol
+Defines the interface for the per-game session registry.
+"""
+from typing import Dict, Any, Optional, Protocol, runtime_checkable, TYPE_CHECKING
+
+from config.managers.session_manager_config import SessionManagerConfig
+
+if TYPE_CHECKING:
+    from agents.factories.game_factory import GameFactory
+    from managers.session_manager import GameSession
+
+@runtime_checkable
+class SessionManagerProtocol(Protocol):
+    """Protocol for the registry of live game sessions.
+
+    Responsabilités:
+    - Création des composants propres à chaque partie
+    - Recherche d'une partie par game_id
+    - Éviction des parties inactives (LRU + timeout)
+    - Statistiques sur les sessions actives
+    """
+
+    def __init__(
+        self,
+        game_factory: 'GameFactory',
+        config: Optional[SessionManagerConfig] = None
+    ) -> None:
+        """Initialize session manager.
+
+        Args:
+            game_factory: Factory used to build per-game components
+            config: Optional session configuration
+        """
+        ...
+
+    async def create_session(self, game_id: Optional[str] = None) -> 'GameSession':
+        """Create a new game session.
+
+        Args:
+            game_id: Optional game ID (will be generated if not provided)
+
+        Returns:
+            GameSession: The new session
+
+        Raises:
+            ValueError: If game_id is not a valid ID
+            SessionError: If the game already has a live session
+        """
+        ...
+
+    async def get_session(self, game_id: str) -> Optional['GameSession']:
+        """Get a live session.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Optional[GameSession]: Session if it is in memory
+        """
+        ...
+
+    async def get_or_create_session(self, game_id: str) -> 'GameSession':
+        """Get a live session or restore it from storage.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            GameSession: Live or restored session
+        """
+        ...
+
+    async def restore_session(self, game_id: str) -> Optional['GameSession']:
+        """Get a live session, or restore a game with a saved state.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Optional[GameSession]: None if the game is unknown
+        """
+        ...
+
+    async def close_session(self, game_id: str) -> bool:
+        """Stop a game and remove it from memory.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            bool: True if a session was closed
+        """
+        ...
+
+    async def evict_idle_sessions(self) -> int:
+        """Evict sessions idle for longer than the configured timeout.
+
+        Returns:
+            int: Number of evicted sessions
+        """
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get live session statistics.
+
+        Returns:
+            Dict[str, Any]: Session counts and limits
+        """
+        ...
+
+    async def start(self) -> None:
+        """Start the idle session sweeper."""
+        ...
+
+    async def shutdown(self) -> None:
+        """Stop the sweeper and close every live session."""
+        ...
@@ -0,0 +1,32 @@
+"""
+Single Flight Protocol
+Defines the interface for coalescing concurrent computations of a key.
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, Protocol, TypeVar, runtime_checkable
+
+T = TypeVar("T")
+
+
+@runtime_checkable
+class SingleFlightProtocol(Protocol):
+    """Protocol for sharing one in-flight computation per key."""
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """Run ``compute`` unless a computation of ``key`` is in flight, then share it.
+
+        Args:
+            key: Computation key
+            compute: Coroutine factory, only called by the first caller
+
+        Returns:
+            T: Result of the shared computation
+        """
+        ...
+
+    def in_flight(self) -> int:
+        """Get the number of computations in flight."""
+        ...
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing counters and per-key wait times."""
+        ...
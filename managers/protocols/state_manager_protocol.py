@@ -110,6 +110,18 @@ class StateManagerProtocol(Protocol):
         """
         ...
 
+    async def flush(self) -> int:
+        """Write states buffered by save_state.
+        
+        Returns:
+            int: Number of state keys written
+        """
+        ...
+
+    async def close(self) -> None:
+        """Write buffered states and stop background writes."""
+        ...
+
     async def load_state(self, game_id: str) -> GameState:
         """Load a game state by ID.
         
@@ -124,6 +136,17 @@ class StateManagerProtocol(Protocol):
         """
         ...
 
+    async def load_current_state(self) -> Optional[GameState]:
+        """Load the last saved state of the current game.
+
+        Returns:
+            Optional[GameState]: Last saved state if exists
+
+        Raises:
+            StateError: If load fails
+        """
+        ...
+
     @property
     def game_id(self) -> Optional[str]:
         """Get current game ID."""
@@ -1,8 +1,9 @@
 """
 Protocol for trace manager implementations.
 """
-from typing import Dict, Any, Protocol, runtime_checkable
+from typing import Dict, Any, AsyncIterator, Optional, Protocol, runtime_checkable
 from models.game_state import GameState
+from models.trace_model import TraceModel, TraceAction
 
 @runtime_checkable
 class TraceManagerProtocol(Protocol):
@@ -24,3 +25,19 @@ class TraceManagerProtocol(Protocol):
     async def save_trace(self) -> None:
         """Save current trace to storage."""
         ...
+        
+    async def load_session(self, session_id: str) -> Optional[TraceModel]:
+        """Resume a stored session trace (snapshot plus journal)."""
+        ...
+        
+    async def get_current_trace(self) -> Optional[TraceModel]:
+        """Get current trace if exists."""
+        ...
+        
+    def iter_actions(self, session_id: Optional[str] = None) -> AsyncIterator[TraceAction]:
+        """Stream the actions of a session, oldest first."""
+        ...
+        
+    def get_trace_history(self) -> AsyncIterator[TraceModel]:
+        """Stream the stored traces of the game, one session at a time."""
+        ...
@@ -4,32 +4,55 @@ Handles game rules storage and caching.
 """
 
 from typing import Dict, Optional, Any, Union, List
+from typing_extensions import TypedDict
 from datetime import datetime
 import logging
 from pathlib import Path
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 import re
 
 from config.storage_config import StorageConfig
 from managers.protocols.cache_manager_protocol import CacheManagerProtocol
 from managers.protocols.rules_manager_protocol import RulesManagerProtocol
+from managers.protocols.section_store_protocol import SectionStoreProtocol
 from models.rules_model import RulesModel, DiceType, SourceType, Choice, ChoiceType
 from models.types.common_types import NextActionType
 from models.errors_model import RulesError
+# Version du format des règles en cache (à incrémenter si RulesModel change)
+RULES_SCHEMA_VERSION = 1
+
+
+class CachedRules(TypedDict):
+    """Cache record of the rules of a section."""
+    schema_version: int
+    rules: RulesModel
+
+
+# Construit une seule fois : la validation est compilée par pydantic-core
+_CACHED_RULES_ADAPTER = TypeAdapter(CachedRules)
+
 
 class RulesManager(RulesManagerProtocol):
     """Manages rules content loading and caching."""
 
-    def __init__(self, config: StorageConfig, cache_manager: CacheManagerProtocol):
+    def __init__(
+        self,
+        config: StorageConfig,
+        cache_manager: CacheManagerProtocol,
+        section_store: Optional[SectionStoreProtocol] = None
+    ):
         """Initialize RulesManager.
         
         Args:
             config: Storage configuration
             cache_manager: Cache manager instance
+            section_store: Optional precompiled section artifact
         """
         logger.info("Initializing RulesManager")
         self.config = config
         self.cache = cache_manager
+        self.section_store = section_store
         self.logger = logging.getLogger(__name__)
         logger.debug("RulesManager initialized with config: {}", config.__class__.__name__)
 
@@ -38,21 +61,24 @@ class RulesManager(RulesManagerProtocol):
         logger.info("Getting cached rules for section {}", section_number)
         
         try:
-            content = await self.cache.get_cached_data(
+            # Artefact précompilé d'abord (aucun accès disque ni LLM)
+            if self.section_store is not None:
+                compiled = self.section_store.get_rules(section_number)
+                if compiled:
+                    logger.debug("Rules of section {} served from compiled artifact", section_number)
+                    return compiled
+                    
+            record = await self.cache.get_cached_data(
                 key=f"section_{section_number}_rules",
                 namespace="rules"
             )
-            if not content:
-                logger.debug("No rules found in cache for section {}", section_number)
-                return None
-                
-            rules = self._markdown_to_rules(content, section_number)
-            if rules:
-                logger.info("Successfully retrieved rules for section {} from cache", section_number)
-                return rules
-                
-            logger.warning("Failed to parse cached rules for section {}", section_number)
-            return None
+            if record:
+                rules = self._record_to_rules(record, section_number)
+                if rules:
+                    logger.info("Successfully retrieved rules for section {} from cache", section_number)
+                    return rules
+                    
+            return await self._migrate_markdown_rules(section_number)
             
         except KeyError:
             logger.warning("Invalid namespace for section {}", section_number)
@@ -104,17 +130,69 @@ class RulesManager(RulesManagerProtocol):
                 message=str(e)
             )
 
+    def _rules_to_record(self, rules: RulesModel) -> Dict[str, Any]:
+        """Convert rules to a versioned cache record."""
+        return {"schema_version": RULES_SCHEMA_VERSION, "rules": rules.model_dump(mode="json")}
+
+    def _record_to_rules(self, record: Any, section_number: int) -> Optional[RulesModel]:
+        """Validate a cache record, in a single pass.
+        
+        Returns:
+            Optional[RulesModel]: New model, or None for another schema version
+        """
+        if not isinstance(record, dict) or record.get("schema_version") != RULES_SCHEMA_VERSION:
+            logger.info("Ignoring cached rules of section {} (schema version {})",
+                        section_number, record.get("schema_version") if isinstance(record, dict) else None)
+            return None
+        try:
+            return _CACHED_RULES_ADAPTER.validate_python(record)["rules"]
+        except ValidationError as e:
+            logger.warning("Invalid cached rules for section {}: {}", section_number, str(e))
+            return None
+
+    async def _migrate_markdown_rules(self, section_number: int) -> Optional[RulesModel]:
+        """Read rules cached in the former markdown format and store them as a record."""
+        content = await self.cache.get_cached_data(
+            key=f"section_{section_number}_rules",
+            namespace="rules_markdown"
+        )
+        if not content:
+            logger.debug("No rules found in cache for section {}", section_number)
+            return None
+            
+        rules = self._markdown_to_rules(content, section_number)
+        if not rules:
+            logger.warning("Failed to parse cached rules for section {}", section_number)
+            return None
+            
+        await self.cache.save_cached_data(
+            key=f"section_{section_number}_rules",
+            namespace="rules",
+            data=self._rules_to_record(rules)
+        )
+        logger.info("Migrated markdown rules of section {} to the structured cache", section_number)
+        return rules
+
     async def save_rules(self, rules: RulesModel) -> Union[RulesModel, RulesError]:
-        """Save rules to cache."""
+        """Save rules to cache.
+        
+        Rules are stored as a versioned JSON record. The markdown rendering
+        is only written when ``rules_markdown_export`` is enabled.
+        """
         logger.info("Saving rules for section {}", rules.section_number)
         
         try:
-            content = self._rules_to_markdown(rules)
             await self.cache.save_cached_data(
                 key=f"section_{rules.section_number}_rules",
                 namespace="rules",
-                data=content
+                data=self._rules_to_record(rules)
             )
+            if self.config.rules_markdown_export:
+                await self.cache.save_cached_data(
+                    key=f"section_{rules.section_number}_rules",
+                    namespace="rules_markdown",
+                    data=self._rules_to_markdown(rules)
+                )
             logger.debug("Rules saved successfully for section {}", rules.section_number)
             return rules
             
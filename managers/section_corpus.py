@@ -0,0 +1,235 @@
+"""
+Section Corpus Module
+Memory-mapped corpus of raw section content.
+
+Les ~400 fichiers ``data/sections/<n>.md`` sont regroupés hors ligne par
+``utils/build_section_corpus.py`` dans un fichier unique :
+
+    en-tête   : magic, version, nombre de sections, mtime max des sources
+    table     : (numéro de section, offset, longueur) triée par numéro
+    contenu   : textes UTF-8 concaténés
+
+Le serveur mappe ce fichier en lecture seule : une section est une tranche
+``memoryview`` du mapping, décodée seulement à la demande. Les pages sont
+celles du cache du système, partagées par tous les workers qui mappent le
+même fichier. Sans corpus (ou s'il est périmé), le répertoire des sources
+reste utilisé.
+"""
+
+import mmap
+import os
+import struct
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config.managers.section_corpus_config import SectionCorpusConfig
+from managers.protocols.section_corpus_protocol import SectionCorpusProtocol
+
+CORPUS_MAGIC = b"CSRC"
+# Version du format du corpus (à incrémenter si la disposition change)
+CORPUS_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIQ")  # magic, version, réservé, nombre, mtime_ns max
+_ENTRY = struct.Struct("<IQI")  # section, offset, longueur
+
+
+def list_section_files(sections_dir: Path) -> Dict[int, Path]:
+    """List the section source files (``<n>.md``) of a directory."""
+    if not sections_dir.is_dir():
+        return {}
+    return {
+        int(path.stem): path
+        for path in sections_dir.glob("*.md")
+        if path.stem.isdigit()
+    }
+
+
+def _sources_signature(files: Dict[int, Path]) -> Tuple[int, int]:
+    """Number of sources and most recent modification time (ns)."""
+    return len(files), max((p.stat().st_mtime_ns for p in files.values()), default=0)
+
+
+def build_corpus(sections_dir: Path, corpus_path: Path, encoding: str = "utf-8") -> int:
+    """Pack the section sources into a corpus file.
+
+    Le contenu est normalisé comme à la lecture des fichiers (``strip``).
+    Le fichier est remplacé atomiquement : les workers qui mappent
+    l'ancienne version la gardent jusqu'à leur prochain chargement.
+
+    Args:
+        sections_dir: Directory of ``<n>.md`` files
+        corpus_path: Corpus file to write
+        encoding: Encoding of the source files
+
+    Returns:
+        int: Number of packed sections
+    """
+    files = list_section_files(Path(sections_dir))
+    count, sources_mtime = _sources_signature(files)
+    contents = [
+        (n, files[n].read_text(encoding=encoding).strip().encode("utf-8"))
+        for n in sorted(files)
+    ]
+
+    table = bytearray()
+    offset = _HEADER.size + _ENTRY.size * count
+    for n, data in contents:
+        table += _ENTRY.pack(n, offset, len(data))
+        offset += len(data)
+
+    corpus_path = Path(corpus_path)
+    corpus_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = corpus_path.with_name(f".{corpus_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, 0, count, sources_mtime))
+            f.write(table)
+            for _, data in contents:
+                f.write(data)
+        os.replace(tmp_path, corpus_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.info("Packed {} sections ({} bytes) into {}", count, offset, corpus_path)
+    return count
+
+
+class SectionCorpus(SectionCorpusProtocol):
+    """Read-only, memory-mapped view of the section corpus."""
+
+    def __init__(self, config: Optional[SectionCorpusConfig] = None):
+        """Initialize SectionCorpus.
+
+        Args:
+            config: Optional corpus configuration
+        """
+        self.config = config or SectionCorpusConfig()
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._entries: Dict[int, Tuple[int, int]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a corpus is mapped."""
+        return self._view is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, section_number: int) -> bool:
+        return section_number in self._entries
+
+    # -------------------------------------------------------------------------
+    # Chargement
+    # -------------------------------------------------------------------------
+    def _is_stale(self, count: int, sources_mtime: int) -> bool:
+        """Check the corpus against the source directory."""
+        sections_dir = Path(self.config.sections_dir)
+        if not self.config.check_sources or not sections_dir.is_dir():
+            return False
+        return _sources_signature(list_section_files(sections_dir)) != (count, sources_mtime)
+
+    def load(self) -> int:
+        """Map the corpus in memory.
+
+        A missing, stale or unreadable corpus is not an error: raw content
+        is then read from the source directory, as before.
+
+        Returns:
+            int: Number of sections in the corpus
+        """
+        self.close()
+        path = Path(self.config.corpus_path)
+        if not self.config.enabled or not path.exists():
+            logger.info("No section corpus at {}", path)
+            return 0
+
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.error("Error mapping section corpus {}: {}", path, str(e))
+            return 0
+
+        try:
+            magic, version, _, count, sources_mtime = _HEADER.unpack_from(mapped, 0)
+            if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+                logger.warning("Ignoring section corpus {} (format {!r} v{})", path, magic, version)
+                mapped.close()
+                return 0
+            if self._is_stale(count, sources_mtime):
+                logger.warning("Ignoring stale section corpus {} (sources changed)", path)
+                mapped.close()
+                return 0
+            entries = {}
+            for n, offset, length in _ENTRY.iter_unpack(mapped[_HEADER.size:_HEADER.size + _ENTRY.size * count]):
+                if offset + length > len(mapped):
+                    raise ValueError(f"section {n} exceeds the corpus size")
+                entries[n] = (offset, length)
+        except (struct.error, ValueError) as e:
+            logger.error("Invalid section corpus {}: {}", path, str(e))
+            mapped.close()
+            return 0
+
+        self._mmap = mapped
+        self._view = memoryview(mapped)
+        self._entries = entries
+        logger.info("Mapped {} sections from {}", len(entries), path)
+        return len(entries)
+
+    # -------------------------------------------------------------------------
+    # Lecture
+    # -------------------------------------------------------------------------
+    def get_view(self, section_number: int) -> Optional[memoryview]:
+        """Get the UTF-8 encoded content of a section without copying it.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[memoryview]: Slice of the mapped corpus if present
+        """
+        entry = self._entries.get(section_number)
+        if entry is None or self._view is None:
+            return None
+        offset, length = entry
+        return self._view[offset:offset + length]
+
+    def get(self, section_number: int) -> Optional[str]:
+        """Get the decoded content of a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[str]: Section content if present
+        """
+        view = self.get_view(section_number)
+        if view is None:
+            return None
+        return str(view, "utf-8")
+
+    def section_numbers(self) -> List[int]:
+        """Get the sorted section numbers of the corpus."""
+        return sorted(self._entries)
+
+    def close(self) -> None:
+        """Unmap the corpus."""
+        view, mapped = self._view, self._mmap
+        self._view, self._mmap, self._entries = None, None, {}
+        if view is not None:
+            view.release()
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # Des tranches sont encore utilisées : le mapping sera libéré avec elles
+                logger.debug("Section corpus still referenced, unmapped on release")
+
+
+# Register protocol after class definition
+SectionCorpusProtocol.register(SectionCorpus)
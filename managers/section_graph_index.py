@@ -0,0 +1,381 @@
+"""
+Section Graph Index Module
+Compiled in-memory graph of [[n]] links between sections.
+
+Le graphe est construit une seule fois (puis mis à jour uniquement pour les
+fichiers modifiés) et stocké sous forme CSR : un tableau d'offsets et un
+tableau de cibles, dans les deux sens. Les requêtes de navigation ne
+relisent donc jamais les fichiers de sections.
+"""
+
+import os
+import re
+import threading
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from config.managers.section_graph_config import SectionGraphConfig
+from managers.protocols.section_graph_protocol import SectionGraphProtocol
+
+_LINK_PATTERN = re.compile(r"\[\[(\d+)\]\]")
+
+
+class _SectionSource:
+    """Parsed section file."""
+
+    __slots__ = ("mtime_ns", "path", "title", "description", "links")
+
+    def __init__(self, mtime_ns: int, path: Path, content: str, section_number: int):
+        lines = content.split("\n")
+        self.mtime_ns = mtime_ns
+        self.path = path
+        self.title = lines[0].strip("# ") if lines else f"Section {section_number}"
+        self.description = lines[1] if len(lines) > 1 else ""
+        # Un lien répété dans le texte ne compte qu'une fois
+        self.links = tuple(dict.fromkeys(int(n) for n in _LINK_PATTERN.findall(content)))
+
+
+class _CompiledGraph:
+    """Immutable CSR snapshot of the graph.
+
+    Les nœuds sont indexés de 0 à n-1 dans l'ordre des numéros de section.
+    Les successeurs du nœud i sont ``targets[offsets[i]:offsets[i + 1]]`` et
+    ses prédécesseurs ``sources[rev_offsets[i]:rev_offsets[i + 1]]``.
+    """
+
+    __slots__ = (
+        "numbers", "index", "offsets", "targets", "rev_offsets", "sources",
+        "broken", "sections", "knowledge_graph", "reachable_from_start"
+    )
+
+    def __init__(self, sources: Dict[int, _SectionSource]):
+        self.numbers = array("i", sorted(sources))
+        self.index = {n: i for i, n in enumerate(self.numbers)}
+        self.offsets = array("i", [0])
+        self.targets = array("i")
+        self.broken: List[Tuple[int, int]] = []
+
+        for n in self.numbers:
+            for target in sources[n].links:
+                i = self.index.get(target)
+                if i is None:
+                    self.broken.append((n, target))
+                else:
+                    self.targets.append(i)
+            self.offsets.append(len(self.targets))
+
+        # Arêtes inverses par tri par comptage (O(V + E))
+        size = len(self.numbers)
+        self.rev_offsets = array("i", [0]) * (size + 1)
+        for t in self.targets:
+            self.rev_offsets[t + 1] += 1
+        for i in range(size):
+            self.rev_offsets[i + 1] += self.rev_offsets[i]
+        self.sources = array("i", [0]) * len(self.targets)
+        cursor = self.rev_offsets[:-1]
+        for source in range(size):
+            for k in range(self.offsets[source], self.offsets[source + 1]):
+                t = self.targets[k]
+                self.sources[cursor[t]] = source
+                cursor[t] += 1
+
+        self.sections = [
+            {
+                "number": n,
+                "title": sources[n].title,
+                "description": sources[n].description,
+                "path": str(sources[n].path)
+            }
+            for n in self.numbers
+        ]
+        self.knowledge_graph: Optional[Dict[str, Any]] = None
+        self.reachable_from_start: Optional[Set[int]] = None
+
+    def out_degree(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def in_degree(self, i: int) -> int:
+        return self.rev_offsets[i + 1] - self.rev_offsets[i]
+
+    def successors(self, i: int) -> array:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def predecessors(self, i: int) -> array:
+        return self.sources[self.rev_offsets[i]:self.rev_offsets[i + 1]]
+
+
+class SectionGraphIndex(SectionGraphProtocol):
+    """Navigation index over the [[n]] links of the section files."""
+
+    def __init__(self, config: Optional[SectionGraphConfig] = None):
+        """Initialize SectionGraphIndex.
+
+        The index is empty until the first ``refresh()``.
+
+        Args:
+            config: Optional index configuration
+        """
+        self.config = config or SectionGraphConfig()
+        self._sources: Dict[int, _SectionSource] = {}
+        self._graph = _CompiledGraph({})
+        self._lock = threading.Lock()
+        self._last_scan: Optional[float] = None
+
+    @property
+    def sections_dir(self) -> Path:
+        """Directory of section sources."""
+        return Path(self.config.sections_dir)
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+    def _scan(self) -> Dict[int, Tuple[int, Path]]:
+        """List section files with their modification time."""
+        files = {}
+        if not self.sections_dir.exists():
+            logger.warning("Sections directory not found: {}", self.sections_dir)
+            return files
+        with os.scandir(self.sections_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext != ".md" or not entry.is_file():
+                    continue
+                if not stem.isdigit():
+                    logger.warning("Invalid section file name: {}", entry.name)
+                    continue
+                files[int(stem)] = (entry.stat().st_mtime_ns, Path(entry.path))
+        return files
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rescan section files and rebuild the index if any changed.
+
+        Seuls les fichiers ajoutés ou modifiés (mtime) sont relus.
+
+        Args:
+            force: Ignore the refresh interval
+
+        Returns:
+            bool: True if the index was rebuilt
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._last_scan is not None and (
+                not self.config.refresh_interval_seconds
+                or now - self._last_scan < self.config.refresh_interval_seconds
+            ):
+                return False
+            self._last_scan = now
+
+            files = self._scan()
+            changed = set(self._sources) - set(files)
+            sources = {n: s for n, s in self._sources.items() if n in files}
+            for n, (mtime_ns, path) in files.items():
+                current = sources.get(n)
+                if current is not None and current.mtime_ns == mtime_ns:
+                    continue
+                try:
+                    sources[n] = _SectionSource(mtime_ns, path, path.read_text(encoding="utf-8"), n)
+                    changed.add(n)
+                except Exception as e:
+                    logger.error("Error processing section {}: {}", path.name, str(e))
+
+            if not changed:
+                return False
+
+            graph = _CompiledGraph(sources)
+            self._sources = sources
+            self._graph = graph
+            logger.info("Section graph built: {} sections, {} links ({} files reloaded)",
+                        len(graph.numbers), len(graph.targets), len(changed))
+            return True
+
+    # -------------------------------------------------------------------------
+    # Requêtes
+    # -------------------------------------------------------------------------
+    def has_section(self, section_number: int) -> bool:
+        """Whether a section exists."""
+        return section_number in self._graph.index
+
+    def successors(self, section_number: int) -> Tuple[int, ...]:
+        """Sections reachable in one step from a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Tuple[int, ...]: Target sections, in text order
+        """
+        graph = self._graph
+        i = graph.index.get(section_number)
+        if i is None:
+            return ()
+        return tuple(graph.numbers[j] for j in graph.successors(i))
+
+    def predecessors(self, section_number: int) -> Tuple[int, ...]:
+        """Sections linking to a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Tuple[int, ...]: Source sections
+        """
+        graph = self._graph
+        i = graph.index.get(section_number)
+        if i is None:
+            return ()
+        return tuple(graph.numbers[j] for j in graph.predecessors(i))
+
+    def has_link(self, source: int, target: int) -> bool:
+        """Whether a section links to another one."""
+        graph = self._graph
+        i = graph.index.get(source)
+        j = graph.index.get(target)
+        if i is None or j is None:
+            return False
+        return j in graph.successors(i)
+
+    def _bfs(self, graph: _CompiledGraph, start: int) -> Set[int]:
+        visited = bytearray(len(graph.numbers))
+        visited[start] = 1
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            for j in graph.successors(i):
+                if not visited[j]:
+                    visited[j] = 1
+                    queue.append(j)
+        return {graph.numbers[i] for i in range(len(visited)) if visited[i]}
+
+    def reachable(self, start: Optional[int] = None) -> Set[int]:
+        """Sections reachable from a section.
+
+        Args:
+            start: Start section (default: the entry section)
+
+        Returns:
+            Set[int]: Reachable sections, start included
+        """
+        graph = self._graph
+        start = self.config.start_section if start is None else start
+        i = graph.index.get(start)
+        if i is None:
+            return set()
+        if start != self.config.start_section:
+            return self._bfs(graph, i)
+        if graph.reachable_from_start is None:
+            graph.reachable_from_start = self._bfs(graph, i)
+        return set(graph.reachable_from_start)
+
+    def unreachable(self) -> List[int]:
+        """Sections that cannot be reached from the entry section."""
+        reachable = self.reachable()
+        return [n for n in self._graph.numbers if n not in reachable]
+
+    def dead_ends(self) -> List[int]:
+        """Sections without outgoing links (fins de partie ou oublis)."""
+        graph = self._graph
+        return [n for i, n in enumerate(graph.numbers) if not graph.out_degree(i)]
+
+    def orphans(self) -> List[int]:
+        """Sections without incoming links (entry section excluded)."""
+        graph = self._graph
+        return [
+            n for i, n in enumerate(graph.numbers)
+            if not graph.in_degree(i) and n != self.config.start_section
+        ]
+
+    def broken_links(self) -> List[Tuple[int, int]]:
+        """Links whose target section does not exist."""
+        return list(self._graph.broken)
+
+    def shortest_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Shortest sequence of sections from source to target.
+
+        Args:
+            source: Start section
+            target: Target section
+
+        Returns:
+            Optional[List[int]]: Sections from source to target, or None if unreachable
+        """
+        graph = self._graph
+        i = graph.index.get(source)
+        j = graph.index.get(target)
+        if i is None or j is None:
+            return None
+
+        parents = array("i", [-1]) * len(graph.numbers)
+        parents[i] = i
+        queue = deque([i])
+        while queue and parents[j] < 0:
+            k = queue.popleft()
+            for m in graph.successors(k):
+                if parents[m] < 0:
+                    parents[m] = k
+                    queue.append(m)
+        if parents[j] < 0:
+            return None
+
+        path = [j]
+        while path[-1] != i:
+            path.append(parents[path[-1]])
+        return [graph.numbers[k] for k in reversed(path)]
+
+    # -------------------------------------------------------------------------
+    # Sérialisation
+    # -------------------------------------------------------------------------
+    def get_sections(self) -> List[Dict[str, Any]]:
+        """Sections with their metadata, sorted by number."""
+        return list(self._graph.sections)
+
+    def to_knowledge_graph(self) -> Dict[str, Any]:
+        """Nodes and links of the graph.
+
+        The structure is built once per index version and shared: callers
+        must not mutate it.
+
+        Returns:
+            Dict[str, Any]: Knowledge graph data with nodes and links
+        """
+        graph = self._graph
+        if graph.knowledge_graph is None:
+            graph.knowledge_graph = {
+                "nodes": [
+                    {
+                        "id": str(section["number"]),
+                        "title": section["title"],
+                        "description": section["description"],
+                        "type": "section"
+                    }
+                    for section in graph.sections
+                ],
+                "links": [
+                    {
+                        "source": str(graph.numbers[i]),
+                        "target": str(graph.numbers[j]),
+                        "type": "section_link"
+                    }
+                    for i in range(len(graph.numbers))
+                    for j in graph.successors(i)
+                ]
+            }
+        return graph.knowledge_graph
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of sections and links."""
+        graph = self._graph
+        return {
+            "sections": len(graph.numbers),
+            "links": len(graph.targets),
+            "broken_links": len(graph.broken)
+        }
+
+
+# Register protocol after class definition
+SectionGraphProtocol.register(SectionGraphIndex)
@@ -0,0 +1,274 @@
+"""
+Section Store Module
+Precompiled narrative + rules artifact.
+
+L'artefact est un fichier SQLite unique produit hors ligne par
+``utils/precompile_sections.py``. Au démarrage, le serveur le charge en
+mémoire : le premier joueur qui atteint une section n'attend plus le LLM.
+Un artefact compilé avec d'autres prompts ou modèles est ignoré, ainsi que
+chaque section dont le fichier source a changé depuis la compilation.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Tuple
+
+from loguru import logger
+
+from config.managers.section_store_config import SectionStoreConfig
+from managers.protocols.section_store_protocol import SectionStoreProtocol
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+
+# Version du format de l'artefact (à incrémenter si le schéma change)
+ARTIFACT_VERSION = 1
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS sections (
+        section_number INTEGER PRIMARY KEY,
+        source_hash TEXT NOT NULL,
+        narrator_json TEXT NOT NULL,
+        rules_json TEXT NOT NULL,
+        compiled_at REAL NOT NULL
+    )
+    """
+)
+
+
+def source_hash(content: str) -> str:
+    """Hash of a section source file, used to detect changes on resume."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compilation_metadata(narrator_config: Any, rules_config: Any) -> Dict[str, str]:
+    """Settings that invalidate compiled sections when they change.
+
+    Args:
+        narrator_config: Narrator agent configuration
+        rules_config: Rules agent configuration
+
+    Returns:
+        Dict[str, str]: Model names and prompt digests
+    """
+    return {
+        "narrator_model": narrator_config.model_name,
+        "narrator_prompt": source_hash(narrator_config.system_message),
+        "rules_model": rules_config.model_name,
+        "rules_prompt": source_hash(rules_config.system_message)
+    }
+
+
+class SectionStore(SectionStoreProtocol):
+    """In-memory view of the compiled section artifact."""
+
+    def __init__(self, config: Optional[SectionStoreConfig] = None, metadata: Optional[Dict[str, Any]] = None):
+        """Initialize SectionStore.
+
+        Args:
+            config: Optional store configuration
+            metadata: Current compilation settings (see ``compilation_metadata``),
+                the artifact is ignored if it was compiled with other ones
+        """
+        self.config = config or SectionStoreConfig()
+        self._expected = dict(metadata or {})
+        self._records: Dict[int, Tuple[str, str]] = {}
+        self._metadata: Dict[str, Any] = {}
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """Whether an artifact is loaded."""
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # -------------------------------------------------------------------------
+    # Lecture
+    # -------------------------------------------------------------------------
+    def load(self) -> int:
+        """Load the artifact in memory.
+
+        A missing artifact, an unknown format version or other compilation
+        settings are not an error: sections are then compiled lazily by the
+        agents, as before. Sections whose source changed are skipped.
+
+        Returns:
+            int: Number of compiled sections
+        """
+        path = Path(self.config.artifact_path)
+        if not self.config.enabled or not path.exists():
+            logger.info("No compiled section artifact at {}", path)
+            return 0
+
+        try:
+            with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as db:
+                metadata = {k: json.loads(v) for k, v in db.execute("SELECT key, value FROM meta")}
+                if metadata.get("version") != ARTIFACT_VERSION:
+                    logger.warning("Ignoring section artifact {} (version {} != {})",
+                                   path, metadata.get("version"), ARTIFACT_VERSION)
+                    return 0
+                stale_keys = [k for k, v in self._expected.items() if metadata.get(k) != v]
+                if stale_keys:
+                    logger.warning("Ignoring section artifact {} (compiled with other {})",
+                                   path, ", ".join(stale_keys))
+                    return 0
+                rows = db.execute(
+                    "SELECT section_number, source_hash, narrator_json, rules_json FROM sections"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Error loading section artifact {}: {}", path, str(e))
+            return 0
+
+        records = {}
+        stale = []
+        for n, digest, narrator_json, rules_json in rows:
+            if self._source_hash(n) == digest:
+                records[n] = (narrator_json, rules_json)
+            else:
+                stale.append(n)
+        if stale:
+            logger.warning("Skipping {} compiled sections whose source changed: {}",
+                           len(stale), sorted(stale)[:20])
+
+        self._records = records
+        self._metadata = metadata
+        self._loaded = True
+        logger.info("Loaded {} compiled sections from {}", len(records), path)
+        return len(records)
+
+    def _source_hash(self, section_number: int) -> Optional[str]:
+        """Hash of the current source of a section, None if it is missing."""
+        try:
+            content = (Path(self.config.sections_dir) / f"{section_number}.md").read_text(encoding="utf-8")
+        except OSError:
+            return None
+        return source_hash(content)
+
+    def get_narrator(self, section_number: int) -> Optional[NarratorModel]:
+        """Get the compiled narrative of a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[NarratorModel]: Compiled narrative if present
+        """
+        record = self._records.get(section_number)
+        if record is None:
+            return None
+        return NarratorModel.model_validate_json(record[0])
+
+    def get_rules(self, section_number: int) -> Optional[RulesModel]:
+        """Get the compiled rules of a section.
+
+        Args:
+            section_number: Section number
+
+        Returns:
+            Optional[RulesModel]: Compiled rules if present
+        """
+        record = self._records.get(section_number)
+        if record is None:
+            return None
+        return RulesModel.model_validate_json(record[1])
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get the artifact metadata (version, models, prompt digests)."""
+        return dict(self._metadata)
+
+
+class SectionStoreWriter:
+    """Incremental writer of the compiled section artifact.
+
+    Chaque section est validée (commit) dès qu'elle est compilée, ce qui
+    permet de reprendre une compilation interrompue.
+    """
+
+    def __init__(self, path: Path, metadata: Dict[str, Any]):
+        """Open (or create) the artifact.
+
+        Args:
+            path: Artifact path
+            metadata: Compilation metadata (models, prompt digests...)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+
+        previous = {k: json.loads(v) for k, v in self._db.execute("SELECT key, value FROM meta")}
+        stale_keys = [k for k, v in metadata.items() if k in previous and previous[k] != v]
+        if previous.get("version", ARTIFACT_VERSION) != ARTIFACT_VERSION or stale_keys:
+            # Prompts ou modèles différents : les sections compilées ne sont plus valides
+            logger.warning("Compilation settings changed ({}), discarding compiled sections",
+                           ", ".join(stale_keys) or "version")
+            self._db.execute("DELETE FROM sections")
+
+        for key, value in {**metadata, "version": ARTIFACT_VERSION}.items():
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, json.dumps(value))
+            )
+        self._db.commit()
+
+    def compiled_hashes(self) -> Dict[int, str]:
+        """Get the source hash of every compiled section."""
+        return dict(self._db.execute("SELECT section_number, source_hash FROM sections"))
+
+    def put(
+        self,
+        section_number: int,
+        source_digest: str,
+        narrator: NarratorModel,
+        rules: RulesModel
+    ) -> None:
+        """Store a compiled section and commit.
+
+        Args:
+            section_number: Section number
+            source_digest: Hash of the section source
+            narrator: Compiled narrative
+            rules: Compiled rules
+        """
+        self._db.execute(
+            "INSERT OR REPLACE INTO sections "
+            "(section_number, source_hash, narrator_json, rules_json, compiled_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (section_number, source_digest, narrator.model_dump_json(), rules.model_dump_json(), time.time())
+        )
+        self._db.commit()
+
+    def prune(self, section_numbers: Set[int]) -> int:
+        """Remove sections whose source no longer exists.
+
+        Args:
+            section_numbers: Sections that still exist
+
+        Returns:
+            int: Number of removed sections
+        """
+        stale = set(self.compiled_hashes()) - section_numbers
+        for n in stale:
+            self._db.execute("DELETE FROM sections WHERE section_number = ?", (n,))
+        self._db.commit()
+        return len(stale)
+
+    def close(self) -> None:
+        """Close the artifact."""
+        self._db.close()
+
+
+# Register protocol after class definition
+SectionStoreProtocol.register(SectionStore)
@@ -0,0 +1,422 @@
+"""
+Session Manager Module
+Registry of live games, keyed by game_id.
+
+Chaque partie possède ses propres managers d'état, de trace et de personnage.
+Les managers de sections et de règles (données immuables) sont partagés
+entre toutes les parties via la GameFactory.
+"""
+
+import asyncio
+import re
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple
+
+from loguru import logger
+
+from config.managers.session_manager_config import SessionManagerConfig
+from managers.protocols.agent_manager_protocol import AgentManagerProtocol
+from managers.protocols.session_manager_protocol import SessionManagerProtocol
+from agents.factories.game_factory import GameFactory
+from models.errors_model import GameError, SessionError
+from utils.metrics import ACTIVE_SESSIONS
+
+# Un game_id sert de nom de dossier : pas de séparateur de chemin
+_GAME_ID = re.compile(r"^[\w-]{1,64}$")
+
+
+@dataclass
+class GameSession:
+    """A live game and its dedicated components."""
+    game_id: str
+    agent_manager: AgentManagerProtocol
+    created_at: float = field(default_factory=time.monotonic)
+    last_access: float = field(default_factory=time.monotonic)
+    # Sérialise les tours d'une même partie (REST + WebSocket)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Levé quand la session retirée du registre a écrit son état
+    released: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def touch(self) -> None:
+        """Mark the session as recently used."""
+        self.last_access = time.monotonic()
+
+    def idle_seconds(self, now: Optional[float] = None) -> float:
+        """Get the time since the last access."""
+        return (now or time.monotonic()) - self.last_access
+
+
+class SessionManager(SessionManagerProtocol):
+    """Registry of live game sessions with LRU and idle eviction."""
+
+    def __init__(
+        self,
+        game_factory: GameFactory,
+        config: Optional[SessionManagerConfig] = None
+    ):
+        """Initialize SessionManager.
+
+        Args:
+            game_factory: Factory used to build per-game components
+            config: Optional session configuration
+        """
+        self.game_factory = game_factory
+        self.config = config or SessionManagerConfig()
+        self._sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+        # Sessions retirées du registre dont l'état n'est pas encore écrit
+        self._releasing: Dict[str, GameSession] = {}
+        self._lock = asyncio.Lock()
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self._created = 0
+        self._evicted = 0
+        self._restored = 0
+        ACTIVE_SESSIONS.set_function(lambda: len(self._sessions))
+        logger.info("SessionManager initialized (max_sessions={}, idle_timeout={}s)",
+                    self.config.max_sessions, self.config.idle_timeout_seconds)
+
+    def _build_session(self, game_id: str) -> GameSession:
+        """Build the components of a game.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            GameSession: New session (not registered)
+        """
+        # Import AgentManager here to avoid circular imports
+        from managers.agent_manager import AgentManager
+
+        agents, managers = self.game_factory.create_session_components(game_id)
+        agent_manager = AgentManager(
+            agents=agents,
+            managers=managers,
+            game_factory=self.game_factory,
+            story_graph_config=self.game_factory.config.agent_configs.story_graph_config
+        )
+        return GameSession(game_id=game_id, agent_manager=agent_manager)
+
+    def _detach(self, game_id: str) -> GameSession:
+        """Remove a session from the registry until it is released.
+
+        Must be called with the registry lock held.
+        """
+        session = self._sessions.pop(game_id)
+        self._releasing[game_id] = session
+        return session
+
+    async def _wait_released(self, game_id: str) -> None:
+        """Wait until the removed sessions of a game have saved their state."""
+        session = self._releasing.get(game_id)
+        while session is not None:
+            await session.released.wait()
+            session = self._releasing.get(game_id)
+
+    def _pop_overflow(self, keep: Optional[str] = None) -> List[GameSession]:
+        """Remove least recently used sessions above capacity.
+
+        Sessions playing a turn are skipped: the registry may stay above
+        capacity until they are done.
+
+        Must be called with the registry lock held.
+
+        Args:
+            keep: Game just registered, never evicted
+
+        Returns:
+            List[GameSession]: Removed sessions, still to be stopped
+        """
+        removed = []
+        for game_id, session in list(self._sessions.items()):
+            if len(self._sessions) <= self.config.max_sessions:
+                break
+            if game_id == keep or session.lock.locked():
+                continue
+            removed.append(self._detach(game_id))
+        return removed
+
+    async def _release(self, session: GameSession) -> None:
+        """Save a session state and release its per-game cache.
+
+        Args:
+            session: Session removed from the registry
+        """
+        try:
+            # Le joueur est parti : ses sections préchargées ne serviront plus
+            self.game_factory.get_prefetcher().cancel_game(session.game_id)
+            async with session.lock:
+                await session.agent_manager.stop_game()
+                # Écrire les états encore en attente (write-behind)
+                state_manager = session.agent_manager.managers.get('state_manager')
+                if state_manager is not None:
+                    await state_manager.close()
+            cache_manager = session.agent_manager.managers.get('cache_manager')
+            if cache_manager is not None:
+                await cache_manager.close()
+        finally:
+            session.released.set()
+            if self._releasing.get(session.game_id) is session:
+                del self._releasing[session.game_id]
+
+    async def _stop_sessions(self, sessions: List[GameSession]) -> None:
+        """Save and stop removed sessions.
+
+        Args:
+            sessions: Sessions removed from the registry
+        """
+        for session in sessions:
+            try:
+                await self._release(session)
+                self._evicted += 1
+                logger.info("Session {} evicted", session.game_id)
+            except Exception as e:
+                logger.error("Error stopping session {}: {}", session.game_id, str(e))
+
+    async def _register(self, session: GameSession) -> GameSession:
+        """Register a session, evicting the LRU ones if needed.
+
+        Args:
+            session: Session to register
+
+        Returns:
+            GameSession: Registered session (an existing one wins a race)
+        """
+        async with self._lock:
+            existing = self._sessions.get(session.game_id)
+            if existing:
+                self._sessions.move_to_end(session.game_id)
+                existing.touch()
+                return existing
+            self._sessions[session.game_id] = session
+            self._created += 1
+            overflow = self._pop_overflow(keep=session.game_id)
+        await self._stop_sessions(overflow)
+        return session
+
+    async def create_session(self, game_id: Optional[str] = None) -> GameSession:
+        """Create a new game session.
+
+        Le game_id fourni par un client devient un chemin sur disque : il est
+        validé, et la partie en cours d'un autre joueur n'est jamais reprise.
+
+        Args:
+            game_id: Optional game ID (will be generated if not provided)
+
+        Returns:
+            GameSession: The new session
+
+        Raises:
+            ValueError: If game_id is not a valid ID
+            SessionError: If the game already has a live session
+            GameError: If session creation fails
+        """
+        session, created = await self._open_session(game_id or str(uuid.uuid4()))
+        if not created:
+            raise SessionError(f"Game {game_id} already has a live session")
+        return session
+
+    async def _open_session(self, game_id: str) -> Tuple[GameSession, bool]:
+        """Get the live session of a game, or build and register it.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Tuple[GameSession, bool]: Session, and whether it was created by this call
+
+        Raises:
+            ValueError: If game_id is not a valid ID
+            GameError: If session creation fails
+        """
+        if not _GAME_ID.match(game_id):
+            raise ValueError(f"Invalid game_id: {game_id!r}")
+        existing = await self.get_session(game_id)
+        if existing:
+            return existing, False
+        # Une session évincée de cette partie écrit peut-être encore son état
+        await self._wait_released(game_id)
+
+        try:
+            logger.debug("Creating session for game {}", game_id)
+            session = self._build_session(game_id)
+            registered = await self._register(session)
+        except Exception as e:
+            logger.error("Error creating session {}: {}", game_id, str(e))
+            raise GameError(f"Failed to create session: {str(e)}") from e
+        return registered, registered is session
+
+    async def get_session(self, game_id: str) -> Optional[GameSession]:
+        """Get a live session.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Optional[GameSession]: Session if it is in memory
+        """
+        async with self._lock:
+            session = self._sessions.get(game_id)
+            if session:
+                self._sessions.move_to_end(game_id)
+                session.touch()
+            return session
+
+    async def get_or_create_session(self, game_id: str) -> GameSession:
+        """Get a live session or restore it from storage.
+
+        Une partie évincée est reconstruite à partir du dernier état sauvegardé.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            GameSession: Live or restored session
+
+        Raises:
+            ValueError: If game_id is not a valid ID
+            GameError: If session creation fails
+        """
+        session = await self.get_session(game_id)
+        if session:
+            return session
+
+        session, _ = await self._open_session(game_id)
+        async with session.lock:
+            state_manager = session.agent_manager.managers['state_manager']
+            if not await state_manager.get_current_state():
+                state = await state_manager.load_current_state()
+                if state:
+                    # Reprendre la trace de la session plutôt qu'en ouvrir une nouvelle
+                    trace_manager = session.agent_manager.managers.get('trace_manager')
+                    if trace_manager is not None:
+                        await trace_manager.load_session(state.session_id)
+                    self._restored += 1
+                    logger.info("Session {} restored at section {}", game_id, state.section_number)
+        return session
+
+    def has_saved_state(self, game_id: str) -> bool:
+        """Tell whether a game has a saved current state on disk.
+
+        Args:
+            game_id: ID of the game
+        """
+        if not _GAME_ID.match(game_id):
+            return False
+        storage_config = self.game_factory.config.manager_configs.storage_config
+        state_dir = storage_config.model_copy(update={"game_id": game_id}).get_absolute_path("state")
+        return any(state_dir.glob(f"game_{game_id}_current.*"))
+
+    async def restore_session(self, game_id: str) -> Optional[GameSession]:
+        """Get a live session, or restore a game with a saved state.
+
+        Contrairement à get_or_create_session, rien n'est construit pour un
+        game_id inconnu : une requête pour une partie inventée ne peut pas
+        évincer les parties en cours.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            Optional[GameSession]: Live or restored session, None if the game is unknown
+        """
+        session = await self.get_session(game_id)
+        if session:
+            return session
+        # L'état d'une session évincée peut être en cours d'écriture
+        await self._wait_released(game_id)
+        if not self.has_saved_state(game_id):
+            return None
+        return await self.get_or_create_session(game_id)
+
+    async def close_session(self, game_id: str) -> bool:
+        """Stop a game and remove it from memory.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            bool: True if a session was closed
+        """
+        async with self._lock:
+            session = self._detach(game_id) if game_id in self._sessions else None
+        if not session:
+            return False
+
+        await self._release(session)
+        logger.info("Session {} closed", game_id)
+        return True
+
+    async def evict_idle_sessions(self) -> int:
+        """Evict sessions idle for longer than the configured timeout.
+
+        Returns:
+            int: Number of evicted sessions
+        """
+        now = time.monotonic()
+        async with self._lock:
+            idle = [
+                game_id for game_id, session in self._sessions.items()
+                if session.idle_seconds(now) > self.config.idle_timeout_seconds
+                and not session.lock.locked()
+            ]
+            removed = [self._detach(game_id) for game_id in idle]
+        await self._stop_sessions(removed)
+        if removed:
+            logger.debug("Evicted {} idle sessions", len(removed))
+        return len(removed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get live session statistics.
+
+        Returns:
+            Dict[str, Any]: Session counts and limits
+        """
+        return {
+            "active_sessions": len(self._sessions),
+            "busy_sessions": sum(1 for s in self._sessions.values() if s.lock.locked()),
+            "max_sessions": self.config.max_sessions,
+            "idle_timeout_seconds": self.config.idle_timeout_seconds,
+            "created_total": self._created,
+            "evicted_total": self._evicted,
+            "restored_total": self._restored
+        }
+
+    async def _sweep_loop(self) -> None:
+        """Periodically evict idle sessions."""
+        while True:
+            await asyncio.sleep(self.config.sweep_interval_seconds)
+            try:
+                await self.evict_idle_sessions()
+            except Exception as e:
+                logger.error("Error sweeping idle sessions: {}", str(e))
+
+    async def start(self) -> None:
+        """Start the idle session sweeper."""
+        if not self._sweeper_task or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_loop())
+            logger.debug("Session sweeper started")
+
+    async def shutdown(self) -> None:
+        """Stop the sweeper and close every live session."""
+        if self._sweeper_task:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+
+        async with self._lock:
+            sessions = [self._detach(game_id) for game_id in list(self._sessions)]
+        for session in sessions:
+            try:
+                await self._release(session)
+            except Exception as e:
+                logger.error("Error stopping session {}: {}", session.game_id, str(e))
+        logger.info("SessionManager shutdown, {} sessions closed", len(sessions))
+
+
+# Register protocol after class definition
+SessionManagerProtocol.register(SessionManager)
@@ -0,0 +1,148 @@
+"""
+Single Flight Module
+Coalesces concurrent computations of the same key.
+
+Quand plusieurs joueurs atteignent en même temps une section absente du
+cache, un seul appel LLM est lancé : les suivants attendent le même
+résultat. Le calcul tourne dans sa propre tâche, si bien que l'annulation
+d'un appelant (joueur déconnecté) n'interrompt pas les autres, et son
+résultat est écrit une seule fois par celui qui l'a calculé.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from loguru import logger
+
+from config.managers.single_flight_config import SingleFlightConfig
+from managers.protocols.single_flight_protocol import SingleFlightProtocol
+
+T = TypeVar("T")
+
+
+@dataclass
+class _KeyStats:
+    """Counters of one key."""
+    calls: int = 0
+    computations: int = 0
+    shared: int = 0
+    errors: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "computations": self.computations,
+            "shared": self.shared,
+            "errors": self.errors,
+            "wait_avg_ms": round(1000 * self.wait_total / self.calls, 3) if self.calls else 0.0,
+            "wait_max_ms": round(1000 * self.wait_max, 3)
+        }
+
+
+def _format_key(key: Hashable) -> str:
+    if isinstance(key, tuple):
+        return ":".join(str(part) for part in key)
+    return str(key)
+
+
+class SingleFlight(SingleFlightProtocol):
+    """Share one in-flight computation per key between concurrent callers."""
+
+    def __init__(self, config: Optional[SingleFlightConfig] = None):
+        """Initialize SingleFlight.
+
+        Args:
+            config: Optional single-flight configuration
+        """
+        self.config = config or SingleFlightConfig()
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self._stats: "OrderedDict[Hashable, _KeyStats]" = OrderedDict()
+        self._totals = _KeyStats()
+
+    def _key_stats(self, key: Hashable) -> _KeyStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _KeyStats()
+            if len(self._stats) > self.config.max_tracked_keys:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        return stats
+
+    def _on_done(self, key: Hashable, stats: _KeyStats, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Récupérée ici : personne n'attend plus si tous les appelants ont été annulés
+        if not task.cancelled() and task.exception() is not None:
+            stats.errors += 1
+            logger.debug("Shared computation {} failed: {}", _format_key(key), task.exception())
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """Run ``compute`` unless a computation of ``key`` is in flight, then share it.
+
+        Errors are propagated to every waiting caller and not remembered:
+        the next call after a failure computes again.
+
+        Args:
+            key: Computation key
+            compute: Coroutine factory, only called by the first caller
+
+        Returns:
+            T: Result of the shared computation
+        """
+        if not self.config.enabled:
+            return await compute()
+
+        stats = self._key_stats(key)
+        stats.calls += 1
+        self._totals.calls += 1
+        loop = asyncio.get_running_loop()
+        task = self._flights.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(compute())
+            task.add_done_callback(functools.partial(self._on_done, key, stats))
+            self._flights[key] = task
+            stats.computations += 1
+            self._totals.computations += 1
+        else:
+            stats.shared += 1
+            self._totals.shared += 1
+            logger.debug("Joining in-flight computation {}", _format_key(key))
+
+        start = time.perf_counter()
+        try:
+            # shield : annuler un appelant n'annule pas le calcul partagé
+            return await asyncio.shield(task)
+        finally:
+            waited = time.perf_counter() - start
+            stats.wait_total += waited
+            stats.wait_max = max(stats.wait_max, waited)
+
+    def in_flight(self) -> int:
+        """Get the number of computations in flight."""
+        return len(self._flights)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing counters and per-key wait times.
+
+        Returns:
+            Dict[str, Any]: Totals and the statistics of the tracked keys
+        """
+        return {
+            "enabled": self.config.enabled,
+            "in_flight": len(self._flights),
+            "calls": self._totals.calls,
+            "computations": self._totals.computations,
+            "shared": self._totals.shared,
+            "keys": {_format_key(key): stats.as_dict() for key, stats in self._stats.items()}
+        }
+
+
+# Register protocol after class definition
+SingleFlightProtocol.register(SingleFlight)
@@ -5,14 +5,16 @@ Manages game state persistence and validation.
 
 from typing import Dict, Optional, Any, List, Union
 from pydantic import BaseModel, ValidationError
-import json
+import asyncio
 import logging
 from datetime import datetime
 import uuid
 from loguru import logger
 
 from models.game_state import GameState
+from utils import json_codec
 from config.storage_config import StorageConfig
+from config.managers.state_persistence_config import StatePersistenceConfig
 from managers.protocols.cache_manager_protocol import CacheManagerProtocol
 from managers.protocols.state_manager_protocol import StateManagerProtocol
 from managers.protocols.character_manager_protocol import CharacterManagerProtocol
@@ -33,7 +35,9 @@ class StateManager(StateManagerProtocol):
         self, 
         config: StorageConfig, 
         cache_manager: CacheManagerProtocol,
-        character_manager: CharacterManagerProtocol
+        character_manager: CharacterManagerProtocol,
+        game_id: Optional[str] = None,
+        persistence_config: Optional[StatePersistenceConfig] = None
     ):
         """Initialize StateManager with configuration.
         
@@ -41,14 +45,21 @@ class StateManager(StateManagerProtocol):
             config: Storage configuration
             cache_manager: Cache manager for state storage
             character_manager: Character manager for character operations
+            game_id: Optional game ID when the manager is bound to a session
+            persistence_config: Optional durability settings of save_state
         """
         logger.info("Initializing StateManager")
         self.config = config
         self.cache = cache_manager
         self.character_manager = character_manager
+        self.persistence_config = persistence_config or StatePersistenceConfig()
         self._current_state: Optional[GameState] = None
-        self._game_id: Optional[str] = None
+        self._game_id: Optional[str] = game_id
         self._session_id: Optional[str] = None
+        # Write-behind : dernier état à écrire par clé (les sauvegardes successives fusionnent)
+        self._pending: Dict[str, GameState] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
         logger.debug("StateManager initialized with config: {}", config)
 
     async def initialize(self) -> None:
@@ -224,7 +235,8 @@ class StateManager(StateManagerProtocol):
             logger.info("Creating initial state")
             
             # 1. S'assurer que le state manager est initialisé
-            if not self._game_id:
+            # (une session peut fournir le game_id sans avoir de session_id)
+            if not self._game_id or not self._session_id:
                 await self.initialize()
             
             # 2. Extraire les données à préserver
@@ -403,26 +415,11 @@ class StateManager(StateManagerProtocol):
             logger.debug("State validated, narrative content: {}", 
                         self._truncate_content(validated_state.narrative.content if validated_state.narrative else None))
             
-            # Sérialiser
-            json_data = validated_state.model_dump()
-            logger.debug("State serialized, narrative content in json: {}", 
-                        self._truncate_content(json_data.get('narrative', {}).get('content') if json_data.get('narrative') else None))
-            
-            # Sauvegarder l'état courant
-            await self.cache.save_cached_data(
-                key=f"game_{self._game_id}_current",
-                namespace="state",
-                data=json_data
-            )
-            logger.debug("Current state saved to cache")
-            
-            # Sauvegarder aussi par section pour l'historique
-            await self.cache.save_cached_data(
-                key=f"game_{self._game_id}_section_{state.section_number}",
-                namespace="state",
-                data=json_data
-            )
-            logger.debug("Section state saved to cache")
+            # Sauvegarder l'état courant et l'état de la section (historique)
+            await self._persist(validated_state, [
+                f"game_{self._game_id}_current",
+                f"game_{self._game_id}_section_{state.section_number}"
+            ])
             
             self._current_state = validated_state
             logger.debug("Current state updated, final narrative content: {}", 
@@ -434,6 +431,89 @@ class StateManager(StateManagerProtocol):
             logger.error("Error saving state: {}", str(e))
             raise StateError(f"Failed to save state: {str(e)}")
 
+    # -------------------------------------------------------------------------
+    # Write-behind
+    # -------------------------------------------------------------------------
+    async def _persist(self, state: GameState, keys: List[str]) -> None:
+        """Write a state now or buffer it, depending on the durability mode."""
+        if self.persistence_config.durability == "sync":
+            await self._write({key: state for key in keys})
+            return
+        
+        for key in keys:
+            self._pending[key] = state
+        if self.persistence_config.durability == "batched":
+            if len(self._pending) >= self.persistence_config.max_dirty_keys:
+                self._schedule_flush(0)
+            else:
+                self._schedule_flush(self.persistence_config.flush_interval_seconds)
+
+    async def _write(self, states: Dict[str, GameState]) -> None:
+        """Write all keys; each state is encoded once (json_codec.encode_state)."""
+        for key, state in states.items():
+            await self.cache.save_cached_data(key=key, namespace="state", data=state)
+        logger.debug("{} state keys written for game {}", len(states), self._game_id)
+
+    def _schedule_flush(self, delay: float) -> None:
+        if delay and self._flush_task is not None and not self._flush_task.done():
+            return  # Une écriture est déjà prévue
+        self._flush_task = asyncio.get_running_loop().create_task(self._delayed_flush(delay))
+
+    async def _delayed_flush(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            await self.flush()
+        except Exception:
+            pass  # Déjà loggé, les états restent en attente
+
+    async def flush(self) -> int:
+        """Write buffered states to storage.
+        
+        Returns:
+            int: Number of state keys written
+            
+        Raises:
+            StateError: If the write fails (states stay buffered)
+        """
+        async with self._flush_lock:
+            # Les états restent lisibles dans le tampon pendant l'écriture
+            pending = dict(self._pending)
+            if not pending:
+                return 0
+            try:
+                await self._write(pending)
+            except BaseException as e:
+                if not isinstance(e, Exception):
+                    raise  # Annulation : les états restent en attente
+                logger.error("Error writing buffered states: {}", str(e))
+                raise StateError(f"Failed to write states: {str(e)}")
+            # Garder les états remplacés par une sauvegarde plus récente entre-temps
+            for key, state in pending.items():
+                if self._pending.get(key) is state:
+                    del self._pending[key]
+            return len(pending)
+
+    async def close(self) -> None:
+        """Write buffered states and stop the write-behind task."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        await self.flush()
+
+    @staticmethod
+    def _as_state(data: Any) -> GameState:
+        """Rebuild a state from a cache read.
+        
+        The memory tier returns the saved GameState itself, files are
+        decoded to a dict; raw JSON (bytes or str) is accepted as well.
+        """
+        if isinstance(data, GameState):
+            return data
+        if isinstance(data, (bytes, str)):
+            data = json_codec.loads(data)
+        return GameState.model_validate(data)
+
     async def load_state(self, section_number: int) -> Optional[GameState]:
         """Load state for a specific section.
         
@@ -450,6 +530,11 @@ class StateManager(StateManagerProtocol):
             if not self._game_id:
                 raise StateError("State manager not initialized")
                 
+            pending = self._pending.get(f"game_{self._game_id}_section_{section_number}")
+            if pending is not None:
+                self._current_state = pending
+                return pending
+                
             json_data = await self.cache.get_cached_data(
                 key=f"game_{self._game_id}_section_{section_number}",
                 namespace="state"
@@ -458,7 +543,7 @@ class StateManager(StateManagerProtocol):
             if not json_data:
                 return None
                 
-            state = GameState(**json.loads(json_data))
+            state = self._as_state(json_data)
             self._current_state = state
             return state
             
@@ -466,6 +551,44 @@ class StateManager(StateManagerProtocol):
             logger.error("Error loading state: {}", str(e))
             raise StateError(f"Failed to load state: {str(e)}")
 
+    async def load_current_state(self) -> Optional[GameState]:
+        """Load the last saved state of the current game.
+        
+        Used to restore a game that was evicted from memory.
+        
+        Returns:
+            Optional[GameState]: Last saved state if exists
+            
+        Raises:
+            StateError: If load fails
+        """
+        try:
+            if not self._game_id:
+                raise StateError("State manager not initialized")
+                
+            pending = self._pending.get(f"game_{self._game_id}_current")
+            if pending is not None:
+                self._current_state = pending
+                self._session_id = pending.session_id
+                return pending
+                
+            json_data = await self.cache.get_cached_data(
+                key=f"game_{self._game_id}_current",
+                namespace="state"
+            )
+            
+            if not json_data:
+                return None
+                
+            state = self._as_state(json_data)
+            self._current_state = state
+            self._session_id = state.session_id
+            return state
+            
+        except Exception as e:
+            logger.error("Error loading current state: {}", str(e))
+            raise StateError(f"Failed to load current state: {str(e)}")
+
     async def get_section_history(self) -> List[int]: #no test
         """Get list of all saved section numbers for current game."""
         try:
@@ -485,16 +608,23 @@ class StateManager(StateManagerProtocol):
             logger.error("Error getting section history: {}", str(e))
             raise StateError(f"Failed to get section history: {str(e)}")
 
-    async def clear_state(self) -> None: #no test and we dont want to clear the persistance, it's persostenance, not cache
-        """Clear current state and cache."""
+    async def clear_state(self) -> None:
+        """Clear the current state and delete the saved states of the game."""
         try:
             logger.info("Clearing game state")
+            game_id = self._game_id
             self._current_state = None
-            self._game_id = None
             
-            # Nettoyer le cache
-            if self.cache:
-                await self.cache.clear()
+            # Les états en attente ne doivent pas être réécrits après l'effacement
+            task, self._flush_task = self._flush_task, None
+            if task is not None and not task.done() and task is not asyncio.current_task():
+                task.cancel()
+            async with self._flush_lock:
+                self._pending.clear()
+                # Supprimer les états sauvegardés (courant et par section)
+                if self.cache and game_id:
+                    await self.cache.clear_pattern(namespace="state", pattern=f"game_{game_id}_*")
+            self._game_id = None
                 
             logger.info("Game state cleared successfully")
             
@@ -6,34 +6,124 @@ Manages game trace persistence and history.
 # Standard library imports
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, AsyncIterator, List
 import json
 import logging
 import uuid
 
 # Local imports
 from config.storage_config import StorageConfig
-from managers.protocols.cache_manager_protocol import CacheManagerProtocol
+from managers.protocols.filesystemadapter_protocol import FileSystemAdapterProtocol
 from managers.protocols.trace_manager_protocol import TraceManagerProtocol
 from models.errors_model import TraceError
 from models.game_state import GameState
 from models.trace_model import TraceModel, TraceAction, ActionType
 
+# Journal d'une session, à côté de son snapshot {session_id}.json
+JOURNAL_SUFFIX = ".jsonl"
+# Nombre minimal d'actions journalisées avant de réécrire le snapshot
+COMPACT_EVERY = 256
+
 class TraceManager(TraceManagerProtocol):
     """Manages game traces and history."""
     
-    def __init__(self, config: StorageConfig, cache_manager: CacheManagerProtocol):
-        """Initialize TraceManager with configuration."""
+    def __init__(
+        self,
+        config: StorageConfig,
+        fs_adapter: FileSystemAdapterProtocol,
+        compact_every: int = COMPACT_EVERY
+    ):
+        """Initialize TraceManager with configuration.
+        
+        Args:
+            config: Storage configuration (namespace ``trace``)
+            fs_adapter: File adapter of the game (``CacheManager.fs_adapter``)
+            compact_every: Minimum number of journaled actions before a snapshot
+        """
         self.config = config
-        self.cache = cache_manager
+        self.fs = fs_adapter
+        self.compact_every = compact_every
         self.logger = logging.getLogger(__name__)
         self._current_trace = None
         self._current_game_id = None
+        self._journal_entries = 0
+        self._snapshot_size = 0
+
+    # -------------------------------------------------------------------------
+    # Journal (verrous par fichier, pool d'I/O et fsync de l'adaptateur)
+    # -------------------------------------------------------------------------
+    def _trace_dir(self) -> Path:
+        """Directory of trace snapshots and journals."""
+        config = self.config
+        if not config.game_id and self._current_trace:
+            config = config.model_copy(update={"game_id": self._current_trace.game_id})
+        return config.get_absolute_path("trace")
+
+    def _snapshot_path(self, session_id: str) -> Path:
+        return self._trace_dir() / f"{session_id}.json"
+
+    def _journal_path(self, session_id: str) -> Path:
+        return self._trace_dir() / f"{session_id}{JOURNAL_SUFFIX}"
+
+    async def _append(self, session_id: str, seq: int, action: TraceAction) -> None:
+        """Append one action to the session journal."""
+        line = json.dumps({"seq": seq, **action.model_dump(mode="json")}, ensure_ascii=False)
+        await self.fs.append_file_async(self._journal_path(session_id), line + "\n")
+
+    async def _compact(self, trace: TraceModel) -> None:
+        """Write a full snapshot of the trace, then truncate its journal.
+        
+        Le snapshot est écrit avant la troncature : après un arrêt entre les
+        deux, les lignes déjà présentes dans le snapshot sont ignorées (seq).
+        """
+        await self.fs.write_file_async(self._snapshot_path(trace.session_id), trace.model_dump_json())
+        await self.fs.write_file_async(self._journal_path(trace.session_id), "")
 
+    async def _read_journal(self, session_id: str, start: int) -> List[TraceAction]:
+        """Read journal actions from a sequence number.
+        
+        Le journal est borné par la compaction : il est lu d'un bloc.
+        """
+        path = self._journal_path(session_id)
+        content = await self.fs.read_file_async(path)
+        actions = []
+        for line in (content or "").splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Dernière ligne incomplète (arrêt pendant l'écriture)
+                self.logger.warning(f"Skipping truncated trace journal line in {path.name}")
+                continue
+            if entry.pop("seq", 0) >= start:
+                actions.append(TraceAction(**entry))
+        return actions
+
+    async def _read_snapshot(self, session_id: str) -> Optional[TraceModel]:
+        content = await self.fs.read_file_async(self._snapshot_path(session_id))
+        if not content:
+            return None
+        return TraceModel.model_validate_json(content)
+
+    async def _load(self, session_id: str) -> Optional[TraceModel]:
+        """Replay a session trace: snapshot plus journal tail."""
+        trace = await self._read_snapshot(session_id)
+        if trace is None:
+            return None
+        tail = await self._read_journal(session_id, len(trace.history))
+        if tail:
+            trace = trace.model_copy(update={
+                "history": trace.history + tail,
+                "section_number": tail[-1].section
+            })
+        return trace
+
+    # -------------------------------------------------------------------------
+    # API
+    # -------------------------------------------------------------------------
     async def start_session(self) -> None:
         """Start a new game session."""
         session_id = str(datetime.now().timestamp())
-        self._current_game_id = str(uuid.uuid4())
+        self._current_game_id = self.config.game_id or str(uuid.uuid4())
         
         self._current_trace = TraceModel(
             game_id=self._current_game_id,
@@ -41,20 +131,40 @@ class TraceManager(TraceManagerProtocol):
             start_time=datetime.now(),
             history=[]
         )
+        self._journal_entries = 0
+        self._snapshot_size = 0
         
-        # Save only the current trace, not in history yet
-        await self.cache.save_cached_data(
-            key=self._current_trace.session_id,
-            namespace="trace",
-            data=self._current_trace.model_dump()
-        )
+        # Snapshot vide : les actions sont ensuite ajoutées au journal
+        await self._compact(self._current_trace)
         
         self.logger.info(f"Started new session {session_id} for game {self._current_game_id}")
 
-    
+    async def load_session(self, session_id: str) -> Optional[TraceModel]:
+        """Resume a stored session trace.
+        
+        Args:
+            session_id: ID of the session to resume
+            
+        Returns:
+            Optional[TraceModel]: Replayed trace, None if not found
+        """
+        trace = await self._load(session_id)
+        if trace:
+            self._current_trace = trace
+            self._current_game_id = trace.game_id
+            self._snapshot_size = len(trace.history)
+            self._journal_entries = 0
+            # Repartir d'un snapshot complet plutôt que d'un journal relu
+            await self.save_trace()
+        return trace
     
     async def process_trace(self, state: GameState, action: Dict[str, Any]) -> None:
-        """Process and store a game trace."""
+        """Process and store a game trace.
+        
+        L'action est ajoutée au journal de la session (O(1) par action) ;
+        le snapshot complet n'est réécrit que lorsque le journal dépasse
+        la taille du dernier snapshot.
+        """
         try:
             if not self._current_trace:
                 self.logger.warning("No current trace found, starting a new session.")
@@ -78,22 +188,19 @@ class TraceManager(TraceManagerProtocol):
                 details=details
             )
 
-            # Ajouter l'action à l'historique
-            new_history = list(self._current_trace.history)
-            new_history.append(trace_action)
-            self._current_trace = TraceModel(
-                game_id=self._current_trace.game_id,
-                session_id=self._current_trace.session_id,
-                section_number=state.section_number,
-                start_time=self._current_trace.start_time,
-                history=new_history,
-                current_section=self._current_trace.current_section,
-                current_rules=self._current_trace.current_rules,
-                character=self._current_trace.character,
-                error=self._current_trace.error
-            )
+            # Nouvelle trace sans revalidation : l'historique précédent reste partagé
+            history = self._current_trace.history
+            self._current_trace = self._current_trace.model_copy(update={
+                "section_number": state.section_number,
+                "history": [*history, trace_action]
+            })
 
-            await self.save_trace()
+            await self._append(self._current_trace.session_id, len(history), trace_action)
+            self._journal_entries += 1
+            
+            # Compaction géométrique : coût d'écriture amorti O(1) par action
+            if self._journal_entries >= max(self.compact_every, self._snapshot_size):
+                await self.save_trace()
             self.logger.info(f"Processed trace for section {state.section_number} successfully.")
 
         except TraceError as e:
@@ -105,25 +212,14 @@ class TraceManager(TraceManagerProtocol):
 
 
     async def save_trace(self) -> None:
-        """Save current trace to storage."""
+        """Compact the current trace into its snapshot."""
         if not self._current_trace:
             return
             
         try:
-            # Save current trace
-            await self.cache.save_cached_data(
-                key=self._current_trace.session_id,
-                namespace="trace",
-                data=self._current_trace.model_dump()
-            )
-            
-            # Only save to history if we have actions
-            if self._current_trace.history:
-                await self.cache.save_cached_data(
-                    key=f"history/{self._current_trace.session_id}",
-                    namespace="trace",
-                    data=self._current_trace.model_dump()
-                )
+            await self._compact(self._current_trace)
+            self._snapshot_size = len(self._current_trace.history)
+            self._journal_entries = 0
         except Exception as e:
             self.logger.error(f"Error saving trace: {e}")
             raise TraceError(f"Failed to save trace: {e}")
@@ -132,20 +228,36 @@ class TraceManager(TraceManagerProtocol):
         """Get current trace if exists."""
         return self._current_trace
 
-    async def get_trace_history(self) -> List[TraceModel]:
-        """Get all traces from storage."""
-        try:
-            # Récupérer toutes les traces de l'historique
-            traces = await self.cache.get_cached_data(
-                key="history/*",
-                namespace="traces",
-                model_type=TraceModel
-            )
+    async def iter_actions(self, session_id: Optional[str] = None) -> AsyncIterator[TraceAction]:
+        """Stream the actions of a session, oldest first.
+        
+        Args:
+            session_id: Session to read (default: current session)
             
-            if not traces:
-                return []
-                
-            return [trace for trace in traces if isinstance(trace, TraceModel)]
+        Yields:
+            TraceAction: Stored actions
+        """
+        if session_id is None or (self._current_trace and session_id == self._current_trace.session_id):
+            for trace_action in list(self._current_trace.history if self._current_trace else []):
+                yield trace_action
+            return
+
+        snapshot = await self._read_snapshot(session_id)
+        start = 0
+        if snapshot is not None:
+            for trace_action in snapshot.history:
+                yield trace_action
+            start = len(snapshot.history)
+        for trace_action in await self._read_journal(session_id, start):
+            yield trace_action
+
+    async def get_trace_history(self) -> AsyncIterator[TraceModel]:
+        """Stream the stored traces of the game, one session at a time."""
+        try:
+            for path in await self.fs.list_files(self._trace_dir(), "*.json"):
+                trace = await self._load(path.stem)
+                if trace:
+                    yield trace
         except Exception as e:
             self.logger.error(f"Error loading traces: {e}")
             raise TraceError(f"Failed to load traces: {e}")
@@ -116,7 +116,7 @@ class WorkflowManager(WorkflowManagerProtocol):
             # 2. Ajouter les métadonnées du workflow
             state = state.with_updates(metadata={"node": "start"})
             
-            logger.debug("Full state in start_workflow before return: {}", state.model_dump())
+            logger.opt(lazy=True).trace("Full state in start_workflow before return: {}", lambda: state.model_dump())
             logger.info("Workflow started successfully: session={}, game={}, section={}", 
                        state.session_id, 
                        state.game_id,
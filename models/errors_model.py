@@ -79,3 +79,8 @@ class StoryGraphError(GameError):
     """Error related to story graph operations."""
     def __init__(self, message: str = "", **kwargs):
         super().__init__(message, **kwargs)
+
+class SessionError(GameError):
+    """Error related to game sessions (e.g. a game that is already live)."""
+    def __init__(self, message: str = "", **kwargs):
+        super().__init__(message, **kwargs)
@@ -97,6 +97,20 @@ def merge(a: Any, b: Any) -> Any:
     # Pour les autres cas, garder la valeur existante
     return a
 
+def _shared_copy(value: Any) -> Any:
+    """
+    Copie superficielle d'un modèle inchangé pour un nouvel état.
+    
+    Les listes (historique de trace, choix) sont partagées entre les deux
+    états et ne doivent pas être modifiées en place. La marque __from_node__
+    n'est pas copiée : seul le noeud qui produit une valeur la marque.
+    """
+    if not isinstance(value, BaseModel):
+        return value
+    copy = value.model_copy()
+    copy.__dict__.pop('__from_node__', None)
+    return copy
+
 class GameStateBase(BaseModel):
     """Base state model with common fields."""
     session_id: Annotated[str, keep_if_not_empty]  # Le session_id doit être préservé
@@ -336,30 +350,20 @@ class GameState(GameStateInput, GameStateOutput):
                 if current_value and hasattr(current_value, '__from_node__'):
                     setattr(value, '__from_node__', getattr(current_value, '__from_node__'))
         
-        # Utiliser la même configuration que la property state
-        state_dict = self.model_dump(
-            exclude_none=False,     # Exclure les champs None comme dans state
-            by_alias=True,         # Cohérence avec state
-            exclude_unset=True,    # Exclure les champs non définis
-            exclude={              # Exclure les champs internes spécifiques
-                'session_id': False,  # Toujours inclure session_id
-                'game_id': False,     # Toujours inclure game_id
-                'error': False        # Toujours inclure error même si None
-            }
-        )
-        
-        # Préserver explicitement les IDs depuis l'instance
-        session_id = self.session_id
-        game_id = self.game_id
-        
-        # Appliquer les mises à jour
-        state_dict.update(updates)
+        # Copie structurelle : les champs inchangés ne sont ni sérialisés ni revalidés,
+        # seuls les validateurs du GameState s'exécutent sur les références
+        values = {
+            name: _shared_copy(getattr(self, name))
+            for name in self.model_fields_set
+            if name not in updates
+        }
+        values.update(updates)
         
         # Toujours réinjecter les IDs
-        state_dict['session_id'] = session_id
-        state_dict['game_id'] = game_id
+        values['session_id'] = self.session_id
+        values['game_id'] = self.game_id
         
-        return GameState(**state_dict)
+        return GameState.model_validate(values)
 
     def model_dump_json(self, **kwargs):
         """Override model_dump_json to handle datetime serialization."""
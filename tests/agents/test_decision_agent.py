@@ -301,3 +301,26 @@ async def test_process_dice_decision(
     assert isinstance(result, DecisionModel)
     assert result.decision_type == DecisionType.DICE
     assert result.dice_type == DiceType.COMBAT
+
+@pytest.mark.asyncio
+async def test_cached_decision_skips_index_lookup(decision_config, mock_decision_manager):
+    """A cached analysis is used before any embedding of the player input."""
+    llm_cache = MagicMock()
+    llm_cache.make_key = MagicMock(return_value="key")
+    llm_cache.get = AsyncMock(return_value='{"next_section": 48}')
+    llm_cache.ainvoke = AsyncMock()
+    decision_index = MagicMock()
+    decision_index.search = AsyncMock()
+    mock_decision_manager.clean_llm_json_response = MagicMock(return_value={"next_section": 48})
+    agent = DecisionAgent(
+        config=decision_config,
+        decision_manager=mock_decision_manager,
+        llm_cache=llm_cache,
+        decision_index=decision_index
+    )
+
+    result = await agent.analyze_response(1, "je fuis", {})
+
+    assert result.next_section == 48
+    decision_index.search.assert_not_called()
+    llm_cache.ainvoke.assert_not_called()
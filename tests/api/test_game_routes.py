@@ -0,0 +1,100 @@
+"""Tests for the game REST and WebSocket routes."""
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from api.routes.rest import api_router_rest
+from api.routes.ws import api_router_ws
+from managers.dependencies import get_session_manager
+from managers.session_manager import GameSession
+from models.errors_model import SessionError, StateError
+
+
+@pytest.fixture
+def session_manager(monkeypatch):
+    """Session registry knowing no game."""
+    manager = Mock()
+    manager.restore_session = AsyncMock(return_value=None)
+    manager.get_session = AsyncMock(return_value=None)
+    manager.get_or_create_session = AsyncMock()
+    manager.create_session = AsyncMock()
+    monkeypatch.setattr("api.routes.ws.game_route_ws.get_session_manager", lambda: manager)
+    monkeypatch.setattr("managers.dependencies.get_session_manager", lambda: manager)
+    return manager
+
+
+@pytest.fixture
+def client(session_manager):
+    app = FastAPI()
+    app.include_router(api_router_rest)
+    app.include_router(api_router_ws)
+    app.dependency_overrides[get_session_manager] = lambda: session_manager
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("url", ["/api/ws/game", "/api/ws/game?game_id=made-up"])
+def test_websocket_requires_a_known_game(client, session_manager, url):
+    with client.websocket_connect(url) as websocket:
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_json()
+
+    assert closed.value.code == 1008
+    session_manager.create_session.assert_not_called()
+    session_manager.get_or_create_session.assert_not_called()
+
+
+@pytest.mark.parametrize("path", ["/api/game/state", "/api/game/feedback"])
+def test_unknown_game_is_not_created(client, session_manager, path):
+    response = client.get(path, params={"game_id": "made-up"})
+
+    assert response.status_code == 404
+    session_manager.restore_session.assert_awaited_once_with("made-up")
+    session_manager.create_session.assert_not_called()
+    session_manager.get_or_create_session.assert_not_called()
+
+
+def make_session(game_id="game-1"):
+    """Live session whose state manager is mocked."""
+    state_manager = Mock()
+    state_manager.clear_state = AsyncMock()
+    agent_manager = Mock()
+    agent_manager.managers = {"state_manager": state_manager}
+    return GameSession(game_id=game_id, agent_manager=agent_manager)
+
+
+def test_reset_clears_states_and_releases_the_session(client, session_manager):
+    session = make_session()
+    session_manager.restore_session = AsyncMock(return_value=session)
+    session_manager.close_session = AsyncMock(return_value=True)
+
+    response = client.post("/api/game/reset", params={"game_id": "game-1"})
+
+    assert response.status_code == 200
+    session.agent_manager.managers["state_manager"].clear_state.assert_awaited_once()
+    session_manager.close_session.assert_awaited_once_with("game-1")
+
+
+def test_reset_releases_the_session_when_clearing_fails(client, session_manager):
+    session = make_session()
+    session.agent_manager.managers["state_manager"].clear_state.side_effect = StateError("disk")
+    session_manager.restore_session = AsyncMock(return_value=session)
+    session_manager.close_session = AsyncMock(return_value=True)
+
+    response = client.post("/api/game/reset", params={"game_id": "game-1"})
+
+    assert response.status_code == 500
+    session_manager.close_session.assert_awaited_once_with("game-1")
+
+
+@pytest.mark.parametrize("error, code", [(ValueError("Invalid game_id"), 400), (SessionError("live"), 409)])
+def test_initialize_rejects_unsafe_or_live_game_ids(client, session_manager, error, code):
+    session_manager.create_session = AsyncMock(side_effect=error)
+
+    response = client.post("/api/game/initialize", json={"game_id": "../../x"})
+
+    assert response.status_code == code
+    session_manager.create_session.assert_awaited_once_with("../../x")
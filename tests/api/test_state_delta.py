@@ -0,0 +1,81 @@
+"""Tests for the versioned snapshot / JSON-patch WebSocket protocol."""
+import json
+import pytest
+
+import jsonpatch
+
+# La factory d'abord : les routes importent managers.session_manager (cycle)
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from api.routes.ws.game_route_ws import GameWSConnectionManager
+from tests.api.test_ws_connection_manager import make_socket, settle
+
+
+def make_state(turn):
+    """State whose trace history grows every turn."""
+    return {
+        "game_id": "g1",
+        "section_number": turn,
+        "narrative": {"content": f"Section {turn}. " + "Il fait nuit. " * 50},
+        "trace": {"history": [{"section": i, "input": f"choix {i}"} for i in range(turn)]}
+    }
+
+
+def received(websocket):
+    messages = [json.loads(text) for text in websocket.sent]
+    websocket.sent.clear()
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_patches_apply_on_acknowledged_state_and_stay_small():
+    manager = GameWSConnectionManager()
+    client, legacy = make_socket(), make_socket()
+    await manager.connect(client, "g1", delta=True)
+    await manager.connect(legacy, "g1")
+
+    await manager.broadcast_state(make_state(1), "g1")
+    await settle()
+    [snapshot] = received(client)
+    assert snapshot["type"] == "state_snapshot"
+    document, version = snapshot["state"], snapshot["version"]
+    assert received(legacy) == [make_state(1)]
+
+    sizes = []
+    for turn in range(2, 40):
+        await manager.ack(client, version)
+        await manager.broadcast_state(make_state(turn), "g1")
+        await settle()
+        [message] = client.sent
+        sizes.append(len(message))
+        [patch] = received(client)
+        assert patch["type"] == "state_patch" and patch["base_version"] == version
+        document = jsonpatch.apply_patch(document, patch["patch"])
+        version = patch["version"]
+        assert document == make_state(turn)
+
+    # Taille constante par tour, alors que l'état complet grandit
+    assert max(sizes) < 2 * min(sizes)
+    assert received(legacy)[-1] == make_state(39)
+    manager.disconnect(client)
+    manager.disconnect(legacy)
+    await settle()
+
+
+@pytest.mark.asyncio
+async def test_unknown_version_triggers_full_resync():
+    manager = GameWSConnectionManager()
+    client = make_socket()
+    await manager.connect(client, "g1", delta=True)
+    await manager.broadcast_state(make_state(1), "g1")
+    await manager.broadcast_state(make_state(2), "g1")
+    await settle()
+    received(client)
+
+    await manager.ack(client, 999)
+    await settle()
+
+    [snapshot] = received(client)
+    assert snapshot["type"] == "state_snapshot"
+    assert snapshot["state"] == make_state(2)
+    manager.disconnect(client)
+    await settle()
@@ -0,0 +1,127 @@
+"""Tests for the per-game WebSocket rooms."""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from starlette.websockets import WebSocketState
+
+# La factory d'abord : les routes importent managers.session_manager (cycle)
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from api.routes.ws.game_route_ws import GameWSConnectionManager
+from config.managers.websocket_config import WebSocketConfig
+from models.game_state import GameState
+from models.narrator_model import NarratorModel
+
+
+def make_socket(delay=0.0):
+    """WebSocket recording the texts (or bytes) it sends."""
+    websocket = Mock()
+    websocket.client_state = WebSocketState.CONNECTED
+    websocket.sent = []
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+
+    async def send_text(text):
+        await asyncio.sleep(delay)
+        websocket.sent.append(text)
+
+    websocket.send_text = send_text
+    websocket.send_bytes = send_text
+    return websocket
+
+
+def make_game_state():
+    return GameState(
+        session_id="s1",
+        game_id="g1",
+        section_number=1,
+        narrative=NarratorModel(section_number=1, content="Il fait nuit.")
+    )
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_only_the_game_room():
+    manager = GameWSConnectionManager()
+    player, spectator, other = make_socket(), make_socket(), make_socket()
+    await manager.connect(player, "g1")
+    await manager.connect(spectator, "g1")
+    await manager.connect(other, "g2")
+
+    await manager.broadcast({"section_number": 3}, "g1")
+    await settle()
+
+    assert player.sent == spectator.sent == [json.dumps({"section_number": 3}, separators=(",", ":"))]
+    assert other.sent == []
+    # Encodé une seule fois : le même objet str est envoyé aux deux clients
+    assert player.sent[0] is spectator.sent[0]
+    stats = manager.get_stats()
+    assert (stats["connections"], stats["rooms"], stats["max_room_size"]) == (3, 2, 2)
+    for websocket in (player, spectator, other):
+        manager.disconnect(websocket)
+    assert manager.get_stats()["connections"] == 0
+    await settle()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_delay_the_room():
+    manager = GameWSConnectionManager(WebSocketConfig(queue_size=2))
+    fast, slow = make_socket(), make_socket(delay=10)
+    await manager.connect(fast, "g1")
+    await manager.connect(slow, "g1")
+
+    for i in range(4):
+        await manager.broadcast({"i": i}, "g1")
+        await settle()
+    await settle()
+
+    assert [json.loads(text)["i"] for text in fast.sent] == [0, 1, 2, 3]
+    stats = manager.get_stats()
+    # Le client lent a gardé les plus récents, les plus anciens sont abandonnés
+    assert stats["dropped"] == 1
+    assert stats["max_queue_depth"] == 2
+    manager.disconnect(fast)
+    manager.disconnect(slow)
+    await settle()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_slow_client():
+    manager = GameWSConnectionManager(WebSocketConfig(queue_size=1, slow_consumer_policy="disconnect"))
+    slow = make_socket(delay=10)
+    await manager.connect(slow, "g1")
+
+    for i in range(3):
+        await manager.broadcast({"i": i}, "g1")
+    await settle()
+
+    slow.close.assert_awaited_once()
+    stats = manager.get_stats()
+    assert stats["slow_disconnects"] == 1
+    assert stats["connections"] == 0
+    await settle()
+
+
+@pytest.mark.asyncio
+async def test_binary_clients_receive_the_encoded_bytes():
+    manager = GameWSConnectionManager()
+    binary, text = make_socket(), make_socket()
+    await manager.connect(binary, "g1", binary=True)
+    await manager.connect(text, "g1")
+
+    await manager.broadcast_state(make_game_state(), "g1")
+    await settle()
+
+    [data] = binary.sent
+    [message] = text.sent
+    assert isinstance(data, bytes) and isinstance(message, str)
+    assert data.decode() == message
+    assert json.loads(data)["narrative"]["content"] == "Il fait nuit."
+    manager.disconnect(binary)
+    manager.disconnect(text)
+    await settle()
@@ -0,0 +1,75 @@
+"""Tests for the debug ring buffer and the sampled trace logging."""
+import pytest
+from loguru import logger
+
+from config import logging_config
+from config.logging_config import DebugRingBuffer, TraceSampler, get_trace_sampler
+
+
+@pytest.fixture
+def sink():
+    """Add a handler for the test, removed afterwards."""
+    handlers = []
+
+    def add(target, level):
+        handlers.append(logger.add(target, level=level, format="{message}"))
+
+    yield add
+    for handler_id in handlers:
+        logger.remove(handler_id)
+
+
+def test_ring_buffer_dumps_recent_records_on_error(tmp_path, sink):
+    buffer = DebugRingBuffer(tmp_path / "debug.log", capacity=3)
+    sink(buffer.write, "DEBUG")
+
+    for i in range(5):
+        logger.debug("step {}", i)
+    assert len(buffer) == 3
+    assert not (tmp_path / "debug.log").exists()
+
+    logger.error("boom")
+
+    content = (tmp_path / "debug.log").read_text(encoding="utf-8")
+    # Les plus anciens ont été écartés, l'erreur termine le vidage
+    assert "step 0" not in content and "step 1" not in content
+    assert content.index("step 3") < content.index("step 4") < content.index("boom")
+    assert buffer.dumps == 1 and len(buffer) == 0
+
+
+def test_trace_sampler_is_lazy_and_sampled(sink):
+    messages = []
+    sink(messages.append, "TRACE")
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "payload"
+
+    sampler = TraceSampler("tests.sampled", rate=0.25)
+    for _ in range(8):
+        sampler.trace("state: {}", expensive)
+
+    assert [message.strip() for message in messages] == ["state: payload"] * 2
+    # Les appels écartés n'évaluent pas leurs arguments
+    assert len(calls) == 2
+
+    muted = TraceSampler("tests.muted", rate=0)
+    muted.trace("state: {}", expensive)
+    assert len(calls) == 2
+
+
+def test_trace_sampler_is_lazy_when_trace_is_off(sink):
+    sink(lambda message: None, "INFO")
+    calls = []
+    get_trace_sampler("tests.off").trace("state: {}", lambda: calls.append(1))
+    assert calls == []
+
+
+def test_sampling_rate_of_longest_module_prefix(monkeypatch):
+    monkeypatch.setattr(logging_config, "_TRACE_RATES", {"managers": 0.5, "managers.filesystem_adapter": 0.01})
+    monkeypatch.setattr(logging_config, "_samplers", {})
+
+    assert get_trace_sampler("managers.filesystem_adapter").every == 100
+    assert get_trace_sampler("managers.cache_manager").every == 2
+    assert get_trace_sampler("agents.narrator_agent").every == 1
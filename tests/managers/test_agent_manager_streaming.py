@@ -0,0 +1,83 @@
+"""Tests for the progressive (per-node) workflow updates of AgentManager."""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+# La factory d'abord : managers.agent_manager l'importe (cycle)
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from managers.agent_manager import AgentManager
+from models.game_state import GameState
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+
+
+class FakeWorkflow:
+    """Compiled workflow emitting node updates like ``astream(stream_mode="updates")``."""
+
+    def __init__(self, chunks, values):
+        self.chunks = chunks
+        self.values = values
+        self.stream_modes = []
+
+    async def astream(self, workflow_input, config, stream_mode="values"):
+        self.stream_modes.append(stream_mode)
+        for chunk in self.chunks:
+            yield chunk
+
+    def get_state(self, config):
+        return SimpleNamespace(values=self.values)
+
+
+def make_manager(workflow, state):
+    state_manager = Mock()
+    state_manager.get_current_state = AsyncMock(return_value=state)
+    state_manager.save_state = AsyncMock(side_effect=lambda s: s)
+    manager = AgentManager(agents={}, managers={"state_manager": state_manager}, game_factory=Mock())
+    manager._compiled_workflow = workflow
+    manager.story_graph = Mock()
+    return manager, state_manager
+
+
+@pytest.fixture
+def state():
+    return GameState(session_id="s1", game_id="g1", section_number=1)
+
+
+@pytest.fixture
+def workflow(state):
+    narrative = NarratorModel(section_number=1, content="Il fait nuit.")
+    rules = RulesModel(section_number=1)
+    return FakeWorkflow(
+        chunks=[
+            {"node_start": {"section_number": 1}},
+            {"node_narrator": {"narrative": narrative}},
+            {"node_rules": {"rules": rules}},
+            {"__interrupt__": ()}
+        ],
+        values={**state.model_dump(), "narrative": narrative, "rules": rules}
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_each_node_then_saved_state(state, workflow):
+    manager, state_manager = make_manager(workflow, state)
+
+    events = [event async for event in manager.stream_game_state(user_input="gauche")]
+
+    assert [event["node"] for event in events] == ["node_start", "node_narrator", "node_rules", None]
+    assert events[1]["update"]["narrative"].content == "Il fait nuit."
+    assert workflow.stream_modes == ["updates"]
+    # Sauvegardé une seule fois, à la fin
+    state_manager.save_state.assert_awaited_once()
+    assert events[-1]["state"].narrative.content == "Il fait nuit."
+
+
+@pytest.mark.asyncio
+async def test_process_game_state_returns_final_state(state, workflow):
+    manager, state_manager = make_manager(workflow, state)
+
+    result = await manager.process_game_state()
+
+    assert isinstance(result, GameState)
+    assert result.rules.section_number == 1
+    state_manager.save_state.assert_awaited_once()
@@ -5,7 +5,8 @@ from unittest.mock import Mock, patch
 from datetime import datetime
 from pathlib import Path
 
-from managers.cache_manager import CacheManager, CacheEntry
+from managers.cache_manager import CacheManager
+from managers.memory_cache import CacheEntry
 from config.storage_config import StorageConfig, StorageFormat
 from models.trace_model import TraceModel
 
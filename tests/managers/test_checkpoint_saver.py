@@ -0,0 +1,120 @@
+"""Tests for the persistent SQLite checkpointer."""
+import sqlite3
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Command, interrupt
+
+from config.managers.checkpoint_config import CheckpointConfig
+from managers.checkpoint_saver import SQLiteCheckpointSaver
+
+
+class TurnState(TypedDict):
+    section: int
+    answer: str
+
+
+def build_graph():
+    """Two-node graph that waits for the player between nodes."""
+    def narrate(state: TurnState):
+        return {"section": state["section"]}
+
+    def decide(state: TurnState):
+        answer = interrupt("choice")
+        return {"answer": answer, "section": state["section"] + 1}
+
+    graph = StateGraph(TurnState)
+    graph.add_node("narrate", narrate)
+    graph.add_node("decide", decide)
+    graph.add_edge(START, "narrate")
+    graph.add_edge("narrate", "decide")
+    graph.add_edge("decide", END)
+    return graph
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Checkpoint configuration in a temporary directory."""
+    return CheckpointConfig(db_path=tmp_path / "checkpoints.sqlite3", keep_versions=2)
+
+
+def thread(game_id):
+    return {"configurable": {"thread_id": game_id}}
+
+
+def count_rows(config, table):
+    with sqlite3.connect(str(config.db_path)) as db:
+        return db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_game_resumes_after_restart(config):
+    """A game interrupted before close resumes from a new saver instance."""
+    saver = SQLiteCheckpointSaver(config)
+    workflow = build_graph().compile(checkpointer=saver)
+    await workflow.ainvoke({"section": 1, "answer": ""}, thread("game-1"))
+    assert workflow.get_state(thread("game-1")).next == ("decide",)
+    await saver.close()
+
+    restarted = SQLiteCheckpointSaver(config)
+    workflow = build_graph().compile(checkpointer=restarted)
+    assert workflow.get_state(thread("game-1")).next == ("decide",)
+
+    result = await workflow.ainvoke(Command(resume="gauche"), thread("game-1"))
+    assert result == {"section": 2, "answer": "gauche"}
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_are_batched_until_flush(config):
+    """Checkpoints stay in memory until the batch is flushed."""
+    config.flush_interval_seconds = 60
+    config.batch_size = 10_000
+    saver = SQLiteCheckpointSaver(config)
+    workflow = build_graph().compile(checkpointer=saver)
+    await workflow.ainvoke({"section": 1, "answer": ""}, thread("game-1"))
+
+    assert saver.get_stats()["pending_rows"] > 0
+    assert count_rows(config, "checkpoints") == 0
+
+    written = saver.flush()
+    assert written > 0
+    assert count_rows(config, "checkpoints") > 0
+    await saver.close()
+
+
+@pytest.mark.asyncio
+async def test_old_versions_are_pruned(config):
+    """Only the latest keep_versions checkpoints of a game are kept."""
+    saver = SQLiteCheckpointSaver(config)
+    workflow = build_graph().compile(checkpointer=saver)
+    for game_id in ("game-1", "game-2"):
+        await workflow.ainvoke({"section": 1, "answer": ""}, thread(game_id))
+        await workflow.ainvoke(Command(resume="droite"), thread(game_id))
+    await saver.close()
+
+    assert count_rows(config, "checkpoints") == 2 * config.keep_versions
+    restarted = SQLiteCheckpointSaver(config)
+    history = list(restarted.list(thread("game-1")))
+    assert len(history) == config.keep_versions
+    assert history[0].checkpoint["channel_values"]["section"] == 2
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_hot_set_is_bounded(config):
+    """Least recently used games leave memory once written to disk."""
+    config.max_hot_threads = 2
+    saver = SQLiteCheckpointSaver(config)
+    workflow = build_graph().compile(checkpointer=saver)
+    for i in range(5):
+        await workflow.ainvoke({"section": i, "answer": ""}, thread(f"game-{i}"))
+    saver.flush()
+    assert saver.get_stats()["hot_threads"] <= 2
+
+    # Une partie évincée est relue depuis le disque
+    state = workflow.get_state(thread("game-0"))
+    assert state.next == ("decide",)
+    assert state.values["section"] == 0
+    await saver.close()
@@ -0,0 +1,181 @@
+"""Tests for the decision retrieval index."""
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+faiss = pytest.importorskip("faiss")
+import numpy as np
+
+from config.managers.decision_index_config import DecisionIndexConfig
+from managers.decision_index_manager import DecisionIndexManager, INDEX_FILE, DOCSTORE_FILE
+
+DIMENSION = 32
+
+
+class StubEmbeddings:
+    """Deterministic embeddings: identical texts share a vector, others are unrelated."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def aembed_query(self, text):
+        self.calls += 1
+        seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).standard_normal(DIMENSION).tolist()
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Index configuration in a temporary directory."""
+    return DecisionIndexConfig(
+        index_dir=tmp_path,
+        seed_dir=None,
+        dimension=DIMENSION,
+        example_threshold=0.0,
+        compact_every=2
+    )
+
+
+@pytest.fixture
+def index(config):
+    """Empty, loaded index."""
+    manager = DecisionIndexManager(config, embeddings=StubEmbeddings())
+    assert manager.load() == 0
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_confirmed_decision_is_reused(index):
+    """A confirmed decision is returned directly for the same input."""
+    retrieval = await index.search(1, "J'engage la procédure d'évasion")
+    assert retrieval.hit is None
+    await index.add_decision(retrieval, 48, [], "Évasion")
+
+    retrieval = await index.search(1, "j'engage la procédure d'évasion !")
+    assert retrieval.hit is not None
+    assert retrieval.hit.record["next_section"] == 48
+
+
+@pytest.mark.asyncio
+async def test_hit_requires_same_section(index):
+    """A decision from another section is only an example."""
+    retrieval = await index.search(1, "je continue")
+    await index.add_decision(retrieval, 398)
+
+    retrieval = await index.search(2, "je continue")
+    assert retrieval.hit is None
+
+
+@pytest.mark.asyncio
+async def test_dice_rolls_are_not_looked_up(index):
+    """Dice rolls depend on the exact value."""
+    assert await index.search(1, "Jet de chance : 8 (3+5)") is None
+
+
+@pytest.mark.asyncio
+async def test_compaction_persists_appends(index, config, tmp_path):
+    """Appends are written to disk and memory-mapped again."""
+    for n, text in enumerate(("aller à gauche", "aller à droite")):
+        retrieval = await index.search(1, text)
+        await index.add_decision(retrieval, 10 + n)
+
+    assert (tmp_path / INDEX_FILE).exists()
+    assert (tmp_path / DOCSTORE_FILE).exists()
+    assert index.get_stats()["pending"] == 0
+
+    reloaded = DecisionIndexManager(config, embeddings=StubEmbeddings())
+    assert reloaded.load() == 2
+    retrieval = await reloaded.search(1, "aller à droite")
+    assert retrieval.hit.record["next_section"] == 11
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_wait_for_compaction(index, config, monkeypatch):
+    """Decisions being written stay searchable and later appends are kept."""
+    written = threading.Event()
+    write_merged = index._write_merged
+
+    def slow_write(*args):
+        assert written.wait(5)
+        return write_merged(*args)
+
+    monkeypatch.setattr(index, "_write_merged", slow_write)
+    for n, text in enumerate(("aller à gauche", "aller à droite")):
+        retrieval = await index.search(1, text)
+        if n == 0:
+            await index.add_decision(retrieval, 10)
+    compaction = asyncio.create_task(index.add_decision(retrieval, 11))
+    await asyncio.sleep(0.05)
+    assert not compaction.done()
+
+    # La boucle reste libre pendant l'écriture
+    retrieval = await asyncio.wait_for(index.search(1, "aller à gauche"), 1)
+    assert retrieval.hit.record["next_section"] == 10
+    retrieval = await index.search(1, "monter l'escalier")
+    await index.add_decision(retrieval, 12)
+    assert index.get_stats()["pending"] == 3
+
+    written.set()
+    await compaction
+    assert index.get_stats()["pending"] == 1
+    await index.close()
+
+    reloaded = DecisionIndexManager(config, embeddings=StubEmbeddings())
+    assert reloaded.load() == 3
+
+
+@pytest.mark.asyncio
+async def test_legacy_entries_are_examples(config, tmp_path):
+    """Raw text entries of the shipped index are injected as examples only."""
+    embeddings = StubEmbeddings()
+    vector = np.asarray([await embeddings.aembed_query("Section 1: je fuis")], dtype="float32")
+    faiss.normalize_L2(vector)
+    legacy = faiss.IndexFlatL2(DIMENSION)
+    legacy.add(vector)
+    faiss.write_index(legacy, str(tmp_path / INDEX_FILE))
+    (tmp_path / DOCSTORE_FILE).write_text('{"0": "Feedback: il fallait aller au 48"}', encoding="utf-8")
+
+    manager = DecisionIndexManager(config, embeddings=embeddings)
+    assert manager.load() == 1
+    retrieval = await manager.search(1, "je fuis")
+    assert retrieval.hit is None
+    assert retrieval.examples[0].text == "Feedback: il fallait aller au 48"
+    assert retrieval.examples[0].similarity == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_seed_index_is_read_only(config, tmp_path):
+    """The shipped index is loaded until the first compaction writes the runtime one."""
+    embeddings = StubEmbeddings()
+    vector = np.asarray([await embeddings.aembed_query("Section 1: je fuis")], dtype="float32")
+    faiss.normalize_L2(vector)
+    seed = faiss.IndexFlatL2(DIMENSION)
+    seed.add(vector)
+    seed_dir = tmp_path / "seed"
+    seed_dir.mkdir()
+    faiss.write_index(seed, str(seed_dir / INDEX_FILE))
+    (seed_dir / DOCSTORE_FILE).write_text('{"0": "Feedback: il fallait aller au 48"}', encoding="utf-8")
+    shipped = {path.name: path.read_bytes() for path in seed_dir.iterdir()}
+    runtime_dir = tmp_path / "runtime"
+    config = config.model_copy(update={"index_dir": runtime_dir, "seed_dir": seed_dir})
+
+    manager = DecisionIndexManager(config, embeddings=embeddings)
+    assert manager.load() == 1
+    for n, text in enumerate(("aller à gauche", "aller à droite")):
+        retrieval = await manager.search(1, text)
+        await manager.add_decision(retrieval, 10 + n)
+
+    assert {path.name: path.read_bytes() for path in seed_dir.iterdir()} == shipped
+    reloaded = DecisionIndexManager(config, embeddings=StubEmbeddings())
+    assert reloaded.load() == 3
+    retrieval = await reloaded.search(1, "je fuis")
+    assert retrieval.examples[0].text == "Feedback: il fallait aller au 48"
+
+
+def test_disabled(config):
+    """A disabled index is never queried."""
+    manager = DecisionIndexManager(config.model_copy(update={"enabled": False}))
+    assert manager.load() == 0
+    assert not manager.available
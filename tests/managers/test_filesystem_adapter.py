@@ -0,0 +1,92 @@
+"""Tests for concurrent access to files through FileSystemAdapter."""
+import asyncio
+import pytest
+
+from config.storage_config import StorageConfig
+from managers import filesystem_adapter
+from managers.filesystem_adapter import FileSystemAdapter
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    """Adapter rooted in a temporary directory."""
+    return FileSystemAdapter(StorageConfig.get_default_config(base_path=str(tmp_path)))
+
+
+def payload(writer: int) -> str:
+    """Large content whose completeness is easy to check."""
+    return f"{writer}:" + "x" * 64 * 1024 + f":{writer}"
+
+
+def is_complete(content: str) -> bool:
+    head, _, tail = content.partition(":")
+    return content == payload(int(head)) and tail.endswith(f":{head}")
+
+
+@pytest.mark.asyncio
+async def test_readers_never_see_partial_writes(adapter, tmp_path):
+    """Concurrent writers and readers on a few files."""
+    paths = [tmp_path / f"section_{i}.md" for i in range(3)]
+    for path in paths:
+        await adapter.write_file_async(path, payload(0))
+    seen = []
+
+    async def write(i):
+        await adapter.write_file_async(paths[i % len(paths)], payload(i))
+
+    async def read(i):
+        seen.append(await adapter.read_file_async(paths[i % len(paths)]))
+
+    tasks = [write(i) for i in range(150)] + [read(i) for i in range(150)]
+    await asyncio.gather(*tasks)
+
+    assert len(seen) == 150
+    assert all(is_complete(content) for content in seen)
+    assert sorted(await adapter.list_files(tmp_path, "*.md")) == sorted(paths)
+    assert not list(tmp_path.glob("*.tmp")) and not list(tmp_path.glob(".*"))
+    assert len(filesystem_adapter._PATH_LOCKS) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_waits_for_readers(adapter, tmp_path):
+    """A delete and a read of the same file do not interleave."""
+    path = tmp_path / "rules.md"
+    await adapter.write_file_async(path, payload(1))
+
+    content, _ = await asyncio.gather(adapter.read_file_async(path), adapter.delete_file_async(path))
+
+    assert is_complete(content)
+    assert await adapter.read_file_async(path) is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_writer_releases_lock(adapter, tmp_path):
+    """Readers queued behind a cancelled writer still get the file."""
+    path = tmp_path / "state.json"
+    await adapter.write_file_async(path, payload(1))
+
+    async with filesystem_adapter._PATH_LOCKS.hold(path, write=False):
+        writer = asyncio.create_task(adapter.write_file_async(path, payload(2)))
+        reader = asyncio.create_task(adapter.read_file_async(path))
+        await asyncio.sleep(0)
+        writer.cancel()
+        assert await asyncio.wait_for(reader, 1) == payload(1)
+
+    with pytest.raises(asyncio.CancelledError):
+        await writer
+
+
+@pytest.mark.asyncio
+async def test_batched_fsync_on_close(tmp_path):
+    """Batched mode flushes written files on close."""
+    config = StorageConfig.get_default_config(base_path=str(tmp_path))
+    config.fsync = "batched"
+    config.fsync_interval_seconds = 60
+    adapter = FileSystemAdapter(config)
+
+    await adapter.write_file_async(tmp_path / "a.md", "a")
+    await adapter.write_file_async(tmp_path / "b.md", "b")
+    assert len(adapter._fsync_pending) == 2
+
+    await adapter.close()
+    assert not adapter._fsync_pending
@@ -0,0 +1,96 @@
+"""Tests for the LLM cache manager module."""
+import pytest
+from unittest.mock import AsyncMock
+
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+
+from config.managers.llm_cache_config import LLMCacheConfig
+from managers.llm_cache_manager import LLMCacheManager
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a cache config writing to a temporary database."""
+    return LLMCacheConfig(db_path=tmp_path / "llm" / "cache.sqlite3")
+
+
+@pytest.fixture
+def llm():
+    """Create a mock chat model."""
+    model = AsyncMock()
+    model.ainvoke = AsyncMock(return_value=AIMessage(content='{"content": "ok"}'))
+    return model
+
+
+@pytest.fixture
+def messages():
+    """Sample prompt."""
+    return [
+        SystemMessage(content="system"),
+        HumanMessage(content="Section Number: 1 Content : test")
+    ]
+
+
+def test_make_key_depends_on_all_parts(config):
+    """Keys differ by model, temperature and prompts."""
+    cache = LLMCacheManager(config)
+    base = cache.make_key("gpt", 0.7, "sys", "human")
+
+    assert base == cache.make_key("gpt", 0.7, "sys", "human")
+    assert base != cache.make_key("other", 0.7, "sys", "human")
+    assert base != cache.make_key("gpt", 0.0, "sys", "human")
+    assert base != cache.make_key("gpt", 0.7, "sys2", "human")
+    assert base != cache.make_key("gpt", 0.7, "sys", "human2")
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_hits_memory(config, llm, messages):
+    """The second identical call does not reach the LLM."""
+    cache = LLMCacheManager(config)
+
+    first = await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7)
+    second = await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7)
+
+    assert first.content == second.content
+    llm.ainvoke.assert_awaited_once()
+    assert cache.get_stats()["memory_hits"] == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(config, llm, messages):
+    """Responses are reloaded from SQLite by a new instance."""
+    cache = LLMCacheManager(config)
+    await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7)
+    await cache.close()
+
+    restarted = LLMCacheManager(config)
+    response = await restarted.ainvoke(llm, messages, model_name="gpt", temperature=0.7)
+
+    assert response.content == '{"content": "ok"}'
+    llm.ainvoke.assert_awaited_once()
+    assert restarted.get_stats()["disk_hits"] == 1
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_invalidate(config, llm, messages):
+    """Invalidated responses are fetched again."""
+    cache = LLMCacheManager(config)
+    await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7, key="k")
+    await cache.invalidate("k")
+    await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7, key="k")
+
+    assert llm.ainvoke.await_count == 2
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_calls_llm(tmp_path, llm, messages):
+    """A disabled cache is a pass-through."""
+    cache = LLMCacheManager(LLMCacheConfig(enabled=False, db_path=tmp_path / "c.sqlite3"))
+    await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7)
+    await cache.ainvoke(llm, messages, model_name="gpt", temperature=0.7)
+
+    assert llm.ainvoke.await_count == 2
+    assert not (tmp_path / "c.sqlite3").exists()
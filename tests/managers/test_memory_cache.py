@@ -0,0 +1,92 @@
+"""Tests for the memory cache module."""
+import pytest
+from unittest.mock import patch
+
+from managers.memory_cache import MemoryCache, CacheEntry
+
+
+@pytest.fixture
+def memory_cache():
+    """Create a memory cache with a bounded state namespace."""
+    cache = MemoryCache(max_entries=10, max_bytes=1000)
+    cache.set_limits("state", 3, 100)
+    return cache
+
+
+def test_cache_entry_ttl():
+    """Entries expire after their TTL."""
+    entry = CacheEntry(value="test", ttl_seconds=10)
+    assert not entry.is_expired()
+    assert entry.is_expired(entry.expiry + 1)
+
+
+def test_namespace_max_entries(memory_cache):
+    """The least recently used entry is evicted above max_entries."""
+    for i in range(3):
+        memory_cache.set(f"state:k{i}", i, None, size=10)
+    memory_cache.get("state:k0")
+    memory_cache.set("state:k3", 3, None, size=10)
+
+    assert "state:k1" not in memory_cache
+    assert "state:k0" in memory_cache
+    assert memory_cache.get_stats()["namespaces"]["state"]["evictions"] == 1
+
+
+def test_namespace_max_bytes(memory_cache):
+    """Entries are evicted when the byte budget is exceeded."""
+    memory_cache.set("state:a", "a", None, size=60)
+    memory_cache.set("state:b", "b", None, size=60)
+
+    assert "state:a" not in memory_cache
+    assert memory_cache.get_stats()["namespaces"]["state"]["bytes"] == 60
+
+
+def test_oversized_entry_not_cached(memory_cache):
+    """An entry larger than the namespace budget is not kept in memory."""
+    memory_cache.set("state:big", "x", None, size=500)
+    assert "state:big" not in memory_cache
+
+
+def test_global_max_entries():
+    """The global budget evicts from the largest namespace."""
+    cache = MemoryCache(max_entries=4)
+    cache.set("rules:r1", 1, None)
+    for i in range(4):
+        cache.set(f"state:k{i}", i, None)
+
+    assert len(cache) == 4
+    assert "rules:r1" in cache
+    assert "state:k0" not in cache
+
+
+def test_hits_and_misses(memory_cache):
+    """Reads update the hit and miss counters."""
+    memory_cache.set("state:k", 1, None, size=1)
+    assert memory_cache.get("state:k").value == 1
+    assert memory_cache.get("state:missing") is None
+
+    stats = memory_cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_purge_expired(memory_cache):
+    """The sweeper removes expired entries without reading them."""
+    memory_cache.set("state:k", 1, 10, size=1)
+    entry = memory_cache["state:k"]
+
+    with patch("managers.memory_cache.time.monotonic", return_value=entry.expiry + 1):
+        assert memory_cache.purge_expired() == 1
+
+    assert len(memory_cache) == 0
+    assert memory_cache.get_stats()["expirations"] == 1
+
+
+def test_clear_namespace(memory_cache):
+    """Clearing a namespace keeps the other ones."""
+    memory_cache.set("state:k", 1, None, size=5)
+    memory_cache.set("rules:r", 1, None, size=5)
+
+    assert memory_cache.clear_namespace("state") == 1
+    assert "rules:r" in memory_cache
+    assert memory_cache.get_stats()["bytes"] == 5
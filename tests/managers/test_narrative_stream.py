@@ -0,0 +1,98 @@
+"""Tests for streaming the narrator output to game clients."""
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import HumanMessage
+
+# La factory d'abord : les agents importent managers.state_manager (cycle)
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from agents.narrator_agent import NarratorAgent
+from config.agents.narrator_agent_config import NarratorAgentConfig
+from config.managers.llm_cache_config import LLMCacheConfig
+from config.managers.narrative_stream_config import NarrativeStreamConfig
+from managers.llm_cache_manager import LLMCacheManager
+from managers.narrative_stream import NarrativeStream
+from models.narrator_model import NarratorModel
+
+CONTENT = "# Section 1\n\nIl fait nuit. Deux chemins s'offrent à vous [[145]] [[278]]."
+RESPONSE = json.dumps({"content": CONTENT, "source_type": "processed", "error": None})
+
+
+def drain(queue):
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+def make_agent(stream):
+    config = NarratorAgentConfig()
+    config.llm = GenericFakeChatModel(messages=iter([RESPONSE]))
+    manager = Mock()
+    manager.get_cached_content = AsyncMock(return_value=None)
+    manager.get_raw_content = AsyncMock(return_value="# Section 1")
+    manager.save_content = AsyncMock(side_effect=lambda model: model)
+    return NarratorAgent(config=config, narrator_manager=manager, narrative_stream=stream), manager
+
+
+@pytest.mark.asyncio
+async def test_narrator_forwards_content_deltas_to_watching_game():
+    """Clients receive the decoded content in order, then the validated model is saved."""
+    stream = NarrativeStream()
+    agent, manager = make_agent(stream)
+    queue = stream.subscribe("g1")
+    other = stream.subscribe("g2")
+    state = SimpleNamespace(game_id="g1", session_id="s1", section_number=1)
+
+    results = [r async for r in agent.ainvoke({"state": state})]
+
+    assert isinstance(results[0]["narrative"], NarratorModel)
+    manager.save_content.assert_awaited_once()
+    messages = drain(queue)
+    assert len(messages) > 2
+    assert all(m["type"] == "narrative_delta" and m["section_number"] == 1 for m in messages)
+    assert "".join(m["delta"] for m in messages) == CONTENT
+    assert [m["offset"] for m in messages[1:]] == [
+        m["offset"] + len(m["delta"]) for m in messages[:-1]
+    ]
+    assert messages[-1]["done"]
+    assert other.empty()
+
+
+def test_late_watcher_catches_up_and_slow_client_drops():
+    stream = NarrativeStream(NarrativeStreamConfig(queue_size=2))
+    queue = stream.subscribe("g1")
+    stream.begin(7)
+    stream.publish(7, "Il fait ")
+    stream.publish(7, "nuit.")
+
+    with stream.watch("g1", 7):
+        stream.publish(7, " Vous")
+        stream.publish(7, " partez.")
+    stream.end(7)
+
+    messages = drain(queue)
+    assert [(m["offset"], m["delta"]) for m in messages] == [(0, "Il fait nuit."), (13, " Vous")]
+    assert stream.get_stats()["dropped"] == 1
+    stream.unsubscribe("g1", queue)
+    assert stream.get_stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_llm_cache_streams_misses_only(tmp_path):
+    """A streamed response is cached whole; a hit is returned without chunks."""
+    cache = LLMCacheManager(LLMCacheConfig(persistent=False, db_path=tmp_path / "llm.sqlite3"))
+    llm = GenericFakeChatModel(messages=iter([RESPONSE]))
+    messages = [HumanMessage(content="Section 1")]
+    chunks = []
+
+    first = await cache.ainvoke(llm, messages, "fake", 0.0, on_chunk=chunks.append)
+    second = await cache.ainvoke(llm, messages, "fake", 0.0, on_chunk=chunks.append)
+
+    assert first.content == second.content == RESPONSE
+    assert "".join(chunks) == RESPONSE
+    assert cache.get_stats()["llm_calls"] == 1
+    await cache.close()
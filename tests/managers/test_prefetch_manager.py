@@ -0,0 +1,145 @@
+"""Tests for the speculative prefetch of reachable sections."""
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from managers.prefetch_manager import PrefetchManager
+from config.managers.prefetch_config import PrefetchConfig
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+from models.errors_model import NarratorError
+
+
+class SlowAgents:
+    """Narrator and rules agents whose generations wait for a release."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.running = 0
+        self.max_running = 0
+        self.generated = []
+        self.narrator_agent = Mock()
+        self.narrator_agent.generate_section = self._narrate
+        self.rules_agent = Mock()
+        self.rules_agent.generate_section = self._rules
+
+    async def _narrate(self, section_number):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        self.generated.append(section_number)
+        return NarratorModel(section_number=section_number, content="...")
+
+    async def _rules(self, section_number):
+        await self.release.wait()
+        return RulesModel(section_number=section_number)
+
+
+def make_prefetcher(agents, **config):
+    config.setdefault("start_delay_seconds", 0)
+    return PrefetchManager(
+        narrator_agent=agents.narrator_agent,
+        rules_agent=agents.rules_agent,
+        config=PrefetchConfig(**config)
+    )
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_schedule_dedups_and_applies_budget():
+    """Targets are queued once, up to the per-game budget."""
+    agents = SlowAgents()
+    prefetcher = make_prefetcher(agents, per_game_budget=2)
+
+    assert prefetcher.schedule("g1", [2, 3, 2, None, 4]) == 2
+    assert prefetcher.schedule("g1", [2, 3]) == 0
+
+    stats = prefetcher.get_stats()
+    assert stats["scheduled"] == 2
+    assert stats["skipped"] == 1
+    assert stats["pending"] == 2
+    await prefetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_global_concurrency_cap():
+    """No more than max_concurrency sections are generated at once."""
+    agents = SlowAgents()
+    prefetcher = make_prefetcher(agents, max_concurrency=2)
+    prefetcher.schedule("g1", [2, 3, 4])
+    prefetcher.schedule("g2", [5, 6])
+    await settle()
+
+    assert agents.running == 2
+
+    agents.release.set()
+    await settle()
+    await settle()
+    assert agents.max_running == 2
+    assert sorted(agents.generated) == [2, 3, 4, 5, 6]
+    assert prefetcher.get_stats()["completed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_transition_accounting():
+    """Completed prefetches are hits, running ones late hits, others misses."""
+    agents = SlowAgents()
+    prefetcher = make_prefetcher(agents, max_concurrency=1)
+
+    prefetcher.schedule("g1", [2, 3])
+    await settle()
+    prefetcher.record_transition("g1", 2)  # en cours
+    prefetcher.schedule("g1", [4])
+    agents.release.set()
+    await settle()
+    prefetcher.record_transition("g1", 4)  # terminé
+    prefetcher.schedule("g1", [5])
+    prefetcher.record_transition("g1", 9)  # non préchargé
+
+    stats = prefetcher.get_stats()
+    assert (stats["hits"], stats["late_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == round(2 / 3, 3)
+    # Le choix 3 non démarré a été abandonné au passage à la section 2
+    assert stats["cancelled"] >= 1
+    assert 3 not in agents.generated
+    await prefetcher.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_is_a_miss():
+    """A generation error is counted as failed, and the transition as a miss."""
+    agents = SlowAgents()
+    agents.narrator_agent.generate_section = lambda n: asyncio.sleep(0, NarratorError("boom"))
+    agents.release.set()
+    prefetcher = make_prefetcher(agents)
+
+    prefetcher.schedule("g1", [2])
+    await settle()
+    prefetcher.record_transition("g1", 2)
+
+    stats = prefetcher.get_stats()
+    assert stats["failed"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_game_keeps_started_generations():
+    """Leaving a game drops its queued prefetches, not the running ones."""
+    agents = SlowAgents()
+    prefetcher = make_prefetcher(agents, max_concurrency=1)
+    prefetcher.schedule("g1", [2, 3, 4])
+    await settle()
+
+    assert prefetcher.cancel_game("g1") == 2
+    agents.release.set()
+    await settle()
+    assert agents.generated == [2]
+    assert prefetcher.get_stats()["pending"] == 0
+    await prefetcher.close()
@@ -0,0 +1,101 @@
+"""Tests for the structured rules cache."""
+import json
+import pytest
+import pytest_asyncio
+
+from config.storage_config import StorageConfig
+from managers.cache_manager import CacheManager
+from managers.rules_manager import RulesManager, RULES_SCHEMA_VERSION
+from models.rules_model import RulesModel, DiceType, Choice, ChoiceType
+
+
+@pytest.fixture
+def config(tmp_path):
+    return StorageConfig.get_default_config(base_path=str(tmp_path))
+
+
+@pytest_asyncio.fixture
+async def make_manager():
+    """Build rules managers on a real cache, as served to the agents."""
+    caches = []
+
+    def make(config):
+        caches.append(CacheManager(config))
+        return RulesManager(config=config, cache_manager=caches[-1])
+
+    yield make
+    for cache in caches:
+        await cache.close()
+
+
+@pytest.fixture
+def rules():
+    return RulesModel(
+        section_number=3,
+        needs_dice=True,
+        dice_type=DiceType.COMBAT,
+        next_action="dice_first",
+        conditions=["has_sword"],
+        choices=[
+            Choice(text="Fuir, vers l'est", type=ChoiceType.DIRECT, target_section=4),
+            Choice(text="Combattre: 1-6", type=ChoiceType.DICE, target_section=5,
+                   dice_type=DiceType.COMBAT, dice_results={"victoire": 5, "défaite": 6})
+        ],
+        rules_summary="Combat: ## Pas un titre\n- ni une clé: valeur",
+        source="rules_agent"
+    )
+
+
+def rules_file(config, extension):
+    return config.get_absolute_path("rules") / f"section_3_rules{extension}"
+
+
+@pytest.mark.asyncio
+async def test_round_trip_from_disk(make_manager, config, rules):
+    """Rules read by another process equal the saved ones."""
+    await make_manager(config).save_rules(rules)
+
+    record = json.loads(rules_file(config, ".json").read_text(encoding="utf-8"))
+    assert record["schema_version"] == RULES_SCHEMA_VERSION
+    assert not rules_file(config, ".md").exists()
+
+    loaded = await make_manager(config).get_cached_rules(3)
+    assert loaded == rules
+
+
+@pytest.mark.asyncio
+async def test_memory_hits_return_new_models(make_manager, config, rules):
+    """Callers may mutate the returned rules without altering the cache."""
+    manager = make_manager(config)
+    await manager.save_rules(rules)
+
+    first = await manager.get_cached_rules(3)
+    first.section_number = 9
+
+    assert (await manager.get_cached_rules(3)).section_number == 3
+
+
+@pytest.mark.asyncio
+async def test_other_schema_version_is_a_miss(make_manager, config, rules):
+    manager = make_manager(config)
+    path = rules_file(config, ".json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"schema_version": 0, "rules": rules.model_dump(mode="json")}), encoding="utf-8")
+
+    assert await manager.get_cached_rules(3) is None
+
+
+@pytest.mark.asyncio
+async def test_markdown_cache_is_migrated(make_manager, config, rules):
+    """Rules cached by the former markdown format are converted once."""
+    config.rules_markdown_export = True
+    await make_manager(config).save_rules(rules)
+    rules_file(config, ".json").unlink()
+    assert rules_file(config, ".md").exists()
+
+    manager = make_manager(config)
+    migrated = await manager.get_cached_rules(3)
+
+    assert migrated.section_number == 3
+    assert [c.target_section for c in migrated.choices] == [4, 5]
+    assert rules_file(config, ".json").exists()
@@ -0,0 +1,87 @@
+"""Tests for the memory-mapped section corpus."""
+import os
+import pytest
+
+from config.managers.section_corpus_config import SectionCorpusConfig
+from config.storage_config import StorageConfig
+from managers.cache_manager import CacheManager
+from managers.section_corpus import SectionCorpus, build_corpus
+
+
+@pytest.fixture
+def sections_dir(tmp_path):
+    """Section sources, as in data/sections."""
+    sections_dir = tmp_path / "sections"
+    sections_dir.mkdir()
+    for n in (1, 2, 10):
+        (sections_dir / f"{n}.md").write_text(f"# Section {n}\n\nÉpée n°{n} [[{n + 1}]]\n", encoding="utf-8")
+    (sections_dir / "notes.md").write_text("not a section", encoding="utf-8")
+    return sections_dir
+
+
+@pytest.fixture
+def config(tmp_path, sections_dir):
+    build_corpus(sections_dir, tmp_path / "compiled" / "sections.corpus")
+    return SectionCorpusConfig(corpus_path=tmp_path / "compiled" / "sections.corpus", sections_dir=sections_dir)
+
+
+def test_sections_served_from_mapping(config):
+    """Content matches the stripped source files."""
+    corpus = SectionCorpus(config)
+
+    assert corpus.load() == 3
+    assert corpus.section_numbers() == [1, 2, 10]
+    assert corpus.get(2) == "# Section 2\n\nÉpée n°2 [[3]]"
+    assert corpus.get(3) is None
+    view = corpus.get_view(10)
+    assert isinstance(view, memoryview) and view.readonly
+    assert bytes(view).decode("utf-8") == corpus.get(10)
+    corpus.close()
+
+
+def test_missing_corpus_is_not_an_error(tmp_path, sections_dir):
+    corpus = SectionCorpus(SectionCorpusConfig(corpus_path=tmp_path / "none.corpus", sections_dir=sections_dir))
+
+    assert corpus.load() == 0
+    assert not corpus.loaded
+    assert corpus.get(1) is None
+
+
+def test_stale_corpus_is_ignored(config, sections_dir):
+    """A source edited after the build falls back to the files."""
+    source = sections_dir / "1.md"
+    stat = source.stat()
+    source.write_text("# Section 1\n\nModifiée", encoding="utf-8")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert SectionCorpus(config).load() == 0
+    assert SectionCorpus(config.model_copy(update={"check_sources": False})).load() == 3
+
+
+def test_close_with_live_slices(config):
+    """Slices held by callers survive close."""
+    corpus = SectionCorpus(config)
+    corpus.load()
+    view = corpus.get_view(1)
+
+    corpus.close()
+
+    assert not corpus.loaded
+    assert bytes(view).startswith(b"# Section 1")
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_uses_corpus_then_files(tmp_path, config, sections_dir):
+    """raw_content comes from the corpus, and from the directory for unpacked sections."""
+    corpus = SectionCorpus(config)
+    corpus.load()
+    cache = CacheManager(StorageConfig.get_default_config(base_path=str(tmp_path)), section_corpus=corpus)
+    (sections_dir / "1.md").unlink()
+    (sections_dir / "5.md").write_text("# Section 5\n", encoding="utf-8")
+
+    assert await cache.exists_raw_content("1", "raw_content")
+    assert await cache.load_raw_content("1", "raw_content") == "# Section 1\n\nÉpée n°1 [[2]]"
+    assert await cache.exists_raw_content("5", "raw_content")
+    assert await cache.load_raw_content("5", "raw_content") == "# Section 5"
+    assert not await cache.exists_raw_content("6", "raw_content")
+    corpus.close()
@@ -0,0 +1,87 @@
+"""Tests for the section graph index."""
+import os
+import pytest
+
+from config.managers.section_graph_config import SectionGraphConfig
+from managers.section_graph_index import SectionGraphIndex
+
+BOOK = {
+    1: "# Section 1\nDébut\nAllez au [[2]] ou au [[3]]. Ou encore au [[2]].",
+    2: "# Section 2\nCouloir\nRendez-vous au [[4]].",
+    3: "# Section 3\nImpasse\nVous êtes mort.",
+    4: "# Section 4\nSalle\nRetournez au [[1]] ou allez au [[99]].",
+    5: "# Section 5\nOubliée\nAllez au [[4]].",
+}
+
+
+def _write(sections_dir, number, content):
+    (sections_dir / f"{number}.md").write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def graph(tmp_path):
+    """Index built over a small book."""
+    for number, content in BOOK.items():
+        _write(tmp_path, number, content)
+    index = SectionGraphIndex(SectionGraphConfig(sections_dir=tmp_path, refresh_interval_seconds=0))
+    assert index.refresh(force=True)
+    return index
+
+
+def test_neighbors(graph):
+    """Links are deduplicated and reverse edges are indexed."""
+    assert graph.successors(1) == (2, 3)
+    assert graph.predecessors(4) == (2, 5)
+    assert graph.has_link(2, 4)
+    assert not graph.has_link(4, 2)
+    assert graph.successors(42) == ()
+
+
+def test_structure_queries(graph):
+    """Dead ends, orphans, unreachable sections and broken links."""
+    assert graph.dead_ends() == [3]
+    assert graph.orphans() == [5]
+    assert graph.unreachable() == [5]
+    assert graph.reachable() == {1, 2, 3, 4}
+    assert graph.broken_links() == [(4, 99)]
+
+
+def test_shortest_path(graph):
+    """Shortest paths follow link direction."""
+    assert graph.shortest_path(1, 4) == [1, 2, 4]
+    assert graph.shortest_path(4, 3) == [4, 1, 3]
+    assert graph.shortest_path(3, 1) is None
+    assert graph.shortest_path(1, 1) == [1]
+
+
+def test_knowledge_graph_is_cached(graph):
+    """The serialized graph is only rebuilt when the index changes."""
+    knowledge_graph = graph.to_knowledge_graph()
+    assert len(knowledge_graph["nodes"]) == 5
+    assert {"source": "1", "target": "2", "type": "section_link"} in knowledge_graph["links"]
+    assert graph.to_knowledge_graph() is knowledge_graph
+
+
+def test_refresh_reloads_modified_files(graph, tmp_path):
+    """Only changed files trigger a rebuild."""
+    assert not graph.refresh(force=True)
+
+    _write(tmp_path, 3, "# Section 3\nImpasse\nFinalement, allez au [[5]].")
+    stat = os.stat(tmp_path / "3.md")
+    os.utime(tmp_path / "3.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (tmp_path / "2.md").unlink()
+
+    assert graph.refresh(force=True)
+    assert graph.successors(3) == (5,)
+    assert not graph.has_section(2)
+    assert graph.orphans() == []
+
+
+def test_refresh_interval(tmp_path):
+    """Scans are throttled by the refresh interval."""
+    index = SectionGraphIndex(SectionGraphConfig(sections_dir=tmp_path, refresh_interval_seconds=3600))
+    index.refresh(force=True)
+    _write(tmp_path, 1, BOOK[1])
+    assert not index.refresh()
+    assert index.refresh(force=True)
+    assert index.has_section(1)
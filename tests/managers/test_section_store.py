@@ -0,0 +1,134 @@
+"""Tests for the compiled section store and the precompilation pipeline."""
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from config.managers.section_store_config import SectionStoreConfig
+from managers.section_store import SectionStore, SectionStoreWriter, compilation_metadata, source_hash
+from models.narrator_model import NarratorModel, SourceType
+from models.rules_model import RulesModel
+from utils.precompile_sections import precompile
+
+METADATA = {"narrator_model": "gpt", "narrator_prompt": "a", "rules_model": "gpt", "rules_prompt": "b"}
+
+
+def _narrator(n):
+    return NarratorModel(section_number=n, content=f"Section {n}", source_type=SourceType.PROCESSED)
+
+
+def _rules(n):
+    return RulesModel(section_number=n, rules_summary=f"Rules {n}")
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    """Path of a temporary artifact."""
+    return tmp_path / "compiled" / "sections.sqlite3"
+
+
+@pytest.fixture
+def sections_dir(tmp_path):
+    """Section sources matching the compiled sections."""
+    path = tmp_path / "sections"
+    path.mkdir()
+    (path / "1.md").write_text("# Section 1", encoding="utf-8")
+    return path
+
+
+def test_load_missing_artifact(artifact):
+    """A missing artifact leaves the store empty."""
+    store = SectionStore(SectionStoreConfig(artifact_path=artifact))
+    assert store.load() == 0
+    assert not store.loaded
+    assert store.get_narrator(1) is None
+
+
+def test_write_then_load(artifact, sections_dir):
+    """Compiled sections are served after loading."""
+    writer = SectionStoreWriter(artifact, METADATA)
+    writer.put(1, source_hash("# Section 1"), _narrator(1), _rules(1))
+    writer.close()
+
+    store = SectionStore(SectionStoreConfig(artifact_path=artifact, sections_dir=sections_dir), METADATA)
+    assert store.load() == 1
+    assert store.get_narrator(1).content == "Section 1"
+    assert store.get_rules(1).rules_summary == "Rules 1"
+    assert store.get_metadata()["narrator_model"] == "gpt"
+
+
+def test_changed_prompt_discards_sections(artifact):
+    """Changing a prompt invalidates previously compiled sections."""
+    writer = SectionStoreWriter(artifact, METADATA)
+    writer.put(1, "hash", _narrator(1), _rules(1))
+    writer.close()
+
+    writer = SectionStoreWriter(artifact, {**METADATA, "rules_prompt": "changed"})
+    assert writer.compiled_hashes() == {}
+    writer.close()
+
+
+def test_load_skips_stale_compilations(artifact, sections_dir):
+    """Edited prompts and section files are not served from the artifact."""
+    narrator_config = Mock(model_name="gpt", system_message="Narrateur")
+    rules_config = Mock(model_name="gpt", system_message="Règles")
+    (sections_dir / "2.md").write_text("# Section 2", encoding="utf-8")
+    writer = SectionStoreWriter(artifact, compilation_metadata(narrator_config, rules_config))
+    for n in (1, 2):
+        writer.put(n, source_hash(f"# Section {n}"), _narrator(n), _rules(n))
+    writer.close()
+    config = SectionStoreConfig(artifact_path=artifact, sections_dir=sections_dir)
+
+    (sections_dir / "2.md").write_text("# Section 2\n\nEdited", encoding="utf-8")
+    store = SectionStore(config, compilation_metadata(narrator_config, rules_config))
+    assert store.load() == 1
+    assert store.get_narrator(1).content == "Section 1"
+    assert store.get_narrator(2) is None
+    assert store.get_rules(2) is None
+
+    rules_config.system_message = "Règles modifiées"
+    store = SectionStore(config, compilation_metadata(narrator_config, rules_config))
+    assert store.load() == 0
+    assert store.get_narrator(1) is None
+
+
+@pytest.mark.asyncio
+async def test_precompile_resumes(tmp_path, artifact):
+    """Up-to-date sections are skipped on the next run."""
+    sections_dir = tmp_path / "sections"
+    sections_dir.mkdir()
+    for n in (1, 2):
+        (sections_dir / f"{n}.md").write_text(f"# Section {n}\n\nText {n}", encoding="utf-8")
+
+    compiler = Mock()
+    compiler.metadata = Mock(return_value=METADATA)
+    compiler.compile_section = AsyncMock(side_effect=lambda n, content: (_narrator(n), _rules(n)))
+    compiler.llm_cache = AsyncMock()
+
+    stats = await precompile(sections_dir, artifact, compiler=compiler)
+    assert stats == {"compiled": 2, "skipped": 0, "failed": 0}
+
+    (sections_dir / "2.md").write_text("# Section 2\n\nEdited", encoding="utf-8")
+    stats = await precompile(sections_dir, artifact, compiler=compiler)
+    assert stats == {"compiled": 1, "skipped": 1, "failed": 0}
+
+    writer = SectionStoreWriter(artifact, METADATA)
+    assert writer.compiled_hashes()[2] == source_hash("# Section 2\n\nEdited")
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_precompile_records_failures(tmp_path, artifact):
+    """A failing section is reported and not written."""
+    sections_dir = tmp_path / "sections"
+    sections_dir.mkdir()
+    (sections_dir / "1.md").write_text("# Section 1", encoding="utf-8")
+
+    compiler = Mock()
+    compiler.metadata = Mock(return_value=METADATA)
+    compiler.compile_section = AsyncMock(side_effect=RuntimeError("llm down"))
+    compiler.llm_cache = AsyncMock()
+
+    stats = await precompile(sections_dir, artifact, compiler=compiler)
+    assert stats["failed"] == 1
+
+    store = SectionStore(SectionStoreConfig(artifact_path=artifact))
+    assert store.load() == 0
@@ -0,0 +1,226 @@
+"""Tests for the session manager module."""
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from config.managers.session_manager_config import SessionManagerConfig
+from managers.session_manager import SessionManager, GameSession
+from models.errors_model import SessionError
+
+
+def _make_agent_manager(game_id):
+    """Create a mock agent manager bound to a game."""
+    state_manager = AsyncMock()
+    state_manager.get_current_state = AsyncMock(return_value=None)
+    state_manager.load_current_state = AsyncMock(return_value=None)
+    agent_manager = Mock()
+    agent_manager.game_id = game_id
+    agent_manager.managers = {"state_manager": state_manager, "trace_manager": AsyncMock()}
+    agent_manager.stop_game = AsyncMock()
+    return agent_manager
+
+
+def _restorable_session(game_id):
+    """Session whose state manager has a saved state."""
+    agent_manager = _make_agent_manager(game_id)
+    agent_manager.managers["state_manager"].load_current_state = AsyncMock(
+        return_value=Mock(session_id="session-1", section_number=3)
+    )
+    return GameSession(game_id=game_id, agent_manager=agent_manager)
+
+
+@pytest.fixture
+def game_factory():
+    """Create a mock game factory."""
+    return Mock()
+
+
+@pytest.fixture
+def session_manager(game_factory):
+    """Create a session manager building mock sessions."""
+    manager = SessionManager(
+        game_factory=game_factory,
+        config=SessionManagerConfig(max_sessions=2, idle_timeout_seconds=10)
+    )
+    manager._build_session = lambda game_id: GameSession(
+        game_id=game_id,
+        agent_manager=_make_agent_manager(game_id)
+    )
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_create_session_isolates_games(session_manager):
+    """Each game gets its own agent manager."""
+    first = await session_manager.create_session("game-1")
+    second = await session_manager.create_session("game-2")
+
+    assert first.agent_manager is not second.agent_manager
+    assert await session_manager.get_session("game-1") is first
+    assert session_manager.get_stats()["active_sessions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_create_session_refuses_live_game(session_manager):
+    """A client cannot take over the live session of another game."""
+    first = await session_manager.create_session("game-1")
+    with pytest.raises(SessionError):
+        await session_manager.create_session("game-1")
+    assert await session_manager.get_session("game-1") is first
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("game_id", ["../../x", "a/b", "x" * 65])
+async def test_create_session_rejects_unsafe_ids(session_manager, game_id):
+    """Client-supplied IDs never become paths outside the storage dir."""
+    with pytest.raises(ValueError):
+        await session_manager.create_session(game_id)
+    assert session_manager.get_stats()["active_sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(session_manager):
+    """The least recently used game is evicted above max_sessions."""
+    first = await session_manager.create_session("game-1")
+    await session_manager.create_session("game-2")
+    await session_manager.get_session("game-1")
+    await session_manager.create_session("game-3")
+
+    assert await session_manager.get_session("game-2") is None
+    assert await session_manager.get_session("game-1") is first
+    assert session_manager.get_stats()["evicted_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_evicted_session_is_saved(session_manager):
+    """Evicted games save their state before being dropped."""
+    first = await session_manager.create_session("game-1")
+    await session_manager.create_session("game-2")
+    await session_manager.create_session("game-3")
+
+    first.agent_manager.stop_game.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_idle_eviction(session_manager):
+    """Games idle longer than the timeout are evicted."""
+    session = await session_manager.create_session("game-1")
+    await session_manager.create_session("game-2")
+
+    with patch("managers.session_manager.time.monotonic", return_value=session.last_access + 60):
+        evicted = await session_manager.evict_idle_sessions()
+
+    assert evicted == 2
+    assert session_manager.get_stats()["active_sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_session_restores_state(session_manager):
+    """A game missing from memory is restored from storage."""
+    session = await session_manager.get_or_create_session("game-1")
+
+    state_manager = session.agent_manager.managers["state_manager"]
+    state_manager.load_current_state.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_session_resumes_trace(session_manager):
+    """A restored game resumes the trace of its saved session."""
+    session_manager._build_session = lambda game_id: _restorable_session(game_id)
+    session = await session_manager.get_or_create_session("game-1")
+
+    trace_manager = session.agent_manager.managers["trace_manager"]
+    trace_manager.load_session.assert_awaited_once_with("session-1")
+
+
+@pytest.mark.asyncio
+async def test_close_session(session_manager):
+    """Closing a game stops it and removes it from memory."""
+    session = await session_manager.create_session("game-1")
+
+    assert await session_manager.close_session("game-1") is True
+    assert await session_manager.close_session("game-1") is False
+    session.agent_manager.stop_game.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_all_sessions(session_manager):
+    """Shutdown stops every live game."""
+    first = await session_manager.create_session("game-1")
+    second = await session_manager.create_session("game-2")
+    await session_manager.start()
+
+    await session_manager.shutdown()
+
+    first.agent_manager.stop_game.assert_awaited_once()
+    second.agent_manager.stop_game.assert_awaited_once()
+    assert session_manager.get_stats()["active_sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_skips_busy_sessions(session_manager):
+    """A game playing a turn is not evicted."""
+    first = await session_manager.create_session("game-1")
+    second = await session_manager.create_session("game-2")
+
+    async with first.lock:
+        await session_manager.create_session("game-3")
+
+    assert await session_manager.get_session("game-1") is first
+    assert await session_manager.get_session("game-2") is None
+    second.agent_manager.stop_game.assert_awaited_once()
+    first.agent_manager.stop_game.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_recreated_session_waits_for_release(session_manager):
+    """A game is rebuilt only once its removed session has saved its state."""
+    first = await session_manager.create_session("game-1")
+    saved = asyncio.Event()
+
+    async def close():
+        saved.set()
+
+    first.agent_manager.managers["state_manager"].close = close
+    await first.lock.acquire()
+    closing = asyncio.create_task(session_manager.close_session("game-1"))
+    await asyncio.sleep(0)
+    restoring = asyncio.create_task(session_manager.get_or_create_session("game-1"))
+    await asyncio.sleep(0.01)
+    # Le tour en cours bloque l'écriture, donc la reconstruction
+    assert not restoring.done()
+
+    first.lock.release()
+    restored = await restoring
+    assert saved.is_set()
+    assert restored is not first
+    assert await closing is True
+
+
+@pytest.mark.asyncio
+async def test_restore_session_ignores_unknown_games(session_manager):
+    """Nothing is built, and no game evicted, for a game without saved state."""
+    first = await session_manager.create_session("game-1")
+    second = await session_manager.create_session("game-2")
+    session_manager.has_saved_state = Mock(return_value=False)
+
+    assert await session_manager.restore_session("made-up") is None
+    assert await session_manager.get_session("game-1") is first
+    assert await session_manager.get_session("game-2") is second
+
+
+@pytest.mark.asyncio
+async def test_restore_session_rebuilds_saved_games(session_manager):
+    """An evicted game with a saved state is restored."""
+    session_manager.has_saved_state = Mock(return_value=True)
+
+    session = await session_manager.restore_session("game-1")
+
+    assert session is await session_manager.get_session("game-1")
+    session.agent_manager.managers["state_manager"].load_current_state.assert_awaited_once()
+
+
+def test_has_saved_state_rejects_paths(session_manager):
+    """A game_id is never resolved outside the games directory."""
+    assert session_manager.has_saved_state("../../etc") is False
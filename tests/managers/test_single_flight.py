@@ -0,0 +1,105 @@
+"""Tests for single-flight coalescing of section generations."""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from langchain_core.messages import AIMessage
+
+# La factory d'abord : les agents importent managers.state_manager (cycle)
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from agents.narrator_agent import NarratorAgent
+from config.agents.narrator_agent_config import NarratorAgentConfig
+from config.managers.single_flight_config import SingleFlightConfig
+from managers.single_flight import SingleFlight
+from models.narrator_model import NarratorModel
+
+
+def slow(result, calls, delay=0.02):
+    """Coroutine factory counting its calls."""
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return compute
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_computation():
+    flight = SingleFlight()
+    calls = []
+
+    results = await asyncio.gather(*(flight.run(("narrator", 1, "v1"), slow("ok", calls)) for _ in range(50)))
+
+    assert results == ["ok"] * 50
+    assert len(calls) == 1
+    stats = flight.get_stats()
+    assert (stats["calls"], stats["computations"], stats["shared"], stats["in_flight"]) == (50, 1, 49, 0)
+    assert stats["keys"]["narrator:1:v1"]["wait_max_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_caller_then_retries():
+    flight = SingleFlight()
+    calls = []
+
+    results = await asyncio.gather(
+        *(flight.run("key", slow(RuntimeError("llm down"), calls)) for _ in range(3)),
+        return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.get_stats()["keys"]["key"]["errors"] == 1
+
+    assert await flight.run("key", slow("ok", calls)) == "ok"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    flight = SingleFlight()
+    calls = []
+    first = asyncio.create_task(flight.run("key", slow("ok", calls, delay=0.05)))
+    second = asyncio.create_task(flight.run("key", slow("ok", calls)))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+
+    assert await second == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_runs_every_call():
+    flight = SingleFlight(SingleFlightConfig(enabled=False))
+    calls = []
+
+    await asyncio.gather(*(flight.run("key", slow("ok", calls)) for _ in range(3)))
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_players_reaching_a_new_section_share_one_llm_call():
+    """One LLM call and one cache write for simultaneous players."""
+    async def answer(messages):
+        await asyncio.sleep(0.02)
+        return AIMessage(content=json.dumps({"content": "Il fait nuit.", "source_type": "processed", "error": None}))
+
+    config = NarratorAgentConfig()
+    config.llm = Mock(ainvoke=AsyncMock(side_effect=answer))
+    manager = Mock()
+    manager.get_cached_content = AsyncMock(return_value=None)
+    manager.get_raw_content = AsyncMock(return_value="# Section 1")
+    manager.save_content = AsyncMock(side_effect=lambda model: model)
+    agent = NarratorAgent(config=config, narrator_manager=manager, single_flight=SingleFlight())
+
+    results = await asyncio.gather(*(agent._process_section(1) for _ in range(20)))
+
+    assert all(isinstance(r, NarratorModel) and r.content == "Il fait nuit." for r in results)
+    assert len({id(r) for r in results}) == 20
+    assert config.llm.ainvoke.await_count == 1
+    assert manager.save_content.await_count == 1
@@ -0,0 +1,209 @@
+"""Tests for the write-behind stage of StateManager.save_state."""
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+# La factory d'abord : managers.state_manager importe agents.factories (cycle)
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from managers.state_manager import StateManager
+from managers.cache_manager import CacheManager
+from config.managers.state_persistence_config import StatePersistenceConfig
+from config.storage_config import StorageConfig
+from models.game_state import GameState
+from models.errors_model import StateError
+
+GAME_ID = "test-game"
+
+
+def make_manager(cache, **persistence):
+    """State manager bound to a game, with a mock cache."""
+    return StateManager(
+        config=StorageConfig.get_default_config(base_path="unused", game_id=GAME_ID),
+        cache_manager=cache,
+        character_manager=Mock(),
+        game_id=GAME_ID,
+        persistence_config=StatePersistenceConfig(**persistence)
+    )
+
+
+def make_state(section_number):
+    return GameState(session_id="test-session", game_id=GAME_ID, section_number=section_number)
+
+
+@pytest.fixture
+def cache():
+    """Cache recording written keys."""
+    cache = Mock()
+    cache.save_cached_data = AsyncMock()
+    cache.get_cached_data = AsyncMock(return_value=None)
+    return cache
+
+
+def written_keys(cache):
+    return [c.kwargs["key"] for c in cache.save_cached_data.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_sync_mode_writes_before_returning(cache):
+    """sync keeps the previous behavior: two writes per save."""
+    manager = make_manager(cache, durability="sync")
+
+    await manager.save_state(make_state(3))
+
+    assert written_keys(cache) == [f"game_{GAME_ID}_current", f"game_{GAME_ID}_section_3"]
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_coalesces_saves(cache):
+    """Saves of one turn are merged into one write per key."""
+    manager = make_manager(cache, durability="batched", flush_interval_seconds=0.01)
+
+    for _ in range(3):
+        await manager.save_state(make_state(3))
+    assert cache.save_cached_data.await_count == 0
+
+    await asyncio.sleep(0.05)
+    assert sorted(written_keys(cache)) == [f"game_{GAME_ID}_current", f"game_{GAME_ID}_section_3"]
+
+
+@pytest.mark.asyncio
+async def test_dirty_threshold_triggers_write(cache):
+    """Reaching max_dirty_keys writes without waiting for the interval."""
+    manager = make_manager(cache, durability="batched", flush_interval_seconds=60, max_dirty_keys=3)
+
+    await manager.save_state(make_state(1))
+    await manager.save_state(make_state(2))
+    await asyncio.sleep(0)
+
+    assert cache.save_cached_data.await_count == 3
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_lazy_mode_reads_buffered_state(cache):
+    """Buffered states are visible to loads and written on close."""
+    manager = make_manager(cache, durability="lazy")
+    saved = await manager.save_state(make_state(2))
+
+    assert await manager.load_current_state() is saved
+    assert await manager.load_state(2) is saved
+    assert cache.save_cached_data.await_count == 0
+
+    await manager.close()
+    assert cache.save_cached_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_write_keeps_states(cache):
+    """States stay buffered when the storage fails."""
+    manager = make_manager(cache, durability="lazy")
+    await manager.save_state(make_state(1))
+    cache.save_cached_data.side_effect = OSError("disk full")
+
+    with pytest.raises(StateError):
+        await manager.flush()
+
+    cache.save_cached_data.side_effect = None
+    assert await manager.flush() == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_state_deletes_saved_states(cache):
+    """Reset deletes the current and per-section states of the game."""
+    cache.clear_pattern = AsyncMock()
+    manager = make_manager(cache, durability="sync")
+    await manager.save_state(make_state(3))
+
+    await manager.clear_state()
+
+    cache.clear_pattern.assert_awaited_once_with(namespace="state", pattern=f"game_{GAME_ID}_*")
+    assert manager.current_state is None
+
+
+@pytest.mark.asyncio
+async def test_clear_state_removes_state_files(tmp_path):
+    """With the real cache, reset leaves no state to restore."""
+    config = StorageConfig.get_default_config(base_path=tmp_path, game_id=GAME_ID)
+    cache = CacheManager(config)
+    manager = StateManager(
+        config=config,
+        cache_manager=cache,
+        character_manager=Mock(),
+        game_id=GAME_ID,
+        persistence_config=StatePersistenceConfig(durability="sync")
+    )
+    await manager.save_state(make_state(3))
+    state_dir = config.get_absolute_path("state")
+    assert list(state_dir.glob(f"game_{GAME_ID}_*"))
+
+    await manager.clear_state()
+
+    assert not list(state_dir.glob(f"game_{GAME_ID}_*"))
+    assert await cache.get_cached_data(f"game_{GAME_ID}_current", "state") is None
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_states_stay_readable_while_written(cache):
+    """Read-your-writes holds during a flush; a newer save stays buffered."""
+    release = asyncio.Event()
+
+    async def slow_write(**kwargs):
+        await release.wait()
+
+    cache.save_cached_data = AsyncMock(side_effect=slow_write)
+    manager = make_manager(cache, durability="batched", flush_interval_seconds=60)
+    first = make_state(3)
+    await manager.save_state(first)
+
+    flushing = asyncio.create_task(manager.flush())
+    await asyncio.sleep(0)
+    assert (await manager.load_current_state()).section_number == 3
+    assert (await manager.load_state(3)).section_number == 3
+    await manager.save_state(make_state(4))
+
+    release.set()
+    assert await flushing == 2
+    # Seule la clé courante, remplacée pendant l'écriture, reste en attente
+    assert (await manager.load_current_state()).section_number == 4
+    assert await manager.flush() == 2
+    assert await manager.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_clear_state_drops_buffered_states(cache):
+    """A reset game is not written back by the release that follows."""
+    cache.clear_pattern = AsyncMock()
+    manager = make_manager(cache, durability="batched", flush_interval_seconds=0.01)
+    await manager.save_state(make_state(3))
+
+    await manager.clear_state()
+    await manager.close()
+    await asyncio.sleep(0.05)
+
+    assert cache.save_cached_data.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_states_round_trip_through_both_cache_tiers(tmp_path):
+    """The state is written as is and read back from memory or from its file."""
+    config = StorageConfig.get_default_config(base_path=tmp_path, game_id=GAME_ID)
+    cache = CacheManager(config)
+    manager = StateManager(
+        config=config,
+        cache_manager=cache,
+        character_manager=Mock(),
+        game_id=GAME_ID,
+        persistence_config=StatePersistenceConfig(durability="sync")
+    )
+    state = await manager.save_state(make_state(3))
+
+    assert await manager.load_current_state() is state
+    await cache.close()
+
+    # Nouveau cache : lecture depuis le fichier
+    manager.cache = CacheManager(config)
+    loaded = await manager.load_state(3)
+    assert isinstance(loaded, GameState)
+    assert loaded.model_dump() == state.model_dump()
+    await manager.cache.close()
@@ -1,9 +1,9 @@
 """Tests for the trace manager module."""
 import pytest
 import pytest_asyncio
-from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 
+from managers.filesystem_adapter import FileSystemAdapter
 from managers.trace_manager import TraceManager
 from models.game_state import GameState
 from models.trace_model import TraceModel, TraceAction, ActionType
@@ -11,21 +11,19 @@ from config.storage_config import StorageConfig
 from models.errors_model import TraceError
 
 @pytest.fixture
-def mock_cache_manager():
-    """Create a mock cache manager."""
-    cache = Mock()
-    cache.save_cached_content = AsyncMock()
-    return cache
+def config(tmp_path):
+    """Create a test storage config."""
+    return StorageConfig.get_default_config(base_path=tmp_path)
 
 @pytest.fixture
-def config():
-    """Create a test storage config."""
-    return StorageConfig.get_default_config(base_path="./test_data")
+def fs_adapter(config):
+    """Create a file adapter writing in a temporary directory."""
+    return FileSystemAdapter(config)
 
 @pytest_asyncio.fixture
-async def trace_manager(config, mock_cache_manager):
+async def trace_manager(config, fs_adapter):
     """Create a test trace manager."""
-    manager = TraceManager(config=config, cache_manager=mock_cache_manager)
+    manager = TraceManager(config=config, fs_adapter=fs_adapter)
     return manager
 
 @pytest.fixture
@@ -47,7 +45,7 @@ def sample_action():
     }
 
 @pytest.mark.asyncio
-async def test_start_session(trace_manager, mock_cache_manager):
+async def test_start_session(trace_manager):
     """Test starting a new session."""
     await trace_manager.start_session()
     
@@ -57,11 +55,17 @@ async def test_start_session(trace_manager, mock_cache_manager):
     assert trace_manager._current_trace.session_id != ""
     assert len(trace_manager._current_trace.history) == 0
     
-    # Verify save was called
-    mock_cache_manager.save_cached_content.assert_called_once()
+    # Verify an empty snapshot was written
+    session_id = trace_manager._current_trace.session_id
+    snapshot = TraceModel.model_validate_json(
+        trace_manager._snapshot_path(session_id).read_text(encoding="utf-8")
+    )
+    assert snapshot.session_id == session_id
+    assert snapshot.history == []
+    assert trace_manager._journal_path(session_id).read_text(encoding="utf-8") == ""
 
 @pytest.mark.asyncio
-async def test_process_trace(trace_manager, mock_cache_manager, sample_game_state, sample_action):
+async def test_process_trace(trace_manager, sample_game_state, sample_action):
     """Test processing a trace."""
     # Process a trace
     await trace_manager.process_trace(sample_game_state, sample_action)
@@ -76,21 +80,30 @@ async def test_process_trace(trace_manager, mock_cache_manager, sample_game_stat
     assert action.action_type == sample_action["type"]
     assert action.details == sample_action
     
-    # Verify save was called
-    mock_cache_manager.save_cached_content.assert_called()
+    # Verify the action was journaled
+    journal = trace_manager._journal_path(trace_manager._current_trace.session_id)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 1
 
 @pytest.mark.asyncio
-async def test_save_trace(trace_manager, mock_cache_manager):
+async def test_save_trace(trace_manager):
     """Test saving trace to storage."""
-    # Start session
+    # Start session and journal one action
     await trace_manager.start_session()
+    session_id = trace_manager._current_trace.session_id
+    await trace_manager.process_trace(
+        GameState(session_id=session_id, game_id="test_game", section_number=1),
+        {"type": ActionType.USER_INPUT, "input": "test input"}
+    )
+    journal = trace_manager._journal_path(session_id)
+    assert journal.read_text(encoding="utf-8") != ""
     
-    # Configure mock
-    mock_cache_manager.save_cached_content.return_value = True
-    
-    # Test successful save
+    # Test successful save: the journal is compacted into the snapshot
     await trace_manager.save_trace()
-    mock_cache_manager.save_cached_content.assert_called()
+    snapshot = TraceModel.model_validate_json(
+        trace_manager._snapshot_path(session_id).read_text(encoding="utf-8")
+    )
+    assert len(snapshot.history) == 1
+    assert journal.read_text(encoding="utf-8") == ""
     
     # Test save with no trace
     trace_manager._current_trace = None
@@ -107,4 +120,84 @@ async def test_get_current_trace(trace_manager):
     await trace_manager.start_session()
     current_trace = await trace_manager.get_current_trace()
     assert current_trace is not None
-    assert isinstance(current_trace, TraceModel)
\ No newline at end of file
+    assert isinstance(current_trace, TraceModel)
+
+@pytest_asyncio.fixture
+async def journal_manager(tmp_path, fs_adapter):
+    """Trace manager bound to a game, writing in a temporary directory."""
+    config = StorageConfig.get_default_config(base_path=tmp_path, game_id="test_game")
+    manager = TraceManager(config=config, fs_adapter=fs_adapter, compact_every=4)
+    await manager.start_session()
+    return manager
+
+def journal_state(manager, section_number=1):
+    """Game state of the manager's session."""
+    return GameState(
+        session_id=manager._current_trace.session_id,
+        game_id="test_game",
+        section_number=section_number
+    )
+
+async def record_actions(manager, count):
+    for i in range(count):
+        await manager.process_trace(
+            journal_state(manager, i + 1),
+            {"type": ActionType.USER_INPUT, "input": f"choix {i}"}
+        )
+
+@pytest.mark.asyncio
+async def test_actions_are_appended_to_journal(journal_manager):
+    """Each action adds one journal line, the snapshot is not rewritten."""
+    session_id = journal_manager._current_trace.session_id
+    snapshot = journal_manager._snapshot_path(session_id)
+    snapshot_mtime = snapshot.stat().st_mtime_ns
+
+    await record_actions(journal_manager, 3)
+
+    journal = journal_manager._journal_path(session_id)
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 3
+    assert snapshot.stat().st_mtime_ns == snapshot_mtime
+
+@pytest.mark.asyncio
+async def test_journal_is_compacted_into_snapshot(journal_manager):
+    """Reaching compact_every rewrites the snapshot and empties the journal."""
+    session_id = journal_manager._current_trace.session_id
+
+    await record_actions(journal_manager, 4)
+
+    snapshot = TraceModel.model_validate_json(
+        journal_manager._snapshot_path(session_id).read_text(encoding="utf-8")
+    )
+    assert len(snapshot.history) == 4
+    assert journal_manager._journal_path(session_id).read_text(encoding="utf-8") == ""
+
+@pytest.mark.asyncio
+async def test_session_replays_snapshot_and_journal(journal_manager, tmp_path, fs_adapter):
+    """A new manager rebuilds the trace from the snapshot plus the journal tail."""
+    session_id = journal_manager._current_trace.session_id
+    await record_actions(journal_manager, 6)
+    # Arrêt pendant l'écriture d'une ligne
+    with open(journal_manager._journal_path(session_id), "a", encoding="utf-8") as f:
+        f.write('{"seq": 6, "sect')
+
+    config = StorageConfig.get_default_config(base_path=tmp_path, game_id="test_game")
+    restarted = TraceManager(config=config, fs_adapter=fs_adapter)
+    trace = await restarted.load_session(session_id)
+
+    assert [a.details["input"] for a in trace.history] == [f"choix {i}" for i in range(6)]
+    assert trace.section_number == 6
+    streamed = [a async for a in restarted.iter_actions(session_id)]
+    assert streamed == trace.history
+
+@pytest.mark.asyncio
+async def test_trace_history_streams_sessions(journal_manager):
+    """Stored sessions are yielded one by one."""
+    await record_actions(journal_manager, 2)
+    first_session = journal_manager._current_trace.session_id
+    await journal_manager.start_session()
+    await record_actions(journal_manager, 1)
+
+    traces = {t.session_id: t async for t in journal_manager.get_trace_history()}
+
+    assert len(traces[first_session].history) == 2
+    assert len(traces[journal_manager._current_trace.session_id].history) == 1
@@ -0,0 +1,78 @@
+"""
+Tests for copy-on-write state updates.
+
+with_updates must not serialize nor revalidate unchanged nested models.
+"""
+from models.game_state import GameState
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+from models.trace_model import TraceModel, TraceAction, ActionType
+
+
+def make_state(history_size: int = 3) -> GameState:
+    """State with a narrative, rules and a trace history."""
+    history = [
+        TraceAction(section=1, action_type=ActionType.USER_INPUT, details={"input": f"choix {i}"})
+        for i in range(history_size)
+    ]
+    return GameState(
+        session_id="test_session",
+        game_id="test_game",
+        section_number=1,
+        narrative=NarratorModel(section_number=1, content="Il fait nuit."),
+        rules=RulesModel(section_number=1),
+        trace=TraceModel(game_id="test_game", session_id="test_session", section_number=1, history=history)
+    )
+
+
+def test_unchanged_models_share_their_content():
+    """Trace history is shared, not copied, by an unrelated update."""
+    state = make_state()
+
+    updated = state.with_updates(error="erreur")
+
+    assert updated.error == "erreur"
+    assert updated.trace is not state.trace
+    assert updated.trace.history is state.trace.history
+    assert updated.narrative.content == state.narrative.content
+    assert updated.session_id == state.session_id
+    assert updated.game_id == state.game_id
+
+
+def test_node_tag_only_on_updated_value():
+    """Unchanged models do not carry the tag of a previous node."""
+    state = make_state()
+    state = state.with_node_updates("node_rules", rules=RulesModel(section_number=1))
+    assert getattr(state.rules, "__from_node__", None) == "node_rules"
+
+    narrative = NarratorModel(section_number=1, content="Le jour se lève.")
+    updated = state.with_node_updates("node_narrator", narrative=narrative)
+
+    assert updated.narrative is narrative
+    assert getattr(updated.narrative, "__from_node__", None) == "node_narrator"
+    assert getattr(updated.rules, "__from_node__", None) is None
+    # L'état source garde sa marque
+    assert getattr(state.rules, "__from_node__", None) == "node_rules"
+
+
+def test_section_change_does_not_mutate_previous_state():
+    """Section sync applies to the new state only."""
+    state = make_state()
+
+    updated = state.with_updates(section_number=2)
+
+    assert updated.section_number == 2
+    assert updated.narrative.section_number == 2
+    assert updated.rules.section_number == 2
+    assert state.narrative.section_number == 1
+    assert state.rules.section_number == 1
+
+
+def test_unset_fields_stay_unset():
+    """Fields never set keep their defaults, as before."""
+    state = GameState(session_id="test_session", game_id="test_game")
+
+    updated = state.with_updates(should_continue=True)
+
+    assert updated.should_continue is True
+    assert not {"narrative", "rules", "trace", "decision"} & updated.model_fields_set
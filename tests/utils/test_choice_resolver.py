@@ -0,0 +1,99 @@
+"""Tests for the local decision resolver."""
+import pytest
+
+from models.rules_model import RulesModel, Choice, ChoiceType, DiceType
+from utils.choice_resolver import dice_key_matches, parse_dice_roll, resolve_choice
+
+
+@pytest.fixture
+def choice_rules() -> RulesModel:
+    """Section with two direct choices and a conditional one."""
+    return RulesModel(
+        section_number=1,
+        choices=[
+            Choice(text="Engager la procédure d'évasion", type=ChoiceType.DIRECT, target_section=48),
+            Choice(text="Continuer votre route", type=ChoiceType.DIRECT, target_section=398),
+            Choice(text="Utiliser le laser", type=ChoiceType.CONDITIONAL,
+                   target_section=12, conditions=["possède un laser"])
+        ]
+    )
+
+
+@pytest.fixture
+def dice_rules() -> RulesModel:
+    """Section whose outcome depends on a 2d6 roll."""
+    return RulesModel(
+        section_number=10,
+        choices=[
+            Choice(text="Tentez votre chance", type=ChoiceType.DICE,
+                   dice_type=DiceType.CHANCE, dice_results={"2-7": 20, "8+": 30})
+        ]
+    )
+
+
+def test_exact_choice_text(choice_rules):
+    """A button click sends the choice text verbatim."""
+    result = resolve_choice("Continuer votre route", choice_rules)
+    assert result.next_section == 398
+
+
+def test_normalized_choice_text(choice_rules):
+    """Case, spaces and final punctuation are ignored."""
+    result = resolve_choice("  continuer   VOTRE route ! ", choice_rules)
+    assert result.next_section == 398
+
+
+def test_conditional_choice_keeps_conditions(choice_rules):
+    """Conditions of the chosen option are reported."""
+    result = resolve_choice("Utiliser le laser", choice_rules)
+    assert result.next_section == 12
+    assert result.conditions == ["possède un laser"]
+
+
+@pytest.mark.parametrize("player_input", ["48", "[[48]]", "Rendez-vous au 48", "section 48"])
+def test_section_reference(choice_rules, player_input):
+    """Explicit section references resolve when they match a choice."""
+    assert resolve_choice(player_input, choice_rules).next_section == 48
+
+
+def test_free_text_falls_back(choice_rules):
+    """Ambiguous free text is left to the LLM."""
+    assert resolve_choice("je fonce vers la planète", choice_rules) is None
+    assert resolve_choice("99", choice_rules) is None
+    assert resolve_choice("", choice_rules) is None
+
+
+def test_allowed_targets(choice_rules):
+    """A target missing from the section graph is not trusted."""
+    assert resolve_choice("Continuer votre route", choice_rules, allowed_targets=(48,)) is None
+
+
+def test_dice_roll(dice_rules):
+    """Numeric dice results resolve locally."""
+    assert resolve_choice("Jet de chance : 8 (3+5)", dice_rules).next_section == 30
+    assert resolve_choice("Jet de chance : 4 (1+3)", dice_rules).next_section == 20
+
+
+def test_dice_roll_needs_character(dice_rules):
+    """Keys depending on the character are left to the LLM."""
+    dice_rules.choices[0].dice_results = {"success": 20, "failure": 30}
+    assert resolve_choice("Jet de chance : 8 (3+5)", dice_rules) is None
+
+
+def test_parse_dice_roll():
+    """Dice roll inputs from the frontend are parsed."""
+    assert parse_dice_roll("Jet de combat : 11 (5+6)") == 11
+    assert parse_dice_roll("Je lance les dés") is None
+
+
+@pytest.mark.parametrize("key,total,expected", [
+    ("6", 6, True),
+    ("5-6", 4, False),
+    ("8+", 9, True),
+    (">=8", 7, False),
+    ("<=7", 7, True),
+    ("success", 7, None),
+])
+def test_dice_key_matches(key, total, expected):
+    """Dice result keys support values, ranges and thresholds."""
+    assert dice_key_matches(key, total) is expected
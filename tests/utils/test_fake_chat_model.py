@@ -0,0 +1,59 @@
+"""Tests for the deterministic local chat model."""
+import json
+
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from utils.fake_chat_model import FakeChatModel
+from config.agents.rules_agent_config import RulesAgentConfig
+
+SECTION_PROMPT = "Section Number: 12\nContent : Vous pouvez fuir [[48]] ou combattre [[398]]."
+
+
+def test_rules_and_narrator_answers_follow_the_section():
+    messages = [SystemMessage(content="Règles"), HumanMessage(content=SECTION_PROMPT)]
+
+    rules = json.loads(FakeChatModel(role="rules").invoke(messages).content)
+    assert [choice["target_section"] for choice in rules["choices"]] == [48, 398]
+    assert rules["needs_user_response"] is True
+
+    narrative = json.loads(FakeChatModel(role="narrator").invoke(messages).content)
+    assert narrative["content"] == "Vous pouvez fuir [[48]] ou combattre [[398]]."
+
+
+def test_decision_prefers_the_reachable_section_named_by_the_player():
+    model = FakeChatModel(role="decision")
+    prompt = "Section actuelle: 12\nSections accessibles: [48, 398]\nRéponse utilisateur: Rendez-vous au {}"
+
+    assert json.loads(model.invoke([HumanMessage(content=prompt.format(398))]).content)["next_section"] == 398
+    # Section inaccessible : premier choix autorisé
+    assert json.loads(model.invoke([HumanMessage(content=prompt.format(7))]).content)["next_section"] == 48
+
+
+def test_latency_draws_are_seeded():
+    first = FakeChatModel(latency_ms=50, latency_sigma=0.5, seed=3)
+    second = FakeChatModel(latency_ms=50, latency_sigma=0.5, seed=3)
+
+    draws = [first.draw_latency() for _ in range(5)]
+    assert draws == [second.draw_latency() for _ in range(5)]
+    assert len(set(draws)) > 1
+    assert FakeChatModel(latency_ms=50).draw_latency() == 0.05
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_rebuild_the_answer():
+    model = FakeChatModel(role="rules", chunk_size=8)
+    messages = [HumanMessage(content=SECTION_PROMPT)]
+
+    chunks = [chunk.content async for chunk in model.astream(messages)]
+    assert len(chunks) > 1
+    assert "".join(chunks) == model.respond(messages)
+
+
+def test_agent_config_selects_the_fake_model(monkeypatch):
+    monkeypatch.setenv("FAKE_LLM_LATENCY_MS", "20")
+    config = RulesAgentConfig(llm_provider="fake", custom_parameters={"seed": 1})
+
+    llm = config.llm
+    assert isinstance(llm, FakeChatModel)
+    assert (llm.role, llm.latency_ms, llm.seed) == ("rules", 20.0, 1)
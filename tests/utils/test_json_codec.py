@@ -0,0 +1,58 @@
+"""Tests for the bytes JSON encoding of game states."""
+import gc
+import json
+from datetime import datetime
+
+from api.utils.serialization_utils import from_game_state, game_state_response, _json_serial
+from models.game_state import GameState
+from models.narrator_model import NarratorModel
+from utils import json_codec
+
+
+def make_state(section_number=1):
+    return GameState(
+        session_id="s1",
+        game_id="g1",
+        section_number=section_number,
+        metadata={"started_at": datetime(2024, 5, 1, 12, 30), "tags": ("nuit", "forêt")},
+        narrative=NarratorModel(section_number=section_number, content="Il fait nuit. « Qui va là ? »")
+    )
+
+
+def test_encoding_matches_the_previous_path():
+    """Same document as model_dump + json.dumps, as UTF-8 bytes."""
+    state = make_state()
+    data = json_codec.encode_state(state)
+
+    assert isinstance(data, bytes)
+    assert json_codec.loads(data) == json.loads(json.dumps(from_game_state(state), default=_json_serial))
+    assert "« Qui va là ? »".encode() in data
+
+
+def test_state_is_encoded_once_while_alive():
+    state = make_state()
+    before = json_codec.get_stats()
+
+    first = json_codec.encode_state(state)
+    assert json_codec.encode_state(state) is first
+    # Un nouvel état (copie avec mises à jour) est encodé à nouveau
+    updated = state.with_updates(section_number=2)
+    assert json_codec.loads(json_codec.encode_state(updated))["section_number"] == 2
+
+    stats = json_codec.get_stats()
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 2
+    entries = stats["entries"]
+    del state, updated
+    gc.collect()
+    assert json_codec.get_stats()["entries"] == entries - 2
+
+
+def test_game_state_response_embeds_the_encoded_state():
+    state = make_state()
+    response = game_state_response(state, message="ok")
+
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert (body["success"], body["message"], body["game_id"]) == (True, "ok", "g1")
+    assert body["state"] == json_codec.loads(json_codec.encode_state(state))
@@ -0,0 +1,43 @@
+"""Tests for the incremental JSON string field extractor."""
+import json
+
+from utils.json_stream import JsonStringFieldStream
+
+DOCUMENT = json.dumps({
+    "source_type": "processed",
+    "content": "# Section 1\n\n« Il fait \"nuit\" » \\ \t 🐉 [[145]]",
+    "error": None
+})
+
+
+def feed_all(chunks, field="content"):
+    stream = JsonStringFieldStream(field)
+    return "".join(stream.feed(chunk) for chunk in chunks), stream
+
+
+def test_decodes_field_fed_char_by_char():
+    """Escapes and surrogate pairs split between chunks are decoded."""
+    text, stream = feed_all(list(DOCUMENT))
+
+    assert text == json.loads(DOCUMENT)["content"]
+    assert stream.done
+
+
+def test_decodes_field_with_fenced_response():
+    """Text around the JSON object (markdown fence) is ignored."""
+    response = "Voici la section :\n```json\n" + DOCUMENT + "\n```"
+    chunks = [response[i:i + 7] for i in range(0, len(response), 7)]
+
+    text, _ = feed_all(chunks)
+
+    assert text == json.loads(DOCUMENT)["content"]
+
+
+def test_emits_text_before_the_object_is_complete():
+    stream = JsonStringFieldStream()
+
+    assert stream.feed('{"content": "Il fait') == "Il fait"
+    assert stream.feed(' nuit.\\') == " nuit."
+    assert stream.feed('n", "error"') == "\n"
+    assert stream.done
+    assert stream.feed(': null}') == ""
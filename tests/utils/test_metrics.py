@@ -0,0 +1,69 @@
+"""Tests for the Prometheus-style metrics."""
+import pytest
+from langgraph.errors import GraphInterrupt
+
+from utils.metrics import MetricsRegistry, GRAPH_NODE_SECONDS, GRAPH_NODE_ERRORS
+from agents.factories.game_factory import GameFactory  # noqa: F401
+from agents.story_graph import StoryGraph
+
+
+def test_text_exposition_format():
+    registry = MetricsRegistry()
+    lookups = registry.counter("lookups", "Cache lookups", ("namespace", "result"))
+    latency = registry.histogram("latency_seconds", "Latency", ("op",), buckets=(0.01, 0.1))
+    sessions = registry.gauge("sessions", "Live sessions")
+
+    lookups.labels("state", "memory").inc()
+    lookups.labels("state", "memory").inc(2)
+    for value in (0.005, 0.01, 0.05, 3):
+        latency.labels("read").observe(value)
+    sessions.set_function(lambda: 4)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE lookups_total counter" in lines
+    assert 'lookups_total{namespace="state",result="memory"} 3' in lines
+    # Buckets cumulés, borne incluse
+    assert 'latency_seconds_bucket{op="read",le="0.01"} 2' in lines
+    assert 'latency_seconds_bucket{op="read",le="0.1"} 3' in lines
+    assert 'latency_seconds_bucket{op="read",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{op="read"} 4' in lines
+    assert 'latency_seconds_sum{op="read"} 3.065' in lines
+    assert "sessions 4" in lines
+
+
+def test_labels_are_checked_and_normalized():
+    registry = MetricsRegistry()
+    calls = registry.counter("calls", "Calls", ("agent", "section"))
+
+    calls.labels("narrator", 3).inc()
+    assert calls.labels("narrator", "3") is calls.labels("narrator", 3)
+    with pytest.raises(ValueError):
+        calls.labels("narrator")
+    with pytest.raises(ValueError):
+        registry.counter("calls", "Duplicate")
+
+
+@pytest.mark.asyncio
+async def test_story_graph_nodes_are_timed():
+    seconds = GRAPH_NODE_SECONDS.labels("node_test")
+    errors = GRAPH_NODE_ERRORS.labels("node_test")
+    count, failed = sum(seconds.counts), errors.value
+
+    async def node(state):
+        return {"state": state}
+
+    async def waiting(state):
+        raise GraphInterrupt()
+
+    async def failing(state):
+        raise ValueError("boom")
+
+    assert await StoryGraph._timed_node("node_test", node)(1) == {"state": 1}
+    with pytest.raises(GraphInterrupt):
+        await StoryGraph._timed_node("node_test", waiting)(1)
+    with pytest.raises(ValueError):
+        await StoryGraph._timed_node("node_test", failing)(1)
+
+    assert sum(seconds.counts) == count + 3
+    # L'attente du joueur n'est pas une erreur
+    assert errors.value == failed + 1
@@ -0,0 +1,37 @@
+"""
+Construction du corpus des sections.
+
+Regroupe ``data/sections/*.md`` dans un fichier unique avec une table
+d'offsets (voir ``managers/section_corpus.py``), mappé en mémoire par le
+serveur. À relancer après toute modification des sources : un corpus
+périmé est ignoré et les fichiers sont alors relus un par un.
+
+Usage:
+    python -m utils.build_section_corpus
+    python -m utils.build_section_corpus --sections-dir data/sections --output data/compiled/sections.corpus
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from config.managers.section_corpus_config import SectionCorpusConfig
+from managers.section_corpus import build_corpus
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    defaults = SectionCorpusConfig()
+    parser = argparse.ArgumentParser(description="Pack section sources into a memory-mapped corpus")
+    parser.add_argument("--sections-dir", type=Path, default=defaults.sections_dir,
+                        help="Directory of section sources")
+    parser.add_argument("--output", type=Path, default=defaults.corpus_path,
+                        help="Corpus path")
+    args = parser.parse_args(argv)
+
+    return 0 if build_corpus(args.sections_dir, args.output) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
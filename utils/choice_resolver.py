@@ -0,0 +1,172 @@
+"""
+Résolution locale des décisions.
+
+La plupart des tours sont des clics : le frontend renvoie exactement le
+texte d'un ``Choice`` ou le résultat d'un jet de dés. Ces cas se résolvent
+à partir des règles, sans appel LLM ; seul le texte libre ambigu est
+confié à l'analyse du DecisionAgent.
+"""
+
+import re
+import unicodedata
+from typing import Iterable, List, Optional, Set
+
+from models.decision_model import AnalysisResult
+from models.rules_model import RulesModel, Choice, ChoiceType
+
+# « Jet de chance : 8 (3+5) » (voir DiceRoller.svelte)
+_DICE_ROLL_PATTERN = re.compile(r"^jet de[^:\d]*:?\s*(\d+)")
+_SECTION_LINK_PATTERN = re.compile(r"\[\[(\d+)\]\]")
+_SECTION_NUMBER_PATTERN = re.compile(r"^(?:section\s*|rendez-vous au\s*)?(\d+)$")
+_RANGE_PATTERN = re.compile(r"^(\d+)\s*(?:-|à|a|to)\s*(\d+)$")
+_MIN_PATTERN = re.compile(r"^(?:(?:>=|≥)\s*(\d+)|(\d+)\s*\+)$")
+_MAX_PATTERN = re.compile(r"^(?:(?:<=|≤)\s*(\d+)|(\d+)\s*-)$")
+
+# Choix dont la cible est connue sans jet de dés
+_TEXT_CHOICE_TYPES = (ChoiceType.DIRECT, ChoiceType.CONDITIONAL)
+
+
+def normalize_player_input(user_response: Optional[str]) -> str:
+    """Normalize a player input for comparisons (casse, espaces, ponctuation finale)."""
+    if not user_response:
+        return ""
+    text = unicodedata.normalize("NFKC", user_response).casefold()
+    return " ".join(text.split()).rstrip(" .!?")
+
+
+def parse_dice_roll(player_input: Optional[str]) -> Optional[int]:
+    """Extract the total of a dice roll input.
+
+    Args:
+        player_input: Player input, e.g. ``"Jet de chance : 8 (3+5)"``
+
+    Returns:
+        Optional[int]: Total of the roll, None if the input is not a roll
+    """
+    match = _DICE_ROLL_PATTERN.match(normalize_player_input(player_input))
+    return int(match.group(1)) if match else None
+
+
+def dice_key_matches(key: str, total: int) -> Optional[bool]:
+    """Check a ``Choice.dice_results`` key against a roll.
+
+    Supported keys: ``"6"``, ``"5-6"``, ``"8+"``, ``">=8"``, ``"<=7"``.
+
+    Args:
+        key: Dice result key
+        total: Total of the roll
+
+    Returns:
+        Optional[bool]: Whether the roll matches, None if the key is not
+        numeric (e.g. ``"success"``, which depends on the character)
+    """
+    key = normalize_player_input(key)
+    if key.isdigit():
+        return total == int(key)
+    match = _RANGE_PATTERN.match(key)
+    if match:
+        low, high = sorted((int(match.group(1)), int(match.group(2))))
+        return low <= total <= high
+    match = _MIN_PATTERN.match(key)
+    if match:
+        return total >= int(match.group(1) or match.group(2))
+    match = _MAX_PATTERN.match(key)
+    if match:
+        return total <= int(match.group(1) or match.group(2))
+    return None
+
+
+def _single_target(choices: Iterable[Choice]) -> Optional[Choice]:
+    """Return the choice if all candidates lead to the same section."""
+    choices = list(choices)
+    if not choices or len({c.target_section for c in choices}) != 1:
+        return None
+    return choices[0]
+
+
+def _resolve_dice(rules: RulesModel, total: int) -> Optional[AnalysisResult]:
+    dice_choices = [c for c in rules.choices if c.dice_results]
+    if not dice_choices or any(c.conditions for c in dice_choices):
+        # Les conditions (objets, caractéristiques) relèvent de l'analyse LLM
+        return None
+
+    targets: Set[int] = set()
+    for choice in dice_choices:
+        for key, target in choice.dice_results.items():
+            matches = dice_key_matches(key, total)
+            if matches is None:
+                return None
+            if matches:
+                targets.add(int(target))
+
+    if len(targets) != 1:
+        return None
+    next_section = targets.pop()
+    return AnalysisResult(
+        next_section=next_section,
+        analysis=f"Jet de dés {total} : section {next_section} (résolution locale)"
+    )
+
+
+def _referenced_sections(player_input: str, text: str) -> List[int]:
+    """Section numbers explicitly referenced by an input ([[n]], « 48 »)."""
+    numbers = [int(n) for n in _SECTION_LINK_PATTERN.findall(player_input)]
+    match = _SECTION_NUMBER_PATTERN.match(text)
+    if match:
+        numbers.append(int(match.group(1)))
+    return list(dict.fromkeys(numbers))
+
+
+def _resolve_text(rules: RulesModel, player_input: str) -> Optional[AnalysisResult]:
+    candidates = [
+        c for c in rules.choices
+        if c.type in _TEXT_CHOICE_TYPES and c.target_section is not None
+    ]
+    if not candidates:
+        return None
+
+    text = normalize_player_input(player_input)
+    choice = _single_target(c for c in candidates if normalize_player_input(c.text) == text)
+
+    if choice is None:
+        referenced = _referenced_sections(player_input, text)
+        if len(referenced) == 1:
+            choice = _single_target(c for c in candidates if c.target_section == referenced[0])
+
+    if choice is None:
+        return None
+    return AnalysisResult(
+        next_section=choice.target_section,
+        conditions=list(choice.conditions),
+        analysis=f"Choix « {choice.text} » : section {choice.target_section} (résolution locale)"
+    )
+
+
+def resolve_choice(
+    player_input: Optional[str],
+    rules: Optional[RulesModel],
+    allowed_targets: Iterable[int] = ()
+) -> Optional[AnalysisResult]:
+    """Resolve a decision from the rules without calling the LLM.
+
+    Args:
+        player_input: Choice text, section reference or dice roll
+        rules: Rules of the current section
+        allowed_targets: Sections linked from the current section (empty if unknown)
+
+    Returns:
+        Optional[AnalysisResult]: Decision, or None if the input is ambiguous
+    """
+    if not player_input or not rules or not rules.choices:
+        return None
+
+    total = parse_dice_roll(player_input)
+    if total is not None:
+        result = _resolve_dice(rules, total)
+    else:
+        result = _resolve_text(rules, player_input)
+
+    allowed_targets = set(allowed_targets)
+    if result is None or (allowed_targets and result.next_section not in allowed_targets):
+        return None
+    return result
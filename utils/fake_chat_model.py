@@ -0,0 +1,202 @@
+"""
+Deterministic local chat model for benchmarks and tests.
+
+``FakeChatModel`` remplace ChatOpenAI quand ``LLM_PROVIDER=fake`` : il
+répond aux prompts du narrateur, des règles et de la décision avec le
+JSON attendu par chaque agent, construit à partir du texte de la section
+(liens ``[[n]]``), après une latence tirée d'une loi log-normale
+(médiane ``latency_ms``, dispersion ``latency_sigma``, graine ``seed``).
+En streaming, la réponse est découpée en morceaux répartis sur la latence.
+
+Variables d'environnement : FAKE_LLM_LATENCY_MS, FAKE_LLM_LATENCY_SIGMA,
+FAKE_LLM_SEED.
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field, PrivateAttr
+
+_SECTION_PROMPT = re.compile(r"Section Number:\s*(\d+)\s*Content\s*:\s*(.*)", re.S)
+_SECTION_LINK = re.compile(r"\[\[(\d+)\]\]")
+_CURRENT_SECTION = re.compile(r"Section actuelle:\s*(\d+)")
+_PLAYER_INPUT = re.compile(r"Réponse utilisateur:\s*(.*)")
+_ALLOWED_TARGETS = re.compile(r"Sections accessibles:\s*\[([\d,\s]*)\]")
+_NUMBER = re.compile(r"\d+")
+
+
+def _last_human_text(messages: List[BaseMessage]) -> str:
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return message.content if isinstance(message.content, str) else str(message.content)
+    return ""
+
+
+def _section_prompt(text: str) -> tuple:
+    match = _SECTION_PROMPT.search(text)
+    if match is None:
+        return 0, text
+    return int(match.group(1)), match.group(2).strip()
+
+
+def narrator_response(text: str) -> Dict[str, Any]:
+    """Narrator JSON: the section content, unchanged."""
+    _, content = _section_prompt(text)
+    return {"content": content, "source_type": "processed", "error": None}
+
+
+def rules_response(text: str) -> Dict[str, Any]:
+    """Rules JSON: one direct choice per ``[[n]]`` link of the section.
+
+    The player is always asked: a section without links ends the game.
+    """
+    section_number, content = _section_prompt(text)
+    targets = list(dict.fromkeys(int(link) for link in _SECTION_LINK.findall(content)))
+    choices = [
+        {"text": f"Rendez-vous au {target}", "type": "direct", "target_section": target}
+        for target in targets
+    ]
+    return {
+        "needs_dice": False,
+        "dice_type": "none",
+        "needs_user_response": True,
+        "next_action": "user_first",
+        "conditions": [],
+        "choices": choices,
+        "rules_summary": f"Section {section_number}: {len(choices)} choix"
+    }
+
+
+def decision_response(text: str) -> Dict[str, Any]:
+    """Decision JSON: the section named by the player if reachable, else the first reachable one."""
+    allowed = []
+    match = _ALLOWED_TARGETS.search(text)
+    if match:
+        allowed = [int(number) for number in _NUMBER.findall(match.group(1))]
+    player_input = _PLAYER_INPUT.search(text)
+    named = [int(number) for number in _NUMBER.findall(player_input.group(1))] if player_input else []
+    candidates = [number for number in named if not allowed or number in allowed]
+    if candidates:
+        next_section = candidates[0]
+    elif allowed:
+        next_section = allowed[0]
+    else:
+        current = _CURRENT_SECTION.search(text)
+        next_section = int(current.group(1)) + 1 if current else 1
+    return {"next_section": next_section, "conditions": [], "analysis": "Réponse simulée"}
+
+
+RESPONDERS = {
+    "narrator": narrator_response,
+    "rules": rules_response,
+    "decision": decision_response
+}
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model returning canned agent JSON after a simulated latency."""
+
+    role: str = Field(default="narrator", description="Agent answered: narrator, rules or decision")
+    latency_ms: float = Field(default=0.0, ge=0, description="Median response latency")
+    latency_sigma: float = Field(default=0.0, ge=0, description="Log-normal dispersion (0: fixed latency)")
+    seed: Optional[int] = Field(default=None, description="Seed of the latency draws")
+    chunk_size: int = Field(default=24, gt=0, description="Characters per streamed chunk")
+
+    _random: random.Random = PrivateAttr()
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._random = random.Random(self.seed)
+
+    @classmethod
+    def from_env(cls, role: str, **overrides: Any) -> "FakeChatModel":
+        """Create a model configured by the FAKE_LLM_* variables.
+
+        Args:
+            role: Agent answered
+            **overrides: Fields taking precedence over the environment
+        """
+        settings: Dict[str, Any] = {
+            "latency_ms": float(os.getenv("FAKE_LLM_LATENCY_MS", "0")),
+            "latency_sigma": float(os.getenv("FAKE_LLM_LATENCY_SIGMA", "0"))
+        }
+        if os.getenv("FAKE_LLM_SEED"):
+            settings["seed"] = int(os.environ["FAKE_LLM_SEED"])
+        fields = cls.model_fields
+        settings.update({key: value for key, value in overrides.items() if key in fields})
+        return cls(role=role, **settings)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def draw_latency(self) -> float:
+        """Draw a response latency, in seconds."""
+        if not self.latency_ms:
+            return 0.0
+        if not self.latency_sigma:
+            return self.latency_ms / 1000
+        return self._random.lognormvariate(0.0, self.latency_sigma) * self.latency_ms / 1000
+
+    def respond(self, messages: List[BaseMessage]) -> str:
+        """Build the response text of a prompt."""
+        responder = RESPONDERS.get(self.role)
+        data = responder(_last_human_text(messages)) if responder else {}
+        return json.dumps(data, ensure_ascii=False)
+
+    def _chunks(self, text: str) -> List[str]:
+        return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)] or [""]
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        time.sleep(self.draw_latency())
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.respond(messages)))])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        await asyncio.sleep(self.draw_latency())
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.respond(messages)))])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        chunks = self._chunks(self.respond(messages))
+        delay = self.draw_latency() / len(chunks)
+        for chunk in chunks:
+            time.sleep(delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=chunk))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        chunks = self._chunks(self.respond(messages))
+        delay = self.draw_latency() / len(chunks)
+        for chunk in chunks:
+            await asyncio.sleep(delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=chunk))
@@ -0,0 +1,66 @@
+"""
+JSON encoding of game data, straight to bytes.
+
+Un seul chemin de sérialisation pour l'API REST, le WebSocket et le disque :
+l'encodeur compilé de pydantic-core produit directement des octets UTF-8,
+sans passer par ``model_dump`` puis ``json.dumps``. Les datetimes sont en
+ISO 8601 ; les types inconnus (contenus ``Any``) sont encodés par ``str``.
+
+Un état de jeu sauvegardé n'est plus modifié : les mises à jour créent un
+nouvel état (``GameState.with_updates``). ``encode_state`` mémorise donc
+les octets de chaque état tant qu'il est vivant, et l'état courant est
+encodé une fois pour le disque, la diffusion WebSocket et les lectures REST.
+"""
+
+import weakref
+from typing import Any, Dict, Tuple
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+# id(état) -> (référence faible, octets encodés)
+_memo: Dict[int, Tuple["weakref.ref[BaseModel]", bytes]] = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def dumps(data: Any) -> bytes:
+    """Encode data (models, dicts, lists...) to JSON bytes."""
+    return to_json(data, fallback=str)
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON bytes or text."""
+    return from_json(data)
+
+
+def _forget(key: int) -> None:
+    _memo.pop(key, None)
+
+
+def encode_state(state: BaseModel) -> bytes:
+    """Encode a state, reusing the bytes of a previous encoding of the same object.
+
+    Args:
+        state: State not modified in place once encoded
+
+    Returns:
+        bytes: JSON document of the state
+    """
+    key = id(state)
+    entry = _memo.get(key)
+    if entry is not None and entry[0]() is state:
+        _stats["hits"] += 1
+        return entry[1]
+    _stats["misses"] += 1
+    data = dumps(state)
+    _memo[key] = (weakref.ref(state, lambda _, key=key: _forget(key)), data)
+    return data
+
+
+def get_stats() -> Dict[str, int]:
+    """Get memoization counters.
+
+    Returns:
+        Dict[str, int]: Hits, misses and states currently memoized
+    """
+    return {**_stats, "entries": len(_memo)}
@@ -0,0 +1,114 @@
+"""
+Incremental extraction of a JSON string field.
+
+Les réponses du narrateur sont des objets JSON ``{"content": "...", ...}``
+produits token par token. ``JsonStringFieldStream`` décode la valeur d'un
+champ texte au fil de l'eau, sans attendre la fin de l'objet : les
+séquences d'échappement coupées entre deux tokens sont gardées en attente
+jusqu'au token suivant. La réponse complète reste validée comme avant.
+"""
+
+import re
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t"
+}
+
+_SPECIAL = re.compile(r'["\\]')
+
+
+class JsonStringFieldStream:
+    """Decode the value of one string field of a JSON object fed in chunks."""
+
+    def __init__(self, field: str = "content"):
+        """Initialize the stream.
+
+        Args:
+            field: Name of the string field to extract
+        """
+        self.field = field
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._in_value = False
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of the JSON document.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            str: Newly decoded characters of the field (may be empty)
+        """
+        if self.done or not chunk:
+            return ""
+        self._buffer += chunk
+
+        if not self._in_value:
+            match = self._start.search(self._buffer)
+            if match is None:
+                # Garder de quoi reconnaître une clé coupée entre deux chunks
+                self._buffer = self._buffer[-(len(self.field) + 64):]
+                return ""
+            self._buffer = self._buffer[match.end():]
+            self._in_value = True
+
+        return self._decode()
+
+    def _decode(self) -> str:
+        buffer, out, i, size = self._buffer, [], 0, len(self._buffer)
+        while i < size:
+            match = _SPECIAL.search(buffer, i)
+            if match is None:
+                out.append(buffer[i:])
+                i = size
+                break
+            out.append(buffer[i:match.start()])
+            i = match.start()
+            if buffer[i] == '"':
+                self.done = True
+                i += 1
+                break
+
+            # Séquence d'échappement, éventuellement incomplète
+            if i + 1 >= size:
+                break
+            escape = buffer[i + 1]
+            if escape != "u":
+                out.append(_ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            if i + 6 > size:
+                break
+            try:
+                code = int(buffer[i + 2:i + 6], 16)
+            except ValueError:
+                out.append(buffer[i:i + 6])
+                i += 6
+                continue
+            if 0xD800 <= code < 0xDC00:
+                # Paire de substitution : attendre la seconde moitié
+                if i + 12 > size:
+                    break
+                if buffer[i + 6:i + 8] == "\\u":
+                    try:
+                        low = int(buffer[i + 8:i + 12], 16)
+                    except ValueError:
+                        low = 0
+                    if 0xDC00 <= low < 0xE000:
+                        out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                        i += 12
+                        continue
+            out.append(chr(code))
+            i += 6
+
+        self._buffer = "" if self.done else buffer[i:]
+        return "".join(out)
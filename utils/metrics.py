@@ -0,0 +1,314 @@
+"""
+Process metrics in the Prometheus text exposition format.
+
+Compteurs, jauges et histogrammes de latence, sans dépendance externe.
+Enregistrer un événement coûte une recherche de bucket (``bisect``) et
+quelques additions : les séries étiquetées sont résolues une fois
+(``labels(...)``) puis gardées par l'appelant sur les chemins chauds.
+La mise en forme texte n'a lieu qu'à la lecture de ``/metrics``.
+
+Les métriques de l'application sont déclarées en bas du module et
+enregistrées dans le registre partagé ``REGISTRY``.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Secondes : de la lecture en cache (100 µs) à la génération LLM (60 s)
+LATENCY_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """Metric family: one series per label values."""
+
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize the family.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels of the series
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _new_series(self):
+        """Create the series of one label values."""
+
+    def labels(self, *values: str):
+        """Get the series of label values (created on first use).
+
+        Args:
+            *values: One value per label name, in order
+        """
+        series = self._series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            key = tuple(str(value) for value in values)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = self._new_series()
+        return series
+
+    @abstractmethod
+    def _samples(self) -> Iterator[Tuple[str, str, float]]:
+        """Yield (sample name, labels text, value) of every series."""
+
+    @property
+    def family(self) -> str:
+        """Name of the family in the exposition format."""
+        return self.name
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.family} {self.documentation}",
+            f"# TYPE {self.family} {self.TYPE}"
+        ]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self._samples())
+        return lines
+
+    def clear(self) -> None:
+        """Remove all series."""
+        self._series.clear()
+
+
+class _CounterSeries:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    TYPE = "counter"
+
+    @property
+    def family(self) -> str:
+        return f"{self.name}_total"
+
+    def _new_series(self) -> _CounterSeries:
+        return _CounterSeries()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the series of a family without labels."""
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for values, series in list(self._series.items()):
+            yield self.family, _labels_text(self.labelnames, values), series.value
+
+
+class _GaugeSeries:
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from a callable when the metrics are collected."""
+        self.function = function
+
+    def get(self) -> float:
+        return self.function() if self.function is not None else self.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    TYPE = "gauge"
+
+    def _new_series(self) -> _GaugeSeries:
+        return _GaugeSeries()
+
+    def set(self, value: float) -> None:
+        """Set the series of a family without labels."""
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the series of a family without labels from a callable."""
+        self.labels().set_function(function)
+
+    def _samples(self):
+        for values, series in list(self._series.items()):
+            try:
+                value = series.get()
+            except Exception:
+                continue
+            yield self.name, _labels_text(self.labelnames, values), value
+
+
+class _HistogramSeries:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # Un compteur par bucket, plus le dernier pour +Inf (cumulés au rendu)
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        """Initialize the family.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels of the series
+            buckets: Upper bounds of the buckets (``+Inf`` is implicit)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(bucket for bucket in buckets if bucket != math.inf))
+
+    def _new_series(self) -> _HistogramSeries:
+        return _HistogramSeries(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe a value in the series of a family without labels."""
+        self.labels().observe(value)
+
+    def _samples(self):
+        for values, series in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), list(series.counts)):
+                cumulative += count
+                labels = _labels_text(self.labelnames + ("le",), values + (_format_value(bound),))
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _labels_text(self.labelnames, values)
+            yield f"{self.name}_sum", labels, series.sum
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Set of metric families exported together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric family, returned for module-level declarations."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all families in the text exposition format."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# -----------------------------------------------------------------------------
+# Métriques de l'application
+# -----------------------------------------------------------------------------
+GRAPH_NODE_SECONDS = REGISTRY.histogram(
+    "casys_graph_node_seconds", "Duration of StoryGraph nodes", ("node",)
+)
+GRAPH_NODE_ERRORS = REGISTRY.counter(
+    "casys_graph_node_errors", "StoryGraph node executions that raised", ("node",)
+)
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "casys_llm_call_seconds", "Duration of agent LLM calls, response cache included", ("agent", "model")
+)
+LLM_CALLS = REGISTRY.counter(
+    "casys_llm_calls", "Agent LLM calls by outcome", ("agent", "model", "outcome")
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "casys_cache_lookups", "CacheManager lookups by namespace and result (memory, storage, miss)",
+    ("namespace", "result")
+)
+FS_OPERATION_SECONDS = REGISTRY.histogram(
+    "casys_fs_operation_seconds", "FileSystemAdapter read and write latency", ("operation",)
+)
+FS_BYTES = REGISTRY.counter(
+    "casys_fs_bytes", "Characters or bytes read and written by FileSystemAdapter", ("operation",)
+)
+WEBSOCKET_SEND_SECONDS = REGISTRY.histogram(
+    "casys_websocket_send_seconds", "Latency of WebSocket sends"
+)
+WEBSOCKET_CONNECTIONS = REGISTRY.gauge(
+    "casys_websocket_connections", "Connected WebSocket clients"
+)
+ACTIVE_SESSIONS = REGISTRY.gauge(
+    "casys_active_sessions", "Game sessions held in memory"
+)
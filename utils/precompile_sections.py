@@ -0,0 +1,225 @@
+"""
+Précompilation hors ligne des sections.
+
+Parcourt ``data/sections/*.md``, exécute le narrateur et l'extraction des
+règles pour chaque section et écrit le résultat dans un artefact SQLite
+unique et versionné (voir ``managers/section_store.py``), chargé par le
+serveur au démarrage.
+
+Usage:
+    python -m utils.precompile_sections --concurrency 8
+    python -m utils.precompile_sections --sections 1 2 3 --force
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
+
+from config.game_config import GameConfig
+from config.managers.section_store_config import SectionStoreConfig
+from managers.llm_cache_manager import LLMCacheManager
+from managers.section_store import SectionStoreWriter, compilation_metadata, source_hash
+from models.errors_model import NarratorError, RulesError
+from models.narrator_model import NarratorModel
+from models.rules_model import RulesModel
+
+DEFAULT_SECTIONS_DIR = Path("data/sections")
+
+
+class CompilationError(Exception):
+    """Raised when a section cannot be compiled (triggers a retry)."""
+
+
+def list_sections(sections_dir: Path, only: Optional[List[int]] = None) -> Dict[int, Path]:
+    """List the section source files.
+
+    Args:
+        sections_dir: Directory of ``<n>.md`` files
+        only: Optional subset of section numbers
+
+    Returns:
+        Dict[int, Path]: Source file of each section
+    """
+    sections = {
+        int(path.stem): path
+        for path in sections_dir.glob("*.md")
+        if path.stem.isdigit()
+    }
+    if only:
+        sections = {n: p for n, p in sections.items() if n in set(only)}
+    return dict(sorted(sections.items()))
+
+
+class SectionCompiler:
+    """Runs the narrator and rules agents over every section."""
+
+    def __init__(self, config: GameConfig, retries: int = 3):
+        """Initialize the compiler.
+
+        Args:
+            config: Game configuration (agent prompts and models)
+            retries: Attempts per section before giving up
+        """
+        # Import agents here to avoid circular imports
+        from agents.narrator_agent import NarratorAgent
+        from agents.rules_agent import RulesAgent
+
+        agent_configs = config.agent_configs
+        # Le cache LLM évite de repayer les sections déjà générées côté serveur
+        self.llm_cache = LLMCacheManager(config.manager_configs.llm_cache_config)
+        self.narrator_agent = NarratorAgent(
+            config=agent_configs.narrator_config,
+            narrator_manager=None,
+            llm_cache=self.llm_cache
+        )
+        self.rules_agent = RulesAgent(
+            config=agent_configs.rules_config,
+            rules_manager=None,
+            llm_cache=self.llm_cache
+        )
+        self.retries = retries
+
+    def metadata(self) -> Dict[str, str]:
+        """Settings that invalidate compiled sections when they change."""
+        return compilation_metadata(self.narrator_agent.config, self.rules_agent.config)
+
+    async def _compile_once(self, section_number: int, content: str) -> Tuple[NarratorModel, RulesModel]:
+        narrator, rules = await asyncio.gather(
+            self.narrator_agent._process_content(section_number, content),
+            self.rules_agent._extract_rules_with_llm(section_number, content)
+        )
+        if isinstance(narrator, NarratorError):
+            raise CompilationError(f"narrator: {narrator.message}")
+        if isinstance(rules, RulesError):
+            raise CompilationError(f"rules: {rules.message}")
+        if rules.error:
+            raise CompilationError(f"rules: {rules.error}")
+        return narrator, rules
+
+    async def compile_section(self, section_number: int, content: str) -> Tuple[NarratorModel, RulesModel]:
+        """Compile a section with retries and exponential backoff.
+
+        Args:
+            section_number: Section number
+            content: Raw section content
+
+        Returns:
+            Tuple[NarratorModel, RulesModel]: Compiled narrative and rules
+
+        Raises:
+            CompilationError: If every attempt failed
+        """
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.retries),
+            wait=wait_exponential(multiplier=1, min=1, max=30),
+            reraise=True
+        ):
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    logger.warning("Retrying section {} (attempt {})",
+                                   section_number, attempt.retry_state.attempt_number)
+                return await self._compile_once(section_number, content)
+
+
+async def precompile(
+    sections_dir: Path,
+    output: Path,
+    concurrency: int = 4,
+    retries: int = 3,
+    force: bool = False,
+    only: Optional[List[int]] = None,
+    compiler: Optional[SectionCompiler] = None
+) -> Dict[str, int]:
+    """Compile sections into the artifact, resuming from previous runs.
+
+    Args:
+        sections_dir: Directory of section sources
+        output: Artifact path
+        concurrency: Maximum number of sections compiled at once
+        retries: Attempts per section
+        force: Recompile sections even if up to date
+        only: Optional subset of section numbers
+        compiler: Optional compiler (defaults to the configured agents)
+
+    Returns:
+        Dict[str, int]: Counts of compiled, skipped and failed sections
+    """
+    compiler = compiler or SectionCompiler(GameConfig.create_default(), retries=retries)
+    writer = SectionStoreWriter(output, compiler.metadata())
+    stats = {"compiled": 0, "skipped": 0, "failed": 0}
+
+    try:
+        sections = list_sections(sections_dir, only)
+        if not only:
+            pruned = writer.prune(set(sections))
+            if pruned:
+                logger.info("Removed {} sections without source", pruned)
+
+        done = writer.compiled_hashes()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(section_number: int, path: Path) -> None:
+            content = path.read_text(encoding="utf-8")
+            digest = source_hash(content)
+            if not force and done.get(section_number) == digest:
+                stats["skipped"] += 1
+                return
+
+            async with semaphore:
+                try:
+                    narrator, rules = await compiler.compile_section(section_number, content)
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error("Section {} failed: {}", section_number, str(e))
+                    return
+
+            # Checkpoint : chaque section est validée dès qu'elle est prête
+            writer.put(section_number, digest, narrator, rules)
+            stats["compiled"] += 1
+            logger.info("Section {} compiled ({}/{})",
+                        section_number, sum(stats.values()), len(sections))
+
+        await asyncio.gather(*(run(n, p) for n, p in sections.items()))
+    finally:
+        writer.close()
+        await compiler.llm_cache.close()
+
+    logger.info("Precompilation done: {compiled} compiled, {skipped} up to date, {failed} failed", **stats)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Precompile game sections (narrative + rules)")
+    parser.add_argument("--sections-dir", type=Path, default=DEFAULT_SECTIONS_DIR,
+                        help="Directory of section sources")
+    parser.add_argument("--output", type=Path, default=SectionStoreConfig().artifact_path,
+                        help="Compiled artifact path")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Maximum number of concurrent sections")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="Attempts per section")
+    parser.add_argument("--force", action="store_true",
+                        help="Recompile up-to-date sections")
+    parser.add_argument("--sections", type=int, nargs="*",
+                        help="Only compile these section numbers")
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(precompile(
+        sections_dir=args.sections_dir,
+        output=args.output,
+        concurrency=args.concurrency,
+        retries=args.retries,
+        force=args.force,
+        only=args.sections
+    ))
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())